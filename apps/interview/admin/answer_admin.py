@@ -1,14 +1,29 @@
 from django.contrib import admin
-from ..models import Answer
+from django.db.models import Prefetch
+
+from ..models import Answer, QuestionOption
 from .read_only_admin_mixin import ReadOnlyAdminMixin
+from .full_text_search_mixin import FullTextSearchAdminMixin
+from .keyset_pagination_mixin import KeysetPaginationAdminMixin
 from apps.transport.admin import tenant_admin_site
 
-class AnswerAdmin(ReadOnlyAdminMixin, admin.ModelAdmin):
+class AnswerAdmin(KeysetPaginationAdminMixin, FullTextSearchAdminMixin, ReadOnlyAdminMixin, admin.ModelAdmin):
     list_display = ('question', 'get_question_type', 'get_answer_display', 'created_at')
     list_filter = ('created_at', 'question', 'question__type')
     search_fields = ('question__text',)
     readonly_fields = ('submission', 'question', 'text_answer', 'rating_answer', 'selected_option', 'created_at')
     ordering = ('-created_at',)
+    # pregunta y opción única en el mismo query del listado (evita N+1)
+    list_select_related = ('question', 'selected_option')
+
+    def get_queryset(self, request):
+        # opciones múltiples de toda la página en un solo query adicional
+        return super().get_queryset(request).prefetch_related(
+            Prefetch(
+                'selected_options',
+                queryset=QuestionOption.objects.only('id', 'text').order_by('position'),
+            )
+        )
 
     def get_answer_display(self, obj):
         """Mostrar la respuesta según el tipo de pregunta."""
@@ -19,8 +34,10 @@ class AnswerAdmin(ReadOnlyAdminMixin, admin.ModelAdmin):
             return f'💬 {text_preview}{"..." if len(obj.text_answer) > 50 else ""}'
         elif obj.selected_option:
             return f'✓ {obj.selected_option.text}'
-        elif obj.selected_options.exists():
-            options = ', '.join(obj.selected_options.values_list('text', flat=True))
+        # .all() usa el prefetch; exists()/values_list() harían un query por fila
+        selected_options = obj.selected_options.all()
+        if selected_options:
+            options = ', '.join(option.text for option in selected_options)
             return f'☑ {options}'
         return '(Sin respuesta)'
     get_answer_display.short_description = 'Respuesta'
@@ -2,9 +2,11 @@ from django.contrib import admin
 from ..models import Complaint
 from apps.transport.admin import tenant_admin_site
 from .read_only_admin_mixin import ReadOnlyAdminMixin
+from .full_text_search_mixin import FullTextSearchAdminMixin
+from .keyset_pagination_mixin import KeysetPaginationAdminMixin
 
 
-class ComplaintAdmin(ReadOnlyAdminMixin, admin.ModelAdmin):
+class ComplaintAdmin(KeysetPaginationAdminMixin, FullTextSearchAdminMixin, ReadOnlyAdminMixin, admin.ModelAdmin):
     list_display = ('unit', 'reason', 'text', 'created_at')
     ordering = ('-created_at',)
     # ✅ Cambiar 'unit__unit_number' por 'unit__transit_number'
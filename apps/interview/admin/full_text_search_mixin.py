@@ -0,0 +1,52 @@
+from django.contrib import admin
+from django.contrib.admin.views.main import SEARCH_VAR
+
+from ..search import build_search_query, search_rank
+
+
+SEARCH_MODE_PARAM = 'search_mode'
+SEARCH_MODE_FULL_TEXT = 'fts'
+
+
+class SearchModeFilter(admin.SimpleListFilter):
+    """Filtro lateral que cambia el buscador del admin a texto completo."""
+    title = 'modo de búsqueda'
+    parameter_name = SEARCH_MODE_PARAM
+
+    def lookups(self, request, model_admin):
+        return ((SEARCH_MODE_FULL_TEXT, 'Texto completo (español)'),)
+
+    def queryset(self, request, queryset):
+        # La búsqueda se aplica en get_search_results
+        return queryset
+
+
+class FullTextSearchAdminMixin:
+    """Mixin que agrega búsqueda de texto completo sobre ``search_vector``.
+
+    Con el modo "Texto completo" activo, el término del buscador se
+    interpreta como consulta web ("chofer frenos", "frase exacta", -palabra)
+    contra el tsvector indexado y los resultados se ordenan por relevancia.
+    Sin el modo activo se conserva la búsqueda por search_fields.
+    """
+
+    def get_list_filter(self, request):
+        return (SearchModeFilter,) + tuple(super().get_list_filter(request))
+
+    def is_full_text_search(self, request):
+        return (
+            request.GET.get(SEARCH_MODE_PARAM) == SEARCH_MODE_FULL_TEXT
+            and bool(request.GET.get(SEARCH_VAR, '').strip())
+        )
+
+    def get_search_results(self, request, queryset, search_term):
+        if not self.is_full_text_search(request):
+            return super().get_search_results(request, queryset, search_term)
+
+        return queryset.filter(search_vector=build_search_query(search_term)), False
+
+    def get_ordering(self, request):
+        if self.is_full_text_search(request):
+            query = build_search_query(request.GET[SEARCH_VAR])
+            return (search_rank(query).desc(),)
+        return super().get_ordering(request)
@@ -0,0 +1,126 @@
+import json
+from datetime import datetime
+
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ChangeList
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db.models import F
+from django.db.models.fields.tuple_lookups import Tuple, TupleLessThan
+from django.utils.functional import cached_property
+
+
+CURSOR_VAR = 'cursor'
+
+# Por encima de este número de filas (estimado) no se hace COUNT(*) exacto
+EXACT_COUNT_THRESHOLD = 10_000
+
+# Orden que permite paginar por cursor (el de ``ordering`` + desempate por pk)
+KEYSET_ORDERING = ['-created_at', '-pk']
+
+
+def planner_row_estimate(queryset):
+    """Filas que el planificador de PostgreSQL estima para el queryset (EXPLAIN, sin ejecutarlo)."""
+    plan = json.loads(queryset.order_by().explain(format='json'))
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator que usa la estimación del planificador en tablas grandes.
+
+    Debajo de ``EXACT_COUNT_THRESHOLD`` filas estimadas cuenta con COUNT(*)
+    como siempre; por encima, el total mostrado es aproximado.
+    """
+
+    @cached_property
+    def count(self):
+        estimate = planner_row_estimate(self.object_list)
+        if estimate > EXACT_COUNT_THRESHOLD:
+            self.is_estimate = True
+            return estimate
+
+        self.is_estimate = False
+        return super().count
+
+
+class KeysetChangeList(ChangeList):
+    """ChangeList que pagina por cursor (created_at, pk) en lugar de OFFSET.
+
+    El cursor es la última fila de la página anterior; la siguiente página
+    es ``WHERE (created_at, id) < (cursor)`` con el mismo orden, así que su
+    costo no depende de qué tan lejos se navegue. Con otro orden (columnas
+    ordenadas por el usuario, relevancia de texto completo) o "mostrar
+    todo" se usa la paginación normal.
+    """
+
+    def __init__(self, request, *args, **kwargs):
+        self.cursor_value = request.GET.get(CURSOR_VAR)
+        self.keyset = False
+        self.next_cursor = None
+        super().__init__(request, *args, **kwargs)
+        # los enlaces de filtros, orden y búsqueda vuelven a la primera página
+        self.params.pop(CURSOR_VAR, None)
+
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        lookup_params.pop(CURSOR_VAR, None)
+        return lookup_params
+
+    def get_results(self, request):
+        # el admin puede repetir columnas (ordering + orden determinístico)
+        ordering = list(dict.fromkeys(str(field) for field in self.queryset.query.order_by))
+        if self.show_all or ordering != KEYSET_ORDERING:
+            return super().get_results(request)
+
+        paginator = self.model_admin.get_paginator(request, self.queryset, self.list_per_page)
+        queryset = self.queryset
+        if self.cursor_value:
+            queryset = queryset.filter(
+                TupleLessThan(Tuple(F('created_at'), F('pk')), self.parse_cursor(self.cursor_value))
+            )
+
+        # una fila extra indica si hay página siguiente
+        rows = list(queryset[:self.list_per_page + 1])
+        result_list = rows[:self.list_per_page]
+        if len(rows) > self.list_per_page:
+            last = result_list[-1]
+            self.next_cursor = f'{last.created_at.isoformat()}|{last.pk}'
+
+        self.keyset = True
+        self.result_count = paginator.count
+        self.full_result_count = None
+        self.show_full_result_count = False
+        self.show_admin_actions = True
+        self.result_list = result_list
+        self.can_show_all = False
+        self.multi_page = bool(self.cursor_value or self.next_cursor)
+        self.paginator = paginator
+
+    def parse_cursor(self, value):
+        try:
+            created_at, pk = value.rsplit('|', 1)
+            return datetime.fromisoformat(created_at), self.lookup_opts.pk.to_python(pk)
+        except (ValueError, ValidationError):
+            raise IncorrectLookupParameters
+
+    @property
+    def first_page_url(self):
+        return self.get_query_string(remove=[CURSOR_VAR])
+
+    @property
+    def next_page_url(self):
+        return self.get_query_string({CURSOR_VAR: self.next_cursor}) if self.next_cursor else None
+
+
+class KeysetPaginationAdminMixin:
+    """Mixin para listados de solo lectura con millones de filas.
+
+    Pagina por cursor (created_at, pk) y usa la estimación del
+    planificador en lugar de COUNT(*) exacto en tablas grandes. Requiere
+    ``ordering = ('-created_at',)`` y un índice (created_at, id).
+    """
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_changelist(self, request, **kwargs):
+        return KeysetChangeList
@@ -11,8 +11,8 @@ class ReadOnlyAdminMixin:
         return False
 
     def get_readonly_fields(self, request, obj=None):
-        # mark all model fields as readonly
-        return [f.name for f in self.model._meta.fields]
+        # mark all model fields as readonly (except generated columns like search_vector)
+        return [f.name for f in self.model._meta.fields if not f.generated]
 
     def save_model(self, request, obj, form, change):
         # prevent saving from admin
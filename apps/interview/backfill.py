@@ -0,0 +1,90 @@
+"""
+Relleno de los campos desnormalizados de envíos, quejas y respuestas.
+
+Los registros nuevos copian al guardarse la ruta de la unidad (envíos y
+quejas) y la unidad, ruta y fecha del envío (respuestas). Este módulo
+rellena los registros anteriores a esos campos, por lotes de llaves
+primarias para no bloquear las tablas con un solo UPDATE gigante.
+
+Para los históricos la ruta es la que la unidad tiene al momento del
+relleno (la única disponible). La migración 0008 rellena la fecha de las
+respuestas al particionar la tabla (submitted_at es la llave de partición).
+"""
+from collections.abc import Iterator
+
+from django.db.models import OuterRef, QuerySet, Subquery
+
+from apps.transport.models import Unit
+
+from .models import Answer, Complaint, SurveySubmission
+from .signals import facts_bulk_written
+
+# Filas por UPDATE
+BACKFILL_BATCH_SIZE = 5000
+
+
+def backfill_denormalized_fields(batch_size: int = BACKFILL_BATCH_SIZE) -> dict[str, int]:
+    """
+    Rellena route en envíos y quejas, y unit/route en respuestas.
+
+    Es idempotente: solo toca filas sin el campo relleno. Las respuestas se
+    rellenan al final porque copian la ruta del envío. Si actualizó filas,
+    envía ``facts_bulk_written``.
+
+    Args:
+        batch_size: Filas por UPDATE
+
+    Returns:
+        Diccionario {tabla: filas actualizadas}
+
+    Example:
+        >>> backfill_denormalized_fields()
+        {'survey_submissions': 1200, 'complaints': 85, 'answers': 9600}
+    """
+    unit_route = Subquery(Unit.objects.filter(pk=OuterRef('unit_id')).values('route_id')[:1])
+    submission = SurveySubmission.objects.filter(pk=OuterRef('submission_id'))
+
+    updated = {
+        'survey_submissions': _update_in_batches(
+            SurveySubmission.objects.filter(route__isnull=True, unit__route__isnull=False),
+            batch_size,
+            route_id=unit_route,
+        ),
+        'complaints': _update_in_batches(
+            Complaint.objects.filter(route__isnull=True, unit__route__isnull=False),
+            batch_size,
+            route_id=unit_route,
+        ),
+        'answers': _update_in_batches(
+            Answer.objects.filter(unit__isnull=True),
+            batch_size,
+            unit_id=Subquery(submission.values('unit_id')[:1]),
+            route_id=Subquery(submission.values('route_id')[:1]),
+        ),
+    }
+
+    if any(updated.values()):
+        facts_bulk_written.send(sender=SurveySubmission, rows=updated)
+    return updated
+
+
+def _update_in_batches(queryset: QuerySet, batch_size: int, **values) -> int:
+    """Aplica ``update(**values)`` a las filas del queryset, un lote de pks a la vez."""
+    updated = 0
+    for pks in _pk_batches(queryset, batch_size):
+        updated += queryset.model.objects.filter(pk__in=pks).update(**values)
+    return updated
+
+
+def _pk_batches(queryset: QuerySet, batch_size: int) -> Iterator[list]:
+    """Lotes de pks del queryset, recorridos en orden de pk (keyset)."""
+    last_pk = None
+    while True:
+        batch = queryset.order_by('pk')
+        if last_pk is not None:
+            batch = batch.filter(pk__gt=last_pk)
+        pks = list(batch.values_list('pk', flat=True)[:batch_size])
+        if not pks:
+            return
+        yield pks
+        last_pk = pks[-1]
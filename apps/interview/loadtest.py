@@ -0,0 +1,475 @@
+"""
+Prueba de carga del flujo público de encuesta.
+
+Cada pasajero simulado recorre el flujo completo de una unidad:
+``survey_form`` (GET) → ``submit_survey`` (POST con el token CSRF y las
+cookies de su sesión) → ``thank_you`` (GET), repartidos entre varios
+tenants y unidades, con varios pasajeros en paralelo (un hilo por
+pasajero concurrente, como un worker ``gthread`` de gunicorn).
+
+Dos modos:
+
+- En proceso (default): las peticiones pasan por la aplicación WSGI del
+  proyecto (``WSGI_APPLICATION``) con todo el middleware, sin servidor
+  HTTP. El reCAPTCHA se sustituye por la respuesta de las claves de
+  prueba de django_recaptcha (siempre válida, sin llamar a Google) y se
+  cuentan las queries de cada petición.
+- Servidor local (``url``): las peticiones van por HTTP a un servidor ya
+  levantado (runserver o gunicorn), con el ``Host`` de cada tenant. El
+  servidor debe usar las claves de prueba de django_recaptcha
+  (``RECAPTCHA_PUBLIC_KEY``/``RECAPTCHA_PRIVATE_KEY``) y silenciar el check
+  ``django_recaptcha.recaptcha_test_key_error``; las queries no se cuentan.
+
+Los envíos, respuestas y quejas de la prueba son reales y se conservan en
+los tenants: debe correr contra tenants de prueba.
+
+Cada pasajero usa una IP distinta (``REMOTE_ADDR`` y ``X-Forwarded-For``),
+así que el rate limit de 1 envío por IP y unidad cada 15 minutos se evalúa
+pero no bloquea la prueba.
+"""
+import http.client
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from http.cookies import SimpleCookie
+from io import BytesIO
+from urllib.parse import urlencode, urlsplit
+
+from django.core.servers.basehttp import get_internal_wsgi_application
+from django.db import connection, connections
+from django.urls import reverse
+from django.utils import timezone
+from django_recaptcha import client as recaptcha_client
+from django_tenants.utils import schema_context
+
+from apps.organization.models import Domain
+from apps.statistical_summary.services.benchmark_service import percentile
+from apps.transport.models import Unit
+
+from .models import ComplaintReason, Question
+from .synthetic import COMPLAINT_TEXTS, DEFAULT_COMPLAINT_RATE, TEXT_ANSWERS
+
+# Pasos del flujo, en orden
+LOADTEST_STEPS = ('survey_form', 'submit_survey', 'thank_you')
+
+# Unidades por tenant entre las que se reparten los pasajeros
+DEFAULT_UNITS_PER_TENANT = 20
+
+# Valor del widget de reCAPTCHA (las claves de prueba aceptan cualquiera)
+RECAPTCHA_TEST_RESPONSE = 'loadtest'
+
+_CSRF_TOKEN_RE = re.compile(rb'name="csrfmiddlewaretoken" value="([^"]+)"')
+
+
+class LoadTestError(Exception):
+    """Configuración de la prueba de carga inválida."""
+
+
+@dataclass(frozen=True)
+class TenantCatalog:
+    """Lo que un pasajero necesita para llenar la encuesta de un tenant."""
+    schema_name: str
+    host: str
+    # (transit_number, pk) de las unidades
+    units: tuple[tuple[str, str], ...]
+    # (campo del formulario, tipo de pregunta, pks de opciones)
+    questions: tuple[tuple[str, str, tuple[str, ...]], ...]
+    reasons: tuple[str, ...]
+
+
+@dataclass
+class StepStats:
+    """Latencia y queries de un paso del flujo."""
+    requests: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    queries_per_request: float | None
+    max_queries: int | None
+
+
+@dataclass
+class LoadTestResult:
+    """Resultado de una prueba de carga."""
+    mode: str
+    target: str
+    tenants: list[str]
+    units: int
+    concurrency: int
+    journeys: int
+    completed: int
+    failed: int
+    seconds: float
+    surveys_per_second: float
+    requests_per_second: float
+    created_at: str
+    steps: dict[str, StepStats] = field(default_factory=dict)
+    errors: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class _Response:
+    status: int
+    headers: list[tuple[str, str]]
+    body: bytes
+
+    def header(self, name: str) -> str | None:
+        name = name.lower()
+        return next((value for key, value in self.headers if key.lower() == name), None)
+
+
+@dataclass
+class _Sample:
+    step: str
+    ms: float
+    queries: int | None
+    error: str | None = None
+
+
+def get_catalogs(schema_names: list[str], units_per_tenant: int = DEFAULT_UNITS_PER_TENANT) -> list[TenantCatalog]:
+    """
+    Carga unidades, preguntas activas y motivos de queja de cada tenant.
+
+    Args:
+        schema_names: Schemas de los tenants a probar
+        units_per_tenant: Unidades por tenant (las primeras por número de tránsito)
+
+    Returns:
+        Un TenantCatalog por tenant con dominio primario, unidades y preguntas
+
+    Raises:
+        LoadTestError: Si algún tenant no tiene dominio, unidades o preguntas
+    """
+    catalogs = []
+    for schema_name in schema_names:
+        domain = Domain.objects.filter(tenant__schema_name=schema_name).order_by('-is_primary', 'domain').first()
+        if domain is None:
+            raise LoadTestError(f'{schema_name}: el tenant no tiene dominio')
+
+        with schema_context(schema_name):
+            units = tuple(
+                (transit_number, str(pk))
+                for transit_number, pk in Unit.objects.order_by('transit_number')
+                .values_list('transit_number', 'pk')[:units_per_tenant]
+            )
+            questions = tuple(
+                (
+                    f'question_{question.pk}',
+                    question.type,
+                    tuple(str(option.pk) for option in question.options.all()),
+                )
+                for question in Question.objects.filter(active=True).prefetch_related('options').order_by('position')
+            )
+            reasons = tuple(str(pk) for pk in ComplaintReason.objects.values_list('pk', flat=True))
+
+        if not units:
+            raise LoadTestError(f'{schema_name}: el tenant no tiene unidades')
+        if not questions:
+            raise LoadTestError(f'{schema_name}: el tenant no tiene preguntas activas')
+        catalogs.append(TenantCatalog(schema_name, domain.domain, units, questions, reasons))
+    return catalogs
+
+
+def run_load_test(
+    catalogs: list[TenantCatalog],
+    journeys: int,
+    concurrency: int = 1,
+    url: str | None = None,
+    complaint_rate: float = DEFAULT_COMPLAINT_RATE,
+    seed: int | None = None,
+) -> LoadTestResult:
+    """
+    Ejecuta ``journeys`` recorridos completos de la encuesta.
+
+    Cada recorrido elige un tenant y una unidad al azar, con una sesión
+    (cookies) y una IP nuevas. Los recorridos se reparten entre
+    ``concurrency`` hilos; con 1 se ejecutan en el hilo actual.
+
+    Args:
+        catalogs: Tenants a probar (get_catalogs)
+        journeys: Recorridos totales (encuestas enviadas si no hay errores)
+        concurrency: Pasajeros en paralelo
+        url: URL base de un servidor local (default: en proceso vía WSGI)
+        complaint_rate: Fracción de envíos con queja
+        seed: Semilla para elegir unidades y respuestas
+
+    Returns:
+        LoadTestResult con throughput, percentiles y queries por paso
+
+    Example:
+        >>> result = run_load_test(get_catalogs(['alianza']), journeys=500, concurrency=8)
+        >>> result.surveys_per_second
+        84.2
+    """
+    if not catalogs:
+        raise LoadTestError('No hay tenants que probar')
+    if journeys < 1 or concurrency < 1:
+        raise LoadTestError('journeys y concurrency deben ser al menos 1')
+
+    concurrency = min(concurrency, journeys)
+    if url:
+        parts = urlsplit(url)
+        if parts.scheme != 'http' or not parts.hostname:
+            raise LoadTestError(f'URL inválida (se espera http://host:puerto): {url}')
+        make_transport = lambda: _HttpTransport(parts.hostname, parts.port or 80)
+    else:
+        application = get_internal_wsgi_application()
+        make_transport = lambda: _WsgiTransport(application)
+
+    paths = {
+        'survey_form': reverse('interview:survey_form', args=['TRANSIT']).replace('TRANSIT', '{}'),
+        'submit_survey': reverse('interview:submit_survey', args=['TRANSIT']).replace('TRANSIT', '{}'),
+        'thank_you': reverse('interview:thank_you'),
+    }
+    rng = random.Random(seed)
+    # Base de IPs distinta en cada corrida: el rate limit persiste 15 minutos en la caché
+    ip_base = random.SystemRandom().getrandbits(24)
+    shares = [journeys // concurrency + (index < journeys % concurrency) for index in range(concurrency)]
+    offsets = [sum(shares[:index]) for index in range(concurrency)]
+    seeds = [rng.getrandbits(32) for _ in range(concurrency)]
+
+    def rider(index):
+        transport = make_transport()
+        try:
+            return _run_rider(
+                transport, catalogs, paths, shares[index], ip_base + offsets[index],
+                complaint_rate, random.Random(seeds[index]),
+            )
+        finally:
+            transport.close()
+            if not url and threading.current_thread() is not threading.main_thread():
+                connections.close_all()
+
+    with _recaptcha_test_keys() if not url else nullcontext():
+        started = time.perf_counter()
+        if concurrency == 1:
+            results = [rider(0)]
+        else:
+            with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='rider') as executor:
+                results = list(executor.map(rider, range(concurrency)))
+        seconds = time.perf_counter() - started
+
+    samples = [sample for rider_samples in results for sample in rider_samples]
+    return _summarize(samples, catalogs, journeys, concurrency, url, seconds)
+
+
+def _run_rider(transport, catalogs, paths, journeys, ip_start, complaint_rate, rng) -> list[_Sample]:
+    """Recorridos de un hilo: GET formulario → POST envío → GET agradecimiento."""
+    samples = []
+    for number in range(journeys):
+        catalog = rng.choice(catalogs)
+        transit_number, unit_pk = rng.choice(catalog.units)
+        ip = _ip_address(ip_start + number)
+        cookies = {}
+
+        def request(step, method, path, data=None):
+            headers = {'Host': catalog.host, 'X-Forwarded-For': ip}
+            if cookies:
+                headers['Cookie'] = '; '.join(f'{name}={value}' for name, value in cookies.items())
+            body = b''
+            if data is not None:
+                body = urlencode(data, doseq=True).encode()
+                headers['Content-Type'] = 'application/x-www-form-urlencoded'
+            started = time.perf_counter()
+            response, queries = transport.request(method, path, headers, body, ip)
+            sample = _Sample(step, (time.perf_counter() - started) * 1000, queries)
+            samples.append(sample)
+            for name, value in response.headers:
+                if name.lower() == 'set-cookie':
+                    cookies.update({key: morsel.value for key, morsel in SimpleCookie(value).items()})
+            return response, sample
+
+        response, sample = request('survey_form', 'GET', paths['survey_form'].format(transit_number))
+        token = _CSRF_TOKEN_RE.search(response.body) if response.status == 200 else None
+        if token is None:
+            sample.error = _status_error('survey_form', response.status) if response.status != 200 else 'survey_form: sin token CSRF'
+            continue
+
+        data = _survey_data(catalog, unit_pk, complaint_rate, rng)
+        data['csrfmiddlewaretoken'] = token.group(1).decode()
+        response, sample = request('submit_survey', 'POST', paths['submit_survey'].format(transit_number), data)
+        location = urlsplit(response.header('Location') or '').path
+        if response.status != 302 or location != paths['thank_you']:
+            if response.status == 200:
+                sample.error = 'submit_survey: formulario inválido'
+            elif response.status == 302:
+                sample.error = 'submit_survey: rate limit'
+            else:
+                sample.error = _status_error('submit_survey', response.status)
+            continue
+
+        response, sample = request('thank_you', 'GET', paths['thank_you'])
+        if response.status != 200:
+            sample.error = _status_error('thank_you', response.status)
+    return samples
+
+
+def _survey_data(catalog: TenantCatalog, unit_pk: str, complaint_rate: float, rng: random.Random) -> dict:
+    """Datos POST de una encuesta completa con respuestas al azar."""
+    data = {'unit': unit_pk, 'g-recaptcha-response': RECAPTCHA_TEST_RESPONSE}
+    for name, question_type, options in catalog.questions:
+        if question_type == Question.QuestionType.RATING:
+            data[name] = rng.randint(1, 5)
+        elif question_type == Question.QuestionType.TEXT:
+            data[name] = rng.choice(TEXT_ANSWERS)
+        elif question_type == Question.QuestionType.CHOICE and options:
+            data[name] = rng.choice(options)
+        elif question_type == Question.QuestionType.MULTI_CHOICE and options:
+            data[name] = rng.sample(options, rng.randint(1, len(options)))
+
+    if catalog.reasons and rng.random() < complaint_rate:
+        data['complaint_reason'] = rng.choice(catalog.reasons)
+        data['complaint_text'] = rng.choice(COMPLAINT_TEXTS)
+    return data
+
+
+def _summarize(samples, catalogs, journeys, concurrency, url, seconds) -> LoadTestResult:
+    """Agrupa las muestras por paso y calcula percentiles, errores y throughput."""
+    steps = {}
+    for step in LOADTEST_STEPS:
+        step_samples = [sample for sample in samples if sample.step == step]
+        if not step_samples:
+            continue
+        times = [sample.ms for sample in step_samples]
+        queries = [sample.queries for sample in step_samples if sample.queries is not None]
+        steps[step] = StepStats(
+            requests=len(step_samples),
+            errors=sum(1 for sample in step_samples if sample.error),
+            p50_ms=round(percentile(times, 50), 2),
+            p95_ms=round(percentile(times, 95), 2),
+            p99_ms=round(percentile(times, 99), 2),
+            max_ms=round(max(times), 2),
+            queries_per_request=round(sum(queries) / len(queries), 2) if queries else None,
+            max_queries=max(queries) if queries else None,
+        )
+
+    errors = {}
+    for sample in samples:
+        if sample.error:
+            errors[sample.error] = errors.get(sample.error, 0) + 1
+
+    completed = sum(1 for sample in samples if sample.step == 'thank_you' and not sample.error)
+    return LoadTestResult(
+        mode='http' if url else 'wsgi',
+        target=url or 'en proceso',
+        tenants=[catalog.schema_name for catalog in catalogs],
+        units=sum(len(catalog.units) for catalog in catalogs),
+        concurrency=concurrency,
+        journeys=journeys,
+        completed=completed,
+        failed=journeys - completed,
+        seconds=round(seconds, 3),
+        surveys_per_second=round(completed / seconds, 2) if seconds else 0.0,
+        requests_per_second=round(len(samples) / seconds, 2) if seconds else 0.0,
+        created_at=timezone.now().isoformat(),
+        steps=steps,
+        errors=errors,
+    )
+
+
+def _status_error(step: str, status: int) -> str:
+    """Mensaje de error de un paso según el status (0: sin respuesta del servidor)."""
+    return f'{step}: HTTP {status}' if status else f'{step}: sin respuesta del servidor'
+
+
+def _ip_address(number: int) -> str:
+    """IP privada 10.x.y.z a partir de un número (módulo 2^24)."""
+    number %= 1 << 24
+    return f'10.{number >> 16}.{(number >> 8) & 255}.{number & 255}'
+
+
+@contextmanager
+def _recaptcha_test_keys():
+    """
+    Valida el reCAPTCHA como lo hace Google con las claves de prueba de
+    django_recaptcha (siempre válido), sin salir a la red.
+    """
+    submit = recaptcha_client.submit
+    recaptcha_client.submit = _test_keys_submit
+    try:
+        yield
+    finally:
+        recaptcha_client.submit = submit
+
+
+def _test_keys_submit(**kwargs):
+    """Sustituto de django_recaptcha.client.submit: respuesta de las claves de prueba."""
+    return recaptcha_client.RecaptchaResponse(is_valid=True)
+
+
+class _WsgiTransport:
+    """Llama a la aplicación WSGI en el hilo actual y cuenta sus queries."""
+
+    def __init__(self, application):
+        self.application = application
+
+    def request(self, method, path, headers, body, ip) -> tuple[_Response, int]:
+        environ = {
+            'REQUEST_METHOD': method,
+            'PATH_INFO': path,
+            'QUERY_STRING': '',
+            'SERVER_NAME': headers['Host'],
+            'SERVER_PORT': '80',
+            'SERVER_PROTOCOL': 'HTTP/1.1',
+            'REMOTE_ADDR': ip,
+            'CONTENT_LENGTH': str(len(body)),
+            'wsgi.version': (1, 0),
+            'wsgi.url_scheme': 'http',
+            'wsgi.input': BytesIO(body),
+            'wsgi.errors': BytesIO(),
+            'wsgi.multithread': True,
+            'wsgi.multiprocess': False,
+            'wsgi.run_once': False,
+        }
+        for name, value in headers.items():
+            key = name.upper().replace('-', '_')
+            environ[key if key == 'CONTENT_TYPE' else f'HTTP_{key}'] = value
+
+        status_headers = []
+
+        def start_response(status, response_headers, exc_info=None):
+            status_headers[:] = [int(status.split()[0]), response_headers]
+
+        queries = [0]
+
+        def count_query(execute, sql, params, many, context):
+            queries[0] += 1
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(count_query):
+            result = self.application(environ, start_response)
+            try:
+                body = b''.join(result)
+            finally:
+                if hasattr(result, 'close'):
+                    result.close()
+        return _Response(status_headers[0], status_headers[1], body), queries[0]
+
+    def close(self):
+        pass
+
+
+class _HttpTransport:
+    """Envía las peticiones por HTTP a un servidor local (una conexión keep-alive por hilo)."""
+
+    def __init__(self, host: str, port: int):
+        self.connection = http.client.HTTPConnection(host, port, timeout=30)
+
+    def request(self, method, path, headers, body, ip) -> tuple[_Response, None]:
+        try:
+            self.connection.request(method, path, body=body or None, headers=headers)
+            response = self.connection.getresponse()
+            return _Response(response.status, response.getheaders(), response.read()), None
+        except (OSError, http.client.HTTPException):
+            # La siguiente petición abre una conexión nueva
+            self.connection.close()
+            return _Response(0, [], b''), None
+
+    def close(self):
+        self.connection.close()
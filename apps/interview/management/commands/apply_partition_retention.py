@@ -0,0 +1,75 @@
+"""
+Comando para desprender las particiones de envíos y respuestas fuera de la retención.
+
+Las particiones se desprenden de la tabla (el dashboard deja de verlas) y
+se conservan como ``archive_<partición>`` (las opciones de respuestas, en
+``archive_<partición>_selected_options``) para respaldarlas con
+``pg_dump -t``, o se eliminan con ``--drop``. Los términos de esas
+respuestas y el cubo del tenant se descartan.
+
+Uso:
+    python manage.py apply_partition_retention --keep-months 24 --dry-run
+    python manage.py apply_partition_retention --keep-months 24 --schema alianza
+    python manage.py apply_partition_retention --keep-months 36 --drop
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django_tenants.utils import get_public_schema_name, get_tenant_model, schema_context
+
+from apps.interview.partitions import detach_expired_partitions, get_expired_partitions
+
+
+class Command(BaseCommand):
+    help = (
+        'Desprende (archiva o elimina) las particiones mensuales de survey_submissions '
+        'y answers anteriores al período de retención.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--keep-months',
+            type=int,
+            required=True,
+            help='Meses a conservar, incluido el actual',
+        )
+        parser.add_argument(
+            '--schema',
+            action='append',
+            dest='schemas',
+            help='Schema del tenant (se puede repetir; default: todos)',
+        )
+        parser.add_argument(
+            '--drop',
+            action='store_true',
+            help='Eliminar las particiones en vez de archivarlas',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Solo listar las particiones que se desprenderían',
+        )
+
+    def handle(self, *args, **options):
+        if options['keep_months'] < 1:
+            raise CommandError('--keep-months debe ser al menos 1')
+
+        tenants = get_tenant_model().objects.exclude(schema_name=get_public_schema_name())
+
+        if options['schemas']:
+            tenants = tenants.filter(schema_name__in=options['schemas'])
+            missing = set(options['schemas']) - set(tenants.values_list('schema_name', flat=True))
+            if missing:
+                raise CommandError(f'Tenants no encontrados: {", ".join(sorted(missing))}')
+
+        for tenant in tenants.order_by('schema_name'):
+            with schema_context(tenant.schema_name):
+                if options['dry_run']:
+                    names = [partition.name for partition in get_expired_partitions(options['keep_months'])]
+                else:
+                    names = detach_expired_partitions(options['keep_months'], drop=options['drop'])
+
+            if not names:
+                self.stdout.write(f'  {tenant.schema_name}: sin particiones vencidas')
+                continue
+
+            action = 'se desprenderían' if options['dry_run'] else ('eliminadas' if options['drop'] else 'archivadas')
+            self.stdout.write(self.style.SUCCESS(f'✓ {tenant.schema_name}: {action} {", ".join(names)}'))
@@ -0,0 +1,48 @@
+"""
+Comando para rellenar route/unit en los registros históricos.
+
+Uso:
+    python manage.py backfill_denormalized_fields
+    python manage.py backfill_denormalized_fields --schema alianza --batch-size 10000
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django_tenants.utils import get_public_schema_name, get_tenant_model, schema_context
+
+from apps.interview.backfill import BACKFILL_BATCH_SIZE, backfill_denormalized_fields
+
+
+class Command(BaseCommand):
+    help = (
+        'Copia la ruta de la unidad a envíos y quejas, y la unidad y ruta '
+        'del envío a las respuestas que aún no las tienen.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--schema',
+            action='append',
+            dest='schemas',
+            help='Schema del tenant a rellenar (se puede repetir; default: todos)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=BACKFILL_BATCH_SIZE,
+            help=f'Filas por UPDATE (default: {BACKFILL_BATCH_SIZE})',
+        )
+
+    def handle(self, *args, **options):
+        tenants = get_tenant_model().objects.exclude(schema_name=get_public_schema_name())
+
+        if options['schemas']:
+            tenants = tenants.filter(schema_name__in=options['schemas'])
+            missing = set(options['schemas']) - set(tenants.values_list('schema_name', flat=True))
+            if missing:
+                raise CommandError(f'Tenants no encontrados: {", ".join(sorted(missing))}')
+
+        for tenant in tenants.order_by('schema_name'):
+            with schema_context(tenant.schema_name):
+                updated = backfill_denormalized_fields(options['batch_size'])
+
+            summary = ', '.join(f'{table}: {count}' for table, count in updated.items())
+            self.stdout.write(self.style.SUCCESS(f'✓ {tenant.schema_name}: {summary}'))
@@ -0,0 +1,51 @@
+"""
+Comando para crear por adelantado las particiones mensuales de envíos y respuestas.
+
+Uso:
+    python manage.py ensure_partitions
+    python manage.py ensure_partitions --schema alianza --months-ahead 6
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django_tenants.utils import get_public_schema_name, get_tenant_model, schema_context
+
+from apps.interview.partitions import DEFAULT_MONTHS_AHEAD, ensure_partitions
+
+
+class Command(BaseCommand):
+    help = (
+        'Crea las particiones de survey_submissions y answers del mes actual '
+        'y de los meses siguientes en cada tenant.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--schema',
+            action='append',
+            dest='schemas',
+            help='Schema del tenant (se puede repetir; default: todos)',
+        )
+        parser.add_argument(
+            '--months-ahead',
+            type=int,
+            default=DEFAULT_MONTHS_AHEAD,
+            help=f'Meses futuros a crear (default: {DEFAULT_MONTHS_AHEAD})',
+        )
+
+    def handle(self, *args, **options):
+        if options['months_ahead'] < 0:
+            raise CommandError('--months-ahead no puede ser negativo')
+
+        tenants = get_tenant_model().objects.exclude(schema_name=get_public_schema_name())
+
+        if options['schemas']:
+            tenants = tenants.filter(schema_name__in=options['schemas'])
+            missing = set(options['schemas']) - set(tenants.values_list('schema_name', flat=True))
+            if missing:
+                raise CommandError(f'Tenants no encontrados: {", ".join(sorted(missing))}')
+
+        for tenant in tenants.order_by('schema_name'):
+            with schema_context(tenant.schema_name):
+                created = ensure_partitions(options['months_ahead'])
+
+            summary = ', '.join(created) if created else 'sin particiones nuevas'
+            self.stdout.write(self.style.SUCCESS(f'✓ {tenant.schema_name}: {summary}'))
@@ -0,0 +1,127 @@
+"""
+Comando para generar envíos, respuestas y quejas sintéticos con COPY.
+
+COPY no dispara señales: al terminar se reconstruye la frecuencia de
+términos (TermCount) y se indexan las firmas de las quejas nuevas, como
+harían las señales al guardar (``--no-index`` lo omite).
+
+Uso:
+    python manage.py generate_synthetic_data --schema alianza --days 365 --per-unit-daily 40
+    python manage.py generate_synthetic_data --curves curvas.json --seed 7
+    python manage.py generate_synthetic_data --schema bench --no-index
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django_tenants.utils import get_public_schema_name, get_tenant_model, schema_context
+
+from apps.interview.synthetic import (
+    COPY_BATCH_SIZE,
+    DEFAULT_ANSWER_RATE,
+    DEFAULT_COMPLAINT_RATE,
+    DEFAULT_TEXT_RATE,
+    SyntheticDataError,
+    TrafficCurves,
+    generate_synthetic_data,
+)
+from apps.statistical_summary.services.dedup_service import index_pending_complaints
+from apps.statistical_summary.services.terms_service import rebuild_term_counts
+
+
+class Command(BaseCommand):
+    help = (
+        'Genera envíos, respuestas (todos los tipos de pregunta) y quejas sintéticos '
+        'con curvas de tráfico por día y hora, y los escribe con COPY en cada tenant.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--schema',
+            action='append',
+            dest='schemas',
+            help='Schema del tenant (se puede repetir; default: todos)',
+        )
+        parser.add_argument('--days', type=int, default=30, help='Días hacia atrás, incluido hoy (default: 30)')
+        parser.add_argument(
+            '--per-unit-daily',
+            type=float,
+            default=20,
+            help='Envíos promedio por unidad y día (default: 20)',
+        )
+        parser.add_argument('--curves', help='Archivo JSON con curvas de tráfico (hourly, weekday, units)')
+        parser.add_argument(
+            '--complaint-rate',
+            type=float,
+            default=DEFAULT_COMPLAINT_RATE,
+            help=f'Fracción de envíos con queja (default: {DEFAULT_COMPLAINT_RATE})',
+        )
+        parser.add_argument(
+            '--answer-rate',
+            type=float,
+            default=DEFAULT_ANSWER_RATE,
+            help=f'Fracción de preguntas de calificación u opción respondidas (default: {DEFAULT_ANSWER_RATE})',
+        )
+        parser.add_argument(
+            '--text-rate',
+            type=float,
+            default=DEFAULT_TEXT_RATE,
+            help=f'Fracción de preguntas de texto respondidas (default: {DEFAULT_TEXT_RATE})',
+        )
+        parser.add_argument('--seed', type=int, help='Semilla del generador (datos reproducibles)')
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=COPY_BATCH_SIZE,
+            help=f'Envíos por lote de COPY (default: {COPY_BATCH_SIZE})',
+        )
+        parser.add_argument(
+            '--no-index',
+            action='store_false',
+            dest='index',
+            help='No reconstruir TermCount ni indexar firmas de quejas (panel de términos y dedup incompletos)',
+        )
+
+    def handle(self, *args, **options):
+        if options['days'] < 1:
+            raise CommandError('--days debe ser al menos 1')
+
+        try:
+            curves = TrafficCurves.from_json(options['curves']) if options['curves'] else TrafficCurves()
+        except SyntheticDataError as exc:
+            raise CommandError(str(exc))
+
+        tenants = get_tenant_model().objects.exclude(schema_name=get_public_schema_name())
+
+        if options['schemas']:
+            tenants = tenants.filter(schema_name__in=options['schemas'])
+            missing = set(options['schemas']) - set(tenants.values_list('schema_name', flat=True))
+            if missing:
+                raise CommandError(f'Tenants no encontrados: {", ".join(sorted(missing))}')
+
+        for tenant in tenants.order_by('schema_name'):
+            with schema_context(tenant.schema_name):
+                try:
+                    result = generate_synthetic_data(
+                        days=options['days'],
+                        per_unit_daily=options['per_unit_daily'],
+                        curves=curves,
+                        complaint_rate=options['complaint_rate'],
+                        answer_rate=options['answer_rate'],
+                        text_rate=options['text_rate'],
+                        seed=options['seed'],
+                        batch_size=options['batch_size'],
+                    )
+                except SyntheticDataError as exc:
+                    self.stdout.write(self.style.WARNING(f'  {tenant.schema_name}: {exc}'))
+                    continue
+
+                summary = ', '.join(f'{table}: {count}' for table, count in result.rows.items())
+                self.stdout.write(self.style.SUCCESS(
+                    f'✓ {tenant.schema_name}: {summary} en {result.seconds:.1f} s '
+                    f'({result.rows_per_minute:,} filas/min)'
+                ))
+
+                if options['index']:
+                    terms = rebuild_term_counts()
+                    indexed = index_pending_complaints()
+                    self.stdout.write(self.style.SUCCESS(
+                        f'✓ {tenant.schema_name}: {terms} conteos de términos, {indexed} quejas indexadas'
+                    ))
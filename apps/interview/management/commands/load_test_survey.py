@@ -0,0 +1,132 @@
+"""
+Comando para medir cuántas encuestas por segundo sostiene la aplicación en
+el flujo público (formulario → envío → agradecimiento).
+
+Las encuestas y quejas enviadas se guardan en los tenants y no se borran
+al terminar: los tenants se indican siempre con --schema.
+
+Uso:
+    python manage.py load_test_survey --schema bench --journeys 2000 --concurrency 8
+    python manage.py load_test_survey --schema bench --schema bench2 --units-per-tenant 50
+    python manage.py load_test_survey --schema bench --url http://127.0.0.1:8000 --concurrency 32 --output loadtest.json
+"""
+import json
+from contextlib import nullcontext
+from dataclasses import asdict
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+from django_tenants.utils import get_public_schema_name, get_tenant_model
+
+from apps.interview.loadtest import (
+    DEFAULT_UNITS_PER_TENANT,
+    LoadTestError,
+    get_catalogs,
+    run_load_test,
+)
+from apps.interview.synthetic import DEFAULT_COMPLAINT_RATE
+
+# Caché en memoria del proceso para --local-cache (rate limit, sesiones de tenant)
+LOCAL_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+class Command(BaseCommand):
+    help = (
+        'Prueba de carga del flujo público de encuesta (survey_form → submit_survey → '
+        'thank_you) con pasajeros concurrentes en varios tenants y unidades; reporta '
+        'encuestas por segundo, percentiles de latencia y queries por petición. '
+        'Los envíos, respuestas y quejas generados se conservan en los tenants.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--schema',
+            action='append',
+            dest='schemas',
+            required=True,
+            help='Schema del tenant de prueba (se puede repetir; obligatorio)',
+        )
+        parser.add_argument('--journeys', type=int, default=500, help='Encuestas a enviar (default: 500)')
+        parser.add_argument('--concurrency', type=int, default=4, help='Pasajeros en paralelo (default: 4)')
+        parser.add_argument(
+            '--units-per-tenant',
+            type=int,
+            default=DEFAULT_UNITS_PER_TENANT,
+            help=f'Unidades por tenant (default: {DEFAULT_UNITS_PER_TENANT})',
+        )
+        parser.add_argument(
+            '--url',
+            help='URL de un servidor local (p. ej. http://127.0.0.1:8000); default: en proceso vía WSGI',
+        )
+        parser.add_argument(
+            '--complaint-rate',
+            type=float,
+            default=DEFAULT_COMPLAINT_RATE,
+            help=f'Fracción de envíos con queja (default: {DEFAULT_COMPLAINT_RATE})',
+        )
+        parser.add_argument('--seed', type=int, help='Semilla para elegir unidades y respuestas')
+        parser.add_argument(
+            '--local-cache',
+            action='store_true',
+            help='En proceso: usar caché en memoria en vez de Redis',
+        )
+        parser.add_argument('--output', help='Archivo JSON donde guardar el resultado')
+
+    def handle(self, *args, **options):
+        tenants = (
+            get_tenant_model().objects
+            .exclude(schema_name=get_public_schema_name())
+            .filter(schema_name__in=options['schemas'])
+        )
+        missing = set(options['schemas']) - set(tenants.values_list('schema_name', flat=True))
+        if missing:
+            raise CommandError(f'Tenants no encontrados: {", ".join(sorted(missing))}')
+
+        if options['local_cache'] and options['url']:
+            raise CommandError('--local-cache solo aplica en proceso (sin --url)')
+
+        try:
+            catalogs = get_catalogs(
+                list(tenants.order_by('schema_name').values_list('schema_name', flat=True)),
+                units_per_tenant=options['units_per_tenant'],
+            )
+            self.stdout.write(
+                f'{options["journeys"]} encuestas, {options["concurrency"]} en paralelo, '
+                f'{len(catalogs)} tenants, {sum(len(catalog.units) for catalog in catalogs)} unidades '
+                f'({options["url"] or "en proceso"})...'
+            )
+            with override_settings(CACHES=LOCAL_CACHES) if options['local_cache'] else nullcontext():
+                result = run_load_test(
+                    catalogs,
+                    journeys=options['journeys'],
+                    concurrency=options['concurrency'],
+                    url=options['url'],
+                    complaint_rate=options['complaint_rate'],
+                    seed=options['seed'],
+                )
+        except LoadTestError as exc:
+            raise CommandError(str(exc))
+
+        self.stdout.write(f'{"Paso":<16} {"peticiones":>10} {"errores":>8} {"p50 ms":>9} {"p95 ms":>9} '
+                          f'{"p99 ms":>9} {"max ms":>9} {"queries":>8}')
+        for step, stats in result.steps.items():
+            queries = '-' if stats.queries_per_request is None else f'{stats.queries_per_request:g}'
+            self.stdout.write(
+                f'{step:<16} {stats.requests:>10} {stats.errors:>8} {stats.p50_ms:>9.2f} {stats.p95_ms:>9.2f} '
+                f'{stats.p99_ms:>9.2f} {stats.max_ms:>9.2f} {queries:>8}'
+            )
+        for error, count in result.errors.items():
+            self.stdout.write(self.style.ERROR(f'✗ {error}: {count}'))
+
+        if options['output']:
+            output = Path(options['output'])
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_text(json.dumps(asdict(result), indent=2, ensure_ascii=False))
+
+        summary = (
+            f'{result.completed}/{result.journeys} encuestas en {result.seconds:.1f} s: '
+            f'{result.surveys_per_second:g} encuestas/s, {result.requests_per_second:g} peticiones/s'
+        )
+        self.stdout.write(self.style.SUCCESS(f'✓ {summary}') if not result.failed else self.style.WARNING(summary))
+
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-19 05:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0002_alter_complaint_created_at_alter_complaint_text'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='complaint',
+            name='submission',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='complaints', to='interview.surveysubmission', verbose_name='Envío de encuesta'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.7 on 2026-10-19 06:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0004_full_text_search'),
+        ('transport', '0002_alter_unit_internal_number'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='answer',
+            index=models.Index(fields=['created_at', 'id'], name='answers_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='complaint',
+            index=models.Index(fields=['created_at', 'id'], name='complaints_created_id_idx'),
+        ),
+    ]
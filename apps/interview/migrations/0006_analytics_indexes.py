@@ -0,0 +1,35 @@
+# Generated by Django 5.2.7 on 2026-10-19 06:37
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0005_created_id_indexes'),
+        ('transport', '0002_alter_unit_internal_number'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='answer',
+            index=models.Index(fields=['question', 'created_at'], name='answers_question_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='complaint',
+            index=models.Index(fields=['unit', 'submitted_at'], name='complaints_unit_submitted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='complaint',
+            index=django.contrib.postgres.indexes.BrinIndex(fields=['submitted_at'], name='complaints_submitted_brin'),
+        ),
+        migrations.AddIndex(
+            model_name='surveysubmission',
+            index=models.Index(fields=['unit', 'submitted_at'], name='submissions_unit_submitted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='surveysubmission',
+            index=django.contrib.postgres.indexes.BrinIndex(fields=['submitted_at'], name='submissions_submitted_brin'),
+        ),
+    ]
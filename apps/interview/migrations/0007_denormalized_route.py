@@ -0,0 +1,64 @@
+# Generated by Django 5.2.7 on 2026-10-19 06:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0006_analytics_indexes'),
+        ('transport', '0002_alter_unit_internal_number'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='answer',
+            name='answers_question_created_idx',
+        ),
+        migrations.AddField(
+            model_name='answer',
+            name='route',
+            field=models.ForeignKey(blank=True, db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='answers', to='transport.route', verbose_name='Ruta'),
+        ),
+        migrations.AddField(
+            model_name='answer',
+            name='submitted_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='Fecha de envío'),
+        ),
+        migrations.AddField(
+            model_name='answer',
+            name='unit',
+            field=models.ForeignKey(blank=True, db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='answers', to='transport.unit', verbose_name='Unidad'),
+        ),
+        migrations.AddField(
+            model_name='complaint',
+            name='route',
+            field=models.ForeignKey(blank=True, db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='complaints', to='transport.route', verbose_name='Ruta'),
+        ),
+        migrations.AddField(
+            model_name='surveysubmission',
+            name='route',
+            field=models.ForeignKey(blank=True, db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='submissions', to='transport.route', verbose_name='Ruta'),
+        ),
+        migrations.AddIndex(
+            model_name='answer',
+            index=models.Index(fields=['question', 'submitted_at'], name='answers_question_submitted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='answer',
+            index=models.Index(fields=['unit', 'question', 'submitted_at'], name='answers_unit_question_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='answer',
+            index=models.Index(fields=['route', 'question', 'submitted_at'], name='answers_route_question_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='complaint',
+            index=models.Index(fields=['route', 'submitted_at'], name='complaints_route_submitted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='surveysubmission',
+            index=models.Index(fields=['route', 'submitted_at'], name='submissions_route_time_idx'),
+        ),
+    ]
@@ -0,0 +1,121 @@
+# Generated by Django 5.2.7 on 2026-10-19 06:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from apps.interview import partitions
+
+
+# Respuestas anteriores a 0007 que el comando backfill_denormalized_fields
+# no alcanzó a rellenar: submitted_at pasa a NOT NULL (llave de partición)
+FILL_ANSWERS_SQL = """
+UPDATE survey_submissions s SET route_id = u.route_id
+FROM units u
+WHERE s.unit_id = u.id AND s.route_id IS NULL AND u.route_id IS NOT NULL;
+
+UPDATE answers a SET unit_id = s.unit_id, route_id = s.route_id, submitted_at = s.submitted_at
+FROM survey_submissions s
+WHERE a.submission_id = s.id AND a.submitted_at IS NULL;
+
+-- los UPDATE dejan eventos de FK diferidos pendientes, y con ellos
+-- PostgreSQL no permite los ALTER TABLE que siguen
+SET CONSTRAINTS ALL IMMEDIATE;
+"""
+
+
+def partition_by_month(apps, schema_editor):
+    """
+    Convierte survey_submissions y answers en tablas particionadas por mes.
+
+    Por cada tabla: se renombra la original, se crea la tabla particionada
+    con las mismas columnas, sus particiones (meses con datos, el actual y
+    los siguientes, más la DEFAULT), se copian las filas y se recrean la
+    llave primaria (id, submitted_at), los índices y las restricciones con
+    los nombres originales.
+    """
+    with schema_editor.connection.cursor() as cursor:
+        for table in partitions.PARTITIONED_TABLES:
+            _partition_table(cursor, table)
+
+
+def _partition_table(cursor, table):
+    original = f'{table}_unpartitioned'
+
+    # índices que no respaldan una restricción (la llave primaria se recrea aparte)
+    cursor.execute(
+        """
+        SELECT pg_get_indexdef(i.indexrelid) FROM pg_index i
+        WHERE i.indrelid = to_regclass(%s)
+          AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid AND c.conrelid = i.indrelid)
+        """,
+        [table],
+    )
+    indexes = [definition for definition, in cursor.fetchall()]
+
+    cursor.execute(
+        """
+        SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint
+        WHERE conrelid = to_regclass(%s) AND contype IN ('f', 'c')
+        """,
+        [table],
+    )
+    constraints = cursor.fetchall()
+
+    cursor.execute(f'ALTER TABLE "{table}" RENAME TO "{original}"')
+    cursor.execute(
+        f'CREATE TABLE "{table}" (LIKE "{original}" INCLUDING DEFAULTS INCLUDING GENERATED) '
+        f'PARTITION BY RANGE ({partitions.PARTITION_KEY})'
+    )
+    cursor.execute(f'CREATE TABLE "{table}_default" PARTITION OF "{table}" DEFAULT')
+
+    cursor.execute(f'SELECT min({partitions.PARTITION_KEY}) FROM "{original}"')
+    oldest = cursor.fetchone()[0]
+    month = partitions.month_start(oldest) if oldest else partitions.month_start()
+    last = partitions.add_months(partitions.month_start(), partitions.DEFAULT_MONTHS_AHEAD)
+    while month <= last:
+        partitions.create_month_partition(table, month)
+        month = partitions.add_months(month, 1)
+
+    columns = ', '.join(f'"{column}"' for column in partitions.insertable_columns(cursor, original))
+    cursor.execute(f'INSERT INTO "{table}" ({columns}) SELECT {columns} FROM "{original}"')
+    cursor.execute(f'DROP TABLE "{original}"')
+
+    cursor.execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "{table}_pkey" PRIMARY KEY (id, {partitions.PARTITION_KEY})')
+    for definition in indexes:
+        cursor.execute(definition)
+    for name, definition in constraints:
+        cursor.execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "{name}" {definition}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0007_denormalized_route'),
+    ]
+
+    operations = [
+        migrations.RunSQL(FILL_ANSWERS_SQL, migrations.RunSQL.noop),
+        migrations.AlterField(
+            model_name='answer',
+            name='submitted_at',
+            field=models.DateTimeField(editable=False, verbose_name='Fecha de envío'),
+        ),
+        # PostgreSQL solo permite FOREIGN KEY hacia una tabla particionada si
+        # incluye la llave de partición; las relaciones quedan solo en el ORM
+        migrations.AlterField(
+            model_name='answer',
+            name='selected_options',
+            field=models.ManyToManyField(blank=True, db_constraint=False, related_name='multi_answers', to='interview.questionoption', verbose_name='Opciones seleccionadas'),
+        ),
+        migrations.AlterField(
+            model_name='answer',
+            name='submission',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='answers', to='interview.surveysubmission', verbose_name='Envío de encuesta'),
+        ),
+        migrations.AlterField(
+            model_name='complaint',
+            name='submission',
+            field=models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='complaints', to='interview.surveysubmission', verbose_name='Envío de encuesta'),
+        ),
+        migrations.RunPython(partition_by_month),
+    ]
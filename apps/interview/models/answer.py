@@ -1,11 +1,17 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 import uuid
 from django.utils import timezone
 
+from ..search import search_vector
+
 
 class Answer(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    submission = models.ForeignKey('interview.SurveySubmission', on_delete=models.CASCADE, related_name='answers', verbose_name='Envío de encuesta')
+    # Sin FOREIGN KEY en la base: survey_submissions está particionada por mes
+    # y su llave primaria es (id, submitted_at). El CASCADE lo aplica el ORM.
+    submission = models.ForeignKey('interview.SurveySubmission', on_delete=models.CASCADE, db_constraint=False, related_name='answers', verbose_name='Envío de encuesta')
     question = models.ForeignKey('interview.Question', on_delete=models.CASCADE, related_name='answers', verbose_name='Pregunta')
     
     # Para QuestionType.TEXT
@@ -25,20 +31,52 @@ class Answer(models.Model):
     )
     
     # Para QuestionType.MULTI_CHOICE (Opciones múltiples)
+    # Sin FOREIGN KEY en la tabla intermedia: answers está particionada por mes
     selected_options = models.ManyToManyField(
         'interview.QuestionOption',
         blank=True,
+        db_constraint=False,
         related_name='multi_answers',
         verbose_name='Opciones seleccionadas'
     )
     
     created_at = models.DateTimeField(default=timezone.now, verbose_name='Fecha de creación')
+
+    # Copiados del envío al guardar, para filtrar por unidad, ruta y período sin joins
+    unit = models.ForeignKey('transport.Unit', null=True, blank=True, editable=False, db_index=False, on_delete=models.SET_NULL, related_name='answers', verbose_name='Unidad')
+    route = models.ForeignKey('transport.Route', null=True, blank=True, editable=False, db_index=False, on_delete=models.SET_NULL, related_name='answers', verbose_name='Ruta')
+    # Llave de partición de la tabla (particiones mensuales, ver apps.interview.partitions)
+    submitted_at = models.DateTimeField(editable=False, verbose_name='Fecha de envío')
+
+    # tsvector (español) de text_answer (solo preguntas TEXT lo llenan)
+    search_vector = models.GeneratedField(
+        expression=search_vector('text_answer'),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
     
 
     def __str__(self):
         return f'Answer {self.id} for Question {self.question.id}'
 
+    def save(self, *args, **kwargs):
+        if self._state.adding and self.submitted_at is None and self.submission_id is not None:
+            submission = self.submission
+            self.unit_id = submission.unit_id
+            self.route_id = submission.route_id
+            self.submitted_at = submission.submitted_at
+        super().save(*args, **kwargs)
+
     class Meta:
         db_table = 'answers'
         verbose_name = 'Respuesta'
         verbose_name_plural = 'Respuestas'
+        indexes = [
+            GinIndex(fields=['search_vector'], name='answers_search_gin'),
+            # paginación por cursor del admin (created_at, id)
+            models.Index(fields=['created_at', 'id'], name='answers_created_id_idx'),
+            # estadísticas por pregunta con filtro de período, unidad o ruta (question_repository)
+            models.Index(fields=['question', 'submitted_at'], name='answers_question_submitted_idx'),
+            models.Index(fields=['unit', 'question', 'submitted_at'], name='answers_unit_question_idx'),
+            models.Index(fields=['route', 'question', 'submitted_at'], name='answers_route_question_idx'),
+        ]
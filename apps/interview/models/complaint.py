@@ -1,22 +1,52 @@
+from django.contrib.postgres.indexes import BrinIndex, GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 import uuid
 from django.utils import timezone
 
+from ..search import search_vector
+
 
 class Complaint(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     unit = models.ForeignKey('transport.Unit', null=True, blank=True, on_delete=models.SET_NULL, related_name='complaints', verbose_name='Unidad')
     reason = models.ForeignKey('interview.ComplaintReason', null=True, blank=True, on_delete=models.SET_NULL, related_name='complaints', verbose_name='Motivo')
+    # Envío de encuesta en el que se capturó la queja (null para quejas históricas)
+    # Sin FOREIGN KEY en la base: survey_submissions está particionada por mes
+    submission = models.ForeignKey('interview.SurveySubmission', null=True, blank=True, on_delete=models.SET_NULL, db_constraint=False, related_name='complaints', verbose_name='Envío de encuesta')
     text = models.TextField(verbose_name='Texto')
     submitted_at = models.DateTimeField(default=timezone.now)
+    # Ruta de la unidad al momento de la queja (no cambia si la unidad se reasigna)
+    route = models.ForeignKey('transport.Route', null=True, blank=True, editable=False, db_index=False, on_delete=models.SET_NULL, related_name='complaints', verbose_name='Ruta')
     metadata = models.JSONField(null=True, blank=True)
     created_at = models.DateTimeField(default=timezone.now, editable=False, verbose_name='Fecha de envio')
+    # tsvector (español) de text, mantenido por PostgreSQL para búsqueda de texto completo
+    search_vector = models.GeneratedField(
+        expression=search_vector('text'),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     def __str__(self):
         # ✅ Cambiar 'unit.unit_number' por 'unit.transit_number'
         return f'Queja {self.id} - {self.unit.transit_number if self.unit else "-"}'
 
+    def save(self, *args, **kwargs):
+        if self._state.adding and self.route_id is None and self.unit_id is not None:
+            self.route_id = self.unit.route_id
+        super().save(*args, **kwargs)
+
     class Meta:
         db_table = 'complaints'
         verbose_name = 'Queja'
         verbose_name_plural = 'Quejas'
+        indexes = [
+            GinIndex(fields=['search_vector'], name='complaints_search_gin'),
+            # paginación por cursor del admin (created_at, id)
+            models.Index(fields=['created_at', 'id'], name='complaints_created_id_idx'),
+            # dashboard: rango de fechas por unidad o por ruta
+            models.Index(fields=['unit', 'submitted_at'], name='complaints_unit_submitted_idx'),
+            models.Index(fields=['route', 'submitted_at'], name='complaints_route_submitted_idx'),
+            # dashboard sin filtro de unidad: submitted_at crece con el orden de inserción
+            BrinIndex(fields=['submitted_at'], name='complaints_submitted_brin'),
+        ]
@@ -1,3 +1,4 @@
+from django.contrib.postgres.indexes import BrinIndex
 from django.db import models
 import uuid
 from django.utils import timezone
@@ -6,12 +7,27 @@ from django.utils import timezone
 class SurveySubmission(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     unit = models.ForeignKey('transport.Unit', on_delete=models.CASCADE, related_name='submissions', verbose_name='Unidad')
+    # Llave de partición de la tabla (particiones mensuales, ver apps.interview.partitions)
     submitted_at = models.DateTimeField(default=timezone.now)
+    # Ruta de la unidad al momento del envío (no cambia si la unidad se reasigna)
+    route = models.ForeignKey('transport.Route', null=True, blank=True, editable=False, db_index=False, on_delete=models.SET_NULL, related_name='submissions', verbose_name='Ruta')
 
     def __str__(self):
         return f'Submission {self.id} for Unit {self.unit.transit_number}'
 
+    def save(self, *args, **kwargs):
+        if self._state.adding and self.route_id is None and self.unit_id is not None:
+            self.route_id = self.unit.route_id
+        super().save(*args, **kwargs)
+
     class Meta:
         db_table = 'survey_submissions'
         verbose_name = 'Envío de encuesta'
         verbose_name_plural = 'Envíos de encuestas'
+        indexes = [
+            # dashboard: rango de fechas por unidad o por ruta
+            models.Index(fields=['unit', 'submitted_at'], name='submissions_unit_submitted_idx'),
+            models.Index(fields=['route', 'submitted_at'], name='submissions_route_time_idx'),
+            # dashboard y página de agradecimiento: submitted_at crece con el orden de inserción
+            BrinIndex(fields=['submitted_at'], name='submissions_submitted_brin'),
+        ]
@@ -0,0 +1,340 @@
+"""
+Particiones mensuales de ``survey_submissions`` y ``answers``.
+
+Ambas tablas están particionadas por rango de ``submitted_at`` (migración
+0008), con una partición por mes local (America/Mazatlan, los mismos meses
+del dashboard y de los snapshots) y una partición DEFAULT que recibe las
+filas de meses sin partición propia.
+
+- ``ensure_partitions`` crea por adelantado las particiones de los meses
+  siguientes (comando ``ensure_partitions``; la fase release de
+  ``start_db.py`` lo ejecuta en cada despliegue).
+- ``detach_expired_partitions`` desprende las particiones más antiguas que
+  el período de retención (comando ``apply_partition_retention``): se
+  conservan como tablas sueltas ``archive_<partición>`` o se eliminan, en
+  vez de borrar millones de filas con DELETE. Como no hay señales por
+  fila, se envía ``partition_detached`` para que statistical_summary
+  descuente sus agregados.
+
+Las funciones operan sobre el schema actual (``schema_context`` del tenant).
+"""
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+from django.db import connection, transaction
+from django.dispatch import Signal
+from django.utils import timezone
+
+# Tablas particionadas por mes; survey_submissions primero (answers depende de ella)
+PARTITIONED_TABLES = ('survey_submissions', 'answers')
+
+# Columna de partición de ambas tablas
+PARTITION_KEY = 'submitted_at'
+
+# Zona horaria de los límites de mes (la del dashboard)
+PARTITION_TIMEZONE = ZoneInfo('America/Mazatlan')
+
+# Meses futuros que se crean por adelantado
+DEFAULT_MONTHS_AHEAD = 3
+
+# Prefijo de las particiones desprendidas por la retención
+ARCHIVE_PREFIX = 'archive_'
+
+# Opciones de respuestas MULTI_CHOICE (sin FOREIGN KEY hacia answers, ver 0008)
+SELECTED_OPTIONS_TABLE = 'answers_selected_options'
+
+PARTITION_NAME_RE = re.compile(
+    rf'^(?:{ARCHIVE_PREFIX})?(?P<table>{"|".join(PARTITIONED_TABLES)})_'
+    r'(?:p(?P<year>\d{4})_(?P<month>\d{2})|default)'
+    # opciones archivadas junto con una partición de answers
+    r'(?:_selected_options)?$'
+)
+
+# Se envía tras desprender una partición (argumento ``partition``)
+partition_detached = Signal()
+
+
+@dataclass(frozen=True)
+class MonthPartition:
+    """Partición mensual de una tabla."""
+    table: str
+    name: str
+    month: date
+
+    @property
+    def bounds(self) -> tuple[datetime, datetime]:
+        return month_bounds(self.month)
+
+
+def month_start(value: datetime | None = None) -> date:
+    """
+    Primer día del mes local de ``value`` (default: ahora).
+
+    Example:
+        >>> month_start(datetime(2025, 3, 1, 5, 0, tzinfo=UTC))
+        datetime.date(2025, 2, 1)
+    """
+    value = timezone.localtime(value or timezone.now(), PARTITION_TIMEZONE)
+    return value.date().replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    """Suma (o resta) meses a un primer día de mes."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_bounds(month: date) -> tuple[datetime, datetime]:
+    """Inicio (incluido) y fin (excluido) del mes local."""
+    next_month = add_months(month, 1)
+    return (
+        datetime(month.year, month.month, 1, tzinfo=PARTITION_TIMEZONE),
+        datetime(next_month.year, next_month.month, 1, tzinfo=PARTITION_TIMEZONE),
+    )
+
+
+def partition_name(table: str, month: date) -> str:
+    """
+    Nombre de la partición mensual.
+
+    Example:
+        >>> partition_name('answers', date(2025, 3, 1))
+        'answers_p2025_03'
+    """
+    return f'{table}_p{month.year:04d}_{month.month:02d}'
+
+
+def is_partition_table(name: str) -> bool:
+    """Indica si ``name`` es una partición (o una partición archivada) de las tablas de hechos."""
+    return PARTITION_NAME_RE.match(name) is not None
+
+
+def get_partitions(table: str) -> list[MonthPartition]:
+    """
+    Particiones mensuales adjuntas a ``table`` (sin la DEFAULT), por mes.
+
+    Args:
+        table: Una de PARTITIONED_TABLES
+
+    Returns:
+        Lista de MonthPartition ordenada por mes
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname
+            FROM pg_inherits inh
+            JOIN pg_class child ON child.oid = inh.inhrelid
+            WHERE inh.inhparent = to_regclass(%s)
+            """,
+            [table],
+        )
+        names = [name for name, in cursor.fetchall()]
+
+    partitions = []
+    for name in names:
+        match = PARTITION_NAME_RE.match(name)
+        if match and match['year']:
+            partitions.append(MonthPartition(table, name, date(int(match['year']), int(match['month']), 1)))
+    return sorted(partitions, key=lambda partition: partition.month)
+
+
+def create_month_partition(table: str, month: date) -> bool:
+    """
+    Crea la partición de ``month`` si no existe.
+
+    Si la partición DEFAULT ya tiene filas de ese mes, se desprende, se crea
+    la partición, se mueven las filas y se vuelve a adjuntar (PostgreSQL no
+    permite crear la partición mientras la DEFAULT tenga filas de su rango).
+
+    Returns:
+        True si se creó la partición
+    """
+    name = partition_name(table, month)
+    if any(partition.name == name for partition in get_partitions(table)):
+        return False
+
+    start, end = month_bounds(month)
+    default = f'{table}_default'
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f'SELECT EXISTS (SELECT 1 FROM "{default}" WHERE {PARTITION_KEY} >= %s AND {PARTITION_KEY} < %s)',
+            [start, end],
+        )
+        if not cursor.fetchone()[0]:
+            cursor.execute(
+                f'CREATE TABLE "{name}" PARTITION OF "{table}" FOR VALUES FROM (%s) TO (%s)',
+                [start, end],
+            )
+            return True
+
+        columns = ', '.join(f'"{column}"' for column in insertable_columns(cursor, table))
+        cursor.execute(f'ALTER TABLE "{table}" DETACH PARTITION "{default}"')
+        cursor.execute(
+            f'CREATE TABLE "{name}" PARTITION OF "{table}" FOR VALUES FROM (%s) TO (%s)',
+            [start, end],
+        )
+        cursor.execute(
+            f'INSERT INTO "{name}" ({columns}) SELECT {columns} FROM "{default}" '
+            f'WHERE {PARTITION_KEY} >= %s AND {PARTITION_KEY} < %s',
+            [start, end],
+        )
+        cursor.execute(
+            f'DELETE FROM "{default}" WHERE {PARTITION_KEY} >= %s AND {PARTITION_KEY} < %s',
+            [start, end],
+        )
+        cursor.execute(f'ALTER TABLE "{table}" ATTACH PARTITION "{default}" DEFAULT')
+    return True
+
+
+def ensure_partitions(months_ahead: int = DEFAULT_MONTHS_AHEAD, now: datetime | None = None) -> list[str]:
+    """
+    Crea las particiones del mes actual y de los ``months_ahead`` siguientes.
+
+    Args:
+        months_ahead: Meses futuros a crear
+        now: Fecha de referencia (default: ahora)
+
+    Returns:
+        Nombres de las particiones creadas
+
+    Example:
+        >>> ensure_partitions(months_ahead=2)
+        ['survey_submissions_p2025_05', 'answers_p2025_05']
+    """
+    current = month_start(now)
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        for table in PARTITIONED_TABLES:
+            if create_month_partition(table, month):
+                created.append(partition_name(table, month))
+    return created
+
+
+def ensure_partitions_between(start: datetime, end: datetime) -> list[str]:
+    """
+    Crea las particiones de los meses entre ``start`` y ``end`` (incluidos).
+
+    Para cargas de datos históricos: sin ellas las filas caen en la DEFAULT.
+
+    Returns:
+        Nombres de las particiones creadas
+    """
+    month, last = month_start(start), month_start(end)
+    created = []
+    while month <= last:
+        for table in PARTITIONED_TABLES:
+            if create_month_partition(table, month):
+                created.append(partition_name(table, month))
+        month = add_months(month, 1)
+    return created
+
+
+def get_expired_partitions(keep_months: int, now: datetime | None = None) -> list[MonthPartition]:
+    """
+    Particiones de meses fuera del período de retención.
+
+    Se conservan el mes actual y los ``keep_months - 1`` anteriores.
+
+    Args:
+        keep_months: Meses a conservar (mínimo 1)
+        now: Fecha de referencia (default: ahora)
+
+    Returns:
+        Particiones a desprender, de ambas tablas, por mes
+    """
+    if keep_months < 1:
+        raise ValueError('keep_months debe ser al menos 1')
+
+    cutoff = add_months(month_start(now), -(keep_months - 1))
+    expired = [
+        partition
+        for table in PARTITIONED_TABLES
+        for partition in get_partitions(table)
+        if partition.month < cutoff
+    ]
+    return sorted(expired, key=lambda partition: partition.month)
+
+
+def detach_partition(partition: MonthPartition, drop: bool = False) -> str | None:
+    """
+    Desprende una partición de su tabla.
+
+    Las opciones seleccionadas de las respuestas desprendidas se quitan de
+    answers_selected_options (se archivan en
+    ``archive_<partición>_selected_options`` salvo con ``drop``). Al
+    terminar se envía ``partition_detached``.
+
+    Args:
+        partition: Partición a desprender
+        drop: Eliminar la tabla en vez de archivarla
+
+    Returns:
+        Nombre de la tabla archivada, o None si se eliminó
+    """
+    archive_name = None if drop else f'{ARCHIVE_PREFIX}{partition.name}'
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f'ALTER TABLE "{partition.table}" DETACH PARTITION "{partition.name}"')
+        if partition.table == 'answers':
+            _remove_selected_options(cursor, partition.name, archive_name and f'{archive_name}_selected_options')
+
+        if drop:
+            cursor.execute(f'DROP TABLE "{partition.name}"')
+        else:
+            cursor.execute(f'ALTER TABLE "{partition.name}" RENAME TO "{archive_name}"')
+
+    partition_detached.send(sender=MonthPartition, partition=partition)
+    return archive_name
+
+
+def detach_expired_partitions(keep_months: int, drop: bool = False, now: datetime | None = None) -> list[str]:
+    """
+    Desprende (y archiva o elimina) las particiones fuera de la retención.
+
+    Las filas de answers se desprenden junto con las de su envío (mismo mes)
+    y sus opciones múltiples se archivan con ellas. Las quejas que apuntan
+    a esos envíos se conservan en su tabla.
+
+    Args:
+        keep_months: Meses a conservar, incluido el actual
+        drop: Eliminar las particiones en vez de archivarlas
+        now: Fecha de referencia (default: ahora)
+
+    Returns:
+        Nombres de las particiones desprendidas
+
+    Example:
+        >>> detach_expired_partitions(keep_months=24)
+        ['survey_submissions_p2023_01', 'answers_p2023_01']
+    """
+    detached = []
+    for partition in get_expired_partitions(keep_months, now):
+        detach_partition(partition, drop=drop)
+        detached.append(partition.name)
+    return detached
+
+
+def _remove_selected_options(cursor, answers_table: str, archive_name: str | None) -> None:
+    """Quita (y archiva en ``archive_name``) las opciones de las respuestas de ``answers_table``."""
+    selected = f'answer_id IN (SELECT id FROM "{answers_table}")'
+    if archive_name:
+        cursor.execute(f'CREATE TABLE "{archive_name}" AS SELECT * FROM "{SELECTED_OPTIONS_TABLE}" WHERE {selected}')
+    cursor.execute(f'DELETE FROM "{SELECTED_OPTIONS_TABLE}" WHERE {selected}')
+
+
+def insertable_columns(cursor, table: str) -> list[str]:
+    """Columnas de ``table`` que admiten INSERT (sin las generadas), en orden."""
+    cursor.execute(
+        """
+        SELECT attname FROM pg_attribute
+        WHERE attrelid = to_regclass(%s) AND attnum > 0 AND NOT attisdropped AND attgenerated = ''
+        ORDER BY attnum
+        """,
+        [table],
+    )
+    return [name for name, in cursor.fetchall()]
@@ -0,0 +1,32 @@
+"""
+Búsqueda de texto completo (PostgreSQL) sobre quejas y respuestas de texto.
+
+``Complaint.search_vector`` y ``Answer.search_vector`` son columnas
+generadas (``tsvector`` almacenado) con índice GIN en cada schema de
+tenant, por lo que la búsqueda no recorre la tabla completa.
+"""
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import F
+
+# Configuración de diccionario: stemming en español ("frenos" ~ "freno")
+SEARCH_CONFIG = 'spanish'
+
+
+def search_vector(field_name: str) -> SearchVector:
+    """Expresión ``to_tsvector`` usada por las columnas generadas."""
+    return SearchVector(field_name, config=SEARCH_CONFIG)
+
+
+def build_search_query(text: str) -> SearchQuery:
+    """
+    Convierte el texto del usuario en un ``tsquery``.
+
+    Usa la sintaxis de buscador web: palabras sueltas (AND), ``"frase exacta"``,
+    ``or`` y ``-exclusión``; nunca falla por sintaxis inválida.
+    """
+    return SearchQuery(text, config=SEARCH_CONFIG, search_type='websearch')
+
+
+def search_rank(query: SearchQuery) -> SearchRank:
+    """Relevancia de cada fila para el ``tsquery`` dado."""
+    return SearchRank(F('search_vector'), query)
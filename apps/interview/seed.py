@@ -0,0 +1,160 @@
+"""
+Catálogo inicial de cada tenant: preguntas de encuesta y motivos de queja.
+
+Lo usan ``populate_db.py`` y ``prepare_tenant_template`` (que lo carga en
+el schema plantilla para que cada tenant clonado nazca con él).
+"""
+import copy
+
+from django.db import transaction
+
+from .models import ComplaintReason, Question, QuestionOption
+
+DEFAULT_QUESTIONS = [
+    # Preguntas tipo RATING
+    {
+        'text': '¿Qué tan satisfecho estás con el servicio de transporte?',
+        'type': Question.QuestionType.RATING,
+        'position': 1,
+        'options': []
+    },
+    {
+        'text': '¿Cómo calificarías la limpieza de la unidad?',
+        'type': Question.QuestionType.RATING,
+        'position': 2,
+        'options': []
+    },
+    {
+        'text': '¿Qué tan puntual fue el servicio?',
+        'type': Question.QuestionType.RATING,
+        'position': 3,
+        'options': []
+    },
+    {
+        'text': '¿Cómo calificarías la conducción del operador?',
+        'type': Question.QuestionType.RATING,
+        'position': 4,
+        'options': []
+    },
+
+    # Preguntas tipo CHOICE
+    {
+        'text': '¿Con qué frecuencia utilizas este servicio?',
+        'type': Question.QuestionType.CHOICE,
+        'position': 5,
+        'options': [
+            {'text': 'Diariamente', 'position': 1},
+            {'text': '3-4 veces por semana', 'position': 2},
+            {'text': '1-2 veces por semana', 'position': 3},
+            {'text': 'Ocasionalmente', 'position': 4},
+            {'text': 'Primera vez', 'position': 5},
+        ]
+    },
+    {
+        'text': '¿Cuál es el principal motivo de tu viaje?',
+        'type': Question.QuestionType.CHOICE,
+        'position': 6,
+        'options': [
+            {'text': 'Trabajo', 'position': 1},
+            {'text': 'Escuela', 'position': 2},
+            {'text': 'Compras', 'position': 3},
+            {'text': 'Entretenimiento', 'position': 4},
+            {'text': 'Salud', 'position': 5},
+            {'text': 'Otro', 'position': 6},
+        ]
+    },
+
+    # Preguntas tipo MULTI_CHOICE
+    {
+        'text': '¿Qué aspectos del servicio consideras más importantes? (Selecciona todos los que apliquen)',
+        'type': Question.QuestionType.MULTI_CHOICE,
+        'position': 7,
+        'options': [
+            {'text': 'Puntualidad', 'position': 1},
+            {'text': 'Limpieza', 'position': 2},
+            {'text': 'Seguridad', 'position': 3},
+            {'text': 'Amabilidad del conductor', 'position': 4},
+            {'text': 'Precio', 'position': 5},
+            {'text': 'Comodidad', 'position': 6},
+        ]
+    },
+    {
+        'text': '¿Qué mejoras te gustaría ver en el servicio? (Selecciona todas las que apliquen)',
+        'type': Question.QuestionType.MULTI_CHOICE,
+        'position': 8,
+        'options': [
+            {'text': 'Más frecuencia de unidades', 'position': 1},
+            {'text': 'Aire acondicionado', 'position': 2},
+            {'text': 'WiFi gratuito', 'position': 3},
+            {'text': 'Puertos USB para cargar dispositivos', 'position': 4},
+            {'text': 'Mejor iluminación', 'position': 5},
+            {'text': 'Mejor ventilación', 'position': 6},
+            {'text': 'Más limpieza', 'position': 7},
+        ]
+    },
+
+    # Pregunta tipo TEXT
+    {
+        'text': '¿Tienes algún comentario o sugerencia adicional?',
+        'type': Question.QuestionType.TEXT,
+        'position': 9,
+        'options': []
+    },
+]
+
+DEFAULT_COMPLAINT_REASONS = [
+    'Mal trato del operador',
+    'Conducción peligrosa o imprudente',
+    'Unidad en malas condiciones',
+    'Unidad sucia',
+    'Retraso excesivo',
+    'No respetó paradas',
+    'Operador hablando por teléfono',
+    'Música a volumen muy alto',
+    'Exceso de velocidad',
+    'Cobro incorrecto',
+    'No dio cambio',
+    'Asientos rotos o dañados',
+    'Mal olor en la unidad',
+    'Acoso o comportamiento inapropiado',
+    'Otro',
+]
+
+
+def seed_default_catalog() -> tuple[int, int]:
+    """
+    Crea en el schema actual las preguntas y motivos que falten.
+
+    Es idempotente: las preguntas se identifican por texto y los motivos
+    por etiqueta.
+
+    Returns:
+        Tupla (preguntas_creadas, motivos_creados)
+
+    Example:
+        >>> with schema_context('tenant_template'):
+        ...     seed_default_catalog()
+        (9, 15)
+    """
+    questions_created = 0
+    reasons_created = 0
+
+    with transaction.atomic():
+        existing_questions = set(Question.objects.values_list('text', flat=True))
+        for question_data in copy.deepcopy(DEFAULT_QUESTIONS):
+            if question_data['text'] in existing_questions:
+                continue
+
+            options_data = question_data.pop('options')
+            question = Question.objects.create(**question_data)
+            QuestionOption.objects.bulk_create(
+                QuestionOption(question=question, **option_data) for option_data in options_data
+            )
+            questions_created += 1
+
+        existing_reasons = set(ComplaintReason.objects.values_list('label', flat=True))
+        missing_reasons = [label for label in DEFAULT_COMPLAINT_REASONS if label not in existing_reasons]
+        ComplaintReason.objects.bulk_create(ComplaintReason(label=label) for label in missing_reasons)
+        reasons_created = len(missing_reasons)
+
+    return questions_created, reasons_created
@@ -0,0 +1,13 @@
+"""
+Señales de interview.
+
+Las escrituras masivas de hechos (COPY del generador sintético, UPDATE por
+lotes del relleno de campos desnormalizados) no disparan señales por fila:
+al terminar envían ``facts_bulk_written`` para que statistical_summary
+actualice sus agregados.
+"""
+from django.dispatch import Signal
+
+# Se envía tras escribir envíos, respuestas o quejas en bloque
+# (argumento ``rows``: diccionario {tabla: filas escritas})
+facts_bulk_written = Signal()
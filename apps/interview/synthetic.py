@@ -0,0 +1,393 @@
+"""
+Generador de datos sintéticos de encuestas con ``COPY``.
+
+Genera envíos, respuestas (de todos los tipos de pregunta, incluidas las
+filas intermedias de opción múltiple) y quejas para las unidades del
+tenant actual, siguiendo curvas de tráfico por día de la semana y por hora
+(globales o por unidad), y los escribe con ``COPY ... FROM STDIN`` por
+lotes: sin ``save()``, sin señales y sin un INSERT por fila.
+
+Los campos desnormalizados (ruta, unidad y fecha de envío en respuestas,
+ruta en envíos y quejas) se escriben igual que al guardar los modelos, y
+antes de escribir se crean las particiones mensuales del rango. Al
+terminar se envía ``facts_bulk_written`` (las filas tienen fechas pasadas
+que las cargas incrementales por fecha no verían).
+
+Curvas en JSON (``--curves``)::
+
+    {
+        "hourly": [24 pesos, hora local 0-23],
+        "weekday": [7 pesos, lunes a domingo],
+        "units": {"ABC001": {"factor": 2.5, "hourly": [...], "weekday": [...]}}
+    }
+"""
+import io
+import json
+import math
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from itertools import accumulate
+from pathlib import Path
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.transport.models import Unit
+
+from . import partitions
+from .models import Answer, Complaint, ComplaintReason, Question, SurveySubmission
+from .signals import facts_bulk_written
+
+# Envíos por lote de COPY (cada envío arrastra sus respuestas y quejas)
+COPY_BATCH_SIZE = 20_000
+
+# Fracciones por defecto: envíos con queja y preguntas respondidas
+DEFAULT_COMPLAINT_RATE = 0.08
+DEFAULT_ANSWER_RATE = 0.95
+DEFAULT_TEXT_RATE = 0.3
+
+# Pesos por hora local: picos de entrada y salida de trabajo/escuela
+DEFAULT_HOURLY_CURVE = (
+    0.1, 0.05, 0.05, 0.05, 0.2, 0.6, 1.5, 2.6, 2.4, 1.4, 1.0, 1.0,
+    1.2, 1.4, 1.3, 1.2, 1.5, 2.2, 2.5, 1.8, 1.1, 0.7, 0.4, 0.2,
+)
+
+# Pesos por día de la semana (lunes a domingo)
+DEFAULT_WEEKDAY_CURVE = (1.0, 1.0, 1.0, 1.0, 1.05, 0.75, 0.5)
+
+# Textos de ejemplo (también los usa la prueba de carga)
+TEXT_ANSWERS = (
+    'Muy buen servicio',
+    'El chofer manejaba muy rápido',
+    'La unidad estaba limpia',
+    'Tardó mucho en pasar',
+    'Todo bien, gracias',
+    'El aire acondicionado no servía',
+    'Deberían pasar más seguido en la tarde',
+)
+
+COMPLAINT_TEXTS = (
+    'El chofer no respetó la parada',
+    'La unidad iba sobrecupo',
+    'No me dieron cambio',
+    'El aire acondicionado no funcionaba',
+    'Manejo imprudente en el bulevar',
+    '',
+)
+
+_NULL = '\\N'
+
+
+class SyntheticDataError(Exception):
+    """Curvas inválidas o tenant sin unidades o preguntas."""
+
+
+@dataclass
+class TrafficCurves:
+    """Curvas de tráfico: pesos por hora y día de la semana, con ajustes por unidad."""
+    hourly: tuple[float, ...] = DEFAULT_HOURLY_CURVE
+    weekday: tuple[float, ...] = DEFAULT_WEEKDAY_CURVE
+    # {transit_number: {"factor": float, "hourly": [...], "weekday": [...]}}
+    units: dict[str, dict] = field(default_factory=dict)
+    # Dispersión (sigma lognormal) del volumen de las unidades sin factor propio
+    unit_skew: float = 0.5
+
+    def __post_init__(self):
+        _check_curve(self.hourly, 24, 'hourly')
+        _check_curve(self.weekday, 7, 'weekday')
+        for transit_number, overrides in self.units.items():
+            if 'hourly' in overrides:
+                _check_curve(overrides['hourly'], 24, f'units.{transit_number}.hourly')
+            if 'weekday' in overrides:
+                _check_curve(overrides['weekday'], 7, f'units.{transit_number}.weekday')
+            if overrides.get('factor', 1) < 0:
+                raise SyntheticDataError(f'units.{transit_number}.factor no puede ser negativo')
+
+    @classmethod
+    def from_json(cls, path: Path) -> 'TrafficCurves':
+        """
+        Carga las curvas de un archivo JSON (claves opcionales: hourly, weekday, units, unit_skew).
+
+        Raises:
+            SyntheticDataError: Si el archivo no se puede leer o las curvas son inválidas
+        """
+        try:
+            data = json.loads(Path(path).read_text())
+        except (OSError, ValueError) as exc:
+            raise SyntheticDataError(f'No se pudieron leer las curvas de {path}: {exc}')
+
+        unknown = set(data) - {'hourly', 'weekday', 'units', 'unit_skew'}
+        if unknown:
+            raise SyntheticDataError(f'Claves desconocidas en las curvas: {", ".join(sorted(unknown))}')
+        return cls(
+            hourly=tuple(data.get('hourly', DEFAULT_HOURLY_CURVE)),
+            weekday=tuple(data.get('weekday', DEFAULT_WEEKDAY_CURVE)),
+            units=data.get('units', {}),
+            unit_skew=data.get('unit_skew', 0.5),
+        )
+
+
+@dataclass
+class GenerationResult:
+    """Filas escritas por tabla y duración de la generación."""
+    rows: dict[str, int]
+    seconds: float
+
+    @property
+    def rows_per_minute(self) -> int:
+        return int(sum(self.rows.values()) / self.seconds * 60) if self.seconds else 0
+
+
+def generate_synthetic_data(
+    days: int = 30,
+    per_unit_daily: float = 20,
+    curves: TrafficCurves | None = None,
+    complaint_rate: float = DEFAULT_COMPLAINT_RATE,
+    answer_rate: float = DEFAULT_ANSWER_RATE,
+    text_rate: float = DEFAULT_TEXT_RATE,
+    units: list[Unit] | None = None,
+    end: datetime | None = None,
+    seed: int | None = None,
+    batch_size: int = COPY_BATCH_SIZE,
+) -> GenerationResult:
+    """
+    Genera y escribe con COPY los datos sintéticos del tenant actual.
+
+    Cada unidad recibe por día un número de envíos con distribución de
+    Poisson de media ``per_unit_daily × peso del día × factor de la unidad``,
+    repartidos en las horas según la curva horaria. Cada unidad tiene
+    además su propio nivel de calificación, para que los promedios por
+    ruta y unidad no sean todos iguales.
+
+    Args:
+        days: Días locales a generar, terminando en el día de ``end``
+        per_unit_daily: Envíos promedio por unidad y día
+        curves: Curvas de tráfico (default: TrafficCurves())
+        complaint_rate: Fracción de envíos con queja
+        answer_rate: Fracción de preguntas de calificación u opción respondidas
+        text_rate: Fracción de preguntas de texto respondidas
+        units: Unidades a usar (default: todas las del tenant)
+        end: Fin del rango (default: ahora); no se generan envíos posteriores
+        seed: Semilla del generador (datos reproducibles)
+        batch_size: Envíos por lote de COPY
+
+    Returns:
+        GenerationResult con las filas escritas por tabla
+
+    Raises:
+        SyntheticDataError: Si no hay unidades o preguntas activas
+
+    Example:
+        >>> result = generate_synthetic_data(days=365, per_unit_daily=40)
+        >>> result.rows
+        {'survey_submissions': 730512, 'answers': 6210334, 'answers_selected_options': 1402211, 'complaints': 58440}
+    """
+    curves = curves or TrafficCurves()
+    end = end or timezone.now()
+    rng = random.Random(seed)
+
+    units = list(units) if units is not None else list(Unit.objects.all())
+    if not units:
+        raise SyntheticDataError('El tenant no tiene unidades')
+    questions = list(Question.objects.filter(active=True).prefetch_related('options').order_by('position'))
+    if not questions:
+        raise SyntheticDataError('El tenant no tiene preguntas activas')
+
+    last_day = timezone.localtime(end, partitions.PARTITION_TIMEZONE).date()
+    first_day = last_day - timedelta(days=days - 1)
+    partitions.ensure_partitions_between(_local_midnight(first_day), end)
+
+    writer = _CopyWriter(
+        rng=rng,
+        questions=[_QuestionProfile(question, rng) for question in questions],
+        reasons=list(ComplaintReason.objects.values_list('id', flat=True)),
+        complaint_rate=complaint_rate,
+        answer_rate=answer_rate,
+        text_rate=text_rate,
+    )
+    profiles = [_UnitProfile(unit, curves, factor, rng) for unit, factor in zip(units, _unit_factors(units, curves, rng))]
+
+    started = time.perf_counter()
+    for offset in range(days):
+        day = first_day + timedelta(days=offset)
+        midnight = _local_midnight(day)
+
+        moments = []
+        for profile in profiles:
+            for _ in range(_poisson(rng, per_unit_daily * profile.weekday[day.weekday()])):
+                hour = rng.choices(range(24), cum_weights=profile.hourly_cum)[0]
+                submitted_at = midnight + timedelta(hours=hour, seconds=rng.random() * 3600)
+                if submitted_at <= end:
+                    moments.append((submitted_at, profile))
+
+        # en orden de tiempo, como llegan en producción (índices BRIN)
+        moments.sort(key=lambda moment: moment[0])
+        for submitted_at, profile in moments:
+            writer.add_submission(profile, submitted_at)
+        if writer.pending >= batch_size:
+            writer.flush()
+    writer.flush()
+    facts_bulk_written.send(sender=SurveySubmission, rows=writer.rows)
+
+    return GenerationResult(rows=writer.rows, seconds=time.perf_counter() - started)
+
+
+def _check_curve(values, length: int, name: str) -> None:
+    if len(values) != length or any(value < 0 for value in values) or not any(values):
+        raise SyntheticDataError(f'La curva {name} debe tener {length} pesos no negativos (al menos uno positivo)')
+
+
+def _unit_factors(units: list[Unit], curves: TrafficCurves, rng: random.Random) -> list[float]:
+    """
+    Factor de volumen de cada unidad: el de las curvas o uno lognormal
+    (pocas unidades con mucho tráfico), reescalados a promedio 1 para que
+    ``per_unit_daily`` siga siendo el promedio por unidad.
+    """
+    explicit = [curves.units.get(unit.transit_number, {}).get('factor') for unit in units]
+    sampled = {index: rng.lognormvariate(0, curves.unit_skew) for index, factor in enumerate(explicit) if factor is None}
+    scale = len(sampled) / sum(sampled.values()) if sampled else 1
+    return [factor if factor is not None else sampled[index] * scale for index, factor in enumerate(explicit)]
+
+
+def _local_midnight(day: date) -> datetime:
+    return datetime(day.year, day.month, day.day, tzinfo=partitions.PARTITION_TIMEZONE)
+
+
+def _poisson(rng: random.Random, mean: float) -> int:
+    """Muestra de Poisson (Knuth; aproximación normal para medias grandes)."""
+    if mean <= 0:
+        return 0
+    if mean > 30:
+        return max(0, round(rng.gauss(mean, math.sqrt(mean))))
+    limit, count, product = math.exp(-mean), 0, rng.random()
+    while product > limit:
+        count += 1
+        product *= rng.random()
+    return count
+
+
+def _uuid() -> str:
+    # siempre aleatorio: con la misma semilla, una segunda carga no debe repetir llaves
+    return str(uuid.uuid4())
+
+
+def _escape(value: str) -> str:
+    """Texto en formato de COPY (text)."""
+    return value.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+
+
+class _UnitProfile:
+    """Unidad con su volumen, curvas y nivel de calificación."""
+
+    def __init__(self, unit: Unit, curves: TrafficCurves, factor: float, rng: random.Random):
+        overrides = curves.units.get(unit.transit_number, {})
+        weekday = overrides.get('weekday', curves.weekday)
+        mean_weekday = sum(weekday) / len(weekday)
+
+        self.unit_id = str(unit.id)
+        self.route_id = str(unit.route_id) if unit.route_id else _NULL
+        self.weekday = [factor * weight / mean_weekday for weight in weekday]
+        self.hourly_cum = list(accumulate(overrides.get('hourly', curves.hourly)))
+        self.rating_mean = min(4.8, max(1.5, rng.gauss(3.8, 0.5)))
+
+
+class _QuestionProfile:
+    """Pregunta con pesos fijos (por corrida) para sus opciones."""
+
+    def __init__(self, question: Question, rng: random.Random):
+        self.id = str(question.id)
+        self.type = question.type
+        self.options = [str(option.id) for option in question.options.all()]
+        self.option_cum = list(accumulate(rng.uniform(0.2, 1.0) for _ in self.options))
+        self.option_probability = [rng.uniform(0.1, 0.6) for _ in self.options]
+
+
+class _CopyWriter:
+    """Acumula filas en buffers de texto por tabla y las escribe con COPY."""
+
+    TABLES = {
+        SurveySubmission: ('id', 'unit', 'route', 'submitted_at'),
+        Answer: (
+            'id', 'submission', 'question', 'text_answer', 'rating_answer', 'selected_option',
+            'created_at', 'unit', 'route', 'submitted_at',
+        ),
+        Answer.selected_options.through: ('answer', 'questionoption'),
+        Complaint: ('id', 'unit', 'reason', 'submission', 'text', 'submitted_at', 'route', 'created_at'),
+    }
+
+    def __init__(self, rng, questions, reasons, complaint_rate, answer_rate, text_rate):
+        self.rng = rng
+        self.questions = questions
+        self.reasons = reasons
+        self.complaint_rate = complaint_rate
+        self.answer_rate = answer_rate
+        self.text_rate = text_rate
+        self.buffers = {model: io.StringIO() for model in self.TABLES}
+        self.rows = {model._meta.db_table: 0 for model in self.TABLES}
+        self.pending = 0
+
+    def add_submission(self, unit: _UnitProfile, submitted_at: datetime) -> None:
+        rng = self.rng
+        submission_id = _uuid()
+        moment = submitted_at.isoformat()
+        self._write(SurveySubmission, submission_id, unit.unit_id, unit.route_id, moment)
+
+        for question in self.questions:
+            rate = self.text_rate if question.type == Question.QuestionType.TEXT else self.answer_rate
+            if rng.random() >= rate:
+                continue
+
+            answer_id = _uuid()
+            text, rating, option = _NULL, _NULL, _NULL
+            if question.type == Question.QuestionType.RATING:
+                rating = str(min(5, max(1, round(rng.gauss(unit.rating_mean, 1.0)))))
+            elif question.type == Question.QuestionType.TEXT:
+                text = _escape(rng.choice(TEXT_ANSWERS))
+            elif question.type == Question.QuestionType.CHOICE:
+                if not question.options:
+                    continue
+                option = rng.choices(question.options, cum_weights=question.option_cum)[0]
+            elif question.type == Question.QuestionType.MULTI_CHOICE:
+                if not question.options:
+                    continue
+                chosen = [
+                    option_id for option_id, probability in zip(question.options, question.option_probability)
+                    if rng.random() < probability
+                ] or rng.choices(question.options, cum_weights=question.option_cum)
+                for option_id in chosen:
+                    self._write(Answer.selected_options.through, answer_id, option_id)
+
+            self._write(
+                Answer, answer_id, submission_id, question.id, text, rating, option,
+                moment, unit.unit_id, unit.route_id, moment,
+            )
+
+        if rng.random() < self.complaint_rate:
+            reason = str(rng.choice(self.reasons)) if self.reasons else _NULL
+            self._write(
+                Complaint, _uuid(), unit.unit_id, reason,
+                submission_id, _escape(rng.choice(COMPLAINT_TEXTS)), moment, unit.route_id, moment,
+            )
+
+        self.pending += 1
+
+    def flush(self) -> None:
+        """Escribe los buffers pendientes (envíos antes que sus respuestas y quejas)."""
+        if not self.pending:
+            return
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            for model, fields in self.TABLES.items():
+                buffer = self.buffers[model]
+                buffer.seek(0)
+                columns = ', '.join(f'"{model._meta.get_field(name).column}"' for name in fields)
+                cursor.copy_expert(f'COPY "{model._meta.db_table}" ({columns}) FROM STDIN', buffer)
+                self.buffers[model] = io.StringIO()
+        self.pending = 0
+
+    def _write(self, model, *values: str) -> None:
+        self.buffers[model].write('\t'.join(values) + '\n')
+        self.rows[model._meta.db_table] += 1
@@ -0,0 +1,20 @@
+"""
+Tests de interview.
+
+- test_admin: queries y paginación por cursor de los listados del admin
+- test_denormalized: ruta, unidad y fecha de envío copiadas en cada registro
+- test_partitions: particiones mensuales y retención
+- test_synthetic: generador de datos sintéticos
+- test_loadtest: prueba de carga del flujo público de encuesta
+
+TEST_SETTINGS sustituye Redis y el almacenamiento de estáticos con manifest
+en los tests que pasan por vistas (se aplica en setUp: TenantTestCase no
+respeta override_settings a nivel de clase).
+"""
+TEST_SETTINGS = {
+    'CACHES': {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    'STORAGES': {
+        'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+        'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+    },
+}
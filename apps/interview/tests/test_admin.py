@@ -0,0 +1,146 @@
+"""
+Tests del admin de interview.
+
+Verifica que el listado de respuestas no hace queries por fila (N+1) y la
+paginación por cursor de los listados de respuestas y quejas.
+"""
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django_tenants.test.client import TenantClient
+
+from apps.interview.admin import keyset_pagination_mixin
+from apps.interview.admin.answer_admin import AnswerAdmin
+from apps.interview.models import Answer, Complaint
+from apps.statistical_summary.tests import StatisticalTestCase
+from . import TEST_SETTINGS
+
+
+class TestAnswerAdminChangelist(StatisticalTestCase):
+    """Tests del costo en queries del listado de AnswerAdmin."""
+
+    def setUp(self):
+        super().setUp()
+        # TenantTestCase no aplica override_settings a nivel de clase
+        test_settings = override_settings(**TEST_SETTINGS)
+        test_settings.enable()
+        self.addCleanup(test_settings.disable)
+
+        user = get_user_model().objects.create_superuser(
+            username='admin', email='admin@example.com', password='admin'
+        )
+        self.client = TenantClient(self.tenant)
+        self.client.force_login(user)
+        self.url = reverse('transport_admin:interview_answer_changelist')
+
+    def count_changelist_queries(self, per_page):
+        with mock.patch.object(AnswerAdmin, 'list_per_page', per_page):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['cl'].result_list), min(per_page, Answer.objects.count()))
+        return len(queries)
+
+    def test_query_count_is_constant_in_page_size(self):
+        """
+        Verifica que una página de 5 y una de 50 respuestas (con RATING,
+        CHOICE y MULTI_CHOICE) cuestan los mismos queries.
+        """
+        self.assertGreaterEqual(Answer.objects.count(), 50)
+        # primera carga: caches de content types, permisos y sesión
+        self.count_changelist_queries(5)
+
+        self.assertEqual(self.count_changelist_queries(5), self.count_changelist_queries(50))
+
+    def test_answer_display_uses_prefetched_options(self):
+        """Verifica que la respuesta MULTI_CHOICE se muestra sin queries adicionales."""
+        answer = (
+            AnswerAdmin(Answer, None)
+            .get_queryset(mock.Mock())
+            .filter(question=self.question_multi1)
+            .first()
+        )
+        expected = ', '.join(answer.selected_options.order_by('position').values_list('text', flat=True))
+
+        with self.assertNumQueries(0):
+            display = AnswerAdmin(Answer, None).get_answer_display(answer)
+
+        self.assertEqual(display, f'☑ {expected}')
+
+
+class TestKeysetPagination(StatisticalTestCase):
+    """Tests de la paginación por cursor y el conteo estimado."""
+
+    def setUp(self):
+        super().setUp()
+        test_settings = override_settings(**TEST_SETTINGS)
+        test_settings.enable()
+        self.addCleanup(test_settings.disable)
+
+        user = get_user_model().objects.create_superuser(
+            username='admin', email='admin@example.com', password='admin'
+        )
+        self.client = TenantClient(self.tenant)
+        self.client.force_login(user)
+        self.url = reverse('transport_admin:interview_answer_changelist')
+
+    def test_pages_cover_all_rows_in_order(self):
+        """Verifica que recorrer las páginas con el cursor entrega cada respuesta una vez, en orden."""
+        seen = []
+        url = self.url
+
+        with mock.patch.object(AnswerAdmin, 'list_per_page', 7):
+            while url:
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                cl = response.context['cl']
+                self.assertTrue(cl.keyset)
+                if cl.next_page_url:
+                    self.assertContains(response, 'Siguiente »')
+                seen += [answer.pk for answer in cl.result_list]
+                url = cl.next_page_url and self.url + cl.next_page_url
+
+        expected = list(Answer.objects.order_by('-created_at', '-pk').values_list('pk', flat=True))
+        self.assertEqual(seen, expected)
+
+    def test_large_tables_use_planner_estimate(self):
+        """Verifica que por encima del umbral no se ejecuta COUNT(*)."""
+        with mock.patch.object(keyset_pagination_mixin, 'EXACT_COUNT_THRESHOLD', 0):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(self.url)
+
+        self.assertTrue(response.context['cl'].paginator.is_estimate)
+        self.assertFalse(any('COUNT(' in query['sql'] for query in queries))
+
+    def test_small_tables_use_exact_count(self):
+        """Verifica que debajo del umbral el total es exacto."""
+        response = self.client.get(self.url)
+
+        cl = response.context['cl']
+        self.assertFalse(cl.paginator.is_estimate)
+        self.assertEqual(cl.result_count, Answer.objects.count())
+
+    def test_custom_ordering_falls_back_to_offset(self):
+        """Verifica que ordenar por otra columna usa la paginación normal."""
+        response = self.client.get(self.url, {'o': '0'})
+
+        self.assertFalse(response.context['cl'].keyset)
+
+    def test_invalid_cursor_is_rejected(self):
+        """Verifica que un cursor mal formado redirige con el error del admin."""
+        response = self.client.get(self.url, {'cursor': 'no-es-un-cursor'})
+
+        self.assertEqual(response.status_code, 302)
+        self.assertIn('e=1', response['Location'])
+
+    def test_complaint_changelist_uses_keyset(self):
+        """Verifica que el listado de quejas también pagina por cursor."""
+        response = self.client.get(reverse('transport_admin:interview_complaint_changelist'))
+
+        self.assertTrue(response.context['cl'].keyset)
+        self.assertEqual(len(response.context['cl'].result_list), Complaint.objects.count())
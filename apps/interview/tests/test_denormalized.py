@@ -0,0 +1,65 @@
+"""
+Tests de los campos desnormalizados (ruta, unidad y fecha de envío) de
+envíos, quejas y respuestas, y de su relleno histórico.
+"""
+from apps.interview.backfill import backfill_denormalized_fields
+from apps.interview.models import Answer, Complaint, SurveySubmission
+from apps.statistical_summary.services import cube_service, statistics_service
+from apps.statistical_summary.tests import StatisticalTestCase
+from apps.statistical_summary.tests.factories import SurveySubmissionFactory
+
+
+class TestDenormalizedRoute(StatisticalTestCase):
+    """Tests de route/unit/submitted_at copiados al guardar envíos, quejas y respuestas."""
+
+    def test_new_rows_capture_route_and_submission(self):
+        """Verifica que los registros nuevos guardan la ruta y los datos del envío."""
+        for submission in SurveySubmission.objects.select_related('unit'):
+            self.assertEqual(submission.route_id, submission.unit.route_id)
+
+        for complaint in Complaint.objects.select_related('unit').exclude(unit=None):
+            self.assertEqual(complaint.route_id, complaint.unit.route_id)
+
+        for answer in Answer.objects.select_related('submission'):
+            self.assertEqual(
+                (answer.unit_id, answer.route_id, answer.submitted_at),
+                (answer.submission.unit_id, answer.submission.route_id, answer.submission.submitted_at),
+            )
+
+    def test_reassigned_unit_keeps_history(self):
+        """
+        Verifica que al cambiar una unidad de ruta sus envíos anteriores
+        siguen contando para la ruta original (SQL y cubo).
+        """
+        unit = self.units_route1[0]
+        before = statistics_service.calculate_dashboard_statistics('all', route_id=str(self.route1.id))
+        moved = Answer.objects.filter(unit=unit).count()
+        self.assertGreater(moved, 0)
+
+        unit.route = self.route2
+        unit.save()
+        SurveySubmissionFactory(unit=unit)
+
+        after = statistics_service.calculate_dashboard_statistics('all', route_id=str(self.route1.id))
+        self.assertEqual(after.total_submissions, before.total_submissions)
+        self.assertEqual(after.questions_statistics, before.questions_statistics)
+        self.assertEqual(SurveySubmission.objects.filter(unit=unit).latest('submitted_at').route, self.route2)
+
+        cube = cube_service.AnalyticsCube()
+        cube.refresh()
+        self.assertEqual(cube.statistics('all', route_id=str(self.route1.id)), after)
+
+    def test_backfill_fills_historical_rows(self):
+        """Verifica que el relleno por lotes copia los campos faltantes y es idempotente."""
+        expected = sorted(Answer.objects.values_list('id', 'unit_id', 'route_id', 'submitted_at'))
+        SurveySubmission.objects.update(route=None)
+        Complaint.objects.update(route=None)
+        Answer.objects.update(unit=None, route=None)
+
+        updated = backfill_denormalized_fields(batch_size=3)
+
+        self.assertEqual(updated['survey_submissions'], SurveySubmission.objects.count())
+        self.assertEqual(updated['answers'], Answer.objects.count())
+        self.assertFalse(Complaint.objects.filter(route=None).exclude(unit=None).exists())
+        self.assertEqual(sorted(Answer.objects.values_list('id', 'unit_id', 'route_id', 'submitted_at')), expected)
+        self.assertEqual(set(backfill_denormalized_fields().values()), {0})
@@ -0,0 +1,76 @@
+"""
+Tests de la prueba de carga del flujo público de encuesta.
+"""
+import json
+import tempfile
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.core.signals import request_finished, request_started
+from django.db import close_old_connections
+from django.test import override_settings
+from django_recaptcha import client as recaptcha_client
+
+from apps.interview import loadtest
+from apps.interview.models import Answer, SurveySubmission
+from apps.statistical_summary.tests import StatisticalTestCase
+from . import TEST_SETTINGS
+
+
+class TestSurveyLoadTest(StatisticalTestCase):
+    """Tests de la prueba de carga del flujo público de encuesta."""
+
+    def setUp(self):
+        super().setUp()
+        test_settings = override_settings(**TEST_SETTINGS)
+        test_settings.enable()
+        self.addCleanup(test_settings.disable)
+        # Como el Client de Django: la transacción del test no debe cerrarse al terminar cada request
+        for signal in (request_started, request_finished):
+            signal.disconnect(close_old_connections)
+            self.addCleanup(signal.connect, close_old_connections)
+
+    def test_journeys_submit_surveys_through_wsgi(self):
+        """
+        Verifica que cada recorrido pasa por formulario, envío y agradecimiento
+        (con reCAPTCHA de prueba y CSRF) y guarda su encuesta, con queries por paso.
+        """
+        before = SurveySubmission.objects.count()
+        catalogs = loadtest.get_catalogs([self.tenant.schema_name], units_per_tenant=3)
+
+        result = loadtest.run_load_test(catalogs, journeys=6, seed=3)
+
+        self.assertEqual(result.errors, {})
+        self.assertEqual(result.completed, 6)
+        self.assertEqual(list(result.steps), list(loadtest.LOADTEST_STEPS))
+        for stats in result.steps.values():
+            self.assertEqual(stats.requests, 6)
+            self.assertGreater(stats.max_queries, 0)
+            self.assertLessEqual(stats.p50_ms, stats.p99_ms)
+        new = SurveySubmission.objects.exclude(id__in=[s.id for s in self.submissions])
+        self.assertEqual(SurveySubmission.objects.count() - before, 6)
+        self.assertEqual(set(new.values_list('unit__transit_number', flat=True)) - {'ABC001', 'ABC002', 'ABC003'}, set())
+        self.assertEqual(Answer.objects.filter(submission__in=new).values('submission').distinct().count(), 6)
+
+    def test_command_reports_and_writes_json(self):
+        """Verifica el JSON del comando y los errores por tenant inexistente u omitido."""
+        submit = recaptcha_client.submit
+        with tempfile.TemporaryDirectory() as directory:
+            output = f'{directory}/loadtest.json'
+            call_command(
+                'load_test_survey', schemas=[self.tenant.schema_name], journeys=2, concurrency=1,
+                output=output, stdout=mock.Mock(),
+            )
+            with open(output) as result_file:
+                result = json.load(result_file)
+
+        self.assertEqual(result['mode'], 'wsgi')
+        self.assertIs(recaptcha_client.submit, submit)
+        self.assertEqual(result['completed'], 2)
+        self.assertEqual(set(result['steps']['submit_survey']), {
+            'requests', 'errors', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms', 'queries_per_request', 'max_queries',
+        })
+        with self.assertRaises(CommandError):
+            call_command('load_test_survey', schemas=['no_existe'], stdout=mock.Mock())
+        with self.assertRaisesMessage(CommandError, '--schema'):
+            call_command('load_test_survey', stdout=mock.Mock())
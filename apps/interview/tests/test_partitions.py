@@ -0,0 +1,146 @@
+"""
+Tests de las particiones mensuales de envíos y respuestas y de su retención.
+"""
+from datetime import timedelta
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import connection
+from django.utils import timezone
+
+from apps.interview import partitions
+from apps.interview.models import Answer, Question, SurveySubmission
+from apps.organization.provisioning import schema_fingerprint
+from apps.statistical_summary.models import TermCount
+from apps.statistical_summary.tests import StatisticalTestCase
+from apps.statistical_summary.tests.factories import AnswerFactory, QuestionFactory
+
+
+class TestMonthlyPartitions(StatisticalTestCase):
+    """Tests de las particiones mensuales de survey_submissions y answers."""
+
+    def backdate(self, submissions, submitted_at):
+        """Mueve envíos (y sus respuestas) a otra fecha; PostgreSQL cambia las filas de partición."""
+        ids = [submission.id for submission in submissions]
+        SurveySubmission.objects.filter(id__in=ids).update(submitted_at=submitted_at)
+        Answer.objects.filter(submission_id__in=ids).update(submitted_at=submitted_at)
+
+    def partition_of(self, model, pk):
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT tableoid::regclass::text FROM {model._meta.db_table} WHERE id = %s', [pk])
+            return cursor.fetchone()[0]
+
+    def test_new_rows_land_in_current_month(self):
+        """Verifica que las tablas están particionadas y las filas nuevas van al mes actual."""
+        current = partitions.month_start()
+        answer = Answer.objects.filter(submission=self.submissions[0]).first()
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT relname FROM pg_class WHERE relkind = 'p' AND relname = ANY(%s)",
+                [list(partitions.PARTITIONED_TABLES)],
+            )
+            self.assertEqual({name for name, in cursor.fetchall()}, set(partitions.PARTITIONED_TABLES))
+
+        self.assertEqual(
+            self.partition_of(SurveySubmission, self.submissions[0].id),
+            partitions.partition_name('survey_submissions', current),
+        )
+        self.assertEqual(self.partition_of(Answer, answer.id), partitions.partition_name('answers', current))
+
+    def test_create_partition_moves_rows_from_default(self):
+        """Verifica que crear la partición de un mes pasado mueve sus filas desde la DEFAULT."""
+        old_month = partitions.add_months(partitions.month_start(), -6)
+        self.backdate(self.submissions[:3], partitions.month_bounds(old_month)[0] + timedelta(days=2))
+        self.assertEqual(self.partition_of(SurveySubmission, self.submissions[0].id), 'survey_submissions_default')
+        total = Answer.objects.count()
+        answers = Answer.objects.filter(submission=self.submissions[0]).count()
+
+        self.assertTrue(partitions.create_month_partition('survey_submissions', old_month))
+        self.assertTrue(partitions.create_month_partition('answers', old_month))
+        self.assertFalse(partitions.create_month_partition('answers', old_month))
+
+        self.assertEqual(
+            self.partition_of(SurveySubmission, self.submissions[0].id),
+            partitions.partition_name('survey_submissions', old_month),
+        )
+        self.assertEqual(Answer.objects.count(), total)
+        self.assertEqual(Answer.objects.filter(submission=self.submissions[0]).count(), answers)
+
+    def test_ensure_partitions_is_idempotent(self):
+        """Verifica que ensure_partitions crea solo los meses que faltan."""
+        created = partitions.ensure_partitions(months_ahead=partitions.DEFAULT_MONTHS_AHEAD + 1)
+
+        month = partitions.add_months(partitions.month_start(), partitions.DEFAULT_MONTHS_AHEAD + 1)
+        self.assertEqual(created, [partitions.partition_name(table, month) for table in partitions.PARTITIONED_TABLES])
+        self.assertEqual(partitions.ensure_partitions(months_ahead=partitions.DEFAULT_MONTHS_AHEAD + 1), [])
+
+    def test_period_filter_prunes_old_partitions(self):
+        """Verifica que un filtro de período no lee las particiones de meses anteriores."""
+        old_month = partitions.add_months(partitions.month_start(), -2)
+        for table in partitions.PARTITIONED_TABLES:
+            partitions.create_month_partition(table, old_month)
+
+        plan = SurveySubmission.objects.filter(submitted_at__gte=timezone.now() - timedelta(hours=1)).explain()
+
+        self.assertIn(partitions.partition_name('survey_submissions', partitions.month_start()), plan)
+        self.assertNotIn(partitions.partition_name('survey_submissions', old_month), plan)
+
+    def test_retention_archives_expired_partitions(self):
+        """
+        Verifica que la retención desprende los meses vencidos de ambas tablas
+        sin tocar la huella estructural del schema.
+        """
+        old_month = partitions.add_months(partitions.month_start(), -13)
+        self.backdate(self.submissions[:2], partitions.month_bounds(old_month)[0] + timedelta(days=1))
+        for table in partitions.PARTITIONED_TABLES:
+            partitions.create_month_partition(table, old_month)
+        fingerprint = schema_fingerprint(self.tenant.schema_name)
+        submissions = SurveySubmission.objects.count()
+
+        call_command('apply_partition_retention', keep_months=12, schemas=[self.tenant.schema_name], dry_run=True, stdout=mock.Mock())
+        self.assertEqual(SurveySubmission.objects.count(), submissions)
+
+        call_command('apply_partition_retention', keep_months=12, schemas=[self.tenant.schema_name], stdout=mock.Mock())
+
+        self.assertEqual(SurveySubmission.objects.count(), submissions - 2)
+        self.assertFalse(Answer.objects.filter(submission_id=self.submissions[0].id).exists())
+        self.assertEqual([p.month for p in partitions.get_partitions('answers')][0], partitions.month_start())
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT count(*) FROM %s' % f'{partitions.ARCHIVE_PREFIX}survey_submissions_p{old_month:%Y_%m}')
+            self.assertEqual(cursor.fetchone()[0], 2)
+        self.assertEqual(schema_fingerprint(self.tenant.schema_name), fingerprint)
+
+    def test_retention_discounts_terms_options_and_cube(self):
+        """
+        Verifica que desprender una partición de answers archiva sus opciones
+        seleccionadas, descarta sus términos y el cubo del tenant.
+        """
+        old_month = partitions.add_months(partitions.month_start(), -13)
+        submission = self.submissions[0]
+        self.backdate([submission], partitions.month_bounds(old_month)[0] + timedelta(days=1))
+        for table in partitions.PARTITIONED_TABLES:
+            partitions.create_month_partition(table, old_month)
+        question = QuestionFactory(text="Comentarios", type=Question.QuestionType.TEXT, position=6)
+        submission.refresh_from_db()
+        AnswerFactory(submission=submission, question=question, text_answer="Frenos ruidosos")
+        answer_ids = list(Answer.objects.filter(submission_id=submission.id).values_list('id', flat=True))
+        options = Answer.selected_options.through.objects.filter(answer_id__in=answer_ids)
+        selected = options.count()
+        self.assertGreater(selected, 0)
+        self.assertTrue(TermCount.objects.filter(term='frenos', day__lt=partitions.month_start()).exists())
+        fingerprint = schema_fingerprint(self.tenant.schema_name)
+
+        with mock.patch('apps.statistical_summary.services.cube_service.invalidate_cube') as invalidate_cube:
+            partitions.detach_expired_partitions(keep_months=12)
+
+        invalidate_cube.assert_called()
+        self.assertFalse(TermCount.objects.filter(term='frenos').exists())
+        self.assertTrue(TermCount.objects.filter(source=TermCount.Source.COMPLAINT).exists())
+        self.assertFalse(options.exists())
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT count(*) FROM "{partitions.ARCHIVE_PREFIX}answers_p{old_month:%Y_%m}_selected_options"'
+            )
+            self.assertEqual(cursor.fetchone()[0], selected)
+        self.assertEqual(schema_fingerprint(self.tenant.schema_name), fingerprint)
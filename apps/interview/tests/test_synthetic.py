@@ -0,0 +1,97 @@
+"""
+Tests del generador de datos sintéticos con COPY.
+"""
+import json
+import tempfile
+from datetime import timedelta
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.db.models import F
+from django.utils import timezone
+
+from apps.interview import partitions
+from apps.interview.models import Answer, Complaint, Question, SurveySubmission
+from apps.interview.synthetic import SyntheticDataError, TrafficCurves, generate_synthetic_data
+from apps.statistical_summary.models import TermCount
+from apps.statistical_summary.tests import StatisticalTestCase
+from apps.statistical_summary.tests.factories import QuestionFactory
+
+
+class TestSyntheticData(StatisticalTestCase):
+    """Tests del generador de datos sintéticos con COPY."""
+
+    def test_generates_every_question_type_consistently(self):
+        """
+        Verifica que se generan respuestas de todos los tipos (con sus filas
+        de opción múltiple) y quejas, con los campos desnormalizados de cada envío.
+        """
+        QuestionFactory(text='¿Algún comentario?', type=Question.QuestionType.TEXT, position=6)
+        before = {
+            'survey_submissions': SurveySubmission.objects.count(),
+            'answers': Answer.objects.count(),
+            'complaints': Complaint.objects.count(),
+        }
+
+        result = generate_synthetic_data(days=3, per_unit_daily=4, complaint_rate=0.3, seed=1, batch_size=25)
+
+        for table, count in before.items():
+            self.assertEqual(result.rows[table], self.model_count(table) - count)
+        generated = Answer.objects.filter(submission__in=SurveySubmission.objects.exclude(id__in=[s.id for s in self.submissions]))
+        for question_type in Question.QuestionType.values:
+            self.assertTrue(generated.filter(question__type=question_type).exists(), question_type)
+        self.assertFalse(generated.filter(question__type=Question.QuestionType.MULTI_CHOICE, selected_options=None).exists())
+        self.assertFalse(generated.exclude(
+            unit_id=F('submission__unit_id'), route_id=F('submission__route_id'), submitted_at=F('submission__submitted_at'),
+        ).exists())
+        self.assertFalse(SurveySubmission.objects.exclude(route_id=F('unit__route_id')).exists())
+        self.assertFalse(Complaint.objects.exclude(submission=None).exclude(unit_id=F('submission__unit_id')).exists())
+        self.assertLessEqual(SurveySubmission.objects.latest('submitted_at').submitted_at, timezone.now())
+
+    def test_follows_traffic_curves(self):
+        """Verifica la curva horaria, el factor por unidad y la reproducibilidad con semilla."""
+        hourly = [0] * 24
+        hourly[8] = 1
+        curves = TrafficCurves(hourly=tuple(hourly), units={'ABC001': {'factor': 0}})
+        end = timezone.now().replace(hour=23) - timedelta(days=1)
+
+        first = generate_synthetic_data(days=5, per_unit_daily=2, curves=curves, end=end, seed=3)
+        second = generate_synthetic_data(days=5, per_unit_daily=2, curves=curves, end=end, seed=3)
+
+        self.assertEqual(first.rows, second.rows)
+        generated = SurveySubmission.objects.exclude(id__in=[s.id for s in self.submissions])
+        self.assertEqual(generated.count(), 2 * first.rows['survey_submissions'])
+        self.assertFalse(generated.filter(unit__transit_number='ABC001').exists())
+        hours = {timezone.localtime(value, partitions.PARTITION_TIMEZONE).hour for value in generated.values_list('submitted_at', flat=True)}
+        self.assertEqual(hours, {8})
+
+    def test_invalid_curves_are_rejected(self):
+        """Verifica la validación de curvas (en código y desde el comando)."""
+        with self.assertRaises(SyntheticDataError):
+            TrafficCurves(weekday=(1, 1, 1))
+
+        with tempfile.NamedTemporaryFile('w', suffix='.json') as curves_file:
+            json.dump({'hourly': [1] * 23}, curves_file)
+            curves_file.flush()
+            with self.assertRaises(CommandError):
+                call_command('generate_synthetic_data', curves=curves_file.name, stdout=mock.Mock())
+
+    def test_command_indexes_terms_and_fingerprints(self):
+        """
+        Verifica que el comando reconstruye TermCount e indexa las firmas de
+        las quejas escritas con COPY (sin señales), salvo con --no-index.
+        """
+        question = QuestionFactory(text='¿Algún comentario?', type=Question.QuestionType.TEXT, position=6)
+        options = {'schemas': [self.tenant.schema_name], 'days': 2, 'per_unit_daily': 2, 'complaint_rate': 0.5}
+
+        call_command('generate_synthetic_data', index=False, seed=4, stdout=mock.Mock(), **options)
+        self.assertFalse(TermCount.objects.filter(question=question).exists())
+        self.assertTrue(Complaint.objects.exclude(text='').filter(fingerprint=None).exists())
+
+        call_command('generate_synthetic_data', seed=5, stdout=mock.Mock(), **options)
+        self.assertTrue(TermCount.objects.filter(question=question).exists())
+        self.assertFalse(Complaint.objects.exclude(text='').filter(fingerprint=None).exists())
+
+    def model_count(self, table):
+        model = {'survey_submissions': SurveySubmission, 'answers': Answer, 'complaints': Complaint}[table]
+        return model.objects.count()
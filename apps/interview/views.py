@@ -239,6 +239,7 @@ def submit_survey(request, transit_number):
         if complaint_reason:
             Complaint.objects.create(
                 unit=unit,
+                submission=submission,
                 reason=complaint_reason,
                 text=complaint_text  # Puede ser vacío
             )
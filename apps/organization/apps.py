@@ -8,11 +8,6 @@ class OrganizationConfig(AppConfig):
     verbose_name = 'Organización'
     verbose_name_plural = 'Organizaciones'
 
-
-    # def ready(self):
-    #     # importar señales para que se registren al arrancar Django
-    #     try:
-    #         import organization.signals  # noqa: F401
-    #     except Exception:
-    #         # no fallar el arranque si algo va mal en import (loguear si lo deseas)
-    #         pass
+    def ready(self):
+        # Registrar señales de invalidación de la caché de tenants
+        from . import signals  # noqa: F401
@@ -1,6 +1,6 @@
 from django import forms
 
-from apps.organization.models import Organization
+from apps.organization.tenant_cache import get_organization_directory
 from django_recaptcha.fields import ReCaptchaField
 from django_recaptcha.widgets import ReCaptchaV2Checkbox
 
@@ -8,12 +8,15 @@ from django_recaptcha.widgets import ReCaptchaV2Checkbox
 class SelectOrganizationForm(forms.Form):
     """
     Formulario reducido que muestra únicamente las organizaciones por su nombre.
+
+    Las opciones salen del directorio cacheado (solo organizaciones activas
+    con dominio primario), así que mostrar y validar el formulario no
+    consulta la base de datos.
     """
 
-    organization = forms.ModelChoiceField(
-        queryset=Organization.objects.exclude(schema_name='public').order_by('name'),
+    organization = forms.ChoiceField(
+        choices=(),
         required=True,
-        empty_label="-- Selecciona la organización --",
         label="Organización",
         widget=forms.Select(attrs={
             'class': 'form-control',
@@ -31,11 +34,19 @@ class SelectOrganizationForm(forms.Form):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.directory = {org['id']: org for org in get_organization_directory()}
         # Mostrar el nombre tal cual
-        self.fields['organization'].label_from_instance = lambda org: org.name
+        self.fields['organization'].choices = [('', '-- Selecciona la organización --')] + [
+            (org_id, org['name']) for org_id, org in self.directory.items()
+        ]
 
     def get_selected_organization(self):
-        """Retorna la organización seleccionada si el formulario es válida."""
+        """
+        Retorna la organización seleccionada si el formulario es válido.
+
+        Returns:
+            Diccionario {'id', 'name', 'domain'} del directorio, o None
+        """
         if self.is_valid():
-            return self.cleaned_data['organization']
+            return self.directory[self.cleaned_data['organization']]
         return None
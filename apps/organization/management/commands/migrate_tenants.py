@@ -0,0 +1,101 @@
+"""
+Comando para migrar los schemas de tenants en paralelo.
+
+Solo migra los schemas con migraciones pendientes (se revisan todos con
+una consulta por lote) y reporta el tiempo de cada uno.
+
+Uso:
+    python manage.py migrate_tenants
+    python manage.py migrate_tenants --workers 4
+    python manage.py migrate_tenants --schema alianza --schema centro
+    python manage.py migrate_tenants --check
+"""
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django_tenants.utils import get_public_schema_name, get_tenant_model
+
+from apps.organization.schema_migrations import (
+    default_workers,
+    get_pending_by_schema,
+    migrate_schemas_parallel,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Aplica las migraciones pendientes de los schemas de tenants en paralelo, '
+        'omitiendo los que ya están al día.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--schema',
+            action='append',
+            dest='schemas',
+            help='Schema del tenant a migrar (se puede repetir; default: todos)',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=settings.TENANT_MIGRATION_WORKERS or default_workers(),
+            help='Procesos simultáneos (default: TENANT_MIGRATION_WORKERS o uno por CPU)',
+        )
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Solo reportar los schemas pendientes; termina con error si hay alguno',
+        )
+
+    def handle(self, *args, **options):
+        tenants = get_tenant_model().objects.exclude(schema_name=get_public_schema_name())
+
+        if options['schemas']:
+            tenants = tenants.filter(schema_name__in=options['schemas'])
+            missing = set(options['schemas']) - set(tenants.values_list('schema_name', flat=True))
+            if missing:
+                raise CommandError(f'Tenants no encontrados: {", ".join(sorted(missing))}')
+
+        schema_names = list(tenants.order_by('schema_name').values_list('schema_name', flat=True))
+        pending = get_pending_by_schema(schema_names)
+        outdated = [schema_name for schema_name in schema_names if pending[schema_name]]
+
+        self.stdout.write(
+            f'{len(schema_names)} tenant(s): {len(schema_names) - len(outdated)} al día, '
+            f'{len(outdated)} con migraciones pendientes'
+        )
+
+        if options['check']:
+            for schema_name in outdated:
+                self.stdout.write(f'  {schema_name}: {len(pending[schema_name])} pendientes')
+            if outdated:
+                raise CommandError(f'{len(outdated)} tenant(s) con migraciones pendientes')
+            return
+
+        if not outdated:
+            return
+
+        workers = max(1, options['workers'])
+        started = time.perf_counter()
+        failed = []
+
+        for result in migrate_schemas_parallel(outdated, workers):
+            count = len(pending[result.schema_name])
+            if result.error:
+                failed.append(result.schema_name)
+                self.stdout.write(self.style.ERROR(
+                    f'✗ {result.schema_name}: {result.error} ({result.seconds:.2f} s)'
+                ))
+            else:
+                self.stdout.write(self.style.SUCCESS(
+                    f'✓ {result.schema_name}: {count} migraciones en {result.seconds:.2f} s'
+                ))
+
+        self.stdout.write(
+            f'{len(outdated)} tenant(s) procesados con {workers} proceso(s) '
+            f'en {time.perf_counter() - started:.2f} s'
+        )
+
+        if failed:
+            raise CommandError(f'Fallaron: {", ".join(sorted(failed))}')
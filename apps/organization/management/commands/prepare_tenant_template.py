@@ -0,0 +1,68 @@
+"""
+Comando para crear o actualizar el schema plantilla de tenants.
+
+Uso:
+    python manage.py prepare_tenant_template
+    python manage.py prepare_tenant_template --no-seed
+    python manage.py prepare_tenant_template --verify
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django_tenants.utils import get_public_schema_name, get_tenant_model
+
+from apps.organization.provisioning import (
+    TenantProvisioningError,
+    get_template_schema,
+    prepare_template_schema,
+    verify_schema,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Crea el schema plantilla (TENANT_TEMPLATE_SCHEMA), aplica sus migraciones '
+        'y carga el catálogo inicial; los tenants nuevos se crean clonándolo.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--no-seed',
+            action='store_false',
+            dest='seed',
+            help='No cargar preguntas y motivos de queja por defecto',
+        )
+        parser.add_argument(
+            '--verify',
+            action='store_true',
+            help='Comparar la estructura de cada tenant con la plantilla',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            applied = prepare_template_schema(seed=options['seed'])
+        except TenantProvisioningError as exc:
+            raise CommandError(str(exc))
+
+        template = get_template_schema()
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ Plantilla "{template}" lista ({len(applied)} migraciones aplicadas)'
+        ))
+
+        if not options['verify']:
+            return
+
+        tenants = get_tenant_model().objects.exclude(schema_name=get_public_schema_name())
+        mismatched = 0
+
+        for schema_name in tenants.order_by('schema_name').values_list('schema_name', flat=True):
+            differences = verify_schema(schema_name, template)
+            if not differences:
+                self.stdout.write(self.style.SUCCESS(f'✓ {schema_name}'))
+                continue
+
+            mismatched += 1
+            self.stdout.write(self.style.ERROR(f'✗ {schema_name}: {len(differences)} diferencias'))
+            for difference in differences:
+                self.stdout.write(f'    {difference}')
+
+        if mismatched:
+            raise CommandError(f'{mismatched} tenant(s) no coinciden con la plantilla')
@@ -1,6 +1,24 @@
 from django.shortcuts import render
 from django.utils.deprecation import MiddlewareMixin
-from django_tenants.utils import get_tenant_model
+from django_tenants.middleware.main import TenantMainMiddleware
+
+from .tenant_cache import get_cached_tenant
+
+
+class CachedTenantMainMiddleware(TenantMainMiddleware):
+    """
+    TenantMainMiddleware que resuelve el hostname desde tenant_cache
+    (LRU en proceso + Redis) en lugar de consultar Domain/Organization
+    en cada request.
+
+    Debe ir primero en MIDDLEWARE, en lugar de TenantMainMiddleware.
+    """
+
+    def get_tenant(self, domain_model, hostname):
+        tenant = get_cached_tenant(hostname)
+        if tenant is None:
+            raise domain_model.DoesNotExist
+        return tenant
 
 
 class TenantActiveMiddleware(MiddlewareMixin):
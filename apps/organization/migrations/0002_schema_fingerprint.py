@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-19 06:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organization', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SchemaFingerprint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fingerprint', models.CharField(max_length=64, unique=True)),
+                ('migrations', models.JSONField(help_text='Última migración de cada app (app.nombre)')),
+                ('schemas', models.PositiveIntegerField(help_text='Schemas verificados')),
+                ('recorded_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Huella de schema',
+                'verbose_name_plural': 'Huellas de schema',
+                'db_table': 'schema_fingerprints',
+            },
+        ),
+    ]
@@ -1,6 +1,8 @@
 import uuid
 from django.db import models
 from django_tenants.models import TenantMixin, DomainMixin
+from django_tenants.postgresql_backend.base import _check_schema_name
+from django_tenants.utils import schema_exists
 
 class Organization(TenantMixin):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -18,6 +20,20 @@ class Organization(TenantMixin):
     
     def __str__(self):
         return self.name
+
+    def create_schema(self, check_if_exists=False, sync_schema=True, verbosity=1):
+        """
+        Crea el schema clonando la plantilla (TENANT_TEMPLATE_SCHEMA) cuando
+        está lista; si no, ejecuta las migraciones como django-tenants.
+        """
+        from .provisioning import clone_template_schema
+
+        if sync_schema and not (check_if_exists and schema_exists(self.schema_name)):
+            _check_schema_name(self.schema_name)
+            if clone_template_schema(self.schema_name, self.clone_mode):
+                return True
+
+        return super().create_schema(check_if_exists, sync_schema, verbosity)
     
     class Meta:
         db_table = 'organizations'
@@ -28,3 +44,23 @@ class Domain(DomainMixin):
     class Meta:
         verbose_name = 'Dominio'
         verbose_name_plural = 'Dominios'
+
+
+class SchemaFingerprint(models.Model):
+    """
+    Estado de migraciones verificado en la fase release (start_db.py).
+
+    ``fingerprint`` es el hash de la última migración de cada app según el
+    código; existe una fila solo si el schema público y todos los tenants
+    tenían ese estado aplicado. El arranque web compara contra esta tabla
+    en lugar de volver a migrar.
+    """
+    fingerprint = models.CharField(max_length=64, unique=True)
+    migrations = models.JSONField(help_text='Última migración de cada app (app.nombre)')
+    schemas = models.PositiveIntegerField(help_text='Schemas verificados')
+    recorded_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'schema_fingerprints'
+        verbose_name = 'Huella de schema'
+        verbose_name_plural = 'Huellas de schema'
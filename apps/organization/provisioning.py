@@ -0,0 +1,325 @@
+"""
+Alta de tenants por clonación de un schema plantilla.
+
+Crear un tenant ejecutando todas las migraciones tarda lo mismo que la
+historia completa de migraciones. Con ``settings.TENANT_TEMPLATE_SCHEMA``
+configurado, ``Organization.create_schema`` copia en su lugar un schema ya
+migrado y con el catálogo inicial (preguntas y motivos de queja) mediante
+la función ``clone_schema`` de django-tenants: un solo llamado a
+PostgreSQL, independiente del número de migraciones.
+
+El clon se verifica contra la plantilla (migraciones registradas, columnas,
+índices y restricciones); si difiere, la creación falla y el tenant no se
+guarda. clone_schema no copia las FOREIGN KEY de las tablas particionadas
+(survey_submissions y answers): se recrean a partir de las de la plantilla.
+Si la plantilla no existe o tiene migraciones pendientes, se usa el
+camino normal (migraciones) para no crear tenants desactualizados.
+"""
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django_tenants.clone import CloneSchema
+from django_tenants.utils import schema_context, schema_exists
+
+from apps.interview.partitions import ensure_partitions, is_partition_table
+
+
+class TenantProvisioningError(Exception):
+    """El schema clonado no coincide con la plantilla."""
+
+
+def get_template_schema() -> str | None:
+    """Schema plantilla configurado (None si la clonación está desactivada)."""
+    return getattr(settings, 'TENANT_TEMPLATE_SCHEMA', '') or None
+
+
+def get_pending_migrations(schema_name: str) -> list[tuple[str, str]]:
+    """
+    Migraciones que ``migrate`` aplicaría en un schema.
+
+    Args:
+        schema_name: Schema a revisar
+
+    Returns:
+        Lista de tuplas (app_label, nombre_de_migración), en orden de aplicación
+    """
+    with schema_context(schema_name):
+        executor = MigrationExecutor(connection)
+        plan = executor.migration_plan(executor.loader.graph.leaf_nodes())
+
+    return [(migration.app_label, migration.name) for migration, _ in plan]
+
+
+def prepare_template_schema(seed: bool = True) -> list[tuple[str, str]]:
+    """
+    Crea o actualiza el schema plantilla.
+
+    Crea el schema si no existe, aplica las migraciones pendientes, crea
+    las particiones mensuales vigentes (los clones las heredan), carga el
+    catálogo inicial e instala la función ``clone_schema`` en la base de datos.
+
+    Args:
+        seed: Cargar preguntas y motivos de queja por defecto
+
+    Returns:
+        Migraciones que se aplicaron
+
+    Raises:
+        TenantProvisioningError: Si TENANT_TEMPLATE_SCHEMA no está configurado
+    """
+    from apps.interview.seed import seed_default_catalog
+
+    template = get_template_schema()
+    if template is None:
+        raise TenantProvisioningError('TENANT_TEMPLATE_SCHEMA no está configurado')
+
+    if not schema_exists(template):
+        with connection.cursor() as cursor:
+            cursor.execute(f'CREATE SCHEMA "{template}"')
+
+    pending = get_pending_migrations(template)
+    if pending:
+        call_command(
+            'migrate_schemas',
+            schema_name=template,
+            interactive=False,
+            verbosity=0,
+        )
+
+    with schema_context(template):
+        ensure_partitions()
+        if seed:
+            seed_default_catalog()
+
+    CloneSchema()._create_clone_schema_function()
+    connection.set_schema_to_public()
+    return pending
+
+
+def clone_template_schema(schema_name: str, clone_mode: str = 'DATA') -> bool:
+    """
+    Crea ``schema_name`` como copia de la plantilla y la verifica.
+
+    Args:
+        schema_name: Schema del tenant nuevo (no debe existir)
+        clone_mode: "DATA" (estructura y datos) o "NODATA" (solo estructura)
+
+    Returns:
+        True si se clonó; False si la plantilla no está lista (el llamador
+        debe crear el schema con migraciones)
+
+    Raises:
+        TenantProvisioningError: Si el clon no coincide con la plantilla
+    """
+    template = get_template_schema()
+    if template is None or not _template_is_ready(template):
+        return False
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT clone_schema(%s, %s, %s)',
+            [template, schema_name, clone_mode],
+        )
+
+    _restore_constraint_names(schema_name, template)
+    _restore_partitioned_foreign_keys(schema_name, template)
+    differences = verify_schema(schema_name, template)
+    connection.set_schema_to_public()
+
+    if differences:
+        raise TenantProvisioningError(
+            f'El schema "{schema_name}" no coincide con la plantilla "{template}": '
+            + '; '.join(differences)
+        )
+    return True
+
+
+def verify_schema(schema_name: str, reference_schema: str) -> list[str]:
+    """
+    Compara un schema contra otro de referencia.
+
+    Revisa las migraciones registradas en ``django_migrations``, las tablas
+    con sus columnas, los índices y las restricciones. Los nombres de schema
+    se normalizan, así que dos schemas migrados igual no tienen diferencias.
+
+    Args:
+        schema_name: Schema a verificar (ej. un tenant recién clonado)
+        reference_schema: Schema esperado (ej. la plantilla)
+
+    Returns:
+        Lista de diferencias legibles (vacía si coinciden)
+
+    Example:
+        >>> verify_schema('alianza', 'tenant_template')
+        ['falta índice: answers.answers_submission_idx']
+    """
+    differences = []
+
+    expected = schema_fingerprint(reference_schema)
+    actual = schema_fingerprint(schema_name)
+
+    for kind, expected_items in expected.items():
+        actual_items = actual[kind]
+        differences += [f'falta {kind}: {item}' for item in sorted(expected_items - actual_items)]
+        differences += [f'sobra {kind}: {item}' for item in sorted(actual_items - expected_items)]
+
+    return differences
+
+
+def schema_fingerprint(schema_name: str) -> dict[str, set[str]]:
+    """
+    Huella estructural de un schema, sin el nombre del schema.
+
+    Las particiones mensuales (y las archivadas) se omiten: dependen de la
+    fecha de creación y de la retención de cada tenant, no de la estructura.
+
+    Returns:
+        Diccionario {tipo: conjunto de descripciones} con los tipos
+        "migración", "columna", "índice" y "restricción"
+    """
+    prefix = f'{schema_name}.'
+    quoted_prefix = f'"{schema_name}".'
+
+    def normalize(text: str | None) -> str:
+        return (text or '').replace(quoted_prefix, '').replace(prefix, '')
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'SELECT app, name FROM "{schema_name}".django_migrations'
+            if _has_table(cursor, schema_name, 'django_migrations')
+            else 'SELECT NULL, NULL WHERE false'
+        )
+        migrations = {f'{app}.{name}' for app, name in cursor.fetchall()}
+
+        cursor.execute(
+            """
+            SELECT table_name, column_name, data_type, is_nullable, column_default
+            FROM information_schema.columns
+            WHERE table_schema = %s
+            """,
+            [schema_name],
+        )
+        columns = {
+            f'{table}.{column} {data_type} null={nullable} default={normalize(default)}'
+            for table, column, data_type, nullable, default in cursor.fetchall()
+            if not is_partition_table(table)
+        }
+
+        cursor.execute(
+            'SELECT tablename, indexname, indexdef FROM pg_indexes WHERE schemaname = %s',
+            [schema_name],
+        )
+        indexes = {
+            f'{table}.{name} {normalize(definition)}'
+            for table, name, definition in cursor.fetchall()
+            if not is_partition_table(table)
+        }
+
+        cursor.execute(
+            """
+            SELECT rel.relname, con.conname, pg_get_constraintdef(con.oid)
+            FROM pg_constraint con
+            JOIN pg_class rel ON rel.oid = con.conrelid
+            JOIN pg_namespace nsp ON nsp.oid = rel.relnamespace
+            WHERE nsp.nspname = %s
+            """,
+            [schema_name],
+        )
+        constraints = {
+            f'{table}.{name} {normalize(definition)}'
+            for table, name, definition in cursor.fetchall()
+            if not is_partition_table(table)
+        }
+
+    return {
+        'migración': migrations,
+        'columna': columns,
+        'índice': indexes,
+        'restricción': constraints,
+    }
+
+
+def _template_is_ready(template: str) -> bool:
+    """La plantilla existe, está al día y la función clone_schema está instalada."""
+    if not schema_exists(template) or get_pending_migrations(template):
+        return False
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT 1 FROM pg_proc p
+            JOIN pg_namespace n ON n.oid = p.pronamespace
+            WHERE n.nspname = 'public' AND p.proname = 'clone_schema'
+            """
+        )
+        return cursor.fetchone() is not None
+
+
+def _restore_constraint_names(schema_name: str, template: str) -> None:
+    """
+    Devuelve a las restricciones UNIQUE del clon el nombre que tienen en la
+    plantilla (clone_schema las recrea con el nombre por defecto de
+    PostgreSQL, y migraciones futuras las buscan por nombre).
+    """
+    query = """
+        SELECT rel.relname, pg_get_constraintdef(con.oid), con.conname
+        FROM pg_constraint con
+        JOIN pg_class rel ON rel.oid = con.conrelid
+        JOIN pg_namespace nsp ON nsp.oid = rel.relnamespace
+        WHERE nsp.nspname = %s AND con.contype = 'u'
+    """
+
+    with connection.cursor() as cursor:
+        cursor.execute(query, [template])
+        expected = {(table, definition): name for table, definition, name in cursor.fetchall()}
+
+        cursor.execute(query, [schema_name])
+        for table, definition, name in cursor.fetchall():
+            expected_name = expected.get((table, definition))
+            if expected_name and expected_name != name:
+                cursor.execute(
+                    f'ALTER TABLE "{schema_name}"."{table}" '
+                    f'RENAME CONSTRAINT "{name}" TO "{expected_name}"'
+                )
+
+
+def _restore_partitioned_foreign_keys(schema_name: str, template: str) -> None:
+    """
+    Recrea en las tablas particionadas del clon (survey_submissions, answers)
+    las FOREIGN KEY de la plantilla: clone_schema no las copia en tablas
+    particionadas. PostgreSQL las propaga a cada partición.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT rel.relname, con.conname, pg_get_constraintdef(con.oid)
+            FROM pg_constraint con
+            JOIN pg_class rel ON rel.oid = con.conrelid
+            JOIN pg_namespace nsp ON nsp.oid = rel.relnamespace
+            WHERE nsp.nspname = %s AND con.contype = 'f' AND rel.relkind = 'p'
+              AND NOT EXISTS (
+                  SELECT 1 FROM pg_constraint cloned
+                  JOIN pg_class cloned_rel ON cloned_rel.oid = cloned.conrelid
+                  JOIN pg_namespace cloned_nsp ON cloned_nsp.oid = cloned_rel.relnamespace
+                  WHERE cloned_nsp.nspname = %s AND cloned_rel.relname = rel.relname
+                    AND cloned.conname = con.conname
+              )
+            """,
+            [template, schema_name],
+        )
+        missing = cursor.fetchall()
+
+        for table, name, definition in missing:
+            # pg_get_constraintdef califica las tablas referenciadas con el schema de la plantilla
+            definition = (
+                definition
+                .replace(f'"{template}".', f'"{schema_name}".')
+                .replace(f'{template}.', f'"{schema_name}".')
+            )
+            cursor.execute(f'ALTER TABLE "{schema_name}"."{table}" ADD CONSTRAINT "{name}" {definition}')
+
+
+def _has_table(cursor, schema_name: str, table_name: str) -> bool:
+    cursor.execute('SELECT to_regclass(%s) IS NOT NULL', [f'"{schema_name}".{table_name}'])
+    return cursor.fetchone()[0]
@@ -0,0 +1,238 @@
+"""
+Migración de schemas de tenants en paralelo.
+
+``migrate_schemas`` recorre los tenants uno por uno y arranca el motor de
+migraciones en cada schema aunque no tenga nada pendiente. Aquí:
+
+1. Se leen las tablas ``django_migrations`` de todos los schemas con una
+   consulta ``UNION ALL`` por lote y se descartan los que ya están al día.
+2. Los pendientes se migran en un pool de procesos (``spawn``: cada
+   proceso inicializa Django y abre su propia conexión).
+
+La fase release registra además una huella (``SchemaFingerprint``) del
+estado de migraciones del código cuando todos los schemas lo tienen
+aplicado; el arranque web solo compara esa huella (una consulta).
+"""
+import hashlib
+import json
+import multiprocessing
+import os
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+
+from django.db import DatabaseError, connection, transaction
+from django.db.migrations.loader import MigrationLoader
+from django_tenants.utils import get_public_schema_name, get_tenant_model
+
+# Schemas por consulta al leer django_migrations
+APPLIED_BATCH_SIZE = 100
+
+
+@dataclass
+class SchemaMigrationResult:
+    """Resultado de migrar un schema."""
+    schema_name: str
+    seconds: float
+    error: str = ''
+
+
+def default_workers() -> int:
+    """Número de procesos por defecto: uno por CPU."""
+    return os.cpu_count() or 1
+
+
+def get_applied_migrations(schema_names: Iterable[str]) -> dict[str, set[tuple[str, str]]]:
+    """
+    Migraciones registradas en cada schema, con una consulta por lote.
+
+    Los schemas sin tabla ``django_migrations`` (o inexistentes) quedan con
+    un conjunto vacío.
+
+    Args:
+        schema_names: Schemas a consultar
+
+    Returns:
+        Diccionario {schema_name: {(app_label, nombre), ...}}
+    """
+    schema_names = list(schema_names)
+    applied: dict[str, set[tuple[str, str]]] = {schema_name: set() for schema_name in schema_names}
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT nspname FROM pg_namespace
+            WHERE nspname = ANY(%s)
+              AND to_regclass(quote_ident(nspname) || '.django_migrations') IS NOT NULL
+            """,
+            [schema_names],
+        )
+        existing = sorted(row[0] for row in cursor.fetchall())
+
+        for start in range(0, len(existing), APPLIED_BATCH_SIZE):
+            batch = existing[start:start + APPLIED_BATCH_SIZE]
+            sql = ' UNION ALL '.join(
+                f'SELECT %s, app, name FROM "{schema_name}".django_migrations' for schema_name in batch
+            )
+            cursor.execute(sql, batch)
+            for schema_name, app_label, name in cursor.fetchall():
+                applied[schema_name].add((app_label, name))
+
+    return applied
+
+
+def get_pending_by_schema(schema_names: Iterable[str]) -> dict[str, list[tuple[str, str]]]:
+    """
+    Migraciones pendientes de cada schema, sin abrir un executor por schema.
+
+    Una migración squash cuenta como aplicada si todas las que reemplaza
+    lo están (igual que hace Django).
+
+    Args:
+        schema_names: Schemas de tenants
+
+    Returns:
+        Diccionario {schema_name: [(app_label, nombre), ...]} (lista vacía = al día)
+    """
+    graph = MigrationLoader(None, ignore_no_migrations=True).graph
+    applied_by_schema = get_applied_migrations(schema_names)
+
+    pending = {}
+    for schema_name, applied in applied_by_schema.items():
+        pending[schema_name] = [
+            key for key, migration in sorted(graph.nodes.items())
+            if key not in applied
+            and not (migration.replaces and all(tuple(replaced) in applied for replaced in migration.replaces))
+        ]
+    return pending
+
+
+def get_code_migrations() -> list[str]:
+    """
+    Última migración de cada app según el código (nodos hoja del grafo).
+
+    Returns:
+        Lista ordenada de "app_label.nombre"
+    """
+    graph = MigrationLoader(None, ignore_no_migrations=True).graph
+    return sorted(f'{app_label}.{name}' for app_label, name in graph.leaf_nodes())
+
+
+def get_code_fingerprint(migrations: list[str] | None = None) -> str:
+    """Hash SHA-256 del estado de migraciones del código."""
+    if migrations is None:
+        migrations = get_code_migrations()
+    return hashlib.sha256(json.dumps(migrations).encode()).hexdigest()
+
+
+def record_schema_fingerprint() -> list[str]:
+    """
+    Registra la huella del código si todos los schemas la tienen aplicada.
+
+    Revisa el schema público y todos los tenants con una consulta por lote.
+
+    Returns:
+        Schemas con migraciones pendientes (lista vacía = huella registrada)
+    """
+    from .models import SchemaFingerprint
+
+    schema_names = [get_public_schema_name()] + list(
+        get_tenant_model().objects
+        .exclude(schema_name=get_public_schema_name())
+        .values_list('schema_name', flat=True)
+    )
+    pending = get_pending_by_schema(schema_names)
+    outdated = sorted(schema_name for schema_name, migrations in pending.items() if migrations)
+    if outdated:
+        return outdated
+
+    migrations = get_code_migrations()
+    SchemaFingerprint.objects.update_or_create(
+        fingerprint=get_code_fingerprint(migrations),
+        defaults={'migrations': migrations, 'schemas': len(schema_names)},
+    )
+    return []
+
+
+def schema_fingerprint_is_current() -> bool:
+    """
+    Indica si la fase release ya verificó el estado de migraciones del código.
+
+    Es la comprobación barata del arranque web: carga el grafo de
+    migraciones desde disco y hace una sola consulta.
+    """
+    from .models import SchemaFingerprint
+
+    try:
+        # atomic: si la tabla no existe, la transacción del llamador sigue usable
+        with transaction.atomic():
+            return SchemaFingerprint.objects.filter(fingerprint=get_code_fingerprint()).exists()
+    except DatabaseError:
+        # Base de datos sin inicializar (la tabla aún no existe)
+        return False
+
+
+def migrate_schemas_parallel(schema_names: list[str], workers: int) -> Iterator[SchemaMigrationResult]:
+    """
+    Migra varios schemas en paralelo.
+
+    Args:
+        schema_names: Schemas a migrar
+        workers: Procesos simultáneos (cada uno usa una conexión a la base de datos)
+
+    Returns:
+        Iterador de resultados, en el orden en que terminan
+    """
+    if workers <= 1 or len(schema_names) <= 1:
+        for schema_name in schema_names:
+            yield migrate_schema(schema_name)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(schema_names)),
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_worker,
+    ) as executor:
+        futures = [executor.submit(migrate_schema, schema_name) for schema_name in schema_names]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def migrate_schema(schema_name: str) -> SchemaMigrationResult:
+    """
+    Ejecuta ``migrate_schemas`` en un schema y mide el tiempo.
+
+    Los errores se reportan en el resultado (no se propagan) para que un
+    tenant con problemas no detenga a los demás.
+    """
+    from django.core.management import call_command
+
+    started = time.perf_counter()
+    error = ''
+
+    try:
+        call_command(
+            'migrate_schemas',
+            schema_name=schema_name,
+            interactive=False,
+            verbosity=0,
+        )
+    except Exception as exc:
+        error = str(exc)
+    finally:
+        connection.close()
+
+    return SchemaMigrationResult(
+        schema_name=schema_name,
+        seconds=time.perf_counter() - started,
+        error=error,
+    )
+
+
+def _init_worker() -> None:
+    """Inicializa Django en un proceso del pool (spawn no hereda el estado)."""
+    import django
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'buzon_quejas.settings')
+    django.setup()
@@ -0,0 +1,26 @@
+"""
+Señales de organization.
+
+La resolución hostname → tenant y el directorio público de organizaciones
+se cachean (tenant_cache); cualquier cambio en organizaciones o dominios
+los invalida para que el enrutamiento, el selector público y el estado
+activo/inactivo se actualicen.
+
+La invalidación se aplica al confirmar la transacción: antes, otro proceso
+podría recargar la fila anterior y guardarla bajo la versión nueva.
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Domain, Organization
+from .tenant_cache import invalidate_tenant_cache
+
+
+@receiver(post_save, sender=Organization)
+@receiver(post_delete, sender=Organization)
+@receiver(post_save, sender=Domain)
+@receiver(post_delete, sender=Domain)
+def invalidate_tenant_routing(sender, **kwargs):
+    """Invalida la caché de tenants al confirmar el guardado o la eliminación."""
+    transaction.on_commit(invalidate_tenant_cache)
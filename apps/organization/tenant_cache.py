@@ -0,0 +1,176 @@
+"""
+Caché de resolución hostname → tenant y del directorio público de
+organizaciones (selector de la página principal).
+
+Dos niveles para que el enrutamiento y la página pública no consulten la
+base de datos en estado estable:
+
+1. LRU en el proceso (sin I/O), con TTL corto.
+2. Cache de Django (Redis), compartido entre procesos.
+
+Guardar o eliminar una ``Organization`` o un ``Domain`` cambia la versión
+de las claves en Redis (todas quedan invalidadas) y vacía el LRU del
+proceso actual; los demás procesos ven el cambio cuando vence su TTL
+local. Si Redis no responde, se consulta la base de datos como siempre.
+"""
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from django.core.cache import cache
+
+from django_tenants.utils import get_public_schema_name
+
+from .models import Domain, Organization
+
+# Entradas del LRU por proceso y su vigencia (segundos)
+LOCAL_MAX_ENTRIES = 512
+LOCAL_TTL = 30
+
+# Vigencia en Redis (segundos); la invalidación por versión la hace innecesaria
+SHARED_TIMEOUT = 60 * 60 * 24
+
+VERSION_KEY = 'tenant_routing:version'
+
+# Marcador de hostname sin tenant (también se cachea: evita consultas por hosts desconocidos)
+NOT_FOUND = 'not-found'
+
+# Clave del directorio de organizaciones (no puede colisionar con un hostname)
+DIRECTORY_KEY = ':directory'
+
+_local: OrderedDict[str, tuple[float, dict | list | str]] = OrderedDict()
+_local_lock = threading.Lock()
+
+
+def get_cached_tenant(hostname: str) -> Organization | None:
+    """
+    Resuelve el tenant de un hostname usando la caché.
+
+    Args:
+        hostname: Host del request sin puerto ni "www."
+
+    Returns:
+        Instancia de Organization (nueva en cada llamada), o None si el
+        hostname no tiene dominio registrado
+    """
+    data = _get_or_load(hostname, lambda: _load_tenant(hostname))
+
+    if data == NOT_FOUND:
+        return None
+
+    return Organization.from_db('default', list(data), list(data.values()))
+
+
+def get_organization_directory() -> list[dict]:
+    """
+    Organizaciones activas con dominio primario, para el selector público.
+
+    El resultado se comparte entre requests: no debe modificarse.
+
+    Returns:
+        Lista de diccionarios {'id', 'name', 'domain'} ordenada por nombre
+
+    Example:
+        >>> get_organization_directory()
+        [{'id': '6f1c…', 'name': 'Alianza', 'domain': 'alianza.tuvozenruta.com'}]
+    """
+    return _get_or_load(DIRECTORY_KEY, _load_directory)
+
+
+def invalidate_tenant_cache() -> None:
+    """Invalida todas las resoluciones y el directorio (Redis y el LRU de este proceso)."""
+    _shared_call(cache.set, VERSION_KEY, uuid.uuid4().hex, None)
+
+    with _local_lock:
+        _local.clear()
+
+
+def _get_or_load(name: str, loader) -> dict | list | str:
+    """Busca ``name`` en el LRU, luego en Redis, y si no está lo carga y lo guarda en ambos."""
+    data = _local_get(name)
+
+    if data is None:
+        key = _shared_key(name)
+        data = _shared_call(cache.get, key) if key else None
+
+        if data is None:
+            data = loader()
+            if key:
+                _shared_call(cache.set, key, data, SHARED_TIMEOUT)
+
+        _local_set(name, data)
+
+    return data
+
+
+def _load_tenant(hostname: str) -> dict | str:
+    """Consulta el dominio y devuelve los campos del tenant (o NOT_FOUND)."""
+    try:
+        tenant = Domain.objects.select_related('tenant').get(domain=hostname).tenant
+    except Domain.DoesNotExist:
+        return NOT_FOUND
+
+    return {field.attname: getattr(tenant, field.attname) for field in Organization._meta.concrete_fields}
+
+
+def _load_directory() -> list[dict]:
+    """Consulta las organizaciones activas (sin la pública) con su dominio primario."""
+    domains = (
+        Domain.objects
+        .filter(is_primary=True, tenant__is_active=True)
+        .exclude(tenant__schema_name=get_public_schema_name())
+        .order_by('tenant__name')
+        .values_list('tenant_id', 'tenant__name', 'domain')
+    )
+    return [
+        {'id': str(tenant_id), 'name': name, 'domain': domain}
+        for tenant_id, name, domain in domains
+    ]
+
+
+def _shared_key(hostname: str) -> str | None:
+    """Clave en Redis para la versión vigente (None si Redis no responde)."""
+    version = _shared_call(cache.get, VERSION_KEY)
+
+    if version is None:
+        version = uuid.uuid4().hex
+        # add: si otro proceso la creó primero, se respeta la suya
+        if not _shared_call(cache.add, VERSION_KEY, version, None):
+            version = _shared_call(cache.get, VERSION_KEY)
+            if version is None:
+                return None
+
+    return f'tenant_routing:{version}:{hostname}'
+
+
+def _shared_call(method, *args):
+    """Llama al cache compartido; un Redis caído equivale a un fallo de caché."""
+    try:
+        return method(*args)
+    except Exception:
+        return None
+
+
+def _local_get(hostname: str) -> dict | list | str | None:
+    with _local_lock:
+        entry = _local.get(hostname)
+        if entry is None:
+            return None
+
+        expires_at, data = entry
+        if expires_at < time.monotonic():
+            del _local[hostname]
+            return None
+
+        _local.move_to_end(hostname)
+        return data
+
+
+def _local_set(hostname: str, data: dict | list | str) -> None:
+    with _local_lock:
+        _local[hostname] = (time.monotonic() + LOCAL_TTL, data)
+        _local.move_to_end(hostname)
+
+        while len(_local) > LOCAL_MAX_ENTRIES:
+            _local.popitem(last=False)
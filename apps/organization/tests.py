@@ -1,3 +1,317 @@
-from django.test import TestCase
+"""
+Tests de organization: caché de enrutamiento de tenants, selector público
+de organizaciones, alta por plantilla y migración de schemas.
+"""
+import io
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import connection, transaction
+from django.db.migrations import Migration
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django_tenants.test.cases import TenantTestCase
+from django_tenants.test.client import TenantClient
+from django_tenants.utils import get_public_schema_name, schema_context
+from django_recaptcha import client as recaptcha_client
+
+from apps.interview.models import Question
+from apps.interview.seed import DEFAULT_QUESTIONS
+from apps.interview.tests import TEST_SETTINGS
+from apps.organization import schema_migrations, tenant_cache
+from apps.organization.models import Domain, Organization, SchemaFingerprint
+from apps.organization.provisioning import get_pending_migrations, prepare_template_schema, verify_schema
+from apps.organization.schema_migrations import (
+    get_pending_by_schema,
+    record_schema_fingerprint,
+    schema_fingerprint_is_current,
+)
+from apps.organization.tenant_cache import get_cached_tenant, get_organization_directory
+
+
+class TestTenantCache(TenantTestCase):
+    """Tests de tenant_cache y CachedTenantMainMiddleware."""
+
+    hostname = 'tenant.test.com'
+
+    def setUp(self):
+        super().setUp()
+        settings_override = override_settings(**TEST_SETTINGS)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        cache.clear()
+        tenant_cache._local.clear()
+        self.addCleanup(tenant_cache._local.clear)
+
+    def test_warm_lookup_runs_no_queries(self):
+        get_cached_tenant(self.hostname)
+
+        with self.assertNumQueries(0):
+            tenant = get_cached_tenant(self.hostname)
+        self.assertEqual(tenant.pk, self.tenant.pk)
+        self.assertEqual(tenant.schema_name, self.tenant.schema_name)
+
+        # Otro proceso (LRU vacío) la resuelve desde el cache compartido
+        tenant_cache._local.clear()
+        with self.assertNumQueries(0):
+            self.assertEqual(get_cached_tenant(self.hostname).pk, self.tenant.pk)
+
+    def test_unknown_hostname_is_cached(self):
+        self.assertIsNone(get_cached_tenant('desconocido.test.com'))
+
+        tenant_cache._local.clear()
+        with self.assertNumQueries(0):
+            self.assertIsNone(get_cached_tenant('desconocido.test.com'))
+        self.assertEqual(cache.get(tenant_cache._shared_key('desconocido.test.com')), tenant_cache.NOT_FOUND)
+
+    def test_saving_domain_invalidates(self):
+        self.assertIsNone(get_cached_tenant('alterno.test.com'))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Domain.objects.create(domain='alterno.test.com', tenant=self.tenant, is_primary=False)
+
+        self.assertEqual(get_cached_tenant('alterno.test.com').pk, self.tenant.pk)
+
+    def test_deactivating_organization_reaches_active_middleware(self):
+        client = TenantClient(self.tenant)
+        self.assertNotEqual(client.get('/').status_code, 503)
+
+        self.tenant.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tenant.save()
+
+        self.assertFalse(get_cached_tenant(self.hostname).is_active)
+        response = client.get('/')
+        self.assertEqual(response.status_code, 503)
+        self.assertTemplateUsed(response, 'organization/organization_inactive.html')
+
+        self.tenant.is_active = True
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tenant.save()
+        self.assertNotEqual(client.get('/').status_code, 503)
+
+    def test_invalidation_waits_for_commit(self):
+        self.assertTrue(get_cached_tenant(self.hostname).is_active)
+        self.assertIsNone(get_cached_tenant('alterno.test.com'))
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            with transaction.atomic():
+                self.tenant.is_active = False
+                self.tenant.save()
+                Domain.objects.create(domain='alterno.test.com', tenant=self.tenant, is_primary=False)
+
+            # Sin confirmar: otro proceso solo puede ver (y cachear) las filas anteriores
+            tenant_cache._local.clear()
+            self.assertTrue(get_cached_tenant(self.hostname).is_active)
+            self.assertIsNone(get_cached_tenant('alterno.test.com'))
+
+        for callback in callbacks:
+            callback()
+
+        self.assertFalse(get_cached_tenant(self.hostname).is_active)
+        self.assertEqual(get_cached_tenant('alterno.test.com').pk, self.tenant.pk)
+
+    def test_falls_back_to_database_when_cache_fails(self):
+        with mock.patch.object(tenant_cache.cache, 'get', side_effect=ConnectionError), \
+                mock.patch.object(tenant_cache.cache, 'set', side_effect=ConnectionError), \
+                mock.patch.object(tenant_cache.cache, 'add', side_effect=ConnectionError):
+            self.assertEqual(get_cached_tenant(self.hostname).pk, self.tenant.pk)
+            self.assertIsNone(get_cached_tenant('desconocido.test.com'))
+
+            tenant_cache._local.clear()
+            self.assertNotEqual(TenantClient(self.tenant).get('/').status_code, 503)
+
+
+class TestSelectOrganization(TenantTestCase):
+    """Tests del selector de organizaciones del dominio público."""
+
+    public_hostname = 'tuvozenruta.com'
+
+    @classmethod
+    def setup_tenant(cls, tenant):
+        tenant.name = 'Alianza'
+
+    def setUp(self):
+        super().setUp()
+        settings_override = override_settings(**TEST_SETTINGS)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.addCleanup(connection.set_schema_to_public)
+
+        # bulk_create: registros sin schema propio (save() lo crearía)
+        public, inactive, without_primary = Organization.objects.bulk_create([
+            Organization(name='Público', schema_name=get_public_schema_name()),
+            Organization(name='Inactiva', schema_name='test_inactiva', is_active=False),
+            Organization(name='Sin dominio primario', schema_name='test_sin_primario'),
+        ])
+        Domain.objects.bulk_create([
+            Domain(domain=self.public_hostname, tenant=public, is_primary=True),
+            Domain(domain='inactiva.test.com', tenant=inactive, is_primary=True),
+            Domain(domain='sin-primario.test.com', tenant=without_primary, is_primary=False),
+        ])
+
+        cache.clear()
+        tenant_cache._local.clear()
+        self.addCleanup(tenant_cache._local.clear)
+        self.client = Client(HTTP_HOST=self.public_hostname)
+
+        # reCAPTCHA siempre válido, sin salir a la red
+        self.enterContext(mock.patch.object(
+            recaptcha_client, 'submit', return_value=recaptcha_client.RecaptchaResponse(is_valid=True)
+        ))
+
+    def choices(self, response):
+        return [label for value, label in response.context['form'].fields['organization'].choices if value]
+
+    def post(self, organization):
+        return self.client.post('/', {'organization': organization, 'g-recaptcha-response': 'ok'})
+
+    def test_warm_requests_run_no_queries(self):
+        self.client.get('/')
+
+        with self.assertNumQueries(0):
+            response = self.client.get('/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.choices(response), [self.tenant.name])
+
+        with self.assertNumQueries(0):
+            response = self.post(str(self.tenant.pk))
+        self.assertRedirects(response, 'http://tenant.test.com/survey/', fetch_redirect_response=False)
+
+    def test_only_active_organizations_with_primary_domain_are_listed(self):
+        self.assertEqual(
+            get_organization_directory(),
+            [{'id': str(self.tenant.pk), 'name': self.tenant.name, 'domain': 'tenant.test.com'}],
+        )
+
+    def test_invalid_choice_is_rejected(self):
+        inactive = Organization.objects.get(schema_name='test_inactiva')
+
+        for organization in (str(inactive.pk), 'no-existe', ''):
+            with self.subTest(organization=organization):
+                response = self.post(organization)
+
+                self.assertEqual(response.status_code, 200)
+                self.assertIn('organization', response.context['form'].errors)
+
+    def test_saving_organization_or_domain_refreshes_directory(self):
+        self.assertEqual(self.choices(self.client.get('/')), [self.tenant.name])
+
+        self.addCleanup(setattr, self.tenant, 'name', self.tenant.name)
+        self.tenant.name = 'Alianza Renovada'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tenant.save()
+        self.assertEqual(self.choices(self.client.get('/')), ['Alianza Renovada'])
+
+        without_primary = Domain.objects.get(domain='sin-primario.test.com')
+        without_primary.is_primary = True
+        with self.captureOnCommitCallbacks(execute=True):
+            without_primary.save()
+        self.assertEqual(self.choices(self.client.get('/')), ['Alianza Renovada', 'Sin dominio primario'])
+
+
+class TestTemplateProvisioning(TestCase):
+    """Tests de provisioning: alta de tenants clonando la plantilla."""
+
+    template = 'test_tenant_template'
+
+    def setUp(self):
+        super().setUp()
+        settings_override = override_settings(TENANT_TEMPLATE_SCHEMA=self.template, **TEST_SETTINGS)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.addCleanup(connection.set_schema_to_public)
+
+    def create_organization(self, schema_name):
+        with CaptureQueriesContext(connection) as queries:
+            Organization(name=schema_name.title(), schema_name=schema_name).save()
+        return any('clone_schema(' in query['sql'] for query in queries.captured_queries)
+
+    def test_tenant_is_cloned_from_template(self):
+        prepare_template_schema()
+
+        self.assertTrue(self.create_organization('test_alianza'))
+
+        self.assertEqual(verify_schema('test_alianza', self.template), [])
+        self.assertEqual(get_pending_migrations('test_alianza'), [])
+        with schema_context('test_alianza'):
+            self.assertEqual(Question.objects.count(), len(DEFAULT_QUESTIONS))
+
+    def test_template_with_pending_migrations_falls_back_to_migrate(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'CREATE SCHEMA "{self.template}"')
+
+        self.assertFalse(self.create_organization('test_norte'))
+
+        self.assertEqual(get_pending_migrations('test_norte'), [])
+        self.assertNotEqual(get_pending_migrations(self.template), [])
+
+
+class TestSchemaMigrations(TenantTestCase):
+    """Tests de schema_migrations y del comando migrate_tenants."""
+
+    latest = ('interview', '0008_monthly_partitions')
+
+    def unapply(self, app_label, name):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'DELETE FROM "{self.tenant.schema_name}".django_migrations WHERE app = %s AND name = %s',
+                [app_label, name],
+            )
+
+    def test_pending_by_schema(self):
+        self.assertEqual(get_pending_by_schema([self.tenant.schema_name]), {self.tenant.schema_name: []})
+
+        self.unapply(*self.latest)
+        pending = get_pending_by_schema([self.tenant.schema_name, 'no_existe'])
+
+        self.assertEqual(pending[self.tenant.schema_name], [self.latest])
+        self.assertIn(self.latest, pending['no_existe'])
+        self.assertIn(('interview', '0001_initial'), pending['no_existe'])
+
+    def test_squashed_migration_counts_as_applied_when_replaced_ones_are(self):
+        applied = Migration('0001_squashed_0002', 'interview')
+        applied.replaces = [
+            ('interview', '0001_initial'),
+            ('interview', '0002_alter_complaint_created_at_alter_complaint_text'),
+        ]
+        partial = Migration('0007_squashed_0009', 'interview')
+        partial.replaces = [('interview', '0007_denormalized_route'), ('interview', '0009_futura')]
+        graph = SimpleNamespace(nodes={
+            ('interview', applied.name): applied,
+            ('interview', partial.name): partial,
+        })
+
+        with mock.patch.object(schema_migrations, 'MigrationLoader', return_value=SimpleNamespace(graph=graph)):
+            pending = get_pending_by_schema([self.tenant.schema_name])
+
+        self.assertEqual(pending[self.tenant.schema_name], [('interview', partial.name)])
+
+    def test_migrate_tenants_check(self):
+        call_command('migrate_tenants', '--check', '--schema', self.tenant.schema_name, stdout=io.StringIO())
+
+        self.unapply(*self.latest)
+        stdout = io.StringIO()
+        with self.assertRaisesMessage(CommandError, '1 tenant(s) con migraciones pendientes'):
+            call_command('migrate_tenants', '--check', '--schema', self.tenant.schema_name, stdout=stdout)
+        self.assertIn(f'{self.tenant.schema_name}: 1 pendientes', stdout.getvalue())
+
+    def test_fingerprint_is_not_recorded_while_a_tenant_is_behind(self):
+        self.unapply(*self.latest)
+
+        self.assertEqual(record_schema_fingerprint(), [self.tenant.schema_name])
+        self.assertFalse(SchemaFingerprint.objects.exists())
+        self.assertFalse(schema_fingerprint_is_current())
+
+    def test_fingerprint_is_recorded_when_all_schemas_are_current(self):
+        self.assertEqual(record_schema_fingerprint(), [])
+        self.assertTrue(schema_fingerprint_is_current())
+
+    def test_fingerprint_is_not_current_without_table(self):
+        with connection.cursor() as cursor:
+            cursor.execute('DROP TABLE public.schema_fingerprints')
+
+        self.assertFalse(schema_fingerprint_is_current())
+        self.assertEqual(get_pending_by_schema([self.tenant.schema_name]), {self.tenant.schema_name: []})
@@ -0,0 +1,175 @@
+"""
+Caché de imágenes QR direccionada por contenido.
+
+Cada PNG se guarda bajo ``render_key()`` (hash de URL, encabezado y
+parámetros de renderizado), así que una entrada nunca queda obsoleta: si
+cambia el diseño cambia la clave. Regenerar los QR de una flota ya
+renderizada solo lee bytes del almacenamiento.
+
+Backends (settings.QR_CACHE_BACKEND):
+    - "disk": archivos en settings.QR_CACHE_DIR (default)
+    - "cache": cache de Django ``default`` (Redis)
+    - "off": sin caché
+"""
+import os
+import tempfile
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import caches
+
+from .rendering import iter_rendered_pngs, render_key, render_qr_png
+
+# Unidades por lote: una consulta get_many por lote al backend
+CACHE_BATCH_SIZE = 100
+
+# Expiración en el backend "cache" (las claves no caducan por contenido)
+CACHE_TIMEOUT = 60 * 60 * 24 * 30
+
+CACHE_KEY_PREFIX = 'qr_png'
+
+
+class DiskQRCache:
+    """PNG en disco, repartidos en subdirectorios por los 2 primeros caracteres del hash."""
+
+    def __init__(self, directory: str | os.PathLike):
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f'{key}.png'
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, bytes]:
+        found = {}
+        for key in keys:
+            try:
+                found[key] = self._path(key).read_bytes()
+            except FileNotFoundError:
+                continue
+        return found
+
+    def set_many(self, items: dict[str, bytes]) -> None:
+        for key, png in items.items():
+            path = self._path(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Escritura atómica: otro proceso nunca lee un archivo a medias
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as tmp_file:
+                tmp_file.write(png)
+            os.replace(tmp_path, path)
+
+
+class DjangoQRCache:
+    """PNG en el cache de Django (Redis en producción)."""
+
+    def __init__(self, alias: str = 'default'):
+        self.cache = caches[alias]
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, bytes]:
+        found = self.cache.get_many([f'{CACHE_KEY_PREFIX}:{key}' for key in keys])
+        return {cache_key.split(':', 1)[1]: png for cache_key, png in found.items()}
+
+    def set_many(self, items: dict[str, bytes]) -> None:
+        self.cache.set_many(
+            {f'{CACHE_KEY_PREFIX}:{key}': png for key, png in items.items()},
+            timeout=CACHE_TIMEOUT,
+        )
+
+
+class NullQRCache:
+    """Sin caché: siempre renderiza."""
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, bytes]:
+        return {}
+
+    def set_many(self, items: dict[str, bytes]) -> None:
+        pass
+
+
+def get_qr_cache() -> DiskQRCache | DjangoQRCache | NullQRCache:
+    """
+    Backend de caché configurado en settings.QR_CACHE_BACKEND.
+
+    Raises:
+        ValueError: Si el backend no es "disk", "cache" u "off"
+    """
+    backend = getattr(settings, 'QR_CACHE_BACKEND', 'disk')
+
+    if backend == 'disk':
+        return DiskQRCache(settings.QR_CACHE_DIR)
+    if backend == 'cache':
+        return DjangoQRCache()
+    if backend == 'off':
+        return NullQRCache()
+    raise ValueError(f"QR_CACHE_BACKEND inválido: {backend}. Opciones: disk, cache, off")
+
+
+def get_qr_png(transit_number: str, tenant: str) -> bytes:
+    """
+    PNG del QR de una unidad, desde la caché o renderizado en el proceso actual.
+
+    Args:
+        transit_number: Número de tránsito de la unidad
+        tenant: Schema name del tenant
+
+    Returns:
+        Bytes del archivo PNG
+    """
+    qr_cache = get_qr_cache()
+    key = render_key(transit_number, tenant)
+
+    png = qr_cache.get_many([key]).get(key)
+    if png is None:
+        png = render_qr_png((transit_number, tenant))
+        qr_cache.set_many({key: png})
+    return png
+
+
+def iter_cached_pngs(
+    transit_numbers: Iterable[str],
+    tenant: str,
+    workers: int
+) -> Iterator[tuple[str, bytes]]:
+    """
+    Igual que ``iter_rendered_pngs`` pero leyendo primero de la caché.
+
+    Procesa por lotes de CACHE_BATCH_SIZE: consulta todas las claves del
+    lote de una vez, envía solo los faltantes al pool de procesos y guarda
+    los nuevos PNG. El orden de salida es el de ``transit_numbers``.
+
+    Args:
+        transit_numbers: Números de tránsito en el orden de salida
+        tenant: Schema name del tenant
+        workers: Procesos del pool para las imágenes faltantes
+
+    Returns:
+        Iterador de tuplas (transit_number, png_bytes)
+    """
+    qr_cache = get_qr_cache()
+    batch: list[str] = []
+
+    for transit_number in transit_numbers:
+        batch.append(transit_number)
+        if len(batch) >= CACHE_BATCH_SIZE:
+            yield from _resolve_batch(qr_cache, batch, tenant, workers)
+            batch = []
+
+    if batch:
+        yield from _resolve_batch(qr_cache, batch, tenant, workers)
+
+
+def _resolve_batch(qr_cache, batch: list[str], tenant: str, workers: int) -> Iterator[tuple[str, bytes]]:
+    keys = {transit_number: render_key(transit_number, tenant) for transit_number in batch}
+    found = qr_cache.get_many(keys.values())
+
+    missing = [transit_number for transit_number in batch if keys[transit_number] not in found]
+    if missing:
+        rendered = {
+            keys[transit_number]: png
+            for transit_number, png in iter_rendered_pngs(missing, tenant, workers)
+        }
+        qr_cache.set_many(rendered)
+        found.update(rendered)
+
+    for transit_number in batch:
+        yield transit_number, found[keys[transit_number]]
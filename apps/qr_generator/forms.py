@@ -12,6 +12,12 @@ class QRGeneratorForm(forms.Form):
         ('single', 'Una unidad específica'),
         ('range', 'Rango de unidades'),
     ]
+
+    FORMAT_CHOICES = [
+        ('png', 'PNG (imagen)'),
+        ('svg', 'SVG (vectorial)'),
+        ('pdf', 'Hoja PDF para imprenta (12 códigos por página)'),
+    ]
     
     selection_type = forms.ChoiceField(
         choices=SELECTION_CHOICES,
@@ -20,6 +26,15 @@ class QRGeneratorForm(forms.Form):
         initial='all'
     )
     
+    # Formato de salida (opcional para compatibilidad: PNG por defecto)
+    output_format = forms.ChoiceField(
+        choices=FORMAT_CHOICES,
+        required=False,
+        widget=forms.RadioSelect(attrs={'class': 'selection-radio'}),
+        label='Formato de salida',
+        initial='png'
+    )
+
     # Para selección única
     single_unit = forms.ModelChoiceField(
         queryset=Unit.objects.none(),
@@ -70,6 +85,7 @@ class QRGeneratorForm(forms.Form):
     def clean(self):
         cleaned_data = super().clean()
         selection_type = cleaned_data.get('selection_type')
+        cleaned_data['output_format'] = cleaned_data.get('output_format') or 'png'
         
         if selection_type == 'single':
             if not cleaned_data.get('single_unit'):
@@ -88,30 +104,53 @@ class QRGeneratorForm(forms.Form):
         
         return cleaned_data
     
+    def get_selection(self):
+        """
+        Retorna la selección como valores simples:
+        (selection_type, start_transit_number, end_transit_number).
+
+        En 'single' ambos números son el de la unidad; en 'all' van vacíos.
+        """
+        selection_type = self.cleaned_data['selection_type']
+
+        if selection_type == 'single':
+            transit_number = self.cleaned_data['single_unit'].transit_number
+            return selection_type, transit_number, transit_number
+
+        if selection_type == 'range':
+            return (
+                selection_type,
+                self.cleaned_data['start_unit'].transit_number,
+                self.cleaned_data['end_unit'].transit_number,
+            )
+
+        return selection_type, '', ''
+
     def get_selected_units(self):
         """
         Retorna el queryset de unidades seleccionadas según el tipo de selección.
         """
         if not self.is_valid():
             return Unit.objects.none()
-        
-        selection_type = self.cleaned_data['selection_type']
-        
-        if selection_type == 'all':
-            return Unit.objects.select_related('route').order_by('transit_number')
-        
-        elif selection_type == 'single':
-            unit = self.cleaned_data['single_unit']
-            return Unit.objects.filter(pk=unit.pk).select_related('route')
-        
-        elif selection_type == 'range':
-            start_unit = self.cleaned_data['start_unit']
-            end_unit = self.cleaned_data['end_unit']
-            
-            # Filtrar unidades en el rango (comparando transit_number como strings)
-            return Unit.objects.filter(
-                transit_number__gte=start_unit.transit_number,
-                transit_number__lte=end_unit.transit_number
-            ).select_related('route').order_by('transit_number')
-        
-        return Unit.objects.none()
+
+        return get_units_for_selection(*self.get_selection())
+
+
+def get_units_for_selection(selection_type, start_transit_number='', end_transit_number=''):
+    """
+    Queryset de unidades para una selección (ver QRGeneratorForm.get_selection).
+    """
+    if selection_type == 'all':
+        return Unit.objects.select_related('route').order_by('transit_number')
+
+    elif selection_type == 'single':
+        return Unit.objects.filter(transit_number=start_transit_number).select_related('route')
+
+    elif selection_type == 'range':
+        # Filtrar unidades en el rango (comparando transit_number como strings)
+        return Unit.objects.filter(
+            transit_number__gte=start_transit_number,
+            transit_number__lte=end_transit_number
+        ).select_related('route').order_by('transit_number')
+
+    return Unit.objects.none()
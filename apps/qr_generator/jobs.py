@@ -0,0 +1,183 @@
+"""
+Trabajos de generación de códigos QR en segundo plano.
+
+La vista registra un ``QrGenerationJob`` y responde de inmediato; el
+comando ``run_qr_generation_jobs`` (proceso worker) toma los pendientes,
+genera el archivo en el formato pedido (ZIP de PNG/SVG u hojas PDF) y lo
+guarda en ``STORAGES['qr_jobs']``, que el proceso web también debe poder leer
+(volumen compartido o backend remoto). El progreso se consulta por polling.
+"""
+import hashlib
+import json
+import tempfile
+from datetime import timedelta
+
+from django.core.files import File
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .forms import get_units_for_selection
+from .models import QrGenerationJob
+from .outputs import OUTPUT_FORMATS, stream_output
+
+# Imágenes entre cada actualización de progreso en la base de datos
+PROGRESS_EVERY = 25
+
+# Un trabajo en proceso sin heartbeat en este tiempo se considera abandonado
+# (worker reiniciado) y otro worker lo vuelve a tomar
+STALE_AFTER = timedelta(minutes=10)
+
+
+def selection_hash(
+    selection_type: str,
+    start_transit_number: str = '',
+    end_transit_number: str = '',
+    output_format: str = 'png'
+) -> str:
+    """
+    Hash de una selección de unidades y formato, usado para deduplicar trabajos.
+
+    Returns:
+        Hash SHA-256 hexadecimal
+    """
+    payload = json.dumps([selection_type, start_transit_number, end_transit_number, output_format])
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def submit_job(
+    selection: tuple[str, str, str],
+    user=None,
+    output_format: str = 'png'
+) -> tuple[QrGenerationJob, bool]:
+    """
+    Registra un trabajo para la selección, o reutiliza uno activo idéntico.
+
+    La restricción ``qr_jobs_one_active_per_selection`` garantiza que dos
+    solicitudes simultáneas no creen trabajos duplicados.
+
+    Args:
+        selection: (selection_type, start_transit_number, end_transit_number),
+            como lo retorna QRGeneratorForm.get_selection()
+        user: Usuario que solicita el trabajo
+        output_format: Clave de outputs.OUTPUT_FORMATS
+
+    Returns:
+        Tupla (trabajo, creado)
+    """
+    digest = selection_hash(*selection, output_format)
+    active = QrGenerationJob.objects.filter(
+        selection_hash=digest, status__in=QrGenerationJob.ACTIVE_STATUSES
+    )
+
+    existing = active.first()
+    if existing:
+        return existing, False
+
+    selection_type, start_transit_number, end_transit_number = selection
+    try:
+        with transaction.atomic():
+            job = QrGenerationJob.objects.create(
+                selection_type=selection_type,
+                start_transit_number=start_transit_number,
+                end_transit_number=end_transit_number,
+                output_format=output_format,
+                selection_hash=digest,
+                requested_by=user,
+            )
+    except IntegrityError:
+        # Otra solicitud idéntica lo creó entre la consulta y el insert
+        return active.get(), False
+
+    return job, True
+
+
+def claim_next_job() -> QrGenerationJob | None:
+    """
+    Toma el trabajo pendiente más antiguo (o uno abandonado) del tenant actual.
+
+    Usa ``SELECT ... FOR UPDATE SKIP LOCKED`` para que varios workers no
+    tomen el mismo trabajo.
+
+    Returns:
+        Trabajo marcado como RUNNING, o None si no hay trabajos
+    """
+    now = timezone.now()
+
+    with transaction.atomic():
+        job = (
+            QrGenerationJob.objects
+            .select_for_update(skip_locked=True)
+            .filter(
+                Q(status=QrGenerationJob.Status.PENDING)
+                | Q(status=QrGenerationJob.Status.RUNNING, heartbeat_at__lt=now - STALE_AFTER)
+            )
+            .order_by('created_at')
+            .first()
+        )
+        if job is None:
+            return None
+
+        job.status = QrGenerationJob.Status.RUNNING
+        job.started_at = now
+        job.heartbeat_at = now
+        job.processed = 0
+        job.save(update_fields=['status', 'started_at', 'heartbeat_at', 'processed'])
+
+    return job
+
+
+def run_job(job: QrGenerationJob, tenant: str, workers: int) -> QrGenerationJob:
+    """
+    Genera el archivo de un trabajo (ZIP o PDF) y lo guarda en ``job.artifact``.
+
+    El archivo se escribe en un temporal (memoria constante) y se sube al
+    almacenamiento al final. Los errores dejan el trabajo en FAILED.
+
+    Args:
+        job: Trabajo tomado con claim_next_job()
+        tenant: Schema name del tenant (para las URLs de los QR)
+        workers: Procesos del pool de renderizado
+
+    Returns:
+        El trabajo actualizado (DONE o FAILED)
+    """
+    try:
+        transit_numbers = list(
+            get_units_for_selection(
+                job.selection_type, job.start_transit_number, job.end_transit_number
+            ).values_list('transit_number', flat=True)
+        )
+        job.total = len(transit_numbers)
+        job.save(update_fields=['total'])
+
+        extension, _ = OUTPUT_FORMATS[job.output_format]
+        tracked = _track_progress(job, transit_numbers)
+
+        with tempfile.TemporaryFile() as output_file:
+            for chunk in stream_output(tracked, tenant, job.output_format, workers):
+                output_file.write(chunk)
+
+            output_file.seek(0)
+            job.artifact.save(f'{job.id}.{extension}', File(output_file), save=False)
+
+        job.status = QrGenerationJob.Status.DONE
+        job.processed = job.total
+    except Exception as exc:
+        job.status = QrGenerationJob.Status.FAILED
+        job.error = str(exc)
+
+    job.finished_at = timezone.now()
+    job.save(update_fields=['status', 'processed', 'artifact', 'error', 'finished_at'])
+    return job
+
+
+def _track_progress(job: QrGenerationJob, transit_numbers: list[str]):
+    """Entrega las unidades al renderizado y reporta progreso cada PROGRESS_EVERY."""
+    for processed, transit_number in enumerate(transit_numbers, start=1):
+        yield transit_number
+
+        if processed % PROGRESS_EVERY == 0:
+            QrGenerationJob.objects.filter(pk=job.pk).update(
+                processed=processed, heartbeat_at=timezone.now()
+            )
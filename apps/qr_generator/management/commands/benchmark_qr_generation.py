@@ -0,0 +1,95 @@
+"""
+Benchmark del renderizado de códigos QR en lote.
+
+Mide el rendimiento (imágenes/segundo) del pipeline de generación + ZIP en
+streaming para distintos números de procesos.
+
+Uso:
+    python manage.py benchmark_qr_generation --count 500 --workers 1 2 4 8
+    python manage.py benchmark_qr_generation --json
+"""
+import json
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.qr_generator.rendering import default_workers, get_executor, iter_rendered_pngs
+from apps.qr_generator.zip_stream import stream_zip
+
+
+class Command(BaseCommand):
+    help = 'Mide imágenes/segundo de la generación masiva de QR según el número de procesos.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--count',
+            type=int,
+            default=200,
+            help='Número de códigos QR por corrida (default: 200)',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            nargs='+',
+            help='Números de procesos a medir (default: 1 y potencias de 2 hasta el número de CPUs)',
+        )
+        parser.add_argument(
+            '--tenant',
+            default='benchmark',
+            help='Schema usado para construir las URLs (no se consulta la BD)',
+        )
+        parser.add_argument(
+            '--json',
+            action='store_true',
+            help='Imprimir resultados en JSON',
+        )
+
+    def handle(self, *args, **options):
+        count = options['count']
+        workers_list = options['workers'] or self._default_worker_counts()
+        transit_numbers = [f'BENCH{i:05d}' for i in range(count)]
+
+        results = []
+        for workers in workers_list:
+            if workers > 1:
+                # Arrancar el pool antes de medir (spawn tarda en importar módulos)
+                list(iter_rendered_pngs(transit_numbers[:workers], options['tenant'], workers))
+
+            started = time.perf_counter()
+            zip_bytes = sum(
+                len(chunk) for chunk in stream_zip(
+                    (f'{transit_number}.png', png)
+                    for transit_number, png in iter_rendered_pngs(transit_numbers, options['tenant'], workers)
+                )
+            )
+            elapsed = time.perf_counter() - started
+
+            results.append({
+                'workers': workers,
+                'images': count,
+                'seconds': round(elapsed, 3),
+                'images_per_second': round(count / elapsed, 1),
+                'zip_bytes': zip_bytes,
+            })
+
+        if workers_list and max(workers_list) > 1:
+            get_executor(max(workers_list)).shutdown()
+
+        if options['json']:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+
+        baseline = results[0]['images_per_second']
+        self.stdout.write(f'{"procesos":>8} {"segundos":>9} {"img/s":>8} {"speedup":>8}')
+        for row in results:
+            self.stdout.write(
+                f'{row["workers"]:>8} {row["seconds"]:>9.3f} {row["images_per_second"]:>8.1f} '
+                f'{row["images_per_second"] / baseline:>7.2f}x'
+            )
+
+    @staticmethod
+    def _default_worker_counts() -> list[int]:
+        counts = [1]
+        while counts[-1] * 2 <= default_workers():
+            counts.append(counts[-1] * 2)
+        return counts
@@ -0,0 +1,91 @@
+"""
+Worker de trabajos de generación de códigos QR.
+
+Recorre los tenants, toma los trabajos pendientes y genera sus archivos.
+Los archivos van a ``STORAGES['qr_jobs']``: si el worker corre en otro
+contenedor que el proceso web, ese almacenamiento debe ser compartido
+(ver QR_JOB_STORAGE_* en settings).
+
+Uso:
+    python manage.py run_qr_generation_jobs              # proceso permanente
+    python manage.py run_qr_generation_jobs --once       # vaciar la cola y salir
+    python manage.py run_qr_generation_jobs --schema alianza
+"""
+import time
+
+from django.core.files.storage import FileSystemStorage
+from django.core.management.base import BaseCommand, CommandError
+from django_tenants.utils import get_public_schema_name, get_tenant_model, schema_context
+
+from apps.qr_generator.jobs import claim_next_job, run_job
+from apps.qr_generator.models import QrGenerationJob
+from apps.qr_generator.views import get_render_workers
+
+
+class Command(BaseCommand):
+    help = 'Procesa los trabajos de generación de códigos QR en segundo plano.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--schema',
+            action='append',
+            dest='schemas',
+            help='Schema del tenant a procesar (se puede repetir; default: todos)',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Procesar los trabajos pendientes y terminar',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=5.0,
+            help='Segundos de espera cuando no hay trabajos (default: 5)',
+        )
+
+    def handle(self, *args, **options):
+        storage = QrGenerationJob._meta.get_field('artifact').storage
+        if isinstance(storage, FileSystemStorage):
+            self.stdout.write(self.style.WARNING(
+                f'Archivos de trabajos en disco local ({storage.location}): '
+                f'el proceso web debe compartir este directorio'
+            ))
+
+        while True:
+            processed = sum(self._drain_tenant(schema) for schema in self._get_schemas(options['schemas']))
+
+            if options['once']:
+                return
+            if not processed:
+                time.sleep(options['interval'])
+
+    def _get_schemas(self, requested):
+        tenants = get_tenant_model().objects.exclude(schema_name=get_public_schema_name())
+
+        if requested:
+            tenants = tenants.filter(schema_name__in=requested)
+            missing = set(requested) - set(tenants.values_list('schema_name', flat=True))
+            if missing:
+                raise CommandError(f"Tenants no encontrados: {', '.join(sorted(missing))}")
+
+        return list(tenants.order_by('schema_name').values_list('schema_name', flat=True))
+
+    def _drain_tenant(self, schema: str) -> int:
+        """Procesa todos los trabajos pendientes de un tenant."""
+        processed = 0
+
+        with schema_context(schema):
+            while (job := claim_next_job()) is not None:
+                started = time.perf_counter()
+                job = run_job(job, schema, get_render_workers())
+                processed += 1
+
+                if job.status == QrGenerationJob.Status.DONE:
+                    self.stdout.write(self.style.SUCCESS(
+                        f'✓ {schema}: trabajo {job.id} ({job.total} QR en {time.perf_counter() - started:.1f}s)'
+                    ))
+                else:
+                    self.stderr.write(self.style.ERROR(f'✗ {schema}: trabajo {job.id} falló: {job.error}'))
+
+        return processed
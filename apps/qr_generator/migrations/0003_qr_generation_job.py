@@ -0,0 +1,46 @@
+# Generated by Django 5.2.7 on 2026-10-19 06:05
+
+import apps.qr_generator.models
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('qr_generator', '0002_alter_qrgenerator_options'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QrGenerationJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('selection_type', models.CharField(max_length=10, verbose_name='Tipo de selección')),
+                ('start_transit_number', models.CharField(blank=True, default='', max_length=50)),
+                ('end_transit_number', models.CharField(blank=True, default='', max_length=50)),
+                ('selection_hash', models.CharField(db_index=True, max_length=64)),
+                ('status', models.CharField(choices=[('pending', 'Pendiente'), ('running', 'En proceso'), ('done', 'Terminado'), ('failed', 'Fallido')], default='pending', max_length=10, verbose_name='Estado')),
+                ('total', models.PositiveIntegerField(default=0)),
+                ('processed', models.PositiveIntegerField(default=0)),
+                ('artifact', models.FileField(blank=True, upload_to=apps.qr_generator.models.job_artifact_path)),
+                ('error', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now, editable=False)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('heartbeat_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('requested_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Trabajo de generación de QR',
+                'verbose_name_plural': 'Trabajos de generación de QR',
+                'db_table': 'qr_generation_jobs',
+                'indexes': [models.Index(fields=['status', 'created_at'], name='qr_jobs_status_created')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('status__in', ['pending', 'running'])), fields=('selection_hash',), name='qr_jobs_one_active_per_selection')],
+            },
+        ),
+    ]
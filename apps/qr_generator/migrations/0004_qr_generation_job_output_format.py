@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-19 06:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('qr_generator', '0003_qr_generation_job'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='qrgenerationjob',
+            name='output_format',
+            field=models.CharField(default='png', max_length=10, verbose_name='Formato'),
+        ),
+    ]
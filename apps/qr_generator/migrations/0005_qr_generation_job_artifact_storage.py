@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-19 08:01
+
+import apps.qr_generator.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('qr_generator', '0004_qr_generation_job_output_format'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='qrgenerationjob',
+            name='artifact',
+            field=models.FileField(blank=True, storage=apps.qr_generator.models.job_artifact_storage, upload_to=apps.qr_generator.models.job_artifact_path),
+        ),
+    ]
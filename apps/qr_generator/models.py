@@ -1,3 +1,10 @@
+import uuid
+
+from django.conf import settings
+from django.core.files.storage import InvalidStorageError, default_storage, storages
+from django.db import connection, models
+from django.utils import timezone
+
 from apps.transport.models import Unit
 
 
@@ -18,4 +25,91 @@ class QrGenerator(Unit):
         # Definir permisos personalizados para control de acceso
         permissions = [
             ("can_generate_qr_codes", "Puede generar códigos QR para unidades"),
-        ]
\ No newline at end of file
+        ]
+
+
+# Alias en settings.STORAGES de los archivos de trabajos
+JOB_STORAGE_ALIAS = 'qr_jobs'
+
+
+def job_artifact_storage():
+    """
+    Almacenamiento de los archivos de trabajos (settings.STORAGES['qr_jobs'],
+    o el almacenamiento por defecto si el alias no está configurado).
+
+    El worker escribe el archivo y el proceso web lo descarga: en despliegues
+    con varios contenedores debe ser compartido (ver QR_JOB_STORAGE_* en settings).
+    """
+    try:
+        return storages[JOB_STORAGE_ALIAS]
+    except InvalidStorageError:
+        return default_storage
+
+
+def job_artifact_path(job, filename):
+    """Ruta del archivo de un trabajo, separada por tenant."""
+    extension = filename.rsplit('.', 1)[-1]
+    return f'qr_jobs/{connection.schema_name}/{job.id}.{extension}'
+
+
+class QrGenerationJob(models.Model):
+    """
+    Trabajo de generación de códigos QR en segundo plano.
+
+    Lo crea la vista del generador y lo procesa el comando
+    ``run_qr_generation_jobs``; el archivo resultante queda en ``artifact``.
+    Solo puede haber un trabajo activo (pendiente o en proceso) por
+    ``selection_hash`` (selección + formato): solicitudes idénticas
+    reutilizan el existente.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'Pendiente'
+        RUNNING = 'running', 'En proceso'
+        DONE = 'done', 'Terminado'
+        FAILED = 'failed', 'Fallido'
+
+    ACTIVE_STATUSES = (Status.PENDING, Status.RUNNING)
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    selection_type = models.CharField(max_length=10, verbose_name='Tipo de selección')
+    # Números de tránsito de la selección (ambos iguales en 'single', vacíos en 'all')
+    start_transit_number = models.CharField(max_length=50, blank=True, default='')
+    end_transit_number = models.CharField(max_length=50, blank=True, default='')
+    output_format = models.CharField(max_length=10, default='png', verbose_name='Formato')
+    selection_hash = models.CharField(max_length=64, db_index=True)
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING, verbose_name='Estado')
+    total = models.PositiveIntegerField(default=0)
+    processed = models.PositiveIntegerField(default=0)
+    artifact = models.FileField(upload_to=job_artifact_path, storage=job_artifact_storage, blank=True)
+    error = models.TextField(blank=True, default='')
+    requested_by = models.ForeignKey(settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.SET_NULL, related_name='+')
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
+    started_at = models.DateTimeField(null=True, blank=True)
+    # Última señal de vida del worker (se actualiza con el progreso)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f'Trabajo QR {self.id} ({self.get_status_display()})'
+
+    @property
+    def progress_percent(self) -> int:
+        if self.status == self.Status.DONE:
+            return 100
+        return int(self.processed * 100 / self.total) if self.total else 0
+
+    class Meta:
+        db_table = 'qr_generation_jobs'
+        verbose_name = 'Trabajo de generación de QR'
+        verbose_name_plural = 'Trabajos de generación de QR'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['selection_hash'],
+                condition=models.Q(status__in=['pending', 'running']),
+                name='qr_jobs_one_active_per_selection',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='qr_jobs_status_created'),
+        ]
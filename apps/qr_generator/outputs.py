@@ -0,0 +1,66 @@
+"""
+Formatos de salida del generador de códigos QR.
+
+Un solo punto de entrada (``stream_output``) para la vista y los trabajos
+en segundo plano: todos los formatos se emiten por bloques, sin cargar el
+lote completo en memoria.
+"""
+import zipfile
+from collections.abc import Iterable, Iterator
+
+from .cache import iter_cached_pngs
+from .vector import iter_rendered_svgs, stream_pdf_sheets
+from .zip_stream import safe_filename, stream_zip
+
+# formato -> (extensión del archivo descargado, content type)
+OUTPUT_FORMATS = {
+    'png': ('zip', 'application/zip'),
+    'svg': ('zip', 'application/zip'),
+    'pdf': ('pdf', 'application/pdf'),
+}
+
+
+def stream_output(
+    transit_numbers: Iterable[str],
+    tenant: str,
+    output_format: str,
+    workers: int
+) -> Iterator[bytes]:
+    """
+    Emite el archivo de salida para varias unidades.
+
+    - png: ZIP de PNG (caché + pool de procesos)
+    - svg: ZIP de SVG vectoriales
+    - pdf: hojas PDF con varios códigos por página
+
+    Args:
+        transit_numbers: Números de tránsito en el orden de salida
+        tenant: Schema name del tenant
+        output_format: Clave de OUTPUT_FORMATS
+        workers: Procesos del pool (solo png)
+
+    Returns:
+        Iterador de bloques de bytes
+
+    Raises:
+        ValueError: Si el formato no existe
+    """
+    if output_format == 'pdf':
+        return stream_pdf_sheets(transit_numbers, tenant)
+
+    if output_format == 'svg':
+        # El SVG es texto: deflate lo reduce varias veces
+        rendered, extension = iter_rendered_svgs(transit_numbers, tenant), 'svg'
+        compression = zipfile.ZIP_DEFLATED
+    elif output_format == 'png':
+        rendered, extension = iter_cached_pngs(transit_numbers, tenant, workers), 'png'
+        compression = zipfile.ZIP_STORED
+    else:
+        raise ValueError(f"Formato inválido: {output_format}. Opciones: {', '.join(OUTPUT_FORMATS)}")
+
+    # Agregar al ZIP usando únicamente el transit_number (sanitizado)
+    entries = (
+        (f'{safe_filename(transit_number)}.{extension}', content)
+        for transit_number, content in rendered
+    )
+    return stream_zip(entries, compression)
@@ -0,0 +1,273 @@
+"""
+Renderizado de códigos QR, en serie o en un pool de procesos.
+
+Las funciones de este módulo no usan el ORM ni los settings de Django: los
+procesos del pool solo reciben números de tránsito y devuelven bytes PNG,
+por lo que pueden arrancar con ``spawn`` sin inicializar Django.
+"""
+import hashlib
+import json
+import multiprocessing
+import os
+import threading
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+
+import qrcode
+from PIL import Image, ImageDraw, ImageFont
+
+# Altura del encabezado con el número de tránsito
+HEADER_HEIGHT = 80
+TITLE_FONT_SIZE = 36
+
+# Parámetros del código QR
+QR_BOX_SIZE = 10  # Tamaño de cada "caja" del QR
+QR_BORDER = 4  # Grosor del borde
+
+# Versión del diseño: incrementarla invalida todas las imágenes en caché
+RENDER_VERSION = 1
+
+TITLE_FONT_PATHS = (
+    "/System/Library/Fonts/Helvetica.ttc",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+)
+
+# Imágenes pendientes por worker: acota la memoria si el cliente descarga lento
+IN_FLIGHT_PER_WORKER = 4
+
+_executor: ProcessPoolExecutor | None = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
+
+def build_survey_url(tenant: str, transit_number: str) -> str:
+    """
+    URL de la encuesta de una unidad.
+
+    Formato: http://alianza.tuvozenruta.com/survey/ABC123/
+    """
+    return f"http://{tenant}.tuvozenruta.com/survey/{transit_number}/"
+
+
+def render_qr_image(transit_number: str, tenant: str) -> Image.Image:
+    """
+    Genera una imagen QR para una unidad con un encabezado que muestra
+    el número de tránsito.
+
+    Args:
+        transit_number: Número de tránsito de la unidad
+        tenant: Schema name del tenant (ej: 'alianza')
+
+    Returns:
+        PIL.Image: Imagen del código QR con encabezado
+    """
+    qr = _build_qr(transit_number, tenant)
+
+    # Generar la imagen QR base
+    qr_img = qr.make_image(fill_color="black", back_color="white")
+
+    # Convertir a RGB si es necesario (para poder agregar texto)
+    if qr_img.mode != 'RGB':
+        qr_img = qr_img.convert('RGB')
+
+    # Obtener dimensiones del QR
+    qr_width, qr_height = qr_img.size
+
+    # Crear una nueva imagen con espacio para el encabezado
+    final_img = Image.new('RGB', (qr_width, HEADER_HEIGHT + qr_height), 'white')
+
+    # Dibujar el encabezado
+    draw = ImageDraw.Draw(final_img)
+    font_title = _load_title_font()
+
+    # Calcular posiciones para centrar el texto
+    try:
+        # Método moderno de Pillow
+        title_bbox = draw.textbbox((0, 0), transit_number, font=font_title)
+        title_width = title_bbox[2] - title_bbox[0]
+    except Exception:
+        # Método legacy si textbbox no está disponible
+        title_width = len(transit_number) * 20
+
+    title_x = (qr_width - title_width) // 2
+
+    # Centrar verticalmente el título en el encabezado
+    title_y = (HEADER_HEIGHT - TITLE_FONT_SIZE) // 2
+
+    # Dibujar el texto del encabezado
+    draw.text((title_x, title_y), transit_number, fill='black', font=font_title)
+
+    # Pegar el código QR debajo del encabezado
+    final_img.paste(qr_img, (0, HEADER_HEIGHT))
+
+    return final_img
+
+
+def build_qr_matrix(transit_number: str, tenant: str) -> list[list[bool]]:
+    """
+    Matriz de módulos del código QR de una unidad, incluido el borde.
+
+    La usan las salidas vectoriales (SVG y PDF): mismo contenido y
+    corrección de errores que el PNG.
+
+    Returns:
+        Filas de módulos (True = oscuro)
+    """
+    return _build_qr(transit_number, tenant).get_matrix()
+
+
+def _build_qr(transit_number: str, tenant: str) -> qrcode.QRCode:
+    qr = qrcode.QRCode(
+        version=1,  # Tamaño del QR (1 es el más pequeño)
+        error_correction=qrcode.constants.ERROR_CORRECT_H,  # Alta corrección de errores
+        box_size=QR_BOX_SIZE,
+        border=QR_BORDER,
+    )
+    qr.add_data(build_survey_url(tenant, transit_number))
+    qr.make(fit=True)
+    return qr
+
+
+def render_qr_png(job: tuple[str, str]) -> bytes:
+    """
+    Renderiza un QR como PNG (función de trabajo del pool).
+
+    Args:
+        job: Tupla (transit_number, tenant)
+
+    Returns:
+        Bytes del archivo PNG
+    """
+    transit_number, tenant = job
+    buffer = BytesIO()
+    render_qr_image(transit_number, tenant).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+def iter_rendered_pngs(
+    transit_numbers: Iterable[str],
+    tenant: str,
+    workers: int
+) -> Iterator[tuple[str, bytes]]:
+    """
+    Renderiza los QR de varias unidades, en orden, usando un pool de procesos.
+
+    Mantiene como máximo ``workers * IN_FLIGHT_PER_WORKER`` imágenes
+    pendientes, de modo que la memoria no crece con el tamaño de la flota
+    aunque el consumidor (la descarga) sea más lento que el renderizado.
+
+    Args:
+        transit_numbers: Números de tránsito en el orden de salida
+        tenant: Schema name del tenant
+        workers: Procesos del pool (1 o menos = en el proceso actual)
+
+    Returns:
+        Iterador de tuplas (transit_number, png_bytes)
+    """
+    jobs = ((transit_number, tenant) for transit_number in transit_numbers)
+
+    if workers <= 1:
+        for job in jobs:
+            yield job[0], render_qr_png(job)
+        return
+
+    executor = get_executor(workers)
+    pending: deque[tuple[str, Future]] = deque()
+    max_in_flight = workers * IN_FLIGHT_PER_WORKER
+
+    try:
+        for job in jobs:
+            pending.append((job[0], executor.submit(render_qr_png, job)))
+            if len(pending) >= max_in_flight:
+                transit_number, future = pending.popleft()
+                yield transit_number, future.result()
+
+        while pending:
+            transit_number, future = pending.popleft()
+            yield transit_number, future.result()
+    finally:
+        # Descarga cancelada por el cliente: no renderizar lo pendiente
+        for _, future in pending:
+            future.cancel()
+
+
+def get_executor(workers: int) -> ProcessPoolExecutor:
+    """
+    Pool de procesos compartido por el proceso web (se crea una sola vez).
+
+    Usa ``spawn`` para no heredar conexiones a la base de datos ni hilos
+    del servidor.
+    """
+    global _executor, _executor_workers
+
+    with _executor_lock:
+        if _executor is None or _executor_workers != workers:
+            if _executor is not None:
+                _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+            _executor_workers = workers
+        return _executor
+
+
+def default_workers() -> int:
+    """Número de procesos por defecto: uno por CPU."""
+    return os.cpu_count() or 1
+
+
+def render_key(transit_number: str, tenant: str) -> str:
+    """
+    Clave de contenido de una imagen QR.
+
+    Hash SHA-256 de todo lo que determina los bytes del PNG: URL, texto del
+    encabezado, parámetros de renderizado y fuente. Dos unidades con la
+    misma clave producen exactamente la misma imagen.
+
+    Args:
+        transit_number: Número de tránsito de la unidad
+        tenant: Schema name del tenant
+
+    Returns:
+        Hash hexadecimal (64 caracteres)
+    """
+    payload = json.dumps([
+        RENDER_VERSION,
+        build_survey_url(tenant, transit_number),
+        transit_number,
+        QR_BOX_SIZE,
+        QR_BORDER,
+        HEADER_HEIGHT,
+        TITLE_FONT_SIZE,
+        _resolve_title_font_path(),
+    ])
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _resolve_title_font_path() -> str | None:
+    """Primera fuente del sistema disponible (None = fuente predeterminada)."""
+    for path in TITLE_FONT_PATHS:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+@lru_cache(maxsize=1)
+def _load_title_font() -> ImageFont.ImageFont:
+    """
+    Fuente del encabezado: del sistema si existe, si no la predeterminada.
+
+    Se carga una sola vez por proceso.
+    """
+    path = _resolve_title_font_path()
+    if path:
+        try:
+            return ImageFont.truetype(path, TITLE_FONT_SIZE)
+        except OSError:
+            pass
+    return ImageFont.load_default()
@@ -84,6 +84,11 @@ document.addEventListener('DOMContentLoaded', function() {
             }
         }
         
+        // Trabajo en segundo plano: la página se recarga con el progreso
+        if (e.submitter && e.submitter.id === 'qrJobSubmit') {
+            return true;
+        }
+
         // Mostrar mensaje de carga (opcional)
         const submitBtn = form.querySelector('button[type="submit"]');
         if (submitBtn) {
@@ -93,4 +98,48 @@ document.addEventListener('DOMContentLoaded', function() {
         
         return true;
     });
-});
\ No newline at end of file
+
+    pollJobProgress();
+});
+
+/**
+ * Consulta periódicamente el estado del trabajo en segundo plano (si hay uno)
+ * y actualiza la barra de progreso hasta que termine.
+ */
+function pollJobProgress() {
+    const jobBox = document.getElementById('qrJob');
+    if (!jobBox) return;
+
+    const statusUrl = jobBox.dataset.statusUrl;
+    const POLL_INTERVAL_MS = 2000;
+
+    function render(job) {
+        document.getElementById('qrJobStatus').textContent = job.status_display;
+        document.getElementById('qrJobBar').style.width = job.percent + '%';
+        document.getElementById('qrJobDetail').textContent = job.status === 'failed'
+            ? 'Error: ' + job.error
+            : job.processed + ' de ' + job.total + ' códigos';
+
+        if (job.download_url) {
+            const link = document.getElementById('qrJobDownload');
+            link.href = job.download_url;
+            link.style.display = 'inline-flex';
+        }
+    }
+
+    function poll() {
+        fetch(statusUrl, { headers: { 'Accept': 'application/json' } })
+            .then(response => response.json())
+            .then(job => {
+                render(job);
+                if (job.status === 'pending' || job.status === 'running') {
+                    setTimeout(poll, POLL_INTERVAL_MS);
+                }
+            })
+            .catch(() => setTimeout(poll, POLL_INTERVAL_MS * 2));
+    }
+
+    if (jobBox.dataset.status === 'pending' || jobBox.dataset.status === 'running') {
+        poll();
+    }
+}
@@ -0,0 +1,57 @@
+"""
+Tests de qr_generator.
+
+- test_rendering: renderizado en orden, en serie o en el pool de procesos
+- test_cache: caché de PNG por clave de contenido
+- test_zip_stream: ZIP en streaming (data descriptors y ZIP64)
+- test_vector: SVG y hojas PDF (estructura y tabla xref)
+- test_jobs: cola de trabajos en segundo plano (deduplicación, toma y ejecución)
+- test_views: descarga en streaming y vistas de los trabajos
+
+QRTestCase renderiza en el proceso del test, sin caché de disco, y guarda
+los archivos de trabajos en un directorio temporal.
+"""
+import tempfile
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.core.files.storage import FileSystemStorage
+from django.test import override_settings
+from django_tenants.test.cases import TenantTestCase
+from django_tenants.test.client import TenantClient
+
+from apps.interview.tests import TEST_SETTINGS
+from apps.qr_generator.models import QrGenerationJob
+from apps.statistical_summary.tests.factories import RouteFactory, UnitFactory
+
+
+class QRTestCase(TenantTestCase):
+    """Tenant con 5 unidades y un cliente con el permiso can_generate_qr_codes."""
+
+    transit_numbers = ['ABC001', 'ABC002', 'ABC003', 'XYZ001', 'XYZ002']
+
+    def setUp(self):
+        super().setUp()
+        # TenantTestCase no aplica override_settings a nivel de clase
+        test_settings = override_settings(QR_RENDER_WORKERS=1, QR_CACHE_BACKEND='off', **TEST_SETTINGS)
+        test_settings.enable()
+        self.addCleanup(test_settings.disable)
+
+        # El storage del campo se resuelve al importar el modelo (STORAGES['qr_jobs'])
+        self.storage_dir = self.enterContext(tempfile.TemporaryDirectory())
+        self.enterContext(mock.patch.object(
+            QrGenerationJob._meta.get_field('artifact'), 'storage', FileSystemStorage(location=self.storage_dir)
+        ))
+
+        route = RouteFactory()
+        # Creadas en desorden: la salida sigue el orden por número de tránsito
+        self.units = {
+            transit_number: UnitFactory(transit_number=transit_number, route=route)
+            for transit_number in reversed(self.transit_numbers)
+        }
+
+        self.user = get_user_model().objects.create_user(username='qr', password='qr')
+        self.user.user_permissions.add(Permission.objects.get(codename='can_generate_qr_codes'))
+        self.client = TenantClient(self.tenant)
+        self.client.force_login(self.user)
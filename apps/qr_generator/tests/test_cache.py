@@ -0,0 +1,123 @@
+"""
+Tests de la caché de imágenes QR: backends, claves de contenido y que una
+segunda generación no vuelve a renderizar.
+"""
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+
+from apps.interview.tests import TEST_SETTINGS
+from apps.qr_generator import cache as qr_cache, rendering
+from apps.qr_generator.cache import (
+    DiskQRCache,
+    DjangoQRCache,
+    NullQRCache,
+    get_qr_cache,
+    get_qr_png,
+    iter_cached_pngs,
+)
+from apps.qr_generator.rendering import render_key, render_qr_png
+
+
+@override_settings(CACHES=TEST_SETTINGS['CACHES'])
+class TestQRCache(SimpleTestCase):
+    """Tests de get_qr_png e iter_cached_pngs con cada backend."""
+
+    tenant = 'alianza'
+    transit_numbers = ['XYZ002', 'ABC001', 'XYZ001', 'ABC003', 'ABC002']
+
+    def setUp(self):
+        super().setUp()
+        self.cache_dir = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        self.enterContext(override_settings(QR_CACHE_BACKEND='disk', QR_CACHE_DIR=str(self.cache_dir)))
+        caches['default'].clear()
+
+        # Cuenta los renderizados del proceso actual (get_qr_png y el pool en serie)
+        self.render = mock.Mock(wraps=render_qr_png)
+        self.enterContext(mock.patch.object(qr_cache, 'render_qr_png', self.render))
+        self.enterContext(mock.patch.object(rendering, 'render_qr_png', self.render))
+
+    def rendered(self):
+        return [job[0] for (job,), _ in self.render.call_args_list]
+
+    def assert_output(self, output):
+        self.assertEqual([transit_number for transit_number, _ in output], self.transit_numbers)
+        for transit_number, png in output:
+            self.assertEqual(png, render_qr_png((transit_number, self.tenant)))
+
+    def test_backend_selection(self):
+        self.assertIsInstance(get_qr_cache(), DiskQRCache)
+        with self.settings(QR_CACHE_BACKEND='cache'):
+            self.assertIsInstance(get_qr_cache(), DjangoQRCache)
+        with self.settings(QR_CACHE_BACKEND='off'):
+            self.assertIsInstance(get_qr_cache(), NullQRCache)
+        with self.settings(QR_CACHE_BACKEND='s3'), self.assertRaisesMessage(ValueError, 'QR_CACHE_BACKEND inválido'):
+            get_qr_cache()
+
+    def test_second_pass_does_not_render(self):
+        for backend in ('disk', 'cache'):
+            with self.subTest(backend=backend), self.settings(QR_CACHE_BACKEND=backend):
+                caches['default'].clear()
+                self.render.reset_mock()
+
+                first = list(iter_cached_pngs(self.transit_numbers, self.tenant, workers=1))
+                self.assertEqual(sorted(self.rendered()), sorted(self.transit_numbers))
+
+                self.render.reset_mock()
+                second = list(iter_cached_pngs(self.transit_numbers, self.tenant, workers=1))
+                self.assertEqual(get_qr_png('ABC003', self.tenant), second[3][1])
+
+                self.render.assert_not_called()
+                self.assertEqual(second, first)
+                self.assert_output(second)
+
+    def test_mixed_batch_keeps_input_order(self):
+        """Con entradas en caché intercaladas (y lotes de 2), solo se renderizan las faltantes y en orden."""
+        get_qr_png('ABC001', self.tenant)
+        get_qr_png('ABC003', self.tenant)
+        self.render.reset_mock()
+
+        with mock.patch.object(qr_cache, 'CACHE_BATCH_SIZE', 2):
+            output = list(iter_cached_pngs(self.transit_numbers, self.tenant, workers=1))
+
+        self.assert_output(output)
+        self.assertEqual(self.rendered(), ['XYZ002', 'XYZ001', 'ABC002'])
+
+    def test_disk_entries_are_sharded_by_key(self):
+        get_qr_png('ABC001', self.tenant)
+
+        key = render_key('ABC001', self.tenant)
+        path = self.cache_dir / key[:2] / f'{key}.png'
+        self.assertEqual(path.read_bytes(), render_qr_png(('ABC001', self.tenant)))
+        self.assertEqual(list(path.parent.glob('*.tmp')), [])
+
+    def test_off_bypasses_storage(self):
+        with self.settings(QR_CACHE_BACKEND='off'):
+            self.assert_output(list(iter_cached_pngs(self.transit_numbers, self.tenant, workers=1)))
+            self.assert_output(list(iter_cached_pngs(self.transit_numbers, self.tenant, workers=1)))
+            get_qr_png('ABC001', self.tenant)
+
+        self.assertEqual(self.render.call_count, 2 * len(self.transit_numbers) + 1)
+        self.assertEqual(list(self.cache_dir.iterdir()), [])
+        self.assertIsNone(caches['default'].get(f"{qr_cache.CACHE_KEY_PREFIX}:{render_key('ABC001', self.tenant)}"))
+
+
+class TestRenderKey(SimpleTestCase):
+    """Tests de rendering.render_key."""
+
+    def test_key_depends_on_unit_tenant_and_render_version(self):
+        key = render_key('ABC001', 'alianza')
+
+        self.assertEqual(render_key('ABC001', 'alianza'), key)
+        self.assertEqual(len(key), 64)
+        self.assertNotEqual(render_key('ABC002', 'alianza'), key)
+        self.assertNotEqual(render_key('ABC001', 'norte'), key)
+
+        with mock.patch.object(rendering, 'RENDER_VERSION', rendering.RENDER_VERSION + 1):
+            self.assertNotEqual(render_key('ABC001', 'alianza'), key)
+
+        with mock.patch.object(rendering, 'QR_BOX_SIZE', rendering.QR_BOX_SIZE + 1):
+            self.assertNotEqual(render_key('ABC001', 'alianza'), key)
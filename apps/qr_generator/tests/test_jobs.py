@@ -0,0 +1,156 @@
+"""
+Tests de la cola de trabajos de QR: deduplicación al registrar, toma con
+SKIP LOCKED (incluidos los trabajos abandonados) y estados al ejecutar.
+"""
+import io
+import zipfile
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import QuerySet
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.qr_generator import jobs
+from apps.qr_generator.jobs import STALE_AFTER, claim_next_job, run_job, selection_hash, submit_job
+from apps.qr_generator.models import QrGenerationJob
+from . import QRTestCase
+
+
+class TestSubmitJob(QRTestCase):
+    """Tests de jobs.submit_job."""
+
+    selection = ('range', 'ABC001', 'ABC003')
+
+    def test_identical_active_job_is_reused(self):
+        job, created = submit_job(self.selection, self.user)
+        self.assertTrue(created)
+        self.assertEqual(job.status, QrGenerationJob.Status.PENDING)
+        self.assertEqual(job.selection_hash, selection_hash(*self.selection, 'png'))
+
+        self.assertEqual(submit_job(self.selection, self.user), (job, False))
+
+        # Otro formato es otro trabajo
+        pdf_job, created = submit_job(self.selection, self.user, 'pdf')
+        self.assertTrue(created)
+        self.assertNotEqual(pdf_job, job)
+
+    def test_finished_job_is_not_reused(self):
+        job, _ = submit_job(self.selection)
+        QrGenerationJob.objects.filter(pk=job.pk).update(status=QrGenerationJob.Status.DONE)
+
+        new_job, created = submit_job(self.selection)
+
+        self.assertTrue(created)
+        self.assertNotEqual(new_job, job)
+
+    def test_concurrent_insert_returns_the_winning_job(self):
+        """Si otra solicitud inserta entre la consulta y el insert, la restricción lo detecta."""
+        winner = QrGenerationJob.objects.create(
+            selection_type='range',
+            start_transit_number='ABC001',
+            end_transit_number='ABC003',
+            selection_hash=selection_hash(*self.selection, 'png'),
+        )
+
+        # La consulta previa no lo ve (como si aún no existiera)
+        with mock.patch.object(QuerySet, 'first', return_value=None):
+            job, created = submit_job(self.selection, self.user)
+
+        self.assertEqual((job, created), (winner, False))
+        self.assertEqual(QrGenerationJob.objects.count(), 1)
+
+
+class TestClaimNextJob(QRTestCase):
+    """Tests de jobs.claim_next_job."""
+
+    def create_job(self, **fields):
+        return QrGenerationJob.objects.create(selection_type='all', selection_hash=selection_hash('all'), **fields)
+
+    def test_claims_oldest_pending_job(self):
+        now = timezone.now()
+        newer = self.create_job(created_at=now)
+        older = QrGenerationJob.objects.create(
+            selection_type='all', selection_hash=selection_hash('all', output_format='pdf'),
+            created_at=now - STALE_AFTER,
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            claimed = claim_next_job()
+
+        self.assertEqual(claimed, older)
+        self.assertEqual(claimed.status, QrGenerationJob.Status.RUNNING)
+        self.assertIsNotNone(claimed.started_at)
+        self.assertIsNotNone(claimed.heartbeat_at)
+        self.assertTrue(any('FOR UPDATE SKIP LOCKED' in query['sql'] for query in queries.captured_queries))
+
+        self.assertEqual(claim_next_job(), newer)
+        self.assertIsNone(claim_next_job())
+
+    def test_reclaims_stale_running_job(self):
+        now = timezone.now()
+        stale = self.create_job(
+            status=QrGenerationJob.Status.RUNNING, processed=40, heartbeat_at=now - STALE_AFTER - STALE_AFTER,
+        )
+
+        claimed = claim_next_job()
+
+        self.assertEqual(claimed, stale)
+        self.assertEqual(claimed.processed, 0)
+        self.assertGreater(claimed.heartbeat_at, now - STALE_AFTER)
+
+    def test_running_job_with_heartbeat_is_not_claimed(self):
+        self.create_job(status=QrGenerationJob.Status.RUNNING, heartbeat_at=timezone.now())
+
+        self.assertIsNone(claim_next_job())
+
+
+class TestRunJob(QRTestCase):
+    """Tests de jobs.run_job y del comando run_qr_generation_jobs."""
+
+    def test_successful_job_stores_the_artifact(self):
+        submit_job(('range', 'ABC002', 'XYZ001'))
+
+        with mock.patch.object(jobs, 'PROGRESS_EVERY', 2):
+            job = run_job(claim_next_job(), self.tenant.schema_name, workers=1)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, QrGenerationJob.Status.DONE)
+        self.assertEqual((job.processed, job.total, job.progress_percent), (3, 3, 100))
+        self.assertEqual(job.error, '')
+        self.assertIsNotNone(job.finished_at)
+        self.assertEqual(job.artifact.name, f'qr_jobs/{self.tenant.schema_name}/{job.id}.zip')
+
+        with job.artifact.open('rb') as artifact:
+            archive = zipfile.ZipFile(io.BytesIO(artifact.read()))
+        self.assertIsNone(archive.testzip())
+        self.assertEqual(archive.namelist(), ['ABC002.png', 'ABC003.png', 'XYZ001.png'])
+
+    def test_failed_job_records_the_error(self):
+        submit_job(('all', '', ''), output_format='svg')
+
+        with mock.patch.object(jobs, 'stream_output', side_effect=RuntimeError('disco lleno')):
+            job = run_job(claim_next_job(), self.tenant.schema_name, workers=1)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, QrGenerationJob.Status.FAILED)
+        self.assertEqual(job.error, 'disco lleno')
+        self.assertEqual(job.total, len(self.transit_numbers))
+        self.assertFalse(job.artifact)
+        self.assertIsNotNone(job.finished_at)
+        # Ya no está activo: la misma selección se puede volver a pedir
+        self.assertTrue(submit_job(('all', '', ''), output_format='svg')[1])
+
+    def test_command_drains_the_queue(self):
+        first, _ = submit_job(('all', '', ''), output_format='pdf')
+        second, _ = submit_job(('single', 'XYZ002', 'XYZ002'))
+
+        stdout = io.StringIO()
+        call_command('run_qr_generation_jobs', '--once', '--schema', self.tenant.schema_name, stdout=stdout)
+
+        self.assertEqual(
+            set(QrGenerationJob.objects.values_list('status', flat=True)), {QrGenerationJob.Status.DONE}
+        )
+        self.assertIn(f'✓ {self.tenant.schema_name}: trabajo {first.id}', stdout.getvalue())
+        self.assertIn(f'✓ {self.tenant.schema_name}: trabajo {second.id}', stdout.getvalue())
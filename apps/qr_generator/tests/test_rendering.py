@@ -0,0 +1,93 @@
+"""
+Tests de rendering.iter_rendered_pngs: orden de salida, límite de imágenes
+pendientes y equivalencia entre el renderizado en serie y el pool.
+"""
+from concurrent.futures import Future
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from apps.qr_generator import rendering
+from apps.qr_generator.rendering import iter_rendered_pngs, render_qr_png
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+class _RecordingExecutor:
+    """Executor en el proceso actual que registra cuántos trabajos se enviaron."""
+
+    def __init__(self):
+        self.submitted = 0
+
+    def submit(self, fn, *args):
+        self.submitted += 1
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+class TestIterRenderedPngs(SimpleTestCase):
+    """Tests del renderizado de QR en lote."""
+
+    tenant = 'alianza'
+    # Deliberadamente no ordenados: la salida respeta el orden de entrada
+    transit_numbers = ['XYZ003', 'ABC001', 'M-10', 'ABC002', 'XYZ001', 'B 7']
+
+    def test_serial_output_keeps_input_order(self):
+        rendered = list(iter_rendered_pngs(self.transit_numbers, self.tenant, workers=1))
+
+        self.assertEqual([transit_number for transit_number, _ in rendered], self.transit_numbers)
+        for transit_number, png in rendered:
+            self.assertTrue(png.startswith(PNG_SIGNATURE))
+            self.assertEqual(png, render_qr_png((transit_number, self.tenant)))
+
+    def test_pool_matches_serial_output(self):
+        serial = list(iter_rendered_pngs(self.transit_numbers, self.tenant, workers=1))
+
+        # Pool propio del test: no reutilizar ni cerrar el compartido del proceso
+        with mock.patch.object(rendering, '_executor', None), mock.patch.object(rendering, '_executor_workers', 0):
+            try:
+                pooled = list(iter_rendered_pngs(self.transit_numbers, self.tenant, workers=2))
+            finally:
+                rendering._executor.shutdown()
+
+        self.assertEqual(pooled, serial)
+
+    def test_in_flight_work_is_bounded(self):
+        """Sin consumir la salida, nunca hay más de workers * IN_FLIGHT_PER_WORKER envíos pendientes."""
+        executor = _RecordingExecutor()
+        transit_numbers = [f'U{i:03d}' for i in range(40)]
+        workers = 2
+        max_in_flight = workers * rendering.IN_FLIGHT_PER_WORKER
+
+        with mock.patch.object(rendering, 'get_executor', return_value=executor):
+            output = iter_rendered_pngs(transit_numbers, self.tenant, workers)
+
+            for yielded, (transit_number, png) in enumerate(output, start=1):
+                self.assertLessEqual(executor.submitted - yielded, max_in_flight - 1)
+                self.assertEqual(transit_number, transit_numbers[yielded - 1])
+                self.assertTrue(png.startswith(PNG_SIGNATURE))
+
+        self.assertEqual(executor.submitted, len(transit_numbers))
+
+    def test_closing_the_output_cancels_pending_work(self):
+        """Una descarga cancelada no deja imágenes encoladas en el pool."""
+        pending = []
+
+        def submit(fn, *args):
+            future = Future()
+            pending.append(future)
+            if len(pending) == 1:
+                future.set_result(fn(*args))
+            return future
+
+        executor = mock.Mock(submit=submit)
+        transit_numbers = [f'U{i:03d}' for i in range(20)]
+
+        with mock.patch.object(rendering, 'get_executor', return_value=executor):
+            output = iter_rendered_pngs(transit_numbers, self.tenant, workers=2)
+            self.assertEqual(next(output)[0], 'U000')
+            output.close()
+
+        self.assertEqual(len(pending), 2 * rendering.IN_FLIGHT_PER_WORKER)
+        self.assertTrue(all(future.cancelled() for future in pending[1:]))
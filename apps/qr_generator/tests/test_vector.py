@@ -0,0 +1,122 @@
+"""
+Tests de las salidas vectoriales: SVG por unidad y hojas PDF escritas por
+bloques (estructura, conteo de páginas y tabla xref).
+"""
+import math
+import re
+import zlib
+from xml.etree import ElementTree
+
+from django.test import SimpleTestCase
+
+from apps.qr_generator.rendering import build_qr_matrix
+from apps.qr_generator.vector import SHEET_COLUMNS, SHEET_ROWS, iter_dark_runs, render_qr_svg, stream_pdf_sheets
+
+SVG_NAMESPACE = '{http://www.w3.org/2000/svg}'
+
+
+class TestRenderQrSvg(SimpleTestCase):
+    """Tests de vector.render_qr_svg."""
+
+    def test_svg_is_well_formed(self):
+        root = ElementTree.fromstring(render_qr_svg('ABC001', 'alianza'))
+
+        self.assertEqual(root.tag, f'{SVG_NAMESPACE}svg')
+        modules = len(build_qr_matrix('ABC001', 'alianza'))
+        self.assertEqual(root.get('viewBox').split()[2], str(modules))
+        self.assertEqual(root.find(f'{SVG_NAMESPACE}text').text, 'ABC001')
+
+        # Un segmento "M x y h largo" por racha de módulos oscuros
+        path = root.find(f'{SVG_NAMESPACE}path').get('d')
+        runs = list(iter_dark_runs(build_qr_matrix('ABC001', 'alianza')))
+        self.assertEqual(path.count('M'), len(runs))
+
+    def test_transit_number_is_escaped(self):
+        transit_number = 'A&B <1> "2"'
+
+        svg = render_qr_svg(transit_number, 'alianza')
+        root = ElementTree.fromstring(svg)
+
+        self.assertEqual(root.find(f'{SVG_NAMESPACE}text').text, transit_number)
+        self.assertIn(b'A&amp;B &lt;1&gt;', svg)
+
+
+class TestStreamPdfSheets(SimpleTestCase):
+    """Tests de vector.stream_pdf_sheets."""
+
+    per_page = SHEET_COLUMNS * SHEET_ROWS
+
+    def build_pdf(self, count):
+        transit_numbers = [f'U({i:03d})' for i in range(count)]
+        return b''.join(stream_pdf_sheets(transit_numbers, 'alianza'))
+
+    def assert_valid_pdf(self, data):
+        """Verifica encabezado, xref (cada offset apunta a su objeto) y trailer; retorna los objetos."""
+        self.assertTrue(data.startswith(b'%PDF-1.4\n'))
+        self.assertTrue(data.endswith(b'%%EOF\n'))
+
+        startxref = int(re.search(rb'startxref\n(\d+)\n%%EOF\n$', data).group(1))
+        self.assertTrue(data[startxref:].startswith(b'xref\n'))
+
+        xref = data[startxref:].split(b'\n')
+        first, size = map(int, xref[1].split())
+        self.assertEqual(first, 0)
+        self.assertEqual(xref[2], b'0000000000 65535 f ')
+        self.assertIn(b'/Size %d' % size, data[startxref:])
+
+        objects = {}
+        for object_id in range(1, size):
+            entry = xref[2 + object_id]
+            # Entradas de 20 bytes exactos con el fin de línea
+            self.assertEqual(len(entry) + 1, 20)
+            offset = int(entry[:10])
+            self.assertTrue(entry.endswith(b' 00000 n '))
+            self.assertTrue(data[offset:].startswith(b'%d 0 obj\n' % object_id), object_id)
+            objects[object_id] = data[offset:data.index(b'\nendobj\n', offset)]
+        return objects
+
+    def page_count(self, objects):
+        count = int(re.search(rb'/Type /Pages /Kids \[([^\]]*)\] /Count (\d+)', objects[2]).group(2))
+        pages = [body for body in objects.values() if b'/Type /Page ' in body]
+        self.assertEqual(len(pages), count)
+        return count
+
+    def test_page_count(self):
+        for count in (1, self.per_page, self.per_page + 1, 2 * self.per_page + 5):
+            with self.subTest(count=count):
+                objects = self.assert_valid_pdf(self.build_pdf(count))
+
+                self.assertEqual(self.page_count(objects), math.ceil(count / self.per_page))
+
+    def test_content_streams_draw_every_code(self):
+        objects = self.assert_valid_pdf(self.build_pdf(self.per_page + 1))
+
+        contents = []
+        for body in objects.values():
+            match = re.search(rb'<< /Length (\d+) /Filter /FlateDecode >>\nstream\n', body)
+            if match:
+                stream = body[match.end():]
+                self.assertEqual(stream[int(match.group(1)):], b'\nendstream')
+                contents.append(zlib.decompress(stream[:int(match.group(1))]))
+
+        self.assertEqual(len(contents), 2)
+        self.assertEqual(contents[0].count(b' Tj ET'), self.per_page)
+        self.assertEqual(contents[1].count(b' Tj ET'), 1)
+        # Paréntesis del número de tránsito escapados en el texto
+        self.assertIn(rb'(U\(012\)) Tj', contents[1])
+
+    def test_empty_input_is_a_single_blank_page(self):
+        objects = self.assert_valid_pdf(self.build_pdf(0))
+
+        self.assertEqual(self.page_count(objects), 1)
+
+    def test_pages_are_emitted_while_consuming_units(self):
+        """La primera hoja se emite antes de pedir las unidades de la segunda."""
+        def transit_numbers():
+            yield from (f'U{i:03d}' for i in range(self.per_page))
+            raise AssertionError('se pidió la segunda hoja antes de emitir la primera')
+
+        chunks = stream_pdf_sheets(transit_numbers(), 'alianza')
+        emitted = b''
+        while b'/Type /Page ' not in emitted:
+            emitted += next(chunks)
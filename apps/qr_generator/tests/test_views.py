@@ -0,0 +1,161 @@
+"""
+Tests de las vistas del generador de QR: descarga directa de una unidad,
+descarga en streaming de varias unidades y trabajos en segundo plano.
+"""
+import zipfile
+from io import BytesIO
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django_tenants.test.client import TenantClient
+
+from apps.qr_generator.jobs import claim_next_job, run_job, submit_job
+from apps.qr_generator.models import QrGenerationJob
+from apps.qr_generator.rendering import render_qr_png
+from . import QRTestCase
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+class TestGenerateQrCodes(QRTestCase):
+    """Tests de la vista generate_qr_codes."""
+
+    url = reverse('qr_generator:generate_qr_codes')
+
+    def test_multiple_units_stream_a_zip(self):
+        response = self.client.post(self.url, {'selection_type': 'all', 'output_format': 'png'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/zip')
+        self.assertEqual(
+            response['Content-Disposition'],
+            f'attachment; filename="QR_Codes_{self.tenant.schema_name}.zip"',
+        )
+
+        # Las unidades se leen antes de responder: el streaming no consulta la BD
+        with self.assertNumQueries(0):
+            chunks = list(response.streaming_content)
+
+        self.assertEqual(len(chunks), len(self.transit_numbers) + 1)
+        archive = zipfile.ZipFile(BytesIO(b''.join(chunks)))
+        self.assertIsNone(archive.testzip())
+        self.assertEqual(archive.namelist(), [f'{tn}.png' for tn in self.transit_numbers])
+        self.assertEqual(
+            archive.read('XYZ001.png'),
+            render_qr_png(('XYZ001', self.tenant.schema_name)),
+        )
+
+    def test_range_streams_only_the_selected_units(self):
+        response = self.client.post(self.url, {
+            'selection_type': 'range',
+            'output_format': 'svg',
+            'start_unit': self.units['ABC002'].pk,
+            'end_unit': self.units['XYZ001'].pk,
+        })
+
+        self.assertTrue(response.streaming)
+        archive = zipfile.ZipFile(BytesIO(b''.join(response.streaming_content)))
+        self.assertIsNone(archive.testzip())
+        self.assertEqual(archive.namelist(), ['ABC002.svg', 'ABC003.svg', 'XYZ001.svg'])
+
+    def test_pdf_is_a_sheet_even_for_one_unit(self):
+        response = self.client.post(self.url, {
+            'selection_type': 'single',
+            'single_unit': self.units['ABC003'].pk,
+            'output_format': 'pdf',
+        })
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/pdf')
+        content = b''.join(response.streaming_content)
+        self.assertTrue(content.startswith(b'%PDF-1.4'))
+        self.assertIn(b'/Count 1 >>', content)
+
+    def test_single_unit_returns_the_image(self):
+        response = self.client.post(self.url, {
+            'selection_type': 'single',
+            'single_unit': self.units['ABC003'].pk,
+        })
+
+        self.assertFalse(response.streaming)
+        self.assertEqual(response['Content-Type'], 'image/png')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="ABC003.png"')
+        self.assertTrue(response.content.startswith(PNG_SIGNATURE))
+
+    def test_invalid_form_renders_the_generator(self):
+        response = self.client.post(self.url, {'selection_type': 'single'})
+
+        self.assertFalse(response.streaming)
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'qr_generator/qr_generator_template.html')
+
+    def test_requires_permission(self):
+        user = get_user_model().objects.create_user(username='sin_permiso', password='x')
+        client = TenantClient(self.tenant)
+        client.force_login(user)
+
+        response = client.post(self.url, {'selection_type': 'all'})
+
+        self.assertEqual(response.status_code, 403)
+
+
+class TestQrJobViews(QRTestCase):
+    """Tests de las vistas de trabajos en segundo plano: registro, estado y descarga."""
+
+    def submit(self, **data):
+        return self.client.post(reverse('qr_generator:submit_qr_job'), {'selection_type': 'all', **data})
+
+    def test_submit_redirects_to_progress_and_reuses_active_job(self):
+        response = self.submit(output_format='pdf')
+
+        job = QrGenerationJob.objects.get()
+        self.assertRedirects(
+            response, f"{reverse('qr_generator:qr_generator')}?job={job.id}", fetch_redirect_response=False
+        )
+        self.assertEqual(job.requested_by, self.user)
+        self.assertEqual(job.output_format, 'pdf')
+
+        response = self.submit(output_format='pdf')
+        self.assertEqual(QrGenerationJob.objects.count(), 1)
+        response = self.client.get(response['Location'])
+        self.assertEqual(response.context['job'], job)
+        self.assertContains(response, 'Ya hay un trabajo en curso para esta selección')
+
+    def test_status_and_download(self):
+        self.submit()
+        job = QrGenerationJob.objects.get()
+        status_url = reverse('qr_generator:qr_job_status', args=[job.id])
+        download_url = reverse('qr_generator:qr_job_download', args=[job.id])
+
+        status = self.client.get(status_url).json()
+        self.assertEqual(status['status'], QrGenerationJob.Status.PENDING)
+        self.assertIsNone(status['download_url'])
+        self.assertEqual(self.client.get(download_url).status_code, 404)
+
+        run_job(claim_next_job(), self.tenant.schema_name, workers=1)
+
+        status = self.client.get(status_url).json()
+        self.assertEqual(status['status'], QrGenerationJob.Status.DONE)
+        self.assertEqual((status['processed'], status['total'], status['percent']), (5, 5, 100))
+        self.assertEqual(status['download_url'], download_url)
+
+        response = self.client.get(download_url)
+        self.assertEqual(response['Content-Type'], 'application/zip')
+        self.assertEqual(
+            response['Content-Disposition'],
+            f'attachment; filename="QR_Codes_{self.tenant.schema_name}.zip"',
+        )
+        archive = zipfile.ZipFile(BytesIO(b''.join(response.streaming_content)))
+        self.assertIsNone(archive.testzip())
+        self.assertEqual(archive.namelist(), [f'{tn}.png' for tn in self.transit_numbers])
+
+    def test_failed_job_reports_the_error(self):
+        job, _ = submit_job(('all', '', ''))
+        QrGenerationJob.objects.filter(pk=job.pk).update(status=QrGenerationJob.Status.FAILED, error='disco lleno')
+
+        status = self.client.get(reverse('qr_generator:qr_job_status', args=[job.id])).json()
+
+        self.assertEqual(status['error'], 'disco lleno')
+        self.assertIsNone(status['download_url'])
+        self.assertEqual(self.client.get(reverse('qr_generator:qr_job_download', args=[job.id])).status_code, 404)
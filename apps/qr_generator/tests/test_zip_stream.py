@@ -0,0 +1,85 @@
+"""
+Tests de zip_stream.stream_zip: el archivo emitido por bloques abre con
+zipfile, en su forma normal y con extensiones ZIP64.
+"""
+import zipfile
+from io import BytesIO
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from apps.qr_generator.zip_stream import safe_filename, stream_zip
+
+# Bit 3 de los flags: tamaños y CRC en un data descriptor tras los datos
+DATA_DESCRIPTOR_FLAG = 0x08
+ZIP64_END_OF_CENTRAL_DIRECTORY = b'PK\x06\x06'
+
+
+class TestStreamZip(SimpleTestCase):
+    """Tests del ZIP en streaming."""
+
+    entries = [
+        ('ABC001.png', b'\x89PNG' + bytes(range(256)) * 4),
+        ('ABC002.png', b''),
+        ('XYZ001.svg', b'<svg xmlns="http://www.w3.org/2000/svg"/>' * 50),
+    ]
+
+    def open_zip(self, chunks):
+        archive = zipfile.ZipFile(BytesIO(b''.join(chunks)))
+        self.addCleanup(archive.close)
+        return archive
+
+    def assert_entries(self, archive):
+        self.assertIsNone(archive.testzip())
+        self.assertEqual(archive.namelist(), [name for name, _ in self.entries])
+        for name, content in self.entries:
+            self.assertEqual(archive.read(name), content)
+
+    def test_stream_is_a_valid_zip(self):
+        chunks = list(stream_zip(self.entries))
+
+        # Un bloque por entrada más el directorio central
+        self.assertEqual(len(chunks), len(self.entries) + 1)
+        archive = self.open_zip(chunks)
+        self.assert_entries(archive)
+        for info in archive.infolist():
+            self.assertEqual(info.compress_type, zipfile.ZIP_STORED)
+            self.assertTrue(info.flag_bits & DATA_DESCRIPTOR_FLAG)
+
+    def test_deflated_stream_is_a_valid_zip(self):
+        archive = self.open_zip(stream_zip(self.entries, zipfile.ZIP_DEFLATED))
+
+        self.assert_entries(archive)
+        self.assertEqual({info.compress_type for info in archive.infolist()}, {zipfile.ZIP_DEFLATED})
+
+    def test_zip64_stream_is_a_valid_zip(self):
+        """Con un límite ZIP64 bajo, las entradas y el directorio usan las extensiones ZIP64."""
+        with mock.patch.object(zipfile, 'ZIP64_LIMIT', 64):
+            data = b''.join(stream_zip(self.entries))
+
+        self.assertIn(ZIP64_END_OF_CENTRAL_DIRECTORY, data)
+        # Se lee con el límite real, como lo haría cualquier cliente
+        archive = self.open_zip([data])
+        self.assert_entries(archive)
+        self.assertTrue(all(info.flag_bits & DATA_DESCRIPTOR_FLAG for info in archive.infolist()))
+
+    def test_empty_stream_is_a_valid_zip(self):
+        archive = self.open_zip(stream_zip([]))
+
+        self.assertIsNone(archive.testzip())
+        self.assertEqual(archive.namelist(), [])
+
+    def test_chunks_are_emitted_as_entries_are_added(self):
+        """La primera entrada se emite antes de pedir la siguiente."""
+        def entries():
+            yield self.entries[0]
+            raise AssertionError('se pidió la segunda entrada antes de emitir la primera')
+
+        chunk = next(stream_zip(entries()))
+
+        self.assertTrue(chunk.startswith(b'PK\x03\x04'))
+        self.assertIn(self.entries[0][1], chunk)
+
+    def test_safe_filename(self):
+        self.assertEqual(safe_filename('ABC-001.png'), 'ABC-001.png')
+        self.assertEqual(safe_filename('../M 10/ñ'), '.._M_10__')
@@ -6,4 +6,7 @@ app_name = 'qr_generator'
 urlpatterns = [
     path('', views.qr_generator_view, name='qr_generator'),
     path('generate/', views.generate_qr_codes, name='generate_qr_codes'),
+    path('jobs/', views.submit_qr_job, name='submit_qr_job'),
+    path('jobs/<uuid:job_id>/', views.qr_job_status, name='qr_job_status'),
+    path('jobs/<uuid:job_id>/download/', views.qr_job_download, name='qr_job_download'),
 ]
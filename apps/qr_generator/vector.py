@@ -0,0 +1,242 @@
+"""
+Salidas vectoriales de códigos QR: SVG por unidad y hojas PDF multi-código.
+
+Ambas se dibujan directamente desde la matriz de módulos del QR (una
+figura por racha horizontal de módulos oscuros), sin rasterizar: los
+archivos son pequeños y se imprimen nítidos a cualquier tamaño.
+
+El PDF se escribe objeto por objeto mientras se consumen las unidades;
+solo se guardan los offsets de la tabla xref, así que la memoria no
+depende del tamaño de la flota.
+"""
+import zlib
+from collections.abc import Iterable, Iterator
+from xml.sax.saxutils import escape
+
+from .rendering import HEADER_HEIGHT, QR_BOX_SIZE, TITLE_FONT_SIZE, build_qr_matrix
+
+# Hoja carta (puntos PDF: 1/72 de pulgada)
+PAGE_WIDTH = 612
+PAGE_HEIGHT = 792
+PAGE_MARGIN = 36
+
+# Códigos por hoja (columnas x filas)
+SHEET_COLUMNS = 3
+SHEET_ROWS = 4
+
+# Encabezado de cada celda en la hoja PDF (puntos)
+SHEET_TITLE_FONT_SIZE = 14
+# Courier: todos los caracteres miden 0.6 em, lo que permite centrar sin métricas
+COURIER_CHAR_WIDTH = 0.6
+
+
+def iter_dark_runs(matrix: list[list[bool]]) -> Iterator[tuple[int, int, int]]:
+    """
+    Rachas horizontales de módulos oscuros.
+
+    Returns:
+        Iterador de tuplas (fila, columna_inicial, longitud)
+    """
+    for y, row in enumerate(matrix):
+        x = 0
+        width = len(row)
+        while x < width:
+            if row[x]:
+                start = x
+                while x < width and row[x]:
+                    x += 1
+                yield y, start, x - start
+            else:
+                x += 1
+
+
+def render_qr_svg(transit_number: str, tenant: str) -> bytes:
+    """
+    Genera el QR de una unidad como SVG, con el mismo encabezado y
+    proporciones que el PNG (1 unidad del viewBox = 1 módulo).
+
+    Args:
+        transit_number: Número de tránsito de la unidad
+        tenant: Schema name del tenant
+
+    Returns:
+        Bytes del documento SVG (UTF-8)
+    """
+    matrix = build_qr_matrix(transit_number, tenant)
+    modules = len(matrix)
+    header = HEADER_HEIGHT / QR_BOX_SIZE
+    font_size = TITLE_FONT_SIZE / QR_BOX_SIZE
+
+    # Cada racha es un trazo de 1 módulo de grosor por el centro de la fila
+    path = ''.join(
+        f'M{x} {y + header + 0.5:g}h{length}'
+        for y, x, length in iter_dark_runs(matrix)
+    )
+
+    svg = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<svg xmlns="http://www.w3.org/2000/svg" '
+        f'width="{modules * QR_BOX_SIZE}" height="{modules * QR_BOX_SIZE + HEADER_HEIGHT}" '
+        f'viewBox="0 0 {modules} {modules + header:g}" shape-rendering="crispEdges">'
+        f'<rect width="100%" height="100%" fill="#fff"/>'
+        f'<text x="{modules / 2:g}" y="{header / 2:g}" font-family="Helvetica, Arial, sans-serif" '
+        f'font-weight="bold" font-size="{font_size:g}" text-anchor="middle" '
+        f'dominant-baseline="central">{escape(transit_number)}</text>'
+        f'<path d="{path}" stroke="#000" stroke-width="1"/>'
+        '</svg>\n'
+    )
+    return svg.encode('utf-8')
+
+
+def iter_rendered_svgs(transit_numbers: Iterable[str], tenant: str) -> Iterator[tuple[str, bytes]]:
+    """
+    SVG de varias unidades, en orden (barato: no requiere pool ni caché).
+
+    Returns:
+        Iterador de tuplas (transit_number, svg_bytes)
+    """
+    for transit_number in transit_numbers:
+        yield transit_number, render_qr_svg(transit_number, tenant)
+
+
+def stream_pdf_sheets(
+    transit_numbers: Iterable[str],
+    tenant: str,
+    columns: int = SHEET_COLUMNS,
+    rows: int = SHEET_ROWS
+) -> Iterator[bytes]:
+    """
+    Emite un PDF con ``columns x rows`` códigos por hoja, listo para imprimir.
+
+    Cada celda lleva el número de tránsito como encabezado y el QR
+    vectorial debajo. Se emite una página a la vez.
+
+    Args:
+        transit_numbers: Números de tránsito en el orden de impresión
+        tenant: Schema name del tenant
+        columns: Códigos por fila
+        rows: Filas por hoja
+
+    Returns:
+        Iterador de bloques de bytes del PDF
+
+    Example:
+        >>> b''.join(stream_pdf_sheets(['ABC123'], 'alianza'))[:8]
+        b'%PDF-1.4'
+    """
+    writer = _PdfWriter()
+    per_page = columns * rows
+
+    # 1: catálogo, 2: árbol de páginas (se escribe al final), 3: fuente
+    yield writer.header()
+    yield writer.add_object(1, b'<< /Type /Catalog /Pages 2 0 R >>')
+    yield writer.add_object(3, b'<< /Type /Font /Subtype /Type1 /BaseFont /Courier-Bold >>')
+
+    page_ids = []
+    batch: list[str] = []
+
+    for transit_number in transit_numbers:
+        batch.append(transit_number)
+        if len(batch) == per_page:
+            yield writer.add_page(_sheet_content(batch, tenant, columns, rows), page_ids)
+            batch = []
+
+    if batch or not page_ids:
+        yield writer.add_page(_sheet_content(batch, tenant, columns, rows), page_ids)
+
+    kids = ' '.join(f'{page_id} 0 R' for page_id in page_ids)
+    yield writer.add_object(2, f'<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>'.encode())
+    yield writer.trailer()
+
+
+def _sheet_content(transit_numbers: list[str], tenant: str, columns: int, rows: int) -> bytes:
+    """Operadores de dibujo de una hoja (sin comprimir)."""
+    cell_width = (PAGE_WIDTH - 2 * PAGE_MARGIN) / columns
+    cell_height = (PAGE_HEIGHT - 2 * PAGE_MARGIN) / rows
+    header_height = SHEET_TITLE_FONT_SIZE * 2
+    qr_size = min(cell_width, cell_height - header_height) * 0.9
+
+    ops = ['0 g']
+    for index, transit_number in enumerate(transit_numbers):
+        column, row = index % columns, index // columns
+        cell_x = PAGE_MARGIN + column * cell_width
+        cell_top = PAGE_HEIGHT - PAGE_MARGIN - row * cell_height
+
+        # Encabezado centrado
+        label = transit_number.encode('latin-1', 'replace').decode('latin-1')
+        text_width = len(label) * SHEET_TITLE_FONT_SIZE * COURIER_CHAR_WIDTH
+        text_x = cell_x + (cell_width - text_width) / 2
+        text_y = cell_top - header_height + SHEET_TITLE_FONT_SIZE / 2
+        ops.append(
+            f'BT /F1 {SHEET_TITLE_FONT_SIZE} Tf {text_x:.2f} {text_y:.2f} Td '
+            f'({_pdf_escape(label)}) Tj ET'
+        )
+
+        # QR: un rectángulo por racha de módulos oscuros
+        matrix = build_qr_matrix(transit_number, tenant)
+        module = qr_size / len(matrix)
+        qr_x = cell_x + (cell_width - qr_size) / 2
+        qr_top = cell_top - header_height
+        for y, x, length in iter_dark_runs(matrix):
+            ops.append(
+                f'{qr_x + x * module:.2f} {qr_top - (y + 1) * module:.2f} '
+                f'{length * module:.2f} {module:.2f} re'
+            )
+        ops.append('f')
+
+    return '\n'.join(ops).encode('latin-1')
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+class _PdfWriter:
+    """Escritor PDF secuencial: registra offsets para la tabla xref."""
+
+    # Los objetos 1-3 son fijos (catálogo, páginas, fuente)
+    FIRST_DYNAMIC_ID = 4
+
+    def __init__(self):
+        self.position = 0
+        self.offsets: dict[int, int] = {}
+        self.next_id = self.FIRST_DYNAMIC_ID
+
+    def _emit(self, data: bytes) -> bytes:
+        self.position += len(data)
+        return data
+
+    def header(self) -> bytes:
+        return self._emit(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+
+    def add_object(self, object_id: int, body: bytes) -> bytes:
+        self.offsets[object_id] = self.position
+        return self._emit(b'%d 0 obj\n%s\nendobj\n' % (object_id, body))
+
+    def add_page(self, content: bytes, page_ids: list[int]) -> bytes:
+        """Agrega el contenido comprimido y la página que lo referencia."""
+        content_id, page_id = self.next_id, self.next_id + 1
+        self.next_id += 2
+        page_ids.append(page_id)
+
+        compressed = zlib.compress(content)
+        stream = (
+            b'<< /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream'
+            % (len(compressed), compressed)
+        )
+        page = (
+            f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] '
+            f'/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>'
+        ).encode()
+
+        return self.add_object(content_id, stream) + self.add_object(page_id, page)
+
+    def trailer(self) -> bytes:
+        size = self.next_id
+        xref_position = self.position
+        lines = [b'xref', b'0 %d' % size, b'0000000000 65535 f ']
+        for object_id in range(1, size):
+            lines.append(b'%010d 00000 n ' % self.offsets[object_id])
+        lines.append(b'trailer\n<< /Size %d /Root 1 0 R >>' % size)
+        lines.append(b'startxref\n%d\n%%%%EOF\n' % xref_position)
+        return self._emit(b'\n'.join(lines))
@@ -1,14 +1,21 @@
-from django.shortcuts import render, redirect
-from django.http import HttpResponse
+import uuid
+
+from django.conf import settings
+from django.shortcuts import get_object_or_404, render, redirect
+from django.http import FileResponse, Http404, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.urls import reverse
+from django.views.decorators.http import require_POST
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required, permission_required
-from io import BytesIO
-import zipfile
-import qrcode
-import re
-from PIL import Image, ImageDraw, ImageFont
 
 from .forms import QRGeneratorForm
+from .jobs import submit_job
+from .models import QrGenerationJob
+from .cache import get_qr_png
+from .outputs import OUTPUT_FORMATS, stream_output
+from .rendering import default_workers, render_qr_image
+from .vector import render_qr_svg
+from .zip_stream import safe_filename
 
 
 @login_required
@@ -28,6 +35,11 @@ def qr_generator_view(request):
         'form': form,
         'title': 'Generador de Códigos QR',
     }
+
+    # Trabajo en segundo plano recién solicitado (?job=<id>): mostrar su progreso
+    job_id = request.GET.get('job')
+    if job_id:
+        context['job'] = QrGenerationJob.objects.filter(pk=job_id).first() if _is_uuid(job_id) else None
     
     return render(request, 'qr_generator/qr_generator_template.html', context)
 
@@ -71,128 +83,132 @@ def generate_qr_codes(request):
         messages.error(request, 'No se pudo obtener el tenant.')
         return redirect('qr_generator:qr_generator')
     
-    # Helper para sanitizar nombres de archivo
-    def _safe_filename(s: str) -> str:
-        s = str(s)
-        # Reemplaza caracteres no permitidos por '_' (mantiene letras, números, guiones, puntos y guion bajo)
-        return re.sub(r'[^A-Za-z0-9._-]', '_', s)
-
-    # Si es una sola unidad, retornar la imagen directamente
-    if units.count() == 1:
+    output_format = form.cleaned_data['output_format']
+
+    # Si es una sola unidad, retornar la imagen directamente (el PDF siempre es hoja)
+    if units.count() == 1 and output_format != 'pdf':
         unit = units.first()
-        qr_image = generate_qr_image(unit, tenant)
 
-        response = HttpResponse(content_type='image/png')
-        filename = f"{_safe_filename(unit.transit_number)}.png"
+        if output_format == 'svg':
+            response = HttpResponse(render_qr_svg(unit.transit_number, tenant), content_type='image/svg+xml')
+        else:
+            response = HttpResponse(get_qr_png(unit.transit_number, tenant), content_type='image/png')
+        filename = f"{safe_filename(unit.transit_number)}.{output_format}"
         response['Content-Disposition'] = f'attachment; filename="{filename}"'
-        qr_image.save(response, 'PNG')
         return response
     
-    # Si son múltiples unidades, crear un ZIP
-    zip_buffer = BytesIO()
-    
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-        for unit in units:
-            qr_image = generate_qr_image(unit, tenant)
-
-            # Guardar la imagen en un buffer temporal
-            img_buffer = BytesIO()
-            qr_image.save(img_buffer, 'PNG')
-            img_buffer.seek(0)
-
-            # Agregar al ZIP usando únicamente el transit_number (sanitizado)
-            filename = f"{_safe_filename(unit.transit_number)}.png"
-            zip_file.writestr(filename, img_buffer.getvalue())
-    
-    # Preparar respuesta con el ZIP
-    zip_buffer.seek(0)
-    response = HttpResponse(zip_buffer.getvalue(), content_type='application/zip')
+    # Si son múltiples unidades, emitir el archivo por bloques (ZIP entrada por
+    # entrada o PDF hoja por hoja) mientras se renderiza
+    # (solo los números de tránsito: el cursor no queda abierto durante la descarga)
+    transit_numbers = list(units.values_list('transit_number', flat=True))
+    extension, content_type = OUTPUT_FORMATS[output_format]
+
+    response = StreamingHttpResponse(
+        stream_output(transit_numbers, tenant, output_format, get_render_workers()),
+        content_type=content_type,
+    )
     # tenant es una cadena (schema_name) — usarla directamente
-    response['Content-Disposition'] = f'attachment; filename="QR_Codes_{tenant}.zip"'
+    response['Content-Disposition'] = f'attachment; filename="QR_Codes_{tenant}.{extension}"'
     
     return response
 
 
-def generate_qr_image(unit, tenant):
+@login_required
+@permission_required('qr_generator.can_generate_qr_codes', raise_exception=True)
+@require_POST
+def submit_qr_job(request):
     """
-    Genera una imagen QR para una unidad específica con un encabezado que muestra
-    el número de tránsito.
+    Registra un trabajo de generación en segundo plano para la selección
+    del formulario y redirige al generador, que muestra su progreso.
 
-    Args:
-        unit: Instancia de Unit
-        tenant: Schema name del tenant (ej: 'alianza')
+    Si ya hay un trabajo activo con la misma selección, se reutiliza.
+    """
+    form = QRGeneratorForm(request.POST)
 
-    Returns:
-        PIL.Image: Imagen del código QR con encabezado
+    if not form.is_valid():
+        context = {
+            'form': form,
+            'title': 'Generador de Códigos QR',
+        }
+        return render(request, 'qr_generator/qr_generator_template.html', context)
+
+    job, created = submit_job(form.get_selection(), request.user, form.cleaned_data['output_format'])
+
+    if not created:
+        messages.info(request, 'Ya hay un trabajo en curso para esta selección; se muestra su progreso.')
+
+    return redirect(f"{reverse('qr_generator:qr_generator')}?job={job.id}")
+
+
+@login_required
+@permission_required('qr_generator.can_generate_qr_codes', raise_exception=True)
+def qr_job_status(request, job_id):
     """
-    # Construir la URL completa para la encuesta de esta unidad
-    # Formato: http://alianza.tuvozenruta.com/survey/ABC123/
-    url = f"http://{tenant}.tuvozenruta.com/survey/{unit.transit_number}/"
-
-    # Crear el código QR
-    qr = qrcode.QRCode(
-        version=1,  # Tamaño del QR (1 es el más pequeño)
-        error_correction=qrcode.constants.ERROR_CORRECT_H,  # Alta corrección de errores
-        box_size=10,  # Tamaño de cada "caja" del QR
-        border=4,  # Grosor del borde
-    )
+    Estado de un trabajo (endpoint de polling).
 
-    qr.add_data(url)
-    qr.make(fit=True)
+    Returns:
+        JsonResponse con id, status, processed, total, percent, error y
+        download_url (solo cuando terminó)
+    """
+    job = get_object_or_404(QrGenerationJob, pk=job_id)
+
+    return JsonResponse({
+        'id': str(job.id),
+        'status': job.status,
+        'status_display': job.get_status_display(),
+        'processed': job.processed,
+        'total': job.total,
+        'percent': job.progress_percent,
+        'error': job.error,
+        'download_url': (
+            reverse('qr_generator:qr_job_download', args=[job.id])
+            if job.status == QrGenerationJob.Status.DONE else None
+        ),
+    })
 
-    # Generar la imagen QR base
-    qr_img = qr.make_image(fill_color="black", back_color="white")
 
-    # Convertir a RGB si es necesario (para poder agregar texto)
-    if qr_img.mode != 'RGB':
-        qr_img = qr_img.convert('RGB')
+@login_required
+@permission_required('qr_generator.can_generate_qr_codes', raise_exception=True)
+def qr_job_download(request, job_id):
+    """Descarga el ZIP de un trabajo terminado."""
+    job = get_object_or_404(QrGenerationJob, pk=job_id, status=QrGenerationJob.Status.DONE)
 
-    # Obtener dimensiones del QR
-    qr_width, qr_height = qr_img.size
+    if not job.artifact:
+        raise Http404('El archivo del trabajo no está disponible.')
 
-    # Configuración del encabezado
-    header_height = 80  # Altura del encabezado
+    extension, content_type = OUTPUT_FORMATS[job.output_format]
 
-    # Crear una nueva imagen con espacio para el encabezado
-    total_height = header_height + qr_height
-    final_img = Image.new('RGB', (qr_width, total_height), 'white')
+    return FileResponse(
+        job.artifact.open('rb'),
+        as_attachment=True,
+        filename=f'QR_Codes_{request.tenant.schema_name}.{extension}',
+        content_type=content_type,
+    )
 
-    # Dibujar el encabezado
-    draw = ImageDraw.Draw(final_img)
 
-    # Intentar usar una fuente del sistema, si no está disponible usar la predeterminada
+def _is_uuid(value):
     try:
-        # Tamaño de fuente para el título
-        font_title = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 36)
-    except:
-        try:
-            # Alternativa para Linux
-            font_title = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 36)
-        except:
-            # Si no hay fuentes disponibles, usar la predeterminada
-            font_title = ImageFont.load_default()
-
-    # Texto del encabezado (solo el número de tránsito)
-    title_text = unit.transit_number
-
-    # Calcular posiciones para centrar el texto
-    try:
-        # Método moderno de Pillow
-        title_bbox = draw.textbbox((0, 0), title_text, font=font_title)
-        title_width = title_bbox[2] - title_bbox[0]
-    except:
-        # Método legacy si textbbox no está disponible
-        title_width = len(title_text) * 20
+        uuid.UUID(value)
+    except ValueError:
+        return False
+    return True
+
 
-    title_x = (qr_width - title_width) // 2
+def get_render_workers():
+    """Procesos para renderizar QR (settings.QR_RENDER_WORKERS; 0 = uno por CPU)."""
+    return getattr(settings, 'QR_RENDER_WORKERS', 0) or default_workers()
 
-    # Centrar verticalmente el título en el encabezado
-    title_y = (header_height - 36) // 2  # 36 es el tamaño de fuente del título
 
-    # Dibujar el texto del encabezado
-    draw.text((title_x, title_y), title_text, fill='black', font=font_title)
+def generate_qr_image(unit, tenant):
+    """
+    Genera una imagen QR para una unidad específica con un encabezado que muestra
+    el número de tránsito.
 
-    # Pegar el código QR debajo del encabezado
-    final_img.paste(qr_img, (0, header_height))
+    Args:
+        unit: Instancia de Unit
+        tenant: Schema name del tenant (ej: 'alianza')
 
-    return final_img
+    Returns:
+        PIL.Image: Imagen del código QR con encabezado
+    """
+    return render_qr_image(unit.transit_number, tenant)
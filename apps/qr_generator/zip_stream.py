@@ -0,0 +1,74 @@
+"""
+Generación de archivos ZIP en streaming.
+
+``zipfile`` puede escribir sobre un archivo no posicionable (usa data
+descriptors en lugar de reescribir los encabezados), así que cada entrada
+se emite en cuanto se agrega y solo una imagen vive en memoria a la vez.
+"""
+import io
+import re
+import zipfile
+from collections.abc import Iterable, Iterator
+
+
+def safe_filename(s: str) -> str:
+    """Reemplaza caracteres no permitidos por '_' (mantiene letras, números, guiones, puntos y guion bajo)."""
+    return re.sub(r'[^A-Za-z0-9._-]', '_', str(s))
+
+
+class _ZipStreamBuffer(io.RawIOBase):
+    """Archivo de solo escritura que acumula bytes hasta que se drenan."""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        """Devuelve y descarta los bytes escritos desde la última llamada."""
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def stream_zip(
+    entries: Iterable[tuple[str, bytes]],
+    compression: int = zipfile.ZIP_STORED
+) -> Iterator[bytes]:
+    """
+    Emite un archivo ZIP entrada por entrada.
+
+    Por defecto las entradas se guardan sin comprimir (ZIP_STORED): los PNG
+    ya están comprimidos y deflate solo agregaría CPU.
+
+    Args:
+        entries: Tuplas (nombre_de_archivo, contenido)
+        compression: Método de zipfile (ZIP_DEFLATED para texto, ej. SVG)
+
+    Returns:
+        Iterador de bloques de bytes del ZIP
+
+    Example:
+        >>> b''.join(stream_zip([('a.png', png_bytes)]))[:2]
+        b'PK'
+    """
+    buffer = _ZipStreamBuffer()
+
+    with zipfile.ZipFile(buffer, 'w', compression) as zip_file:
+        for filename, content in entries:
+            zip_file.writestr(filename, content)
+            yield buffer.drain()
+
+    # Directorio central (se escribe al cerrar)
+    yield buffer.drain()
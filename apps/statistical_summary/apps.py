@@ -6,3 +6,7 @@ class StatisticalSummaryConfig(AppConfig):
     name = 'apps.statistical_summary'
     label = 'statistical_summary'
     verbose_name = 'Resumen Estadístico'  # Esto controla el nombre en el sidebar
+
+    def ready(self):
+        # Registrar señales de invalidación del cubo analítico
+        from . import signals  # noqa: F401
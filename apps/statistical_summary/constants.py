@@ -4,6 +4,8 @@ Constantes y configuraciones para statistical_summary.
 Este módulo centraliza todas las constantes usadas en el cálculo
 de estadísticas para facilitar mantenimiento y configuración.
 """
+from datetime import timedelta
+
 import pytz
 
 # Timezone para conversión de fechas (visual en admin, DB usa UTC)
@@ -29,3 +31,85 @@ QUESTION_TYPE_LABELS = {
     "CHOICE": "opción",
     "MULTI_CHOICE": "múltiples opciones",
 }
+
+# Exportación de respuestas
+# Tamaño de lote del cursor del servidor: acota la memoria usada por la exportación
+EXPORT_CHUNK_SIZE = 500
+
+# Separador para las opciones de preguntas MULTI_CHOICE en una sola celda
+EXPORT_MULTI_CHOICE_SEPARATOR = "; "
+
+# Columnas fijas de la exportación (antes de las columnas de preguntas)
+EXPORT_BASE_COLUMNS = ["unidad", "ruta", "fecha_envio"]
+
+# Columnas de queja (después de las columnas de preguntas)
+EXPORT_COMPLAINT_COLUMNS = ["motivo_queja", "texto_queja"]
+
+# Formatos de exportación soportados y su content-type
+EXPORT_CONTENT_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "jsonl": "application/x-ndjson; charset=utf-8",
+}
+
+# Snapshots columnares (comando export_snapshot)
+SNAPSHOT_COMPRESSION = "zstd"
+SNAPSHOT_STATE_FILE = "_snapshot_state.json"
+
+# Cubo analítico en memoria (STATISTICS_ENGINE = "cube")
+# Intervalo mínimo entre cargas incrementales del cubo
+CUBE_REFRESH_SECONDS = 30
+
+# Ventana que se relee en cada carga para no perder filas confirmadas fuera de orden
+CUBE_WATERMARK_OVERLAP = timedelta(minutes=5)
+
+# Filas por lote al cargar el cubo (solo un lote de tuplas vive en memoria)
+CUBE_LOAD_CHUNK_SIZE = 50_000
+
+# Búsqueda de texto completo (quejas y respuestas TEXT)
+SEARCH_SOURCES = ("all", "complaints", "answers")
+SEARCH_PAGE_SIZE = 20
+SEARCH_MAX_PAGE_SIZE = 100
+
+# Frecuencia de términos (textos libres de quejas y respuestas TEXT)
+TERM_MIN_LENGTH = 3
+TERM_MAX_LENGTH = 64
+TOP_TERMS_LIMIT = 15
+
+# Vigencia en cada proceso de los ids de preguntas TEXT (descuento de términos al eliminar)
+TEXT_QUESTIONS_CACHE_SECONDS = 60
+
+# Palabras vacías en español que no aportan al análisis de frecuencia
+SPANISH_STOPWORDS = frozenset("""
+    ahi al algo algun alguna algunas alguno algunos ante antes aqui asi aun aunque bien
+    cada casi como con contra cual cuales cuando de del desde donde dos el ella ellas
+    ellos en entre era eran es esa esas ese eso esos esta estaba estaban estan estar
+    este esto estos fue fueron ha habia han hasta hay la las le les lo los mas me mi
+    mis mucho muy nada ni no nos nosotros o otra otro para pero poco por porque que
+    quien se ser si sin sobre solo son su sus tambien tan tanto te tiene tienen todo
+    todos tu un una uno unos usted ustedes va van ya yo
+    ahí aquí así aún cuál cuáles cuándo dónde está están estás él más mí qué quién
+    sí sólo también tú
+""".split())
+
+# Detección de quejas casi duplicadas (MinHash + LSH)
+# Firma: DEDUP_NUM_PERMUTATIONS mínimos de shingles de DEDUP_SHINGLE_SIZE caracteres
+DEDUP_NUM_PERMUTATIONS = 64
+DEDUP_SHINGLE_SIZE = 5
+
+# LSH: la firma se divide en DEDUP_BANDS bandas; dos quejas son candidatas si
+# comparten al menos una banda (probabilidad alta a partir de ~50% de similitud)
+DEDUP_BANDS = 16
+
+# Similitud de Jaccard estimada para marcar una queja como duplicada
+DEDUP_SIMILARITY_THRESHOLD = 0.8
+
+# Ventana de tiempo (misma unidad) en la que se buscan duplicados
+DEDUP_WINDOW = timedelta(hours=24)
+
+# Semilla fija: las firmas deben ser comparables entre procesos y ejecuciones
+DEDUP_SEED = 20240501
+
+# Dashboard ejecutivo multi-tenant (esquema público)
+# Schemas por query UNION ALL y vigencia en cache de los KPIs de cada tenant
+TENANT_OVERVIEW_BATCH_SIZE = 50
+TENANT_OVERVIEW_CACHE_SECONDS = 300
@@ -0,0 +1,168 @@
+"""
+Comando para medir el dashboard de un tenant y guardar el resultado como JSON.
+
+Con ``--seed`` los datos se escriben con COPY (sin señales): después se
+reconstruye TermCount y se indexan las firmas de quejas, salvo con
+``--no-index``.
+
+Uso:
+    python manage.py benchmark_dashboard --schema bench --seed 1000000
+    python manage.py benchmark_dashboard --schema bench --repeat 10 --output benchmarks/main.json
+    python manage.py benchmark_dashboard --schema bench --baseline benchmarks/main.json
+"""
+import json
+import subprocess
+from dataclasses import asdict
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django_tenants.utils import get_tenant_model, schema_context
+
+from apps.statistical_summary.repositories import benchmark_repository
+from apps.statistical_summary.services import benchmark_service
+from apps.statistical_summary.services.dedup_service import index_pending_complaints
+from apps.statistical_summary.services.terms_service import rebuild_term_counts
+
+# Escalas con nombre para --seed
+SCALES = {'10k': 10_000, '1m': 1_000_000, '10m': 10_000_000}
+
+
+class Command(BaseCommand):
+    help = (
+        'Mide latencia (p50/p95) y queries de cada KPI del dashboard para todas las '
+        'combinaciones de período, ruta y unidad de un tenant; opcionalmente siembra '
+        'datos sintéticos antes.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--schema', required=True, help='Schema del tenant a medir')
+        parser.add_argument(
+            '--seed',
+            help=f'Respuestas sintéticas a insertar antes de medir ({", ".join(SCALES)} o un número)',
+        )
+        parser.add_argument('--units', type=int, default=50, help='Unidades de benchmark al sembrar (default: 50)')
+        parser.add_argument('--routes', type=int, default=5, help='Rutas de benchmark al sembrar (default: 5)')
+        parser.add_argument('--days', type=int, default=365, help='Días que cubren los datos sembrados (default: 365)')
+        parser.add_argument(
+            '--no-index',
+            action='store_false',
+            dest='index',
+            help='Al sembrar, no reconstruir TermCount ni indexar firmas de quejas',
+        )
+        parser.add_argument('--repeat', type=int, default=5, help='Mediciones por KPI y combinación (default: 5)')
+        parser.add_argument('--warmup', type=int, default=1, help='Llamadas sin medir por KPI y combinación (default: 1)')
+        parser.add_argument(
+            '--max-units',
+            type=int,
+            default=10,
+            help='Unidades a medir como filtro (0 para todas; default: 10)',
+        )
+        parser.add_argument(
+            '--kpi',
+            action='append',
+            dest='kpis',
+            choices=list(benchmark_service.BENCHMARK_KPIS),
+            help='KPI a medir (se puede repetir; default: todos)',
+        )
+        parser.add_argument('--engine', choices=['sql', 'cube'], help='Motor del KPI "dashboard" (default: settings)')
+        parser.add_argument('--output', help='Archivo JSON de resultado (default: benchmarks/<schema>-<fecha>.json)')
+        parser.add_argument('--baseline', help='Resultado JSON anterior contra el cual comparar')
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=1.2,
+            help='Razón de p95 que se reporta como regresión (default: 1.2)',
+        )
+
+    def handle(self, *args, **options):
+        schema_name = options['schema']
+        if not get_tenant_model().objects.filter(schema_name=schema_name).exists():
+            raise CommandError(f'Tenant no encontrado: {schema_name}')
+
+        with schema_context(schema_name):
+            if options['seed']:
+                self._seed(options)
+
+            combinations = benchmark_service.get_combinations(options['max_units'] or None)
+            self.stdout.write(f'Midiendo {len(combinations)} combinaciones × {options["repeat"]} repeticiones...')
+            result = benchmark_service.run_benchmark(
+                schema_name,
+                combinations,
+                repeat=options['repeat'],
+                warmup=options['warmup'],
+                engine=options['engine'],
+                commit=_current_commit(),
+                kpis=options['kpis'],
+            )
+
+        data = asdict(result)
+        output = Path(options['output'] or f'benchmarks/{schema_name}-{timezone.now():%Y%m%d-%H%M%S}.json')
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(data, indent=2, ensure_ascii=False))
+
+        rows = ', '.join(f'{table}: {count}' for table, count in result.rows.items())
+        self.stdout.write(f'{schema_name} ({rows}; motor {result.engine}; commit {result.commit or "-"})')
+        self.stdout.write(f'{"KPI":<22} {"p50 ms":>10} {"p95 ms":>10} {"max ms":>10} {"queries":>8}')
+        for kpi, stats in result.kpis.items():
+            self.stdout.write(
+                f'{kpi:<22} {stats.p50_ms:>10.2f} {stats.p95_ms:>10.2f} {stats.max_ms:>10.2f} {stats.max_queries:>8}'
+            )
+        self.stdout.write(self.style.SUCCESS(f'✓ Resultado en {output}'))
+
+        if options['baseline']:
+            self._compare(Path(options['baseline']), data, options['threshold'])
+
+    def _seed(self, options):
+        value = options['seed'].lower()
+        try:
+            answers = SCALES[value] if value in SCALES else int(value)
+        except ValueError:
+            raise CommandError(f'--seed inválido: {options["seed"]}')
+
+        started = timezone.now()
+        try:
+            inserted = benchmark_repository.seed_dashboard_data(
+                answers,
+                units=options['units'],
+                routes=options['routes'],
+                days=options['days'],
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        seconds = (timezone.now() - started).total_seconds()
+        summary = ', '.join(f'{table}: {count}' for table, count in inserted.items())
+        self.stdout.write(self.style.SUCCESS(f'✓ Datos sembrados en {seconds:.1f} s ({summary})'))
+
+        if options['index']:
+            terms = rebuild_term_counts()
+            indexed = index_pending_complaints()
+            self.stdout.write(self.style.SUCCESS(f'✓ {terms} conteos de términos, {indexed} quejas indexadas'))
+
+    def _compare(self, baseline_path, data, threshold):
+        try:
+            baseline = json.loads(baseline_path.read_text())
+        except (OSError, ValueError) as exc:
+            raise CommandError(f'No se pudo leer {baseline_path}: {exc}')
+
+        rows = benchmark_service.compare_benchmarks(baseline, data, threshold)
+        self.stdout.write(f'\nContra {baseline_path} (commit {baseline.get("commit") or "-"}):')
+        for row in rows:
+            line = (
+                f'{row["kpi"]:<22} p95 {row["baseline_p95_ms"]:.2f} → {row["current_p95_ms"]:.2f} ms '
+                f'(×{row["ratio"]}), queries {row["baseline_queries"]} → {row["current_queries"]}'
+            )
+            self.stdout.write(self.style.ERROR(f'✗ {line}') if row['regression'] else f'  {line}')
+
+
+def _current_commit() -> str | None:
+    """Commit corto del código medido, si el proyecto es un repositorio git."""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=settings.BASE_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
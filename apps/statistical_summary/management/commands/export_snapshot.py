@@ -0,0 +1,62 @@
+"""
+Comando para exportar snapshots columnares (Parquet) por tenant.
+
+Uso:
+    python manage.py export_snapshot --output-dir snapshots
+    python manage.py export_snapshot --incremental
+    python manage.py export_snapshot --schema alianza --schema express
+"""
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django_tenants.utils import get_public_schema_name, get_tenant_model, schema_context
+
+from apps.statistical_summary.services.snapshot_service import write_tenant_snapshot
+
+
+class Command(BaseCommand):
+    help = (
+        'Escribe un snapshot columnar (Parquet, particionado por mes) de envíos, '
+        'respuestas y quejas de cada tenant.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output-dir',
+            default='snapshots',
+            help='Directorio raíz donde se escriben los snapshots (default: snapshots)',
+        )
+        parser.add_argument(
+            '--schema',
+            action='append',
+            dest='schemas',
+            help='Schema del tenant a exportar (se puede repetir; default: todos)',
+        )
+        parser.add_argument(
+            '--incremental',
+            action='store_true',
+            help='Reescribir solo los meses con registros nuevos desde la última ejecución',
+        )
+
+    def handle(self, *args, **options):
+        output_dir = Path(options['output_dir'])
+        tenants = get_tenant_model().objects.exclude(schema_name=get_public_schema_name())
+
+        if options['schemas']:
+            tenants = tenants.filter(schema_name__in=options['schemas'])
+            missing = set(options['schemas']) - set(tenants.values_list('schema_name', flat=True))
+            if missing:
+                raise CommandError(f'Tenants no encontrados: {", ".join(sorted(missing))}')
+
+        for tenant in tenants.order_by('schema_name'):
+            with schema_context(tenant.schema_name):
+                result = write_tenant_snapshot(
+                    tenant.schema_name,
+                    output_dir,
+                    incremental=options['incremental'],
+                )
+
+            months = ', '.join(result.months_written) or 'sin cambios'
+            self.stdout.write(self.style.SUCCESS(
+                f'✓ {tenant.schema_name}: {result.rows_written} filas ({months})'
+            ))
@@ -0,0 +1,41 @@
+"""
+Comando para indexar las firmas MinHash de quejas históricas.
+
+Uso:
+    python manage.py index_complaint_fingerprints
+    python manage.py index_complaint_fingerprints --schema alianza
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django_tenants.utils import get_public_schema_name, get_tenant_model, schema_context
+
+from apps.statistical_summary.services.dedup_service import index_pending_complaints
+
+
+class Command(BaseCommand):
+    help = (
+        'Calcula la firma MinHash y el índice LSH de las quejas que aún no lo '
+        'tienen, marcando las casi duplicadas.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--schema',
+            action='append',
+            dest='schemas',
+            help='Schema del tenant a indexar (se puede repetir; default: todos)',
+        )
+
+    def handle(self, *args, **options):
+        tenants = get_tenant_model().objects.exclude(schema_name=get_public_schema_name())
+
+        if options['schemas']:
+            tenants = tenants.filter(schema_name__in=options['schemas'])
+            missing = set(options['schemas']) - set(tenants.values_list('schema_name', flat=True))
+            if missing:
+                raise CommandError(f'Tenants no encontrados: {", ".join(sorted(missing))}')
+
+        for tenant in tenants.order_by('schema_name'):
+            with schema_context(tenant.schema_name):
+                indexed = index_pending_complaints()
+
+            self.stdout.write(self.style.SUCCESS(f'✓ {tenant.schema_name}: {indexed} quejas indexadas'))
@@ -0,0 +1,42 @@
+"""
+Comando para reconstruir la frecuencia de términos (TermCount) por tenant.
+
+Uso:
+    python manage.py rebuild_term_counts
+    python manage.py rebuild_term_counts --schema alianza
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django_tenants.utils import get_public_schema_name, get_tenant_model, schema_context
+
+from apps.statistical_summary.services.terms_service import rebuild_term_counts
+
+
+class Command(BaseCommand):
+    help = (
+        'Reconstruye desde cero la tabla de frecuencia de términos de quejas '
+        'y respuestas TEXT (carga del histórico).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--schema',
+            action='append',
+            dest='schemas',
+            help='Schema del tenant a reconstruir (se puede repetir; default: todos)',
+        )
+
+    def handle(self, *args, **options):
+        tenants = get_tenant_model().objects.exclude(schema_name=get_public_schema_name())
+
+        if options['schemas']:
+            tenants = tenants.filter(schema_name__in=options['schemas'])
+            missing = set(options['schemas']) - set(tenants.values_list('schema_name', flat=True))
+            if missing:
+                raise CommandError(f'Tenants no encontrados: {", ".join(sorted(missing))}')
+
+        for tenant in tenants.order_by('schema_name'):
+            with schema_context(tenant.schema_name), transaction.atomic():
+                rows = rebuild_term_counts()
+
+            self.stdout.write(self.style.SUCCESS(f'✓ {tenant.schema_name}: {rows} filas'))
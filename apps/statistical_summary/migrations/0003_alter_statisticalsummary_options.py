@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-19 05:41
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('statistical_summary', '0002_alter_statisticalsummary_options'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='statisticalsummary',
+            options={'default_permissions': (), 'permissions': [('can_view_statistical_dashboard', 'Puede ver el dashboard de estadísticas'), ('can_export_survey_data', 'Puede exportar las respuestas de encuestas')], 'verbose_name': 'Resumen de Estadísticas', 'verbose_name_plural': 'Resumen de Estadísticas'},
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.7 on 2026-10-19 05:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0004_full_text_search'),
+        ('statistical_summary', '0003_alter_statisticalsummary_options'),
+        ('transport', '0002_alter_unit_internal_number'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TermCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='Día (hora local)')),
+                ('source', models.CharField(choices=[('complaint', 'Queja'), ('answer', 'Respuesta')], max_length=20, verbose_name='Origen')),
+                ('term', models.CharField(max_length=64, verbose_name='Término')),
+                ('count', models.IntegerField(default=0, verbose_name='Textos')),
+                ('question', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='term_counts', to='interview.question', verbose_name='Pregunta')),
+                ('unit', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='term_counts', to='transport.unit', verbose_name='Unidad')),
+            ],
+            options={
+                'verbose_name': 'Frecuencia de término',
+                'verbose_name_plural': 'Frecuencias de términos',
+                'db_table': 'term_counts',
+                'default_permissions': (),
+                'indexes': [models.Index(fields=['source', 'day'], name='term_counts_source_day')],
+                'constraints': [models.UniqueConstraint(fields=('day', 'unit', 'source', 'question', 'term'), name='term_counts_unique', nulls_distinct=False)],
+            },
+        ),
+    ]
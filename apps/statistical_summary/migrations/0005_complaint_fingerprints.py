@@ -0,0 +1,55 @@
+# Generated by Django 5.2.7 on 2026-10-19 05:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0004_full_text_search'),
+        ('statistical_summary', '0004_termcount'),
+        ('transport', '0002_alter_unit_internal_number'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ComplaintFingerprint',
+            fields=[
+                ('complaint', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='fingerprint', serialize=False, to='interview.complaint', verbose_name='Queja')),
+                ('submitted_at', models.DateTimeField(verbose_name='Fecha de envío')),
+                ('signature', models.BinaryField(verbose_name='Firma MinHash')),
+                ('duplicate_of', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='duplicate_fingerprints', to='interview.complaint', verbose_name='Duplicado de')),
+                ('unit', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='transport.unit', verbose_name='Unidad')),
+            ],
+            options={
+                'verbose_name': 'Firma de queja',
+                'verbose_name_plural': 'Firmas de quejas',
+                'db_table': 'complaint_fingerprints',
+                'default_permissions': (),
+            },
+        ),
+        migrations.CreateModel(
+            name='ComplaintLshBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('band', models.PositiveSmallIntegerField(verbose_name='Banda')),
+                ('bucket', models.BigIntegerField(verbose_name='Bucket')),
+                ('fingerprint', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='buckets', to='statistical_summary.complaintfingerprint', verbose_name='Firma')),
+            ],
+            options={
+                'verbose_name': 'Bucket LSH',
+                'verbose_name_plural': 'Buckets LSH',
+                'db_table': 'complaint_lsh_buckets',
+                'default_permissions': (),
+            },
+        ),
+        migrations.AddIndex(
+            model_name='complaintfingerprint',
+            index=models.Index(fields=['unit', 'submitted_at'], name='complaint_fp_unit_time'),
+        ),
+        migrations.AddIndex(
+            model_name='complaintlshbucket',
+            index=models.Index(fields=['band', 'bucket'], name='complaint_lsh_band_bucket'),
+        ),
+    ]
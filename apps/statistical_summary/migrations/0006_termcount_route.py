@@ -0,0 +1,40 @@
+# Generated by Django 5.2.7 on 2026-10-19 07:39
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# Los conteos existentes no guardan la ruta del texto: se toma la ruta
+# actual de la unidad. El comando rebuild_term_counts recalcula la ruta
+# registrada en cada queja y respuesta.
+FILL_ROUTE_SQL = """
+UPDATE term_counts t SET route_id = u.route_id
+FROM units u
+WHERE t.unit_id = u.id AND u.route_id IS NOT NULL;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0008_monthly_partitions'),
+        ('statistical_summary', '0005_complaint_fingerprints'),
+        ('transport', '0002_alter_unit_internal_number'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='termcount',
+            name='term_counts_unique',
+        ),
+        migrations.AddField(
+            model_name='termcount',
+            name='route',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='term_counts', to='transport.route', verbose_name='Ruta'),
+        ),
+        migrations.RunSQL(FILL_ROUTE_SQL, migrations.RunSQL.noop),
+        migrations.AddConstraint(
+            model_name='termcount',
+            constraint=models.UniqueConstraint(fields=('day', 'unit', 'route', 'source', 'question', 'term'), name='term_counts_unique', nulls_distinct=False),
+        ),
+    ]
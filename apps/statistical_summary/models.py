@@ -9,6 +9,7 @@ class StatisticalSummary(SurveySubmission):
 
     Permisos:
     - can_view_statistical_dashboard: Permite acceder al dashboard de estadísticas
+    - can_export_survey_data: Permite descargar la exportación de respuestas
     """
     class Meta:
         proxy = True
@@ -19,4 +20,138 @@ class StatisticalSummary(SurveySubmission):
         # Definir permisos personalizados para control de acceso
         permissions = [
             ("can_view_statistical_dashboard", "Puede ver el dashboard de estadísticas"),
-        ]
\ No newline at end of file
+            ("can_export_survey_data", "Puede exportar las respuestas de encuestas"),
+        ]
+
+class TermCount(models.Model):
+    """
+    Frecuencia de términos de textos libres, agregada por día, unidad y
+    ruta (la registrada en el texto al momento del envío).
+
+    Se actualiza de forma incremental al guardar quejas y respuestas TEXT
+    (ver signals.py), de modo que el panel de palabras frecuentes del
+    dashboard es un ``SUM`` sobre esta tabla en lugar de re-tokenizar cada
+    texto por request. ``count`` es el número de textos que contienen el
+    término (no el número de apariciones).
+    """
+    class Source(models.TextChoices):
+        COMPLAINT = 'complaint', 'Queja'
+        ANSWER = 'answer', 'Respuesta'
+
+    day = models.DateField(verbose_name='Día (hora local)')
+    unit = models.ForeignKey(
+        'transport.Unit',
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        related_name='term_counts',
+        verbose_name='Unidad'
+    )
+    route = models.ForeignKey(
+        'transport.Route',
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        related_name='term_counts',
+        verbose_name='Ruta'
+    )
+    source = models.CharField(max_length=20, choices=Source.choices, verbose_name='Origen')
+    # Pregunta TEXT de origen (null para quejas)
+    question = models.ForeignKey(
+        'interview.Question',
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        related_name='term_counts',
+        verbose_name='Pregunta'
+    )
+    term = models.CharField(max_length=64, verbose_name='Término')
+    count = models.IntegerField(default=0, verbose_name='Textos')
+
+    class Meta:
+        db_table = 'term_counts'
+        verbose_name = 'Frecuencia de término'
+        verbose_name_plural = 'Frecuencias de términos'
+        default_permissions = ()
+        constraints = [
+            # Llave del upsert incremental (unidad, ruta y pregunta pueden ser nulas)
+            models.UniqueConstraint(
+                fields=['day', 'unit', 'route', 'source', 'question', 'term'],
+                name='term_counts_unique',
+                nulls_distinct=False,
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['source', 'day'], name='term_counts_source_day'),
+        ]
+
+
+class ComplaintFingerprint(models.Model):
+    """
+    Firma MinHash del texto de una queja para detectar casi duplicados.
+
+    ``duplicate_of`` apunta a la queja original (la primera del grupo) cuando
+    el texto es casi idéntico a otra queja de la misma unidad dentro de
+    DEDUP_WINDOW; el dashboard puede excluir esas quejas de los conteos.
+    """
+    complaint = models.OneToOneField(
+        'interview.Complaint',
+        primary_key=True,
+        on_delete=models.CASCADE,
+        related_name='fingerprint',
+        verbose_name='Queja'
+    )
+    unit = models.ForeignKey(
+        'transport.Unit',
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name='+',
+        verbose_name='Unidad'
+    )
+    submitted_at = models.DateTimeField(verbose_name='Fecha de envío')
+    # DEDUP_NUM_PERMUTATIONS enteros uint32 (little-endian)
+    signature = models.BinaryField(verbose_name='Firma MinHash')
+    duplicate_of = models.ForeignKey(
+        'interview.Complaint',
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name='duplicate_fingerprints',
+        verbose_name='Duplicado de'
+    )
+
+    class Meta:
+        db_table = 'complaint_fingerprints'
+        verbose_name = 'Firma de queja'
+        verbose_name_plural = 'Firmas de quejas'
+        default_permissions = ()
+        indexes = [
+            models.Index(fields=['unit', 'submitted_at'], name='complaint_fp_unit_time'),
+        ]
+
+
+class ComplaintLshBucket(models.Model):
+    """
+    Índice LSH: una fila por banda de la firma de cada queja.
+
+    Buscar candidatos es un lookup por (band, bucket) en lugar de comparar
+    la queja nueva contra todas las anteriores.
+    """
+    fingerprint = models.ForeignKey(
+        ComplaintFingerprint,
+        on_delete=models.CASCADE,
+        related_name='buckets',
+        verbose_name='Firma'
+    )
+    band = models.PositiveSmallIntegerField(verbose_name='Banda')
+    bucket = models.BigIntegerField(verbose_name='Bucket')
+
+    class Meta:
+        db_table = 'complaint_lsh_buckets'
+        verbose_name = 'Bucket LSH'
+        verbose_name_plural = 'Buckets LSH'
+        default_permissions = ()
+        indexes = [
+            models.Index(fields=['band', 'bucket'], name='complaint_lsh_band_bucket'),
+        ]
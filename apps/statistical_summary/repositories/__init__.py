@@ -9,10 +9,24 @@ from . import complaint_repository
 from . import survey_repository
 from . import question_repository
 from . import transport_repository
+from . import export_repository
+from . import cube_repository
+from . import search_repository
+from . import term_repository
+from . import dedup_repository
+from . import tenant_overview_repository
+from . import benchmark_repository
 
 __all__ = [
     'complaint_repository',
     'survey_repository',
     'question_repository',
     'transport_repository',
+    'export_repository',
+    'cube_repository',
+    'search_repository',
+    'term_repository',
+    'dedup_repository',
+    'tenant_overview_repository',
+    'benchmark_repository',
 ]
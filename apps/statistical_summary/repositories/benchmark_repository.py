@@ -0,0 +1,109 @@
+"""
+Repository para sembrar datos sintéticos de benchmark en un tenant.
+
+Crea las rutas y unidades de benchmark y delega la generación de envíos,
+respuestas y quejas al generador con COPY de ``apps.interview.synthetic``.
+"""
+from apps.interview.models import Answer, Complaint, Question, SurveySubmission
+from apps.interview.synthetic import (
+    COPY_BATCH_SIZE,
+    DEFAULT_ANSWER_RATE,
+    DEFAULT_TEXT_RATE,
+    TrafficCurves,
+    generate_synthetic_data,
+)
+from apps.transport.models import Route, Unit
+
+
+def get_row_counts() -> dict[str, int]:
+    """
+    Filas de las tablas de hechos del tenant actual.
+
+    Example:
+        >>> get_row_counts()
+        {'survey_submissions': 1250, 'answers': 10000, 'complaints': 125}
+    """
+    return {
+        'survey_submissions': SurveySubmission.objects.count(),
+        'answers': Answer.objects.count(),
+        'complaints': Complaint.objects.count(),
+    }
+
+
+def seed_dashboard_data(
+    answers: int,
+    units: int = 50,
+    routes: int = 5,
+    days: int = 365,
+    complaint_rate: float = 0.1,
+    batch_size: int = COPY_BATCH_SIZE,
+    seed: int = 0,
+) -> dict[str, int]:
+    """
+    Siembra en el tenant actual alrededor de ``answers`` respuestas sintéticas.
+
+    Crea (si faltan) rutas y unidades de benchmark y genera envíos en los
+    últimos ``days`` días con las curvas de tráfico por defecto. Los
+    volúmenes siguen una distribución de Poisson, así que el total es
+    aproximado.
+
+    Args:
+        answers: Respuestas a generar (aproximado)
+        units: Unidades entre las que se reparten los envíos
+        routes: Rutas entre las que se reparten las unidades
+        days: Días hacia atrás que cubren los envíos
+        complaint_rate: Fracción de envíos con una queja
+        batch_size: Envíos por lote de COPY
+        seed: Semilla del generador aleatorio (datos reproducibles)
+
+    Returns:
+        Diccionario {tabla: filas insertadas}
+
+    Raises:
+        ValueError: Si el tenant no tiene preguntas activas
+
+    Example:
+        >>> seed_dashboard_data(answers=10_000)
+        {'survey_submissions': 1187, 'answers': 9968, 'answers_selected_options': 2410, 'complaints': 121}
+    """
+    questions = list(Question.objects.filter(active=True).values_list('type', flat=True))
+    if not questions:
+        raise ValueError('El tenant no tiene preguntas activas')
+
+    # respuestas esperadas por envío con las tasas por defecto del generador
+    answers_per_submission = sum(
+        DEFAULT_TEXT_RATE if kind == Question.QuestionType.TEXT else DEFAULT_ANSWER_RATE for kind in questions
+    )
+    benchmark_units = _ensure_units(units, routes)
+    per_unit_daily = answers / answers_per_submission / len(benchmark_units) / days
+
+    result = generate_synthetic_data(
+        days=days,
+        per_unit_daily=per_unit_daily,
+        curves=TrafficCurves(),
+        complaint_rate=complaint_rate,
+        units=benchmark_units,
+        seed=seed,
+        batch_size=batch_size,
+    )
+    return result.rows
+
+
+def _ensure_units(units: int, routes: int) -> list[Unit]:
+    """Crea las rutas y unidades de benchmark que falten y las devuelve."""
+    names = [f'Benchmark Ruta {index + 1:02d}' for index in range(routes)]
+    existing = set(Route.objects.filter(name__in=names).values_list('name', flat=True))
+    Route.objects.bulk_create([Route(name=name) for name in names if name not in existing])
+    route_ids = list(
+        Route.objects.filter(name__in=names).order_by('name').values_list('id', flat=True)
+    )
+    Unit.objects.bulk_create(
+        [
+            Unit(transit_number=f'BENCH-{index + 1:05d}', route_id=route_ids[index % len(route_ids)])
+            for index in range(units)
+        ],
+        ignore_conflicts=True,
+    )
+    return list(
+        Unit.objects.filter(transit_number__startswith='BENCH-').order_by('transit_number')[:units]
+    )
@@ -0,0 +1,122 @@
+"""
+Repository para el cubo analítico en memoria.
+
+Este módulo encapsula las queries que cargan las dimensiones (unidades,
+motivos, preguntas, opciones) y los hechos (envíos, quejas, respuestas y
+selecciones múltiples) que el cubo mantiene en arrays de NumPy. Los hechos
+se leen con ``values_list().iterator()`` para no instanciar modelos.
+"""
+from datetime import datetime
+from typing import Any, Iterator
+
+from apps.interview.models import (
+    Question, QuestionOption, ComplaintReason,
+    SurveySubmission, Answer, Complaint
+)
+from apps.transport.models import Unit
+from ..constants import EXPORT_CHUNK_SIZE
+
+
+def get_units() -> list[tuple[Any, str]]:
+    """
+    Obtiene las unidades.
+
+    Returns:
+        Lista de tuplas (unit_id, transit_number)
+    """
+    return list(Unit.objects.values_list('id', 'transit_number'))
+
+
+def get_reasons() -> list[tuple[Any, str]]:
+    """
+    Obtiene los motivos de queja.
+
+    Returns:
+        Lista de tuplas (reason_id, label)
+    """
+    return list(ComplaintReason.objects.values_list('id', 'label'))
+
+
+def get_active_questions() -> list[tuple[Any, str, str]]:
+    """
+    Obtiene las preguntas activas (mismo criterio que question_repository).
+
+    Returns:
+        Lista de tuplas (question_id, text, type)
+    """
+    return list(Question.objects.filter(active=True).values_list('id', 'text', 'type'))
+
+
+def get_options() -> list[tuple[Any, Any, str]]:
+    """
+    Obtiene todas las opciones de preguntas.
+
+    Returns:
+        Lista de tuplas (option_id, question_id, text)
+    """
+    return list(QuestionOption.objects.values_list('id', 'question_id', 'text'))
+
+
+def iter_submissions(since: datetime | None) -> Iterator[tuple]:
+    """
+    Itera envíos con ``submitted_at >= since`` (todos si since es None).
+
+    Returns:
+        Iterador de tuplas (id, unit_id, route_id, submitted_at)
+    """
+    qs = SurveySubmission.objects.all()
+    if since:
+        qs = qs.filter(submitted_at__gte=since)
+    return qs.values_list('id', 'unit_id', 'route_id', 'submitted_at').iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+
+def iter_complaints(since: datetime | None) -> Iterator[tuple]:
+    """
+    Itera quejas insertadas con ``created_at >= since`` (todas si since es None).
+
+    Returns:
+        Iterador de tuplas (id, unit_id, route_id, reason_id, submitted_at, created_at)
+    """
+    qs = Complaint.objects.all()
+    if since:
+        qs = qs.filter(created_at__gte=since)
+    return qs.values_list(
+        'id', 'unit_id', 'route_id', 'reason_id', 'submitted_at', 'created_at'
+    ).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+
+def iter_answers(since: datetime | None) -> Iterator[tuple]:
+    """
+    Itera respuestas insertadas con ``created_at >= since`` (todas si since es None).
+
+    Returns:
+        Iterador de tuplas (id, question_id, unit_id, route_id, created_at,
+        submitted_at, rating_answer, selected_option_id)
+    """
+    qs = Answer.objects.all()
+    if since:
+        qs = qs.filter(created_at__gte=since)
+    return qs.values_list(
+        'id', 'question_id', 'unit_id', 'route_id', 'created_at',
+        'submitted_at', 'rating_answer', 'selected_option_id'
+    ).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+
+def iter_selections(since: datetime | None) -> Iterator[tuple]:
+    """
+    Itera las selecciones de respuestas MULTI_CHOICE con ``submitted_at >= since``
+    de la respuesta (todas si since es None).
+
+    El id de la tabla intermedia no sirve como marca de agua: una transacción
+    que confirma fuera de orden deja ids menores que los ya cargados.
+
+    Returns:
+        Iterador de tuplas (id, question_id, unit_id, route_id, answer_submitted_at, option_id)
+    """
+    qs = Answer.selected_options.through.objects.all()
+    if since:
+        qs = qs.filter(answer__submitted_at__gte=since)
+    return qs.values_list(
+        'id', 'answer__question_id', 'answer__unit_id', 'answer__route_id',
+        'answer__submitted_at', 'questionoption_id'
+    ).iterator(chunk_size=EXPORT_CHUNK_SIZE)
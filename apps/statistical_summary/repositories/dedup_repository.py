@@ -0,0 +1,98 @@
+"""
+Repository para la detección de quejas casi duplicadas.
+
+Este módulo encapsula las queries sobre ComplaintFingerprint y el índice
+LSH (ComplaintLshBucket): búsqueda de candidatos por bucket y guardado de
+la firma de una queja.
+"""
+from datetime import datetime
+from functools import reduce
+from operator import or_
+from typing import Any, Iterator
+from django.db.models import Q
+
+from apps.interview.models import Complaint
+from ..constants import EXPORT_CHUNK_SIZE
+from ..models import ComplaintFingerprint, ComplaintLshBucket
+
+
+def find_candidates(
+    unit_id: Any,
+    since: datetime,
+    until: datetime,
+    buckets: list[int],
+    exclude_complaint_id: Any = None
+) -> list[dict[str, Any]]:
+    """
+    Obtiene las quejas que comparten al menos una banda LSH.
+
+    Solo considera quejas de la misma unidad con ``since <= submitted_at <= until``.
+
+    Args:
+        unit_id: Unidad de la queja (None para quejas sin unidad)
+        since: Inicio de la ventana
+        until: Fin de la ventana
+        buckets: Buckets por banda (índice = banda)
+        exclude_complaint_id: Queja a excluir (la propia)
+
+    Returns:
+        Lista de dicts con complaint_id, signature, duplicate_of_id y submitted_at
+    """
+    same_bucket = reduce(or_, (
+        Q(buckets__band=band, buckets__bucket=bucket) for band, bucket in enumerate(buckets)
+    ))
+    qs = (
+        ComplaintFingerprint.objects
+        .filter(same_bucket, unit_id=unit_id, submitted_at__gte=since, submitted_at__lte=until)
+        .exclude(complaint_id=exclude_complaint_id)
+        .values('complaint_id', 'signature', 'duplicate_of_id', 'submitted_at')
+        .distinct()
+        .order_by('submitted_at')
+    )
+    return list(qs)
+
+
+def save_fingerprint(
+    complaint: Complaint,
+    signature: bytes,
+    buckets: list[int],
+    duplicate_of_id: Any
+) -> ComplaintFingerprint:
+    """
+    Guarda (o reemplaza) la firma de una queja y sus buckets LSH.
+
+    Returns:
+        ComplaintFingerprint guardada
+    """
+    fingerprint, _ = ComplaintFingerprint.objects.update_or_create(
+        complaint=complaint,
+        defaults={
+            'unit_id': complaint.unit_id,
+            'submitted_at': complaint.submitted_at,
+            'signature': signature,
+            'duplicate_of_id': duplicate_of_id,
+        },
+    )
+    fingerprint.buckets.all().delete()
+    ComplaintLshBucket.objects.bulk_create(
+        ComplaintLshBucket(fingerprint=fingerprint, band=band, bucket=bucket)
+        for band, bucket in enumerate(buckets)
+    )
+    return fingerprint
+
+
+def iter_unindexed_complaints() -> Iterator[Complaint]:
+    """
+    Itera las quejas sin firma en orden cronológico (para el backfill).
+
+    Returns:
+        Iterador de Complaint (solo id, unit_id, text, submitted_at)
+    """
+    return (
+        Complaint.objects
+        .filter(fingerprint__isnull=True)
+        .exclude(text='')
+        .only('id', 'unit_id', 'text', 'submitted_at')
+        .order_by('submitted_at', 'id')
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
@@ -0,0 +1,72 @@
+"""
+Repository para la exportación de respuestas de encuestas.
+
+Este módulo encapsula las queries usadas por la exportación en streaming,
+recorriendo los envíos con un cursor del servidor (``QuerySet.iterator``)
+para que la memoria usada no dependa del tamaño del tenant.
+"""
+from typing import Any, Iterator
+from django.db.models import Prefetch
+
+from apps.interview.models import Question, SurveySubmission, Answer, Complaint
+from ..constants import EXPORT_CHUNK_SIZE
+
+
+def get_export_questions() -> list[Question]:
+    """
+    Obtiene las preguntas activas en el orden en que se muestran al usuario.
+
+    Cada pregunta se convierte en una columna de la exportación.
+
+    Returns:
+        Lista de Question activas ordenadas por posición
+
+    Example:
+        >>> questions = get_export_questions()
+        >>> print([q.position for q in questions])
+        [1, 2, 3, 4, 5]
+    """
+    return list(Question.objects.filter(active=True).order_by('position'))
+
+
+def iter_submissions(
+    filters: dict[str, Any],
+    chunk_size: int = EXPORT_CHUNK_SIZE
+) -> Iterator[SurveySubmission]:
+    """
+    Itera los envíos de encuestas con sus respuestas y quejas precargadas.
+
+    En PostgreSQL ``iterator()`` usa un cursor del servidor, y las relaciones
+    de ``prefetch_related`` se cargan por lote de ``chunk_size`` envíos, por lo
+    que cada lote cuesta un número constante de queries y nunca se mantiene
+    más de un lote en memoria.
+
+    Args:
+        filters: Filtros a aplicar al queryset (ver build_submission_filters)
+        chunk_size: Número de envíos por lote del cursor
+
+    Returns:
+        Iterador de SurveySubmission con unit, route (del envío), answers y complaints
+
+    Example:
+        >>> for submission in iter_submissions({'unit_id': 'uuid'}):
+        ...     print(submission.unit.transit_number, len(submission.answers.all()))
+        ABC001 5
+    """
+    answers_qs = (
+        Answer.objects
+        .select_related('selected_option')
+        .prefetch_related('selected_options')
+    )
+    complaints_qs = Complaint.objects.select_related('reason').order_by('created_at')
+
+    return (
+        SurveySubmission.objects.filter(**filters)
+        .select_related('unit', 'route')
+        .prefetch_related(
+            Prefetch('answers', queryset=answers_qs),
+            Prefetch('complaints', queryset=complaints_qs),
+        )
+        .order_by('submitted_at', 'id')
+        .iterator(chunk_size=chunk_size)
+    )
@@ -50,15 +50,16 @@ def get_filtered_answers(
         >>> print(answers.count())
         42
     """
+    # unit_id, route_id y submitted_at vienen copiados del envío (sin joins)
     answers_qs = Answer.objects.filter(question=question)
     
     if start_date:
-        answers_qs = answers_qs.filter(created_at__gte=start_date)
+        answers_qs = answers_qs.filter(submitted_at__gte=start_date)
     
     if route_id:
-        answers_qs = answers_qs.filter(submission__unit__route_id=route_id)
+        answers_qs = answers_qs.filter(route_id=route_id)
     elif unit_id:
-        answers_qs = answers_qs.filter(submission__unit_id=unit_id)
+        answers_qs = answers_qs.filter(unit_id=unit_id)
     
     return answers_qs
 
@@ -0,0 +1,102 @@
+"""
+Repository para la búsqueda de texto completo.
+
+Este módulo encapsula las queries sobre ``search_vector`` (tsvector con
+índice GIN) de quejas y respuestas de preguntas TEXT. Ambas fuentes
+exponen las mismas columnas para poder combinarse con ``UNION ALL`` y
+ordenarse por relevancia en una sola query.
+"""
+from typing import Any
+from django.contrib.postgres.search import SearchQuery
+from django.db.models import F, QuerySet, Value, CharField
+
+from apps.interview.models import Question, Answer, Complaint
+from apps.interview.search import search_rank
+
+# Columnas comunes de ambas fuentes (mismo orden para el UNION)
+RESULT_FIELDS = ('id', 'source', 'content', 'label', 'transit_number', 'date', 'rank')
+
+
+def search_complaints(query: SearchQuery) -> QuerySet:
+    """
+    Quejas cuyo texto coincide con la consulta.
+
+    Args:
+        query: SearchQuery (configuración en español)
+
+    Returns:
+        QuerySet de dicts con RESULT_FIELDS
+    """
+    return (
+        Complaint.objects
+        .filter(search_vector=query)
+        .annotate(
+            source=Value('complaint', output_field=CharField()),
+            content=F('text'),
+            label=F('reason__label'),
+            transit_number=F('unit__transit_number'),
+            date=F('submitted_at'),
+            rank=search_rank(query),
+        )
+        .values(*RESULT_FIELDS)
+    )
+
+
+def search_answers(query: SearchQuery) -> QuerySet:
+    """
+    Respuestas de preguntas TEXT cuyo texto coincide con la consulta.
+
+    Args:
+        query: SearchQuery (configuración en español)
+
+    Returns:
+        QuerySet de dicts con RESULT_FIELDS
+    """
+    return (
+        Answer.objects
+        .filter(search_vector=query, question__type=Question.QuestionType.TEXT)
+        .annotate(
+            source=Value('answer', output_field=CharField()),
+            content=F('text_answer'),
+            label=F('question__text'),
+            transit_number=F('submission__unit__transit_number'),
+            date=F('submission__submitted_at'),
+            rank=search_rank(query),
+        )
+        .values(*RESULT_FIELDS)
+    )
+
+
+def search(
+    query: SearchQuery,
+    sources: list[str],
+    offset: int,
+    limit: int
+) -> list[dict[str, Any]]:
+    """
+    Busca en las fuentes indicadas y devuelve una página ordenada por relevancia.
+
+    Args:
+        query: SearchQuery (configuración en español)
+        sources: Subconjunto de ["complaints", "answers"]
+        offset: Número de resultados a omitir
+        limit: Número máximo de resultados
+
+    Returns:
+        Lista de dicts con RESULT_FIELDS
+
+    Example:
+        >>> search(build_search_query("frenos"), ["complaints"], 0, 20)
+        [{'id': UUID(...), 'source': 'complaint', 'content': 'Fallan los frenos', ...}]
+    """
+    querysets = []
+    if 'complaints' in sources:
+        querysets.append(search_complaints(query))
+    if 'answers' in sources:
+        querysets.append(search_answers(query))
+
+    combined = querysets[0]
+    if len(querysets) > 1:
+        combined = combined.union(*querysets[1:], all=True)
+
+    return list(combined.order_by('-rank', '-date', 'id')[offset:offset + limit])
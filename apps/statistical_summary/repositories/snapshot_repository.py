@@ -0,0 +1,176 @@
+"""
+Repository para snapshots columnares de analítica.
+
+Este módulo encapsula las queries usadas por el comando export_snapshot:
+detección de meses con datos (o con cambios desde la última ejecución) y
+lectura de envíos, respuestas y quejas de un mes con ``values()`` para no
+instanciar modelos.
+"""
+from datetime import datetime
+from typing import Any, Iterator
+from zoneinfo import ZoneInfo
+from django.db.models import F, QuerySet
+from django.db.models.functions import TruncMonth
+
+from apps.interview.models import Question, SurveySubmission, Answer, Complaint
+from ..constants import DISPLAY_TIMEZONE, EXPORT_CHUNK_SIZE
+
+# TruncMonth necesita un tzinfo de zoneinfo (con pytz aplicaría el offset LMT)
+MONTH_TIMEZONE = ZoneInfo(DISPLAY_TIMEZONE.zone)
+
+
+def get_months(
+    model: type[SurveySubmission] | type[Complaint],
+    changed_since: datetime | None = None
+) -> set[datetime]:
+    """
+    Obtiene los meses (en hora local) que contienen registros del modelo.
+
+    Los registros se asignan al mes de ``submitted_at``. Si se indica
+    ``changed_since``, solo se consideran los registros insertados después
+    de esa fecha: ``submitted_at`` para envíos y ``created_at`` para quejas.
+
+    Args:
+        model: SurveySubmission o Complaint
+        changed_since: Fecha de la última ejecución (None = todos los meses)
+
+    Returns:
+        Conjunto de inicios de mes en hora local (MONTH_TIMEZONE)
+
+    Example:
+        >>> get_months(SurveySubmission)
+        {datetime(2024, 1, 1, 0, 0, tzinfo=<America/Mazatlan>), ...}
+    """
+    qs = model.objects.all()
+
+    if changed_since:
+        changed_field = 'created_at' if model is Complaint else 'submitted_at'
+        qs = qs.filter(**{f'{changed_field}__gte': changed_since})
+
+    months = (
+        qs.annotate(month=TruncMonth('submitted_at', tzinfo=MONTH_TIMEZONE))
+        .values_list('month', flat=True)
+        .distinct()
+    )
+    return set(months)
+
+
+def get_questions() -> QuerySet[Question]:
+    """
+    Obtiene todas las preguntas (activas e inactivas) ordenadas por posición.
+
+    Las preguntas inactivas se incluyen porque los meses históricos pueden
+    tener respuestas para ellas.
+
+    Returns:
+        QuerySet de Question ordenado por posición
+    """
+    return Question.objects.order_by('position', 'created_at')
+
+
+def iter_month_submissions(start: datetime, end: datetime) -> Iterator[dict[str, Any]]:
+    """
+    Itera los envíos de un mes como diccionarios.
+
+    Args:
+        start: Inicio del mes (inclusive)
+        end: Inicio del mes siguiente (exclusivo)
+
+    Returns:
+        Iterador de dicts con id, unit_id, transit_number, route_id, route_name y submitted_at
+    """
+    return (
+        SurveySubmission.objects
+        .filter(submitted_at__gte=start, submitted_at__lt=end)
+        .order_by('submitted_at', 'id')
+        .values(
+            'id', 'unit_id', 'submitted_at',
+            'route_id',
+            transit_number=F('unit__transit_number'),
+            route_name=F('route__name'),
+        )
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+
+
+def iter_month_answers(start: datetime, end: datetime) -> Iterator[dict[str, Any]]:
+    """
+    Itera las respuestas de los envíos de un mes como diccionarios.
+
+    El mes se determina por ``submitted_at`` (copiado del envío), igual que
+    en iter_month_submissions(), para que ambas particiones coincidan.
+
+    Args:
+        start: Inicio del mes (inclusive)
+        end: Inicio del mes siguiente (exclusivo)
+
+    Returns:
+        Iterador de dicts con submission_id, question_id, rating_answer,
+        text_answer y option_text (opción única)
+    """
+    return (
+        Answer.objects
+        .filter(submitted_at__gte=start, submitted_at__lt=end)
+        .order_by('submitted_at', 'submission_id')
+        .values(
+            'submission_id', 'question_id', 'rating_answer', 'text_answer',
+            option_text=F('selected_option__text'),
+        )
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+
+
+def iter_month_multi_options(start: datetime, end: datetime) -> Iterator[dict[str, Any]]:
+    """
+    Itera las opciones seleccionadas en respuestas MULTI_CHOICE de un mes.
+
+    Lee directamente la tabla intermedia del ManyToMany para obtener todas
+    las selecciones del mes en una sola query.
+
+    Args:
+        start: Inicio del mes (inclusive)
+        end: Inicio del mes siguiente (exclusivo)
+
+    Returns:
+        Iterador de dicts con submission_id, question_id y option_text
+    """
+    through = Answer.selected_options.through
+    return (
+        through.objects
+        .filter(
+            answer__submitted_at__gte=start,
+            answer__submitted_at__lt=end,
+        )
+        .order_by('questionoption__position')
+        .values(
+            submission_id=F('answer__submission_id'),
+            question_id=F('answer__question_id'),
+            option_text=F('questionoption__text'),
+        )
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+
+
+def iter_month_complaints(start: datetime, end: datetime) -> Iterator[dict[str, Any]]:
+    """
+    Itera las quejas de un mes (por ``submitted_at``) como diccionarios.
+
+    Args:
+        start: Inicio del mes (inclusive)
+        end: Inicio del mes siguiente (exclusivo)
+
+    Returns:
+        Iterador de dicts con los campos de la queja y su unidad, ruta y motivo
+    """
+    return (
+        Complaint.objects
+        .filter(submitted_at__gte=start, submitted_at__lt=end)
+        .order_by('submitted_at', 'id')
+        .values(
+            'id', 'unit_id', 'route_id', 'submission_id', 'text', 'submitted_at', 'created_at',
+            transit_number=F('unit__transit_number'),
+            reason_label=F('reason__label'),
+        )
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+
@@ -0,0 +1,98 @@
+"""
+Repository para el dashboard ejecutivo multi-tenant.
+
+Se ejecuta desde el esquema público: los agregados de cada tenant se leen
+con nombres de tabla calificados por schema (``"alianza"."complaints"``)
+y se combinan con ``UNION ALL``, de modo que N organizaciones cuestan una
+sola query en lugar de N cambios de search_path.
+"""
+from datetime import datetime
+from typing import Any
+
+from django.db import connection
+from django_tenants.utils import get_public_schema_name, get_tenant_model
+
+from apps.interview.models import Question, Answer, Complaint, SurveySubmission
+
+
+def get_active_tenants() -> list[tuple[str, str]]:
+    """
+    Obtiene las organizaciones activas (sin el esquema público).
+
+    Returns:
+        Lista de tuplas (schema_name, name) ordenada por nombre
+    """
+    return list(
+        get_tenant_model().objects
+        .filter(is_active=True)
+        .exclude(schema_name=get_public_schema_name())
+        .order_by('name')
+        .values_list('schema_name', 'name')
+    )
+
+
+def get_tenant_kpis(
+    schema_names: list[str],
+    start_date: datetime | None
+) -> dict[str, tuple[int, int, float | None]]:
+    """
+    Calcula envíos, quejas y promedio de calificación de varios tenants.
+
+    Mismos criterios que el dashboard de cada tenant: envíos, quejas y
+    respuestas por ``submitted_at``, y solo preguntas RATING activas para
+    el promedio.
+
+    Args:
+        schema_names: Schemas de los tenants
+        start_date: Fecha mínima (None = sin filtro de fecha)
+
+    Returns:
+        Diccionario {schema_name: (total_submissions, total_complaints, average_rating)}
+
+    Example:
+        >>> get_tenant_kpis(["alianza"], None)
+        {'alianza': (120, 14, 4.3)}
+    """
+    if not schema_names:
+        return {}
+
+    selects: list[str] = []
+    params: list[Any] = []
+    for schema_name in schema_names:
+        select, select_params = _kpi_select(schema_name, start_date)
+        selects.append(select)
+        params.extend(select_params)
+
+    with connection.cursor() as cursor:
+        cursor.execute('\nUNION ALL\n'.join(selects), params)
+        return {
+            schema_name: (submissions, complaints, float(average) if average is not None else None)
+            for schema_name, submissions, complaints, average in cursor.fetchall()
+        }
+
+
+def _kpi_select(schema_name: str, start_date: datetime | None) -> tuple[str, list[Any]]:
+    """SELECT de una fila con los KPIs de un schema."""
+    quote = connection.ops.quote_name
+    schema = quote(schema_name)
+    submissions = f'{schema}.{quote(SurveySubmission._meta.db_table)}'
+    complaints = f'{schema}.{quote(Complaint._meta.db_table)}'
+    answers = f'{schema}.{quote(Answer._meta.db_table)}'
+    questions = f'{schema}.{quote(Question._meta.db_table)}'
+
+    submitted_filter = answered_filter = ''
+    date_params: list[Any] = []
+    if start_date:
+        submitted_filter = ' WHERE submitted_at >= %s'
+        answered_filter = ' AND a.submitted_at >= %s'
+        date_params = [start_date]
+
+    sql = (
+        f'SELECT %s, '
+        f'(SELECT COUNT(*) FROM {submissions}{submitted_filter}), '
+        f'(SELECT COUNT(*) FROM {complaints}{submitted_filter}), '
+        f'(SELECT AVG(a.rating_answer) FROM {answers} a '
+        f'JOIN {questions} q ON q.id = a.question_id '
+        f'WHERE q.type = %s AND q.active{answered_filter})'
+    )
+    return sql, [schema_name, *date_params, *date_params, Question.QuestionType.RATING.value, *date_params]
@@ -0,0 +1,201 @@
+"""
+Repository para la frecuencia de términos de textos libres.
+
+Este módulo encapsula las queries sobre TermCount: el upsert incremental
+(``INSERT ... ON CONFLICT DO UPDATE``) usado al guardar textos, la lectura
+de textos para reconstruir la tabla y las agregaciones del dashboard.
+"""
+from collections.abc import Iterable, Iterator
+from datetime import date
+from typing import Any
+from django.db import connection
+from django.db.models import F, QuerySet, Sum
+
+from apps.interview.models import Question, Answer, Complaint
+from ..constants import EXPORT_CHUNK_SIZE
+from ..models import TermCount
+
+# Fila de conteo: (day, unit_id, route_id, source, question_id, term, delta)
+TermRow = tuple[date, Any, Any, str, Any, str, int]
+
+
+def increment_term_counts(rows: Iterable[TermRow]) -> None:
+    """
+    Suma conteos de términos, creando las filas que no existan.
+
+    Args:
+        rows: Filas (day, unit_id, route_id, source, question_id, term, delta)
+
+    Example:
+        >>> increment_term_counts([(date(2024, 1, 5), unit.id, route.id, 'complaint', None, 'frenos', 1)])
+    """
+    rows = list(rows)
+    if not rows:
+        return
+
+    table = connection.ops.quote_name(TermCount._meta.db_table)
+    sql = (
+        f'INSERT INTO {table} (day, unit_id, route_id, source, question_id, term, count) '
+        f'VALUES (%s, %s, %s, %s, %s, %s, %s) '
+        f'ON CONFLICT ON CONSTRAINT term_counts_unique '
+        f'DO UPDATE SET count = {table}.count + EXCLUDED.count'
+    )
+    with connection.cursor() as cursor:
+        cursor.executemany(sql, rows)
+
+
+def decrement_term_counts(
+    day: date,
+    unit_id: Any,
+    route_id: Any,
+    source: str,
+    question_id: Any,
+    terms: Iterable[str]
+) -> None:
+    """
+    Resta un texto a los conteos existentes de los términos dados.
+
+    Usa UPDATE (no upsert) para no crear filas al eliminar en cascada
+    unidades o preguntas.
+
+    Args:
+        day: Día local del texto
+        unit_id: Unidad del texto (puede ser None)
+        route_id: Ruta registrada en el texto (puede ser None)
+        source: TermCount.Source
+        question_id: Pregunta TEXT (None para quejas)
+        terms: Términos del texto eliminado
+    """
+    terms = list(terms)
+    if not terms:
+        return
+
+    TermCount.objects.filter(
+        day=day, unit_id=unit_id, route_id=route_id, source=source, question_id=question_id, term__in=terms
+    ).update(count=F('count') - 1)
+
+
+def delete_term_counts(source: str, start_day: date, end_day: date) -> int:
+    """
+    Elimina los conteos de un origen en un rango de días.
+
+    Args:
+        source: TermCount.Source
+        start_day: Primer día (incluido)
+        end_day: Último día (excluido)
+
+    Returns:
+        Número de filas eliminadas
+    """
+    deleted, _ = TermCount.objects.filter(source=source, day__gte=start_day, day__lt=end_day).delete()
+    return deleted
+
+
+def replace_term_counts(counts: dict[tuple, int], batch_size: int = EXPORT_CHUNK_SIZE) -> int:
+    """
+    Reemplaza todo el contenido de TermCount (reconstrucción completa).
+
+    Args:
+        counts: {(day, unit_id, route_id, source, question_id, term): count}
+        batch_size: Tamaño de lote de bulk_create
+
+    Returns:
+        Número de filas insertadas
+    """
+    TermCount.objects.all().delete()
+    TermCount.objects.bulk_create(
+        (
+            TermCount(
+                day=day, unit_id=unit_id, route_id=route_id, source=source,
+                question_id=question_id, term=term, count=count,
+            )
+            for (day, unit_id, route_id, source, question_id, term), count in counts.items()
+        ),
+        batch_size=batch_size,
+    )
+    return len(counts)
+
+
+def iter_complaint_texts() -> Iterator[tuple]:
+    """
+    Itera los textos de todas las quejas.
+
+    Returns:
+        Iterador de tuplas (unit_id, route_id, submitted_at, text)
+    """
+    return (
+        Complaint.objects
+        .exclude(text='')
+        .values_list('unit_id', 'route_id', 'submitted_at', 'text')
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+
+
+def iter_answer_texts() -> Iterator[tuple]:
+    """
+    Itera los textos de las respuestas a preguntas TEXT.
+
+    Returns:
+        Iterador de tuplas (question_id, unit_id, route_id, submitted_at, text_answer)
+    """
+    return (
+        Answer.objects
+        .filter(question__type=Question.QuestionType.TEXT, text_answer__isnull=False)
+        .values_list('question_id', 'unit_id', 'route_id', 'submitted_at', 'text_answer')
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+
+
+def get_text_question_ids() -> list[Any]:
+    """
+    Obtiene los ids de todas las preguntas TEXT (activas o no).
+
+    Returns:
+        Lista de ids de Question
+    """
+    return list(Question.objects.filter(type=Question.QuestionType.TEXT).values_list('id', flat=True))
+
+
+def get_text_questions() -> QuerySet[Question]:
+    """
+    Obtiene las preguntas TEXT activas ordenadas por posición.
+
+    Returns:
+        QuerySet de Question
+    """
+    return Question.objects.filter(active=True, type=Question.QuestionType.TEXT).order_by('position')
+
+
+def get_top_terms(
+    filters: dict[str, Any],
+    source: str,
+    limit: int,
+    question_id: Any = None
+) -> dict[str, int]:
+    """
+    Obtiene los términos más frecuentes con un SUM agrupado.
+
+    Args:
+        filters: Filtros de build_term_filters()
+        source: TermCount.Source
+        limit: Número máximo de términos
+        question_id: Pregunta TEXT opcional (solo para source="answer")
+
+    Returns:
+        Diccionario {término: textos} ordenado descendentemente
+
+    Example:
+        >>> get_top_terms({}, TermCount.Source.COMPLAINT, 3)
+        {'chofer': 42, 'frenos': 17, 'tarde': 9}
+    """
+    qs = TermCount.objects.filter(source=source, **filters)
+    if question_id is not None:
+        qs = qs.filter(question_id=question_id)
+
+    top_terms = (
+        qs.values('term')
+        .annotate(total=Sum('count'))
+        .filter(total__gt=0)
+        .order_by('-total', 'term')[:limit]
+    )
+    return {item['term']: item['total'] for item in top_terms}
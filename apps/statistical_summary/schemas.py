@@ -10,6 +10,8 @@ from typing import Literal
 # Type aliases
 PeriodType = Literal["today", "week", "month", "year", "all"]
 QuestionTypeLabel = Literal["calificación", "opción", "múltiples opciones"]
+ExportFormat = Literal["csv", "jsonl"]
+SearchSource = Literal["all", "complaints", "answers"]
 
 
 @dataclass
@@ -77,3 +79,77 @@ class DashboardStatistics:
     submissions_by_unit: dict[str, int]
     questions_statistics: dict[str, QuestionStatistic]
     survey_submissions_timeline: TimelineData
+
+
+@dataclass
+class SearchResult:
+    """
+    Resultado de la búsqueda de texto completo.
+
+    Attributes:
+        id: UUID de la queja o respuesta
+        source: "complaint" o "answer"
+        text: Texto de la queja o de la respuesta
+        label: Motivo de la queja o texto de la pregunta
+        transit_number: Número de tránsito de la unidad (si existe)
+        submitted_at: Fecha de envío en formato ISO
+        rank: Relevancia (ts_rank) respecto a la consulta
+    """
+    id: str
+    source: Literal["complaint", "answer"]
+    text: str
+    label: str | None
+    transit_number: str | None
+    submitted_at: str
+    rank: float
+
+
+@dataclass
+class SearchResultsPage:
+    """Página de resultados de búsqueda ordenados por relevancia."""
+    query: str
+    page: int
+    page_size: int
+    has_next: bool
+    results: list[SearchResult]
+
+
+@dataclass
+class TermFrequencies:
+    """
+    Palabras más frecuentes en textos libres.
+
+    Attributes:
+        complaints: {término: número de quejas que lo mencionan}
+        answers: {texto_pregunta: {término: número de respuestas}} por pregunta TEXT activa
+    """
+    complaints: dict[str, int]
+    answers: dict[str, dict[str, int]]
+
+
+@dataclass
+class TenantKpis:
+    """
+    KPIs de una organización para el dashboard ejecutivo (esquema público).
+
+    Attributes:
+        schema_name: Schema del tenant
+        organization_name: Nombre de la organización
+        total_submissions: Envíos de encuestas en el período
+        total_complaints: Quejas en el período
+        average_rating: Promedio de las preguntas RATING activas (None sin datos)
+    """
+    schema_name: str
+    organization_name: str
+    total_submissions: int
+    total_complaints: int
+    average_rating: float | None
+
+
+@dataclass
+class TenantOverview:
+    """KPIs de todas las organizaciones activas y sus totales."""
+    period_label: str
+    tenants: list[TenantKpis]
+    total_submissions: int
+    total_complaints: int
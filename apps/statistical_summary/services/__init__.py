@@ -8,6 +8,10 @@ from .statistics_service import calculate_dashboard_statistics
 from .complaints_service import get_complaints_data, get_complaints_by_unit_data
 from .survey_service import get_submission_total, get_timeline_data
 from .questions_service import get_questions_statistics
+from .export_service import stream_export
+from .search_service import search_text
+from .terms_service import get_term_frequencies
+from .dedup_service import index_complaint
 
 __all__ = [
     'calculate_dashboard_statistics',
@@ -16,4 +20,8 @@ __all__ = [
     'get_submission_total',
     'get_timeline_data',
     'get_questions_statistics',
+    'stream_export',
+    'search_text',
+    'get_term_frequencies',
+    'index_complaint',
 ]
@@ -0,0 +1,259 @@
+"""
+Service para medir el dashboard sobre los datos del tenant actual.
+
+Ejecuta cada KPI de ``calculate_dashboard_statistics`` (y el dashboard
+completo) para todas las combinaciones de período, ruta y unidad del
+dashboard, varias veces cada una, y resume por KPI la latencia (p50, p95,
+máximo) y los queries por llamada. El resultado se guarda como JSON con el
+commit actual, para comparar corridas entre commits.
+
+Los datos se siembran a la escala deseada con
+``benchmark_repository.seed_dashboard_data`` (comando ``benchmark_dashboard --seed``).
+"""
+import math
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils import timezone
+
+from ..constants import PERIOD_LABELS
+from ..repositories import benchmark_repository, transport_repository
+from ..utils.date_utils import get_period_date_range
+from ..utils.filter_builder import build_complaint_filters, build_submission_filters
+from . import complaints_service, questions_service, survey_service
+from .statistics_service import calculate_dashboard_statistics
+
+# Combinación del dashboard: (período, route_id, unit_id)
+Combination = tuple[str, str | None, str | None]
+
+
+def _submissions_total(period, route_id, unit_id):
+    start_date, _ = get_period_date_range(period)
+    return survey_service.get_submission_total(build_submission_filters(start_date, route_id, unit_id))
+
+
+def _complaints_summary(period, route_id, unit_id):
+    start_date, _ = get_period_date_range(period)
+    return complaints_service.get_complaints_data(build_complaint_filters(start_date, route_id, unit_id))
+
+
+def _complaints_by_unit(period, route_id, unit_id):
+    start_date, _ = get_period_date_range(period)
+    return complaints_service.get_complaints_by_unit_data(build_complaint_filters(start_date, route_id, unit_id))
+
+
+def _submissions_by_unit(period, route_id, unit_id):
+    start_date, _ = get_period_date_range(period)
+    return survey_service.get_submissions_by_unit_data(build_submission_filters(start_date, route_id, unit_id))
+
+
+def _questions(period, route_id, unit_id):
+    start_date, _ = get_period_date_range(period)
+    return questions_service.get_questions_statistics(start_date, route_id, unit_id)
+
+
+def _timeline(period, route_id, unit_id):
+    start_date, _ = get_period_date_range(period)
+    filters = build_submission_filters(start_date, route_id, unit_id)
+    return survey_service.get_timeline_data(filters, group_by_hour=(period == 'today'))
+
+
+# KPI -> función (period, route_id, unit_id), en el orden del dashboard
+BENCHMARK_KPIS: dict[str, Callable[[str, str | None, str | None], Any]] = {
+    'total_submissions': _submissions_total,
+    'complaints_summary': _complaints_summary,
+    'complaints_by_unit': _complaints_by_unit,
+    'submissions_by_unit': _submissions_by_unit,
+    'questions_statistics': _questions,
+    'timeline': _timeline,
+    'dashboard': calculate_dashboard_statistics,
+}
+
+
+@dataclass
+class KpiBenchmark:
+    """Latencia y queries de un KPI sobre todas sus llamadas."""
+    calls: int
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+    queries_per_call: float
+    max_queries: int
+
+
+@dataclass
+class DashboardBenchmark:
+    """Resultado de una corrida del benchmark en un tenant."""
+    schema_name: str
+    engine: str
+    commit: str | None
+    created_at: str
+    repeat: int
+    combinations: int
+    rows: dict[str, int]
+    kpis: dict[str, KpiBenchmark] = field(default_factory=dict)
+    # {período: {kpi: KpiBenchmark}}
+    by_period: dict[str, dict[str, KpiBenchmark]] = field(default_factory=dict)
+
+
+def get_combinations(max_units: int | None = 10) -> list[Combination]:
+    """
+    Combinaciones de filtros del dashboard: cada período sin filtro, por cada
+    ruta y por una muestra de unidades.
+
+    Args:
+        max_units: Unidades a incluir (repartidas uniformemente en el orden
+            del filtro del dashboard); None para todas
+
+    Returns:
+        Lista de (period, route_id, unit_id)
+
+    Example:
+        >>> get_combinations(max_units=2)[:3]
+        [('today', None, None), ('today', 'uuid-ruta', None), ('today', None, 'uuid-unidad')]
+    """
+    filter_data = transport_repository.get_filter_data()
+    units = filter_data.units
+    if max_units is not None and len(units) > max_units:
+        step = len(units) / max_units
+        units = [units[int(index * step)] for index in range(max_units)]
+
+    scopes = [(None, None)]
+    scopes += [(route.id, None) for route in filter_data.routes]
+    scopes += [(None, unit.id) for unit in units]
+    return [(period, route_id, unit_id) for period in PERIOD_LABELS for route_id, unit_id in scopes]
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """
+    Percentil por rango más cercano.
+
+    Example:
+        >>> percentile([1, 2, 3, 4], 50)
+        2
+    """
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def run_benchmark(
+    schema_name: str,
+    combinations: list[Combination],
+    repeat: int = 5,
+    warmup: int = 1,
+    engine: str | None = None,
+    commit: str | None = None,
+    kpis: list[str] | None = None,
+) -> DashboardBenchmark:
+    """
+    Mide los KPIs del dashboard en el tenant actual.
+
+    Args:
+        schema_name: Schema del tenant (solo para el reporte)
+        combinations: Combinaciones a medir (ver get_combinations)
+        repeat: Mediciones por KPI y combinación
+        warmup: Llamadas previas sin medir por KPI y combinación
+        engine: "sql" o "cube" para el KPI "dashboard" (default: settings.STATISTICS_ENGINE)
+        commit: Commit del código medido (solo para el reporte)
+        kpis: KPIs a medir (default: todos los de BENCHMARK_KPIS)
+
+    Returns:
+        DashboardBenchmark con el resumen por KPI y por período
+    """
+    engine = engine or getattr(settings, 'STATISTICS_ENGINE', 'sql')
+    kpis = kpis or list(BENCHMARK_KPIS)
+
+    durations = defaultdict(list)
+    queries = defaultdict(list)
+
+    with override_settings(STATISTICS_ENGINE=engine):
+        for period, route_id, unit_id in combinations:
+            for kpi in kpis:
+                function = BENCHMARK_KPIS[kpi]
+                for _ in range(warmup):
+                    function(period, route_id, unit_id)
+                for _ in range(repeat):
+                    elapsed, count = _measure(function, period, route_id, unit_id)
+                    durations[kpi, period].append(elapsed)
+                    queries[kpi, period].append(count)
+
+    result = DashboardBenchmark(
+        schema_name=schema_name,
+        engine=engine,
+        commit=commit,
+        created_at=timezone.now().isoformat(),
+        repeat=repeat,
+        combinations=len(combinations),
+        rows=benchmark_repository.get_row_counts(),
+    )
+    for kpi in kpis:
+        periods = [period for period in PERIOD_LABELS if (kpi, period) in durations]
+        result.kpis[kpi] = _summarize(
+            [value for period in periods for value in durations[kpi, period]],
+            [value for period in periods for value in queries[kpi, period]],
+        )
+        for period in periods:
+            result.by_period.setdefault(period, {})[kpi] = _summarize(durations[kpi, period], queries[kpi, period])
+    return result
+
+
+def compare_benchmarks(baseline: dict, current: dict, threshold: float = 1.2) -> list[dict]:
+    """
+    Compara el p95 y los queries por KPI de dos resultados (JSON ya cargado).
+
+    Args:
+        baseline: Resultado de referencia (p. ej. el de la rama principal)
+        current: Resultado nuevo
+        threshold: Razón de p95 a partir de la cual se marca una regresión
+
+    Returns:
+        Lista de {kpi, baseline_p95_ms, current_p95_ms, ratio, baseline_queries,
+        current_queries, regression} por cada KPI presente en ambos
+
+    Example:
+        >>> compare_benchmarks(old, new)[0]
+        {'kpi': 'total_submissions', 'baseline_p95_ms': 2.1, 'current_p95_ms': 2.3, 'ratio': 1.1, ...}
+    """
+    rows = []
+    for kpi, current_kpi in current['kpis'].items():
+        baseline_kpi = baseline['kpis'].get(kpi)
+        if baseline_kpi is None:
+            continue
+        ratio = current_kpi['p95_ms'] / baseline_kpi['p95_ms'] if baseline_kpi['p95_ms'] else math.inf
+        rows.append({
+            'kpi': kpi,
+            'baseline_p95_ms': baseline_kpi['p95_ms'],
+            'current_p95_ms': current_kpi['p95_ms'],
+            'ratio': round(ratio, 2),
+            'baseline_queries': baseline_kpi['max_queries'],
+            'current_queries': current_kpi['max_queries'],
+            'regression': ratio > threshold or current_kpi['max_queries'] > baseline_kpi['max_queries'],
+        })
+    return rows
+
+
+def _measure(function, period, route_id, unit_id) -> tuple[float, int]:
+    """Milisegundos y queries de una llamada (sin los SET search_path de django-tenants)."""
+    with CaptureQueriesContext(connection) as context:
+        start = time.perf_counter()
+        function(period, route_id, unit_id)
+        elapsed = (time.perf_counter() - start) * 1000
+    count = sum(1 for query in context.captured_queries if not query['sql'].startswith('SET search_path'))
+    return elapsed, count
+
+
+def _summarize(durations: list[float], queries: list[int]) -> KpiBenchmark:
+    return KpiBenchmark(
+        calls=len(durations),
+        p50_ms=round(percentile(durations, 50), 3),
+        p95_ms=round(percentile(durations, 95), 3),
+        max_ms=round(max(durations), 3),
+        queries_per_call=round(sum(queries) / len(queries), 2),
+        max_queries=max(queries),
+    )
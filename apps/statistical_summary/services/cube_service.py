@@ -0,0 +1,621 @@
+"""
+Motor alternativo de estadísticas basado en un cubo en memoria (NumPy).
+
+Para tenants grandes, las queries por request sobre ``answers`` dominan el
+tiempo del dashboard. Este módulo carga una sola vez los hechos del tenant
+en arrays compactos (índice de unidad, hora local, pregunta, calificación,
+opción) y responde los mismos filtros de calculate_dashboard_statistics()
+con máscaras vectorizadas y ``np.bincount``.
+
+El cubo se mantiene por proceso y por schema, y se actualiza de forma
+incremental (solo filas nuevas) como máximo cada CUBE_REFRESH_SECONDS.
+Las filas se leen por lotes de CUBE_LOAD_CHUNK_SIZE y se copian a los
+arrays al instante, así que la carga inicial no materializa el tenant en
+listas de Python.
+
+Las eliminaciones y las escrituras masivas con fechas pasadas (que la
+marca de agua por fecha no vería) invalidan el cubo completo (ver
+signals.py): se descarta en el proceso que escribió y se publica una
+versión nueva del tenant en el caché compartido, con la que los demás
+procesos reconstruyen su cubo en su siguiente actualización.
+
+Se activa con ``STATISTICS_ENGINE = "cube"`` en settings; por defecto el
+dashboard usa la implementación SQL.
+"""
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Iterable, Iterator
+
+import numpy as np
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.interview.models import Question
+from ..constants import (
+    CUBE_LOAD_CHUNK_SIZE,
+    CUBE_REFRESH_SECONDS,
+    CUBE_WATERMARK_OVERLAP,
+    QUESTION_TYPE_LABELS,
+)
+from ..repositories import cube_repository
+from ..schemas import DashboardStatistics, PeriodType, QuestionStatistic, TimelineData
+from ..utils.date_utils import get_period_date_range
+
+# Valor centinela para calificaciones nulas
+RATING_NULL = np.iinfo(np.int16).min
+
+# Valor centinela para fechas nulas (respuestas sin submitted_at copiado):
+# nunca cae en un período, igual que ``submitted_at >= start`` en SQL
+TIME_NULL = np.iinfo(np.int64).min
+
+# Índice de un filtro por un id que el cubo no conoce (no coincide con nada)
+_UNKNOWN = -2
+
+# Clave de la versión del cubo de cada tenant en el caché compartido
+CUBE_VERSION_KEY = 'statistics_cube:version:{schema_name}'
+
+# Origen para convertir buckets locales (horas/días desde epoch) a etiquetas
+_LOCAL_EPOCH = datetime(1970, 1, 1)
+
+
+class _FactTable:
+    """
+    Columnas NumPy de una tabla de hechos, ampliables por lotes.
+
+    Los lotes se copian en arrays preasignados cuya capacidad se duplica al
+    llenarse: cargar n filas copia O(n) valores en total. ``columns`` son
+    vistas de las filas cargadas; un lote nuevo se escribe después de ellas,
+    así que quien lee las columnas anteriores no ve cambios.
+    """
+
+    def __init__(self, **dtypes: Any):
+        self.dtypes = dtypes
+        self._buffers = {name: np.empty(0, dtype) for name, dtype in dtypes.items()}
+        self.columns = dict(self._buffers)
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values())))
+
+    def append(self, rows: dict[str, np.ndarray]) -> None:
+        """Agrega un lote de filas (un array por columna)."""
+        size = len(self)
+        count = len(next(iter(rows.values()), ()))
+        if not count:
+            return
+
+        buffers = self._buffers
+        if size + count > len(next(iter(buffers.values()))):
+            capacity = max(size + count, 2 * size)
+            buffers = {}
+            for name, dtype in self.dtypes.items():
+                buffers[name] = np.empty(capacity, dtype)
+                buffers[name][:size] = self.columns[name]
+            self._buffers = buffers
+
+        for name in self.dtypes:
+            buffers[name][size:size + count] = rows[name]
+        # Reemplazar el dict completo para que los lectores vean columnas consistentes
+        self.columns = {name: buffer[:size + count] for name, buffer in buffers.items()}
+
+
+class _TimeWatermark:
+    """
+    Marca de agua por fecha para la carga incremental.
+
+    Relee una ventana de traslape (CUBE_WATERMARK_OVERLAP) para no perder
+    filas confirmadas fuera de orden, y descarta las ya cargadas usando los
+    ids recientes.
+    """
+
+    def __init__(self):
+        self.value: datetime | None = None
+        self.recent: dict[Any, datetime] = {}
+
+    def since(self) -> datetime | None:
+        return self.value - CUBE_WATERMARK_OVERLAP if self.value else None
+
+    def is_new(self, row_id: Any) -> bool:
+        return row_id not in self.recent
+
+    def advance(self, rows: Iterable[tuple[Any, datetime]]) -> None:
+        for row_id, row_time in rows:
+            self.recent[row_id] = row_time
+            if self.value is None or row_time > self.value:
+                self.value = row_time
+        if self.value is not None:
+            cutoff = self.value - CUBE_WATERMARK_OVERLAP
+            self.recent = {k: t for k, t in self.recent.items() if t >= cutoff}
+
+
+class AnalyticsCube:
+    """
+    Cubo analítico en memoria de un tenant.
+
+    Hechos almacenados (un array por columna):
+        - submissions: unit, route, time (epoch UTC), hour y day (buckets locales)
+        - complaints: unit, route, reason, time (submitted_at)
+        - answers: question, unit, route, time (submitted_at), rating, option
+        - selections: question, unit, route, time, option (MULTI_CHOICE)
+
+    ``route`` es la ruta guardada en cada fila al momento del envío.
+    Los índices -1 representan relaciones nulas.
+
+    ``version`` es la versión del tenant con la que se cargó (ver
+    invalidate_cube); None si no había versión publicada.
+
+    Example:
+        >>> cube = AnalyticsCube()
+        >>> cube.refresh()
+        >>> stats = cube.statistics("month", route_id="uuid")
+        >>> print(stats.total_submissions)
+        1520
+    """
+
+    def __init__(self, version: str | None = None):
+        self._lock = threading.Lock()
+        self.refreshed_at: float | None = None
+        self.version = version
+
+        # Dimensiones (id como str -> índice)
+        self._unit_index: dict[str, int] = {}
+        self._unit_labels: list[str | None] = []
+        self._route_index: dict[str, int] = {}
+        self._reason_index: dict[str, int] = {}
+        self._reason_labels: list[str] = []
+        self._question_index: dict[str, int] = {}
+        self._option_index: dict[str, int] = {}
+        self._option_labels: list[str] = []
+        self._options_by_question: dict[int, list[int]] = {}
+        self._active_questions: list[tuple[int, str, str]] = []
+
+        # Hechos
+        self.submissions = _FactTable(
+            unit=np.int32, route=np.int32, time=np.int64, hour=np.int32, day=np.int32
+        )
+        self.complaints = _FactTable(unit=np.int32, route=np.int32, reason=np.int32, time=np.int64)
+        self.answers = _FactTable(
+            question=np.int32, unit=np.int32, route=np.int32, time=np.int64, rating=np.int16, option=np.int32
+        )
+        self.selections = _FactTable(
+            question=np.int32, unit=np.int32, route=np.int32, time=np.int64, option=np.int32
+        )
+
+        # Marcas de agua para la carga incremental
+        self._submissions_mark = _TimeWatermark()
+        self._complaints_mark = _TimeWatermark()
+        self._answers_mark = _TimeWatermark()
+        self._selections_mark = _TimeWatermark()
+
+    # ==================== Carga ====================
+
+    def is_stale(self) -> bool:
+        """Indica si pasaron más de CUBE_REFRESH_SECONDS desde la última carga."""
+        return self.refreshed_at is None or time.monotonic() - self.refreshed_at >= CUBE_REFRESH_SECONDS
+
+    def refresh_if_stale(self) -> None:
+        """Actualiza el cubo si pasaron más de CUBE_REFRESH_SECONDS."""
+        if self.is_stale():
+            self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Recarga las dimensiones y agrega los hechos nuevos desde la última carga.
+
+        La primera llamada carga el tenant completo.
+        """
+        with self._lock:
+            self._load_dimensions()
+            self._load_submissions()
+            self._load_complaints()
+            self._load_answers()
+            self._load_selections()
+            self.refreshed_at = time.monotonic()
+
+    def _load_dimensions(self) -> None:
+        """Recarga unidades, motivos, preguntas y opciones (tablas pequeñas)."""
+        for unit_id, transit_number in cube_repository.get_units():
+            self._set_label(self._unit_labels, self._index(self._unit_index, unit_id), transit_number)
+
+        for reason_id, label in cube_repository.get_reasons():
+            self._set_label(self._reason_labels, self._index(self._reason_index, reason_id), label)
+
+        self._active_questions = [
+            (self._index(self._question_index, question_id), text, question_type)
+            for question_id, text, question_type in cube_repository.get_active_questions()
+        ]
+
+        options_by_question: dict[int, list[int]] = {}
+        for option_id, question_id, text in cube_repository.get_options():
+            idx = self._index(self._option_index, option_id)
+            self._set_label(self._option_labels, idx, text)
+            question_idx = self._index(self._question_index, question_id)
+            options_by_question.setdefault(question_idx, []).append(idx)
+        self._options_by_question = options_by_question
+
+    def _load_submissions(self) -> None:
+        mark = self._submissions_mark
+        for rows in _new_rows(cube_repository.iter_submissions(mark.since()), mark):
+            count = len(rows)
+            epochs = np.fromiter((int(r[3].timestamp()) for r in rows), np.int64, count)
+            hours, days = _local_buckets(epochs)
+            self.submissions.append({
+                'unit': np.fromiter((self._index(self._unit_index, r[1]) for r in rows), np.int32, count),
+                'route': np.fromiter((self._index(self._route_index, r[2]) for r in rows), np.int32, count),
+                'time': epochs,
+                'hour': hours,
+                'day': days,
+            })
+            mark.advance((r[0], r[3]) for r in rows)
+
+    def _load_complaints(self) -> None:
+        mark = self._complaints_mark
+        for rows in _new_rows(cube_repository.iter_complaints(mark.since()), mark):
+            count = len(rows)
+            self.complaints.append({
+                'unit': np.fromiter((self._index(self._unit_index, r[1]) for r in rows), np.int32, count),
+                'route': np.fromiter((self._index(self._route_index, r[2]) for r in rows), np.int32, count),
+                'reason': np.fromiter((self._index(self._reason_index, r[3]) for r in rows), np.int32, count),
+                'time': np.fromiter((int(r[4].timestamp()) for r in rows), np.int64, count),
+            })
+            mark.advance((r[0], r[5]) for r in rows)
+
+    def _load_answers(self) -> None:
+        mark = self._answers_mark
+        for rows in _new_rows(cube_repository.iter_answers(mark.since()), mark):
+            count = len(rows)
+            self.answers.append({
+                'question': np.fromiter((self._index(self._question_index, r[1]) for r in rows), np.int32, count),
+                'unit': np.fromiter((self._index(self._unit_index, r[2]) for r in rows), np.int32, count),
+                'route': np.fromiter((self._index(self._route_index, r[3]) for r in rows), np.int32, count),
+                'time': np.fromiter((_epoch(r[5]) for r in rows), np.int64, count),
+                'rating': np.fromiter((RATING_NULL if r[6] is None else r[6] for r in rows), np.int16, count),
+                'option': np.fromiter((self._index(self._option_index, r[7]) for r in rows), np.int32, count),
+            })
+            mark.advance((r[0], r[4]) for r in rows)
+
+    def _load_selections(self) -> None:
+        mark = self._selections_mark
+        for rows in _new_rows(cube_repository.iter_selections(mark.since()), mark):
+            count = len(rows)
+            self.selections.append({
+                'question': np.fromiter((self._index(self._question_index, r[1]) for r in rows), np.int32, count),
+                'unit': np.fromiter((self._index(self._unit_index, r[2]) for r in rows), np.int32, count),
+                'route': np.fromiter((self._index(self._route_index, r[3]) for r in rows), np.int32, count),
+                'time': np.fromiter((_epoch(r[4]) for r in rows), np.int64, count),
+                'option': np.fromiter((self._index(self._option_index, r[5]) for r in rows), np.int32, count),
+            })
+            mark.advance((r[0], r[4]) for r in rows)
+
+    @staticmethod
+    def _index(index: dict[str, int], key: Any) -> int:
+        """Obtiene (o asigna) el índice de un id; -1 para None."""
+        if key is None:
+            return -1
+        return index.setdefault(str(key), len(index))
+
+    @staticmethod
+    def _set_label(labels: list, idx: int, label: Any) -> None:
+        """Asigna la etiqueta de un índice, ampliando la lista si hace falta."""
+        if idx >= len(labels):
+            labels.extend([None] * (idx + 1 - len(labels)))
+        labels[idx] = label
+
+    # ==================== Consultas ====================
+
+    def statistics(
+        self,
+        period: PeriodType,
+        route_id: str | None = None,
+        unit_id: str | None = None
+    ) -> DashboardStatistics:
+        """
+        Calcula las estadísticas del dashboard desde los arrays en memoria.
+
+        Devuelve exactamente lo mismo que la implementación SQL de
+        statistics_service.calculate_dashboard_statistics().
+
+        Args:
+            period: Período de tiempo ("today", "week", "month", "year", "all")
+            route_id: ID de ruta opcional para filtrar
+            unit_id: ID de unidad opcional (mutuamente excluyente con route_id)
+
+        Returns:
+            DashboardStatistics con todos los datos calculados
+
+        Raises:
+            ValueError: Si period no es válido
+        """
+        start_date, period_label = get_period_date_range(period)
+        start = int(start_date.timestamp()) if start_date else None
+        dimension = self._dimension_filter(route_id, unit_id)
+
+        submissions = self.submissions.columns
+        complaints = self.complaints.columns
+        submission_mask = _mask(submissions, start, dimension)
+        complaint_mask = _mask(complaints, start, dimension)
+
+        by_reason = self._complaints_by_reason(complaints['reason'][complaint_mask])
+
+        return DashboardStatistics(
+            period_label=period_label,
+            total_submissions=int(submission_mask.sum()),
+            total_complaints=int(complaint_mask.sum()),
+            complaints_by_reason=by_reason,
+            complaints_by_unit=self._count_by_unit(complaints['unit'][complaint_mask]),
+            submissions_by_unit=self._count_by_unit(submissions['unit'][submission_mask]),
+            questions_statistics=self._questions_statistics(start, dimension),
+            survey_submissions_timeline=_timeline(submissions, submission_mask, period == "today"),
+        )
+
+    def _dimension_filter(self, route_id: str | None, unit_id: str | None) -> tuple[str, int] | None:
+        """
+        Filtro por ruta o unidad como (columna, índice); None = sin filtro.
+
+        Las filas con la relación nula (-1) nunca coinciden, y un id que el
+        cubo no conoce se traduce a un índice que no coincide con nada.
+        """
+        if route_id:
+            return 'route', self._route_index.get(str(route_id), _UNKNOWN)
+        if unit_id:
+            return 'unit', self._unit_index.get(str(unit_id), _UNKNOWN)
+        return None
+
+    def _complaints_by_reason(self, reasons: np.ndarray) -> dict[str, int]:
+        """Conteo por etiqueta de motivo ('Sin motivo' para nulos)."""
+        counts = np.bincount(reasons + 1, minlength=len(self._reason_labels) + 1)
+        by_reason: dict[str, int] = {}
+        for idx in np.flatnonzero(counts):
+            label = self._reason_labels[idx - 1] if idx > 0 else None
+            label = label or 'Sin motivo'
+            by_reason[label] = by_reason.get(label, 0) + int(counts[idx])
+        return _sorted_desc(by_reason)
+
+    def _count_by_unit(self, units: np.ndarray) -> dict[str, int]:
+        """Conteo por número de tránsito, excluyendo unidades nulas."""
+        units = units[units >= 0]
+        counts = np.bincount(units, minlength=len(self._unit_labels))
+        by_unit: dict[str, int] = {}
+        for idx in np.flatnonzero(counts):
+            label = self._unit_labels[idx] if idx < len(self._unit_labels) else None
+            if label:
+                by_unit[label] = by_unit.get(label, 0) + int(counts[idx])
+        return _sorted_desc(by_unit)
+
+    def _questions_statistics(
+        self,
+        start: int | None,
+        dimension: tuple[str, int] | None
+    ) -> dict[str, QuestionStatistic]:
+        """Estadísticas por pregunta activa (mismo formato que questions_service)."""
+        answers = self.answers.columns
+        selections = self.selections.columns
+        answer_mask = _mask(answers, start, dimension)
+        selection_mask = _mask(selections, start, dimension)
+
+        n_questions = len(self._question_index)
+        n_options = len(self._option_index)
+
+        # Promedio de calificación por pregunta: suma y conteo con bincount ponderado
+        rated = answer_mask & (answers['rating'] != RATING_NULL)
+        rating_sums = np.bincount(
+            answers['question'][rated], weights=answers['rating'][rated], minlength=n_questions
+        )
+        rating_counts = np.bincount(answers['question'][rated], minlength=n_questions)
+
+        # Matrices pregunta x opción (única y múltiple) con un solo bincount cada una
+        chosen = answer_mask & (answers['option'] >= 0)
+        choice_counts = _pair_counts(
+            answers['question'][chosen], answers['option'][chosen], n_questions, n_options
+        )
+        selected = selection_mask & (selections['option'] >= 0)
+        multi_counts = _pair_counts(
+            selections['question'][selected], selections['option'][selected], n_questions, n_options
+        )
+
+        statistics: dict[str, QuestionStatistic] = {}
+        for question_idx, text, question_type in self._active_questions:
+            match question_type:
+                case Question.QuestionType.RATING:
+                    count = rating_counts[question_idx]
+                    summary: str | dict[str, int] = (
+                        f"{rating_sums[question_idx] / count:.1f}/5" if count else "Sin datos"
+                    )
+                    stat = QuestionStatistic(type=QUESTION_TYPE_LABELS["RATING"], summary=summary)
+                case Question.QuestionType.CHOICE:
+                    # Como en get_choice_counts(): cualquier opción elegida en la pregunta
+                    counts: dict[str, int] = {}
+                    for option_idx in np.flatnonzero(choice_counts[question_idx]):
+                        label = self._option_labels[option_idx]
+                        counts[label] = counts.get(label, 0) + int(choice_counts[question_idx, option_idx])
+                    stat = QuestionStatistic(
+                        type=QUESTION_TYPE_LABELS["CHOICE"], summary=counts or "Sin datos"
+                    )
+                case Question.QuestionType.MULTI_CHOICE:
+                    # Como en get_multi_choice_counts(): solo opciones de la pregunta
+                    counts = {
+                        self._option_labels[option_idx]: int(multi_counts[question_idx, option_idx])
+                        for option_idx in self._options_by_question.get(question_idx, [])
+                        if multi_counts[question_idx, option_idx]
+                    }
+                    stat = QuestionStatistic(
+                        type=QUESTION_TYPE_LABELS["MULTI_CHOICE"], summary=counts or "Sin datos"
+                    )
+                case _:
+                    # Ignorar otros tipos (TEXT), igual que questions_service
+                    continue
+
+            statistics[text] = stat
+
+        return statistics
+
+
+# ==================== Registro de cubos por tenant ====================
+
+_cubes: dict[str, AnalyticsCube] = {}
+_cubes_lock = threading.Lock()
+
+
+def get_cube() -> AnalyticsCube:
+    """
+    Obtiene el cubo del tenant activo, cargándolo o actualizándolo si hace falta.
+
+    Al actualizar se compara la versión publicada del tenant: si otro
+    proceso eliminó hechos desde la carga, el cubo se reemplaza por uno
+    nuevo (los requests que aún leen el anterior no se ven afectados).
+
+    Returns:
+        AnalyticsCube del schema actual
+    """
+    schema_name = connection.schema_name
+    with _cubes_lock:
+        cube = _cubes.get(schema_name)
+
+    if cube is None or cube.is_stale():
+        version = _get_version(schema_name)
+        if cube is None or cube.version != version:
+            cube = AnalyticsCube(version)
+            with _cubes_lock:
+                _cubes[schema_name] = cube
+
+    cube.refresh_if_stale()
+    return cube
+
+
+def invalidate_cube(schema_name: str | None = None) -> None:
+    """
+    Descarta el cubo de un tenant (por defecto, el activo) en todos los procesos.
+
+    Se usa cuando se eliminan filas, ya que la carga incremental solo
+    detecta inserciones. El cubo de este proceso se descarta de inmediato;
+    la versión nueva se publica al confirmar la transacción (una vez por
+    transacción, aunque se eliminen miles de filas en cascada), para que
+    otro proceso no recargue filas cuyo borrado aún no es visible.
+    """
+    schema_name = schema_name or connection.schema_name
+    with _cubes_lock:
+        _cubes.pop(schema_name, None)
+
+    pending = (entry[1] for entry in connection.run_on_commit)
+    if not any(getattr(callback, 'cube_schema', None) == schema_name for callback in pending):
+        transaction.on_commit(_VersionBump(schema_name))
+
+
+def calculate_dashboard_statistics(
+    period: PeriodType,
+    route_id: str | None = None,
+    unit_id: str | None = None
+) -> DashboardStatistics:
+    """
+    Equivalente en memoria de statistics_service.calculate_dashboard_statistics().
+
+    Example:
+        >>> stats = calculate_dashboard_statistics("week", unit_id="uuid")
+        >>> print(stats.period_label)
+        Esta Semana
+    """
+    return get_cube().statistics(period, route_id, unit_id)
+
+
+# ==================== Helpers ====================
+
+class _VersionBump:
+    """Callback de on_commit que publica una versión nueva del cubo de un tenant."""
+
+    def __init__(self, schema_name: str):
+        self.cube_schema = schema_name
+
+    def __call__(self) -> None:
+        key = CUBE_VERSION_KEY.format(schema_name=self.cube_schema)
+        _shared_call(cache.set, key, uuid.uuid4().hex, None)
+
+
+def _get_version(schema_name: str) -> str | None:
+    """Versión publicada del cubo de un tenant (None si no hay o el caché no responde)."""
+    return _shared_call(cache.get, CUBE_VERSION_KEY.format(schema_name=schema_name))
+
+
+def _shared_call(method, *args):
+    """Llama al caché compartido; un Redis caído no debe tumbar el dashboard."""
+    try:
+        return method(*args)
+    except Exception:
+        return None
+
+
+def _new_rows(rows: Iterable[tuple], mark: _TimeWatermark) -> Iterator[list[tuple]]:
+    """Filas que la marca de agua aún no cargó (id en la posición 0), en lotes de CUBE_LOAD_CHUNK_SIZE."""
+    batch: list[tuple] = []
+    for row in rows:
+        if mark.is_new(row[0]):
+            batch.append(row)
+            if len(batch) >= CUBE_LOAD_CHUNK_SIZE:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def _mask(columns: dict[str, np.ndarray], start: int | None, dimension: tuple[str, int] | None) -> np.ndarray:
+    """Máscara booleana por período y filtro de ruta o unidad."""
+    mask = np.ones(len(columns['time']), bool)
+    if start is not None:
+        mask &= columns['time'] >= start
+    if dimension is not None:
+        column, idx = dimension
+        mask &= columns[column] == idx
+    return mask
+
+
+def _epoch(value: datetime | None) -> int:
+    """Segundos UTC de una fecha (TIME_NULL si es nula)."""
+    return TIME_NULL if value is None else int(value.timestamp())
+
+
+def _timeline(columns: dict[str, np.ndarray], mask: np.ndarray, group_by_hour: bool) -> TimelineData:
+    """Timeline por hora o día local, con las mismas etiquetas que survey_repository."""
+    buckets = columns['hour' if group_by_hour else 'day'][mask]
+    values, counts = np.unique(buckets, return_counts=True)
+
+    if group_by_hour:
+        dates = [(_LOCAL_EPOCH + timedelta(hours=int(v))).strftime('%H:00') for v in values]
+    else:
+        dates = [(_LOCAL_EPOCH + timedelta(days=int(v))).strftime('%Y-%m-%d') for v in values]
+
+    return TimelineData(dates=dates, counts=[int(c) for c in counts])
+
+
+def _local_buckets(epochs: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Convierte segundos UTC a buckets de hora y día en la zona horaria actual.
+
+    El offset se calcula una vez por hora UTC distinta (no por fila), lo que
+    respeta cambios de horario sin iterar todos los registros.
+    """
+    tz = timezone.get_current_timezone()
+    utc_hours = epochs // 3600
+    unique_hours, inverse = np.unique(utc_hours, return_inverse=True)
+    offsets = np.array([
+        int(datetime.fromtimestamp(int(h) * 3600, tz).utcoffset().total_seconds())
+        for h in unique_hours
+    ], np.int64)
+    local = epochs + offsets[inverse]
+    return (local // 3600).astype(np.int32), (local // 86400).astype(np.int32)
+
+
+def _pair_counts(
+    questions: np.ndarray,
+    options: np.ndarray,
+    n_questions: int,
+    n_options: int
+) -> np.ndarray:
+    """Matriz (n_questions, n_options) de conteos por par pregunta/opción."""
+    keys = questions.astype(np.int64) * n_options + options
+    return np.bincount(keys, minlength=n_questions * n_options).reshape(n_questions, n_options)
+
+
+def _sorted_desc(counts: dict[str, int]) -> dict[str, int]:
+    """Ordena un conteo de mayor a menor (como order_by('-count'))."""
+    return dict(sorted(counts.items(), key=lambda item: item[1], reverse=True))
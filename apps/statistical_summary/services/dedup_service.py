@@ -0,0 +1,76 @@
+"""
+Service para la detección de quejas casi duplicadas.
+
+Al ingresar una queja se calcula su firma MinHash, se buscan candidatas en
+el índice LSH (mismo bucket en alguna banda, misma unidad, dentro de
+DEDUP_WINDOW) y solo esas pocas candidatas se comparan. Si alguna supera
+DEDUP_SIMILARITY_THRESHOLD, la queja se marca como duplicada de la
+original del grupo.
+
+utils.minhash (NumPy) se importa al indexar la primera queja, no al cargar
+la app: este módulo se importa desde signals.py en todos los procesos.
+"""
+from apps.interview.models import Complaint
+from ..constants import DEDUP_SIMILARITY_THRESHOLD, DEDUP_WINDOW
+from ..models import ComplaintFingerprint
+from ..repositories import dedup_repository
+
+
+def index_complaint(complaint: Complaint) -> ComplaintFingerprint | None:
+    """
+    Calcula e indexa la firma de una queja, marcándola si es casi duplicada.
+
+    Args:
+        complaint: Queja recién guardada
+
+    Returns:
+        ComplaintFingerprint guardada, o None si la queja no tiene texto
+
+    Example:
+        >>> fingerprint = index_complaint(complaint)
+        >>> print(fingerprint.duplicate_of_id)
+        UUID('...')  # id de la queja original, o None
+    """
+    from ..utils.minhash import (
+        band_buckets, compute_signature, estimate_similarity,
+        signature_from_bytes, signature_to_bytes,
+    )
+
+    signature = compute_signature(complaint.text)
+    if signature is None:
+        return None
+
+    buckets = band_buckets(signature)
+    candidates = dedup_repository.find_candidates(
+        complaint.unit_id,
+        since=complaint.submitted_at - DEDUP_WINDOW,
+        until=complaint.submitted_at,
+        buckets=buckets,
+        exclude_complaint_id=complaint.id,
+    )
+
+    duplicate_of_id = None
+    for candidate in candidates:
+        similarity = estimate_similarity(signature, signature_from_bytes(candidate['signature']))
+        if similarity >= DEDUP_SIMILARITY_THRESHOLD:
+            # Apuntar siempre a la original del grupo, no a otra copia
+            duplicate_of_id = candidate['duplicate_of_id'] or candidate['complaint_id']
+            break
+
+    return dedup_repository.save_fingerprint(
+        complaint, signature_to_bytes(signature), buckets, duplicate_of_id
+    )
+
+
+def index_pending_complaints() -> int:
+    """
+    Indexa las quejas que aún no tienen firma (histórico), en orden cronológico.
+
+    Returns:
+        Número de quejas indexadas
+    """
+    indexed = 0
+    for complaint in dedup_repository.iter_unindexed_complaints():
+        if index_complaint(complaint) is not None:
+            indexed += 1
+    return indexed
@@ -0,0 +1,178 @@
+"""
+Service para la exportación de respuestas de encuestas.
+
+Este módulo transforma los envíos de encuestas en filas planas (una por
+envío, una columna por pregunta activa) y las serializa como CSV o JSONL
+de forma incremental, para usarse con StreamingHttpResponse.
+"""
+import csv
+import json
+from typing import Any, Iterator
+
+from apps.interview.models import Question, SurveySubmission
+from ..constants import (
+    DISPLAY_TIMEZONE,
+    EXPORT_BASE_COLUMNS,
+    EXPORT_COMPLAINT_COLUMNS,
+    EXPORT_MULTI_CHOICE_SEPARATOR,
+)
+from ..repositories import export_repository
+from ..schemas import ExportFormat, PeriodType
+from ..utils.date_utils import get_period_date_range
+from ..utils.filter_builder import build_submission_filters
+
+
+class _EchoBuffer:
+    """Pseudo-buffer que devuelve lo escrito en lugar de almacenarlo."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def build_export_header(questions: list[Question]) -> list[str]:
+    """
+    Construye el encabezado de la exportación.
+
+    Args:
+        questions: Preguntas activas (ver get_export_questions)
+
+    Returns:
+        Lista de nombres de columna
+
+    Example:
+        >>> build_export_header(questions)
+        ['unidad', 'ruta', 'fecha_envio', '¿Cómo califica el servicio?', ..., 'motivo_queja', 'texto_queja']
+    """
+    return (
+        EXPORT_BASE_COLUMNS
+        + [question.text for question in questions]
+        + EXPORT_COMPLAINT_COLUMNS
+    )
+
+
+def build_export_row(
+    submission: SurveySubmission,
+    questions: list[Question]
+) -> list[Any]:
+    """
+    Convierte un envío en una fila alineada con build_export_header().
+
+    Usa únicamente las relaciones precargadas por el repository, por lo que
+    no ejecuta queries adicionales.
+
+    Args:
+        submission: Envío con answers y complaints precargados
+        questions: Preguntas activas en el orden del encabezado
+
+    Returns:
+        Lista de valores (None para preguntas sin respuesta)
+
+    Example:
+        >>> build_export_row(submission, questions)
+        ['ABC001', 'Ruta Centro-Norte', '2024-01-20T08:15:00-07:00', 4, 'Sí', ..., 'Mal servicio', '']
+    """
+    answers_by_question = {
+        answer.question_id: answer for answer in submission.answers.all()
+    }
+
+    # Ruta al momento del envío (no la actual de la unidad)
+    unit = submission.unit
+    route = submission.route
+    row: list[Any] = [
+        unit.transit_number if unit else None,
+        route.name if route else None,
+        submission.submitted_at.astimezone(DISPLAY_TIMEZONE).isoformat(),
+    ]
+
+    for question in questions:
+        answer = answers_by_question.get(question.id)
+        row.append(_answer_value(answer, question) if answer else None)
+
+    # Solo puede existir una queja por envío; tomar la primera si hubiera más
+    complaints = submission.complaints.all()
+    complaint = complaints[0] if complaints else None
+    if complaint:
+        row.append(complaint.reason.label if complaint.reason else None)
+        row.append(complaint.text)
+    else:
+        row.extend([None, None])
+
+    return row
+
+
+def stream_export(
+    export_format: ExportFormat,
+    period: PeriodType,
+    route_id: str | None = None,
+    unit_id: str | None = None
+) -> Iterator[str]:
+    """
+    Genera la exportación de envíos como fragmentos de texto.
+
+    El período se valida antes de devolver el generador, de modo que los
+    errores de parámetros se reportan antes de iniciar la respuesta.
+
+    Args:
+        export_format: "csv" o "jsonl"
+        period: Período de tiempo ("today", "week", "month", "year", "all")
+        route_id: ID de ruta opcional para filtrar
+        unit_id: ID de unidad opcional para filtrar (mutuamente excluyente con route_id)
+
+    Returns:
+        Iterador de líneas de texto (una por envío, más el encabezado en CSV)
+
+    Raises:
+        ValueError: Si period o export_format no son válidos
+
+    Example:
+        >>> lines = stream_export("csv", "today")
+        >>> print(next(lines))
+        unidad,ruta,fecha_envio,¿Cómo califica el servicio?,...
+    """
+    start_date, _ = get_period_date_range(period)
+    filters = build_submission_filters(start_date, route_id, unit_id)
+
+    match export_format:
+        case "csv":
+            return _stream_csv(filters)
+        case "jsonl":
+            return _stream_jsonl(filters)
+        case _:
+            raise ValueError(
+                f"Invalid export format: {export_format}. Must be one of: csv, jsonl"
+            )
+
+
+def _stream_csv(filters: dict[str, Any]) -> Iterator[str]:
+    """Serializa los envíos como CSV, una línea por envío."""
+    questions = export_repository.get_export_questions()
+    writer = csv.writer(_EchoBuffer())
+
+    yield writer.writerow(build_export_header(questions))
+    for submission in export_repository.iter_submissions(filters):
+        yield writer.writerow(build_export_row(submission, questions))
+
+
+def _stream_jsonl(filters: dict[str, Any]) -> Iterator[str]:
+    """Serializa los envíos como JSON Lines, un objeto por envío."""
+    questions = export_repository.get_export_questions()
+    header = build_export_header(questions)
+
+    for submission in export_repository.iter_submissions(filters):
+        record = dict(zip(header, build_export_row(submission, questions)))
+        yield json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def _answer_value(answer, question: Question) -> Any:
+    """Obtiene el valor exportable de una respuesta según el tipo de pregunta."""
+    match question.type:
+        case Question.QuestionType.RATING:
+            return answer.rating_answer
+        case Question.QuestionType.TEXT:
+            return answer.text_answer
+        case Question.QuestionType.CHOICE:
+            return answer.selected_option.text if answer.selected_option else None
+        case Question.QuestionType.MULTI_CHOICE:
+            options = sorted(answer.selected_options.all(), key=lambda o: o.position)
+            return EXPORT_MULTI_CHOICE_SEPARATOR.join(option.text for option in options)
+    return None
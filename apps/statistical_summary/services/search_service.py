@@ -0,0 +1,79 @@
+"""
+Service para la búsqueda de texto completo en quejas y respuestas.
+
+Este módulo valida los parámetros de búsqueda, arma la consulta en español
+y pagina los resultados ordenados por relevancia.
+"""
+from apps.interview.search import build_search_query
+from ..constants import DISPLAY_TIMEZONE, SEARCH_MAX_PAGE_SIZE, SEARCH_PAGE_SIZE, SEARCH_SOURCES
+from ..repositories import search_repository
+from ..schemas import SearchResult, SearchResultsPage, SearchSource
+
+
+def search_text(
+    text: str,
+    source: SearchSource = "all",
+    page: int = 1,
+    page_size: int = SEARCH_PAGE_SIZE
+) -> SearchResultsPage:
+    """
+    Busca texto en quejas y respuestas TEXT del tenant activo.
+
+    No calcula el total de coincidencias: pide una fila extra para saber si
+    existe una página siguiente, lo que mantiene la query acotada.
+
+    Args:
+        text: Consulta en sintaxis web ("chofer frenos", "frase exacta", -palabra)
+        source: "all", "complaints" o "answers"
+        page: Número de página (desde 1)
+        page_size: Resultados por página (máximo SEARCH_MAX_PAGE_SIZE)
+
+    Returns:
+        SearchResultsPage con los resultados de la página
+
+    Raises:
+        ValueError: Si la consulta está vacía o algún parámetro no es válido
+
+    Example:
+        >>> results = search_text("frenos", source="complaints")
+        >>> print(results.results[0].text)
+        Los frenos hacen ruido
+    """
+    text = (text or '').strip()
+    if not text:
+        raise ValueError("La búsqueda no puede estar vacía")
+    if source not in SEARCH_SOURCES:
+        raise ValueError(f"Fuente de búsqueda no válida: {source}")
+    if page < 1 or not 1 <= page_size <= SEARCH_MAX_PAGE_SIZE:
+        raise ValueError(
+            f"Paginación no válida (page >= 1, 1 <= page_size <= {SEARCH_MAX_PAGE_SIZE})"
+        )
+
+    sources = ["complaints", "answers"] if source == "all" else [source]
+    rows = search_repository.search(
+        build_search_query(text),
+        sources,
+        offset=(page - 1) * page_size,
+        limit=page_size + 1,
+    )
+
+    return SearchResultsPage(
+        query=text,
+        page=page,
+        page_size=page_size,
+        has_next=len(rows) > page_size,
+        results=[_to_result(row) for row in rows[:page_size]],
+    )
+
+
+def _to_result(row: dict) -> SearchResult:
+    """Convierte una fila del repository en SearchResult."""
+    return SearchResult(
+        id=str(row['id']),
+        source=row['source'],
+        text=row['content'],
+        label=row['label'],
+        transit_number=row['transit_number'],
+        submitted_at=row['date'].astimezone(DISPLAY_TIMEZONE).isoformat(),
+        rank=round(float(row['rank']), 6),
+    )
@@ -0,0 +1,241 @@
+"""
+Service para snapshots columnares (Parquet) de un tenant.
+
+Este módulo escribe envíos, respuestas (formato ancho: una columna por
+pregunta) y quejas en archivos Parquet particionados por mes, para que el
+equipo de datos analice sin consultar la base de datos de producción.
+
+Estructura generada por tenant::
+
+    <output_dir>/<schema>/questions.parquet
+    <output_dir>/<schema>/submissions/month=YYYY-MM/part.parquet
+    <output_dir>/<schema>/answers/month=YYYY-MM/part.parquet
+    <output_dir>/<schema>/complaints/month=YYYY-MM/part.parquet
+    <output_dir>/<schema>/_snapshot_state.json
+
+En modo incremental solo se reescriben los meses con registros nuevos desde
+la última ejecución (registrada en _snapshot_state.json).
+"""
+import json
+import os
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from django.utils import timezone
+
+from apps.interview.models import Question, SurveySubmission, Complaint
+from ..constants import SNAPSHOT_COMPRESSION, SNAPSHOT_STATE_FILE
+from ..repositories import snapshot_repository
+
+
+# Tipo Arrow de cada columna de pregunta según su tipo
+_QUESTION_ARROW_TYPES = {
+    Question.QuestionType.RATING: pa.int8(),
+    Question.QuestionType.TEXT: pa.string(),
+    Question.QuestionType.CHOICE: pa.dictionary(pa.int32(), pa.string()),
+    Question.QuestionType.MULTI_CHOICE: pa.list_(pa.string()),
+}
+
+_TIMESTAMP = pa.timestamp('us', tz='UTC')
+
+SUBMISSIONS_SCHEMA = pa.schema([
+    ('id', pa.string()),
+    ('unit_id', pa.string()),
+    ('transit_number', pa.dictionary(pa.int32(), pa.string())),
+    ('route_id', pa.string()),
+    ('route_name', pa.dictionary(pa.int32(), pa.string())),
+    ('submitted_at', _TIMESTAMP),
+])
+
+COMPLAINTS_SCHEMA = pa.schema([
+    ('id', pa.string()),
+    ('unit_id', pa.string()),
+    ('submission_id', pa.string()),
+    ('transit_number', pa.dictionary(pa.int32(), pa.string())),
+    ('route_id', pa.string()),
+    ('reason_label', pa.dictionary(pa.int32(), pa.string())),
+    ('text', pa.string()),
+    ('submitted_at', _TIMESTAMP),
+    ('created_at', _TIMESTAMP),
+])
+
+
+@dataclass
+class SnapshotResult:
+    """Resumen de la ejecución de un snapshot para un tenant."""
+    schema_name: str
+    months_written: list[str] = field(default_factory=list)
+    rows_written: int = 0
+
+
+def write_tenant_snapshot(
+    schema_name: str,
+    output_dir: Path,
+    incremental: bool = False
+) -> SnapshotResult:
+    """
+    Escribe el snapshot columnar del tenant activo.
+
+    Debe ejecutarse dentro del schema del tenant (schema_context).
+
+    Args:
+        schema_name: Schema del tenant (nombre del directorio de salida)
+        output_dir: Directorio raíz de los snapshots
+        incremental: True para reescribir solo los meses con cambios desde
+                     la última ejecución
+
+    Returns:
+        SnapshotResult con los meses y filas escritas
+
+    Example:
+        >>> with schema_context('alianza'):
+        ...     result = write_tenant_snapshot('alianza', Path('snapshots'))
+        >>> print(result.months_written)
+        ['2024-01', '2024-02']
+    """
+    tenant_dir = output_dir / schema_name
+    state_path = tenant_dir / SNAPSHOT_STATE_FILE
+    state = _read_state(state_path)
+
+    # Marcar el inicio antes de leer para no perder filas insertadas durante la ejecución
+    run_started_at = timezone.now()
+    changed_since = _parse_datetime(state.get('last_run')) if incremental else None
+
+    submission_months = snapshot_repository.get_months(SurveySubmission, changed_since)
+    complaint_months = snapshot_repository.get_months(Complaint, changed_since)
+
+    questions = list(snapshot_repository.get_questions())
+    _write_table(tenant_dir / 'questions.parquet', _questions_table(questions))
+
+    result = SnapshotResult(schema_name=schema_name)
+
+    for month_start in sorted(submission_months | complaint_months):
+        month_end = _next_month(month_start)
+        month_key = month_start.strftime('%Y-%m')
+
+        if month_start in submission_months:
+            submissions = _rows_to_table(
+                snapshot_repository.iter_month_submissions(month_start, month_end),
+                SUBMISSIONS_SCHEMA,
+            )
+            answers = _answers_table(questions, month_start, month_end)
+            _write_partition(tenant_dir, 'submissions', month_key, submissions)
+            _write_partition(tenant_dir, 'answers', month_key, answers)
+            result.rows_written += submissions.num_rows + answers.num_rows
+
+        if month_start in complaint_months:
+            complaints = _rows_to_table(
+                snapshot_repository.iter_month_complaints(month_start, month_end),
+                COMPLAINTS_SCHEMA,
+            )
+            _write_partition(tenant_dir, 'complaints', month_key, complaints)
+            result.rows_written += complaints.num_rows
+
+        result.months_written.append(month_key)
+
+    _write_state(state_path, {'last_run': run_started_at.isoformat()})
+    return result
+
+
+def _answers_table(
+    questions: list[Question],
+    month_start: datetime,
+    month_end: datetime
+) -> pa.Table:
+    """
+    Construye la tabla ancha de respuestas de un mes.
+
+    Una fila por envío y una columna por pregunta (nombrada con el id de la
+    pregunta; ver questions.parquet para el texto y el tipo).
+    """
+    question_types = {question.id: question.type for question in questions}
+    rows: dict[Any, dict[str, Any]] = {}
+
+    for answer in snapshot_repository.iter_month_answers(month_start, month_end):
+        question_type = question_types.get(answer['question_id'])
+        row = rows.setdefault(answer['submission_id'], {})
+        match question_type:
+            case Question.QuestionType.RATING:
+                row[answer['question_id']] = answer['rating_answer']
+            case Question.QuestionType.TEXT:
+                row[answer['question_id']] = answer['text_answer']
+            case Question.QuestionType.CHOICE:
+                row[answer['question_id']] = answer['option_text']
+
+    for selection in snapshot_repository.iter_month_multi_options(month_start, month_end):
+        row = rows.setdefault(selection['submission_id'], {})
+        row.setdefault(selection['question_id'], []).append(selection['option_text'])
+
+    submission_ids = list(rows.keys())
+    columns = {'submission_id': pa.array([str(pk) for pk in submission_ids], pa.string())}
+    for question in questions:
+        columns[str(question.id)] = pa.array(
+            [rows[pk].get(question.id) for pk in submission_ids],
+            _QUESTION_ARROW_TYPES[question.type],
+        )
+    return pa.table(columns)
+
+
+def _questions_table(questions: list[Question]) -> pa.Table:
+    """Tabla de dimensión con el texto y tipo de cada columna de pregunta."""
+    return pa.table({
+        'id': pa.array([str(q.id) for q in questions], pa.string()),
+        'text': pa.array([q.text for q in questions], pa.string()),
+        'type': pa.array([q.type for q in questions], pa.string()),
+        'position': pa.array([q.position for q in questions], pa.int32()),
+        'active': pa.array([q.active for q in questions], pa.bool_()),
+    })
+
+
+def _rows_to_table(rows: Iterable[dict[str, Any]], schema: pa.Schema) -> pa.Table:
+    """Convierte filas de values() en una tabla Arrow con el esquema dado."""
+    columns: dict[str, list[Any]] = {name: [] for name in schema.names}
+    for row in rows:
+        for name in schema.names:
+            value = row.get(name)
+            # Los UUID se guardan como texto
+            columns[name].append(str(value) if isinstance(value, uuid.UUID) else value)
+    return pa.table(columns, schema=schema)
+
+
+def _write_partition(tenant_dir: Path, table_name: str, month_key: str, table: pa.Table) -> None:
+    """Escribe (o reemplaza) la partición mensual de una tabla."""
+    _write_table(tenant_dir / table_name / f'month={month_key}' / 'part.parquet', table)
+
+
+def _write_table(path: Path, table: pa.Table) -> None:
+    """Escribe un archivo Parquet de forma atómica (archivo temporal + rename)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.parquet.tmp')
+    pq.write_table(table, tmp_path, compression=SNAPSHOT_COMPRESSION)
+    os.replace(tmp_path, path)
+
+
+def _next_month(month_start: datetime) -> datetime:
+    """Inicio del mes siguiente, en la misma zona horaria que month_start."""
+    if month_start.month == 12:
+        return month_start.replace(year=month_start.year + 1, month=1)
+    return month_start.replace(month=month_start.month + 1)
+
+
+def _read_state(path: Path) -> dict[str, Any]:
+    """Lee el estado de la última ejecución (vacío si no existe)."""
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def _write_state(path: Path, state: dict[str, Any]) -> None:
+    """Guarda el estado de la ejecución actual."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(state, indent=2))
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    """Convierte una fecha ISO del archivo de estado."""
+    return datetime.fromisoformat(value) if value else None
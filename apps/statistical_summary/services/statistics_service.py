@@ -3,7 +3,12 @@ Service principal para orquestación de estadísticas.
 
 Este módulo contiene la función principal que orquesta todos los servicios
 para calcular las estadísticas completas del dashboard.
+
+Si ``settings.STATISTICS_ENGINE`` es "cube", el cálculo se delega al cubo
+en memoria de cube_service.
 """
+from django.conf import settings
+
 from ..schemas import DashboardStatistics, PeriodType
 from ..utils.date_utils import get_period_date_range
 from ..utils.filter_builder import build_submission_filters, build_complaint_filters
@@ -13,7 +18,8 @@ from . import survey_service, complaints_service, questions_service
 def calculate_dashboard_statistics(
     period: PeriodType,
     route_id: str | None = None,
-    unit_id: str | None = None
+    unit_id: str | None = None,
+    deduplicate: bool = False
 ) -> DashboardStatistics:
     """
     Calcula todas las estadísticas del dashboard.
@@ -25,6 +31,7 @@ def calculate_dashboard_statistics(
         period: Período de tiempo ("today", "week", "month", "year", "all")
         route_id: ID de ruta opcional para filtrar
         unit_id: ID de unidad opcional para filtrar (mutuamente excluyente con route_id)
+        deduplicate: True para contar las quejas casi duplicadas una sola vez
         
     Returns:
         DashboardStatistics con todos los datos calculados
@@ -41,13 +48,19 @@ def calculate_dashboard_statistics(
         >>> print(f"Period: {stats.period_label}")
         Period: Hoy
     """
+    # El cubo no conoce las marcas de duplicado: la deduplicación siempre usa SQL
+    if getattr(settings, 'STATISTICS_ENGINE', 'sql') == 'cube' and not deduplicate:
+        # Import diferido: NumPy solo es necesario con el motor de cubo
+        from . import cube_service
+        return cube_service.calculate_dashboard_statistics(period, route_id, unit_id)
+
     # Validación ocurre en get_period_date_range
     # Obtener rango de fechas y label
     start_date, period_label = get_period_date_range(period)
     
     # Construir filtros para queries
     submissions_filters = build_submission_filters(start_date, route_id, unit_id)
-    complaints_filters = build_complaint_filters(start_date, route_id, unit_id)
+    complaints_filters = build_complaint_filters(start_date, route_id, unit_id, deduplicate)
     
     # ==================== KPI 1: Envíos de encuestas ====================
     total_submissions = survey_service.get_submission_total(submissions_filters)
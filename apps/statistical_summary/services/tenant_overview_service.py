@@ -0,0 +1,74 @@
+"""
+Service para el dashboard ejecutivo multi-tenant (esquema público).
+
+Los KPIs de cada organización se guardan en cache por (schema, período);
+solo los tenants sin entrada vigente se calculan, en lotes de
+TENANT_OVERVIEW_BATCH_SIZE schemas por query UNION ALL.
+"""
+from django.core.cache import cache
+
+from ..constants import TENANT_OVERVIEW_BATCH_SIZE, TENANT_OVERVIEW_CACHE_SECONDS
+from ..repositories import tenant_overview_repository
+from ..schemas import PeriodType, TenantKpis, TenantOverview
+from ..utils.date_utils import get_period_date_range
+
+
+def get_tenant_overview(period: PeriodType) -> TenantOverview:
+    """
+    Calcula los KPIs de todas las organizaciones activas.
+
+    Args:
+        period: Período de tiempo ("today", "week", "month", "year", "all")
+
+    Returns:
+        TenantOverview con una fila por organización (orden por nombre) y totales
+
+    Raises:
+        ValueError: Si period no es válido
+
+    Example:
+        >>> overview = get_tenant_overview("month")
+        >>> [(t.organization_name, t.total_complaints) for t in overview.tenants]
+        [('Alianza', 14), ('Express', 3)]
+    """
+    start_date, period_label = get_period_date_range(period)
+    tenants = tenant_overview_repository.get_active_tenants()
+
+    keys = {schema_name: _cache_key(schema_name, period) for schema_name, _ in tenants}
+    cached = cache.get_many(keys.values())
+    kpis = {
+        schema_name: cached[key]
+        for schema_name, key in keys.items() if key in cached
+    }
+
+    missing = [schema_name for schema_name in keys if schema_name not in kpis]
+    for batch_start in range(0, len(missing), TENANT_OVERVIEW_BATCH_SIZE):
+        batch = missing[batch_start:batch_start + TENANT_OVERVIEW_BATCH_SIZE]
+        computed = tenant_overview_repository.get_tenant_kpis(batch, start_date)
+        cache.set_many(
+            {keys[schema_name]: values for schema_name, values in computed.items()},
+            TENANT_OVERVIEW_CACHE_SECONDS,
+        )
+        kpis.update(computed)
+
+    rows = [
+        TenantKpis(
+            schema_name=schema_name,
+            organization_name=name,
+            total_submissions=kpis[schema_name][0],
+            total_complaints=kpis[schema_name][1],
+            average_rating=kpis[schema_name][2],
+        )
+        for schema_name, name in tenants
+    ]
+
+    return TenantOverview(
+        period_label=period_label,
+        tenants=rows,
+        total_submissions=sum(row.total_submissions for row in rows),
+        total_complaints=sum(row.total_complaints for row in rows),
+    )
+
+
+def _cache_key(schema_name: str, period: PeriodType) -> str:
+    return f'tenant_overview:{schema_name}:{period}'
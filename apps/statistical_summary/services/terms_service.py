@@ -0,0 +1,203 @@
+"""
+Service para el análisis de frecuencia de términos.
+
+Los textos se tokenizan una sola vez, al guardarse (ver signals.py), y los
+conteos se acumulan en TermCount por día local (de ``submitted_at``),
+unidad, ruta registrada al momento del envío y origen. El panel
+del dashboard solo agrega esa tabla.
+"""
+import threading
+import time
+from collections import Counter
+from datetime import date, datetime
+from typing import Any
+
+from django.db import connection
+
+from apps.interview.models import Answer, Complaint
+from ..constants import DISPLAY_TIMEZONE, TEXT_QUESTIONS_CACHE_SECONDS, TOP_TERMS_LIMIT
+from ..models import TermCount
+from ..repositories import term_repository
+from ..schemas import PeriodType, TermFrequencies
+from ..utils.date_utils import get_period_date_range
+from ..utils.filter_builder import build_term_filters
+from ..utils.text_utils import extract_terms
+
+# Ids de preguntas TEXT por schema: (monotonic de carga, ids)
+_text_questions: dict[str, tuple[float, frozenset]] = {}
+_text_questions_lock = threading.Lock()
+
+
+def record_complaint_terms(complaint: Complaint, removed: bool = False) -> None:
+    """
+    Suma (o resta, si se eliminó) los términos de una queja.
+
+    Args:
+        complaint: Queja creada o eliminada
+        removed: True si la queja fue eliminada
+    """
+    _record_terms(
+        extract_terms(complaint.text),
+        _local_day(complaint.submitted_at), complaint.unit_id, complaint.route_id,
+        TermCount.Source.COMPLAINT, None,
+        removed,
+    )
+
+
+def record_answer_terms(answer: Answer, removed: bool = False) -> None:
+    """
+    Suma (o resta, si se eliminó) los términos de una respuesta TEXT.
+
+    Las respuestas de otros tipos se ignoran sin consultar su pregunta ni
+    su envío, para que eliminar en cascada miles de respuestas no haga
+    queries por fila.
+
+    Args:
+        answer: Respuesta creada o eliminada
+        removed: True si la respuesta fue eliminada
+    """
+    if not answer.text_answer or answer.question_id not in get_text_question_ids():
+        return
+
+    _record_terms(
+        extract_terms(answer.text_answer),
+        _local_day(answer.submitted_at), answer.unit_id, answer.route_id,
+        TermCount.Source.ANSWER, answer.question_id,
+        removed,
+    )
+
+
+def discard_answer_terms(start_day: date, end_day: date) -> int:
+    """
+    Descarta los términos de respuestas TEXT de un rango de días.
+
+    Se usa al desprender particiones de answers (retención), que eliminan
+    respuestas sin señales por fila. TermCount agrupa por el día local de
+    ``submitted_at``, igual que los límites de las particiones.
+
+    Args:
+        start_day: Primer día (incluido)
+        end_day: Último día (excluido)
+
+    Returns:
+        Número de filas de TermCount eliminadas
+    """
+    return term_repository.delete_term_counts(TermCount.Source.ANSWER, start_day, end_day)
+
+
+def get_text_question_ids() -> frozenset:
+    """
+    Ids de las preguntas TEXT del tenant activo.
+
+    Se cachean en el proceso por TEXT_QUESTIONS_CACHE_SECONDS; guardar o
+    eliminar una pregunta los descarta (ver signals.py).
+
+    Returns:
+        Conjunto de ids de Question
+    """
+    schema_name = connection.schema_name
+    with _text_questions_lock:
+        cached = _text_questions.get(schema_name)
+    if cached and time.monotonic() - cached[0] < TEXT_QUESTIONS_CACHE_SECONDS:
+        return cached[1]
+
+    ids = frozenset(term_repository.get_text_question_ids())
+    with _text_questions_lock:
+        _text_questions[schema_name] = (time.monotonic(), ids)
+    return ids
+
+
+def clear_text_question_ids(schema_name: str | None = None) -> None:
+    """Descarta los ids de preguntas TEXT cacheados de un tenant (por defecto, el activo)."""
+    with _text_questions_lock:
+        _text_questions.pop(schema_name or connection.schema_name, None)
+
+
+def _record_terms(
+    terms: set[str],
+    day: date,
+    unit_id: Any,
+    route_id: Any,
+    source: str,
+    question_id: Any,
+    removed: bool
+) -> None:
+    """Aplica los términos de un texto a TermCount (upsert o decremento)."""
+    if removed:
+        term_repository.decrement_term_counts(day, unit_id, route_id, source, question_id, terms)
+    else:
+        term_repository.increment_term_counts(
+            (day, unit_id, route_id, source, question_id, term, 1) for term in terms
+        )
+
+
+def rebuild_term_counts() -> int:
+    """
+    Reconstruye TermCount desde cero para el tenant activo.
+
+    Útil para cargar el histórico previo a este módulo o tras cambiar las
+    palabras vacías.
+
+    Returns:
+        Número de filas de TermCount generadas
+    """
+    counts: Counter[tuple[Any, ...]] = Counter()
+
+    for unit_id, route_id, submitted_at, text in term_repository.iter_complaint_texts():
+        day = _local_day(submitted_at)
+        for term in extract_terms(text):
+            counts[(day, unit_id, route_id, TermCount.Source.COMPLAINT, None, term)] += 1
+
+    for question_id, unit_id, route_id, submitted_at, text in term_repository.iter_answer_texts():
+        day = _local_day(submitted_at)
+        for term in extract_terms(text):
+            counts[(day, unit_id, route_id, TermCount.Source.ANSWER, question_id, term)] += 1
+
+    return term_repository.replace_term_counts(counts)
+
+
+def get_term_frequencies(
+    period: PeriodType,
+    route_id: str | None = None,
+    unit_id: str | None = None,
+    limit: int = TOP_TERMS_LIMIT
+) -> TermFrequencies:
+    """
+    Obtiene las palabras más frecuentes de quejas y preguntas TEXT.
+
+    Args:
+        period: Período de tiempo ("today", "week", "month", "year", "all")
+        route_id: ID de ruta opcional para filtrar
+        unit_id: ID de unidad opcional (mutuamente excluyente con route_id)
+        limit: Número máximo de términos por panel
+
+    Returns:
+        TermFrequencies con los términos de quejas y de cada pregunta TEXT
+
+    Raises:
+        ValueError: Si period no es válido
+
+    Example:
+        >>> terms = get_term_frequencies("month", route_id="uuid")
+        >>> print(terms.complaints)
+        {'chofer': 12, 'frenos': 5}
+    """
+    start_date, _ = get_period_date_range(period)
+    filters = build_term_filters(start_date, route_id, unit_id)
+
+    answers = {
+        question.text: term_repository.get_top_terms(
+            filters, TermCount.Source.ANSWER, limit, question_id=question.id
+        )
+        for question in term_repository.get_text_questions()
+    }
+
+    return TermFrequencies(
+        complaints=term_repository.get_top_terms(filters, TermCount.Source.COMPLAINT, limit),
+        answers={text: terms for text, terms in answers.items() if terms},
+    )
+
+
+def _local_day(moment: datetime) -> date:
+    """Día en DISPLAY_TIMEZONE de una fecha aware."""
+    return moment.astimezone(DISPLAY_TIMEZONE).date()
@@ -0,0 +1,96 @@
+"""
+Señales de statistical_summary.
+
+- El cubo en memoria (cube_service) solo detecta inserciones en su carga
+  incremental; al eliminar envíos, respuestas o quejas se descarta el cubo
+  del tenant en todos los procesos para que la siguiente consulta lo
+  reconstruya.
+- La frecuencia de términos (TermCount) se actualiza al crear o eliminar
+  quejas y respuestas TEXT, para no tokenizar textos en cada request. Los
+  ids de preguntas TEXT se cachean; guardar o eliminar una pregunta los
+  descarta.
+- Al desprender particiones de envíos y respuestas (retención) se
+  descartan sus términos y el cubo del tenant. Las escrituras masivas
+  (generador sintético, relleno de campos desnormalizados) también
+  descartan el cubo: traen filas con fechas anteriores a su marca de agua.
+- Cada queja nueva se indexa con su firma MinHash para detectar casi
+  duplicados (dedup_service).
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.interview.models import SurveySubmission, Answer, Complaint, Question
+from apps.interview.partitions import add_months, partition_detached
+from apps.interview.signals import facts_bulk_written
+from .services.dedup_service import index_complaint
+from .services.terms_service import (
+    clear_text_question_ids,
+    discard_answer_terms,
+    record_answer_terms,
+    record_complaint_terms,
+)
+
+
+@receiver(post_delete, sender=SurveySubmission)
+@receiver(post_delete, sender=Answer)
+@receiver(post_delete, sender=Complaint)
+def invalidate_statistics_cube(sender, **kwargs):
+    """Descarta el cubo del tenant activo tras eliminar hechos."""
+    from .services.cube_service import invalidate_cube
+    invalidate_cube()
+
+
+@receiver(post_save, sender=Complaint)
+def count_complaint_terms(sender, instance, created, raw=False, **kwargs):
+    """Suma los términos de una queja nueva."""
+    if created and not raw:
+        record_complaint_terms(instance)
+
+
+@receiver(post_save, sender=Complaint)
+def index_complaint_fingerprint(sender, instance, created, raw=False, **kwargs):
+    """Indexa la firma MinHash de una queja nueva."""
+    if created and not raw:
+        index_complaint(instance)
+
+
+@receiver(post_save, sender=Answer)
+def count_answer_terms(sender, instance, created, raw=False, **kwargs):
+    """Suma los términos de una respuesta TEXT nueva."""
+    if created and not raw:
+        record_answer_terms(instance)
+
+
+@receiver(post_delete, sender=Complaint)
+def discount_complaint_terms(sender, instance, **kwargs):
+    """Resta los términos de una queja eliminada."""
+    record_complaint_terms(instance, removed=True)
+
+
+@receiver(post_delete, sender=Answer)
+def discount_answer_terms(sender, instance, **kwargs):
+    """Resta los términos de una respuesta TEXT eliminada."""
+    record_answer_terms(instance, removed=True)
+
+
+@receiver(partition_detached)
+def discount_detached_partition(sender, partition, **kwargs):
+    """Descarta los términos y el cubo de una partición desprendida por la retención."""
+    from .services.cube_service import invalidate_cube
+    if partition.table == 'answers':
+        discard_answer_terms(partition.month, add_months(partition.month, 1))
+    invalidate_cube()
+
+
+@receiver(facts_bulk_written)
+def invalidate_cube_after_bulk_write(sender, **kwargs):
+    """Descarta el cubo del tenant tras una escritura masiva de hechos."""
+    from .services.cube_service import invalidate_cube
+    invalidate_cube()
+
+
+@receiver(post_save, sender=Question)
+@receiver(post_delete, sender=Question)
+def clear_text_questions(sender, **kwargs):
+    """Descarta los ids de preguntas TEXT cacheados tras cambiar una pregunta."""
+    clear_text_question_ids()
@@ -0,0 +1,82 @@
+"""
+Tests para export_repository.
+
+Verifica que la exportación obtiene las preguntas en orden y recorre
+los envíos con sus relaciones precargadas en un número constante de queries.
+"""
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.statistical_summary.repositories import export_repository
+from .. import StatisticalTestCase
+
+
+class TestGetExportQuestions(StatisticalTestCase):
+    """Tests para export_repository.get_export_questions()."""
+
+    def test_get_export_questions_ordered_by_position(self):
+        """
+        Verifica que get_export_questions() retorna las preguntas activas
+        ordenadas por posición.
+        """
+        # Arrange
+        self.question_multi2.active = False
+        self.question_multi2.save()
+
+        # Act
+        questions = export_repository.get_export_questions()
+
+        # Assert
+        self.assertEqual(
+            [q.position for q in questions],
+            [1, 2, 3, 4]
+        )
+
+
+class TestIterSubmissions(StatisticalTestCase):
+    """Tests para export_repository.iter_submissions()."""
+
+    def test_iter_submissions_prefetches_relations(self):
+        """
+        Verifica que iter_submissions() carga respuestas, opciones y quejas
+        por lote, sin queries adicionales por envío.
+        """
+        # Arrange
+        self.complaints[0].submission = self.submissions[0]
+        self.complaints[0].save()
+
+        # Act
+        with CaptureQueriesContext(connection) as context:
+            submissions = list(export_repository.iter_submissions({}, chunk_size=100))
+            for submission in submissions:
+                for answer in submission.answers.all():
+                    list(answer.selected_options.all())
+                    _ = answer.selected_option
+                list(submission.complaints.all())
+                _ = submission.unit, submission.route
+
+        # Assert
+        # django-tenants agrega un SET search_path antes de algunas queries
+        queries = [
+            q['sql'] for q in context.captured_queries
+            if not q['sql'].startswith('SET search_path')
+        ]
+        # 1 envíos + 1 respuestas + 1 opciones múltiples + 1 quejas
+        self.assertEqual(len(queries), 4)
+        self.assertEqual(len(submissions), 10)
+
+    def test_iter_submissions_applies_filters(self):
+        """
+        Verifica que iter_submissions() respeta los filtros de ruta.
+        """
+        # Arrange
+        filters = {'unit__route_id': self.route1.id}
+
+        # Act
+        submissions = list(export_repository.iter_submissions(filters))
+
+        # Assert
+        # Los 10 envíos rotan sobre las primeras 10 unidades (todas de la ruta 1)
+        self.assertEqual(len(submissions), 10)
+        for submission in submissions:
+            self.assertEqual(submission.unit.route_id, self.route1.id)
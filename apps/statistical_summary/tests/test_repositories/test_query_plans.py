@@ -0,0 +1,206 @@
+"""
+Tests de los planes de ejecución de las consultas del dashboard.
+
+Ejecuta cada consulta de los repositorios (con los filtros que arma el
+dashboard), corre ``EXPLAIN`` sobre el SQL capturado y verifica que las
+tablas de hechos (envíos, respuestas, quejas) se leen por índice.
+
+Con los pocos datos de prueba PostgreSQL siempre prefiere un Seq Scan,
+así que se desactiva con ``enable_seqscan = off``: si aun así aparece
+uno es porque ningún índice sirve para la consulta.
+
+Envíos y respuestas están particionados por mes: los planes nombran las
+particiones y sus índices, que se traducen a la tabla e índice padre.
+"""
+import json
+from datetime import timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.interview.models import SurveySubmission
+from apps.interview.partitions import PARTITION_NAME_RE
+from apps.statistical_summary.constants import PERIOD_LABELS
+from apps.statistical_summary.repositories import (
+    complaint_repository,
+    question_repository,
+    survey_repository,
+)
+from apps.statistical_summary.utils.date_utils import get_period_date_range
+from apps.statistical_summary.utils.filter_builder import (
+    build_complaint_filters,
+    build_submission_filters,
+)
+from .. import StatisticalTestCase
+
+FACT_TABLES = {'survey_submissions', 'answers', 'complaints'}
+
+
+def parent_table(name):
+    """Tabla padre de una partición (o el mismo nombre si no es partición)."""
+    match = PARTITION_NAME_RE.match(name or '')
+    return match['table'] if match else name
+
+
+def plan_nodes(plan):
+    """Recorre todos los nodos de un plan de EXPLAIN (FORMAT JSON)."""
+    yield plan
+    for child in plan.get('Plans', []):
+        yield from plan_nodes(child)
+
+
+class TestDashboardQueryPlans(StatisticalTestCase):
+    """Verifica que ninguna consulta del dashboard hace Seq Scan sobre tablas de hechos."""
+
+    def explain_queries(self, run):
+        """
+        Ejecuta ``run()`` y devuelve los nodos de los planes de sus consultas.
+
+        Returns:
+            Lista de (sql, nodos) por cada consulta ejecutada
+        """
+        with CaptureQueriesContext(connection) as queries:
+            run()
+
+        plans = []
+        with connection.cursor() as cursor:
+            cursor.execute('SET enable_seqscan = off')
+            try:
+                # django-tenants intercala sus SET search_path
+                for query in queries:
+                    if not query['sql'].lstrip().upper().startswith('SELECT'):
+                        continue
+                    cursor.execute(f"EXPLAIN (FORMAT JSON) {query['sql']}")
+                    plan = cursor.fetchone()[0]
+                    if isinstance(plan, str):
+                        plan = json.loads(plan)
+                    plans.append((query['sql'], list(plan_nodes(plan[0]['Plan']))))
+            finally:
+                cursor.execute('RESET enable_seqscan')
+        return plans
+
+    def assert_no_fact_seq_scans(self, run):
+        plans = self.explain_queries(run)
+        self.assertTrue(plans)
+
+        for sql, nodes in plans:
+            seq_scans = [
+                node['Relation Name'] for node in nodes
+                if node['Node Type'] == 'Seq Scan' and parent_table(node.get('Relation Name')) in FACT_TABLES
+            ]
+            self.assertEqual(seq_scans, [], f'Seq Scan en {seq_scans}: {sql}')
+        return plans
+
+    def used_indexes(self, plans):
+        """Índices usados por los planes; los de una partición se reportan con el nombre del índice padre."""
+        names = {node['Index Name'] for _, nodes in plans for node in nodes if 'Index Name' in node}
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT child.relname, parent.relname
+                FROM pg_inherits inh
+                JOIN pg_class child ON child.oid = inh.inhrelid
+                JOIN pg_class parent ON parent.oid = inh.inhparent
+                WHERE child.relname = ANY(%s) AND child.relkind = 'i'
+                """,
+                [list(names)],
+            )
+            parents = dict(cursor.fetchall())
+        return {parents.get(name, name) for name in names}
+
+    def filter_combinations(self):
+        """
+        Combinaciones de filtros del dashboard: (start_date, route_id, unit_id).
+
+        Se omite "Todo el Tiempo" sin ruta ni unidad: esa consulta lee la
+        tabla completa y un Seq Scan es el plan correcto.
+        """
+        combinations = []
+        for period in PERIOD_LABELS:
+            start_date, _ = get_period_date_range(period)
+            for route_id, unit_id in ((None, None), (self.route1.id, None), (None, self.units_route1[0].id)):
+                if start_date or route_id or unit_id:
+                    combinations.append((start_date, route_id, unit_id))
+        return combinations
+
+    def test_survey_repository(self):
+        """Verifica conteo, timeline y agrupación por unidad de envíos."""
+        for start_date, route_id, unit_id in self.filter_combinations():
+            filters = build_submission_filters(start_date, route_id, unit_id)
+            with self.subTest(filters=filters):
+                self.assert_no_fact_seq_scans(lambda: (
+                    survey_repository.get_submission_count(filters),
+                    survey_repository.get_submissions_timeline(filters),
+                    survey_repository.get_submissions_timeline(filters, group_by_hour=True),
+                    survey_repository.get_submissions_by_unit(filters),
+                ))
+
+    def test_complaint_repository(self):
+        """Verifica conteo, resumen por motivo y agrupación por unidad de quejas."""
+        for start_date, route_id, unit_id in self.filter_combinations():
+            for deduplicate in (False, True):
+                filters = build_complaint_filters(start_date, route_id, unit_id, deduplicate)
+                with self.subTest(filters=filters):
+                    self.assert_no_fact_seq_scans(lambda: (
+                        complaint_repository.get_complaint_count(filters),
+                        complaint_repository.get_summary(filters),
+                        complaint_repository.get_by_unit(filters),
+                    ))
+
+    def test_question_repository(self):
+        """Verifica las estadísticas por pregunta (rating, opción única y múltiple)."""
+        questions = [self.question_rating, self.question_choice1, self.question_multi1]
+
+        def run(start_date, route_id, unit_id):
+            for question in questions:
+                answers = question_repository.get_filtered_answers(question, start_date, route_id, unit_id)
+                question_repository.get_rating_average(answers)
+                question_repository.get_choice_counts(answers, question)
+                question_repository.get_multi_choice_counts(answers, question)
+
+        for start_date, route_id, unit_id in self.filter_combinations():
+            with self.subTest(start_date=start_date, route_id=route_id, unit_id=unit_id):
+                self.assert_no_fact_seq_scans(lambda: run(start_date, route_id, unit_id))
+
+    def test_date_and_unit_filters_use_composite_indexes(self):
+        """Verifica que el filtro (unidad, fecha) usa los índices compuestos nuevos."""
+        start_date = timezone.now() - timedelta(days=7)
+        unit_id = self.units_route1[0].id
+
+        plans = self.assert_no_fact_seq_scans(lambda: (
+            survey_repository.get_submission_count(build_submission_filters(start_date, None, unit_id)),
+            complaint_repository.get_complaint_count(build_complaint_filters(start_date, None, unit_id)),
+            question_repository.get_filtered_answers(self.question_rating, start_date, None, None).count(),
+        ))
+
+        self.assertTrue(
+            {'submissions_unit_submitted_idx', 'complaints_unit_submitted_idx', 'answers_question_submitted_idx'}
+            <= self.used_indexes(plans)
+        )
+
+    def test_route_filters_are_single_table(self):
+        """Verifica que el filtro por ruta usa la ruta guardada en cada fila, sin join a units."""
+        start_date = timezone.now() - timedelta(days=7)
+        route_id = self.route1.id
+
+        plans = self.assert_no_fact_seq_scans(lambda: (
+            survey_repository.get_submission_count(build_submission_filters(start_date, route_id, None)),
+            complaint_repository.get_complaint_count(build_complaint_filters(start_date, route_id, None)),
+            question_repository.get_filtered_answers(self.question_rating, start_date, route_id, None).count(),
+        ))
+
+        # con tan pocas filas el planificador puede preferir el índice por
+        # (question, submitted_at) para respuestas; lo importante es que no hay joins
+        self.assertTrue({'submissions_route_time_idx', 'complaints_route_submitted_idx'} <= self.used_indexes(plans))
+        self.assertFalse(any('JOIN' in sql for sql, _ in plans))
+
+    def test_thank_you_count_uses_index(self):
+        """Verifica el conteo de envíos del día de la página de agradecimiento."""
+        today_start = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+        plans = self.assert_no_fact_seq_scans(
+            lambda: SurveySubmission.objects.filter(submitted_at__gte=today_start).count()
+        )
+
+        self.assertIn('submissions_submitted_brin', self.used_indexes(plans))
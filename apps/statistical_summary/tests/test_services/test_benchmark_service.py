@@ -0,0 +1,92 @@
+"""
+Tests para benchmark_service y benchmark_repository.
+
+Verifica la siembra de datos sintéticos (consistente con lo que guardan
+los modelos), las combinaciones medidas, el resumen por KPI y la
+comparación entre corridas.
+"""
+from django.db.models import F
+
+from apps.interview.models import Answer, SurveySubmission
+from apps.statistical_summary.repositories import benchmark_repository
+from apps.statistical_summary.services import benchmark_service, statistics_service
+from .. import StatisticalTestCase
+
+
+class TestSeedDashboardData(StatisticalTestCase):
+    """Tests para benchmark_repository.seed_dashboard_data()."""
+
+    def test_seeds_consistent_rows(self):
+        """
+        Verifica que se inserta aproximadamente el volumen pedido en las
+        unidades de benchmark y los campos desnormalizados de cada respuesta
+        coinciden con su envío.
+        """
+        before = benchmark_repository.get_row_counts()
+
+        inserted = benchmark_repository.seed_dashboard_data(answers=2000, units=4, routes=2, days=20, batch_size=50)
+
+        self.assertTrue(1400 < inserted['answers'] < 2600, inserted)
+        self.assertGreater(inserted['answers_selected_options'], 0)
+        after = benchmark_repository.get_row_counts()
+        for table in ('survey_submissions', 'answers', 'complaints'):
+            self.assertEqual(after[table] - before[table], inserted[table])
+
+        seeded = Answer.objects.filter(unit__transit_number__startswith='BENCH-')
+        self.assertEqual(seeded.count(), inserted['answers'])
+        self.assertFalse(seeded.exclude(
+            unit_id=F('submission__unit_id'),
+            route_id=F('submission__route_id'),
+            submitted_at=F('submission__submitted_at'),
+        ).exists())
+
+    def test_seeded_data_is_visible_to_dashboard(self):
+        """Verifica que el dashboard cuenta los envíos sembrados."""
+        inserted = benchmark_repository.seed_dashboard_data(answers=200, units=2, routes=1, days=30)
+
+        stats = statistics_service.calculate_dashboard_statistics('all')
+
+        self.assertEqual(stats.total_submissions, SurveySubmission.objects.count())
+        self.assertEqual(stats.total_submissions, 10 + inserted['survey_submissions'])
+
+
+class TestRunBenchmark(StatisticalTestCase):
+    """Tests para benchmark_service.run_benchmark()."""
+
+    def test_combinations_cover_periods_routes_and_units(self):
+        """Verifica las combinaciones: sin filtro, cada ruta y la muestra de unidades, por período."""
+        combinations = benchmark_service.get_combinations(max_units=4)
+
+        # 5 períodos × (sin filtro + 2 rutas + 4 unidades)
+        self.assertEqual(len(combinations), 5 * 7)
+        self.assertEqual(len({unit_id for _, _, unit_id in combinations if unit_id}), 4)
+        self.assertEqual(len(benchmark_service.get_combinations(max_units=None)), 5 * 23)
+
+    def test_reports_latency_and_queries_per_kpi(self):
+        """Verifica el resumen por KPI y por período."""
+        combinations = benchmark_service.get_combinations(max_units=1)
+
+        result = benchmark_service.run_benchmark(self.tenant.schema_name, combinations, repeat=2, warmup=0, engine='sql')
+
+        self.assertEqual(list(result.kpis), list(benchmark_service.BENCHMARK_KPIS))
+        self.assertEqual(set(result.by_period), {'today', 'week', 'month', 'year', 'all'})
+        for kpi, stats in result.kpis.items():
+            self.assertEqual(stats.calls, len(combinations) * 2)
+            self.assertLessEqual(stats.p50_ms, stats.p95_ms)
+            self.assertLessEqual(stats.p95_ms, stats.max_ms)
+        self.assertEqual(result.kpis['total_submissions'].max_queries, 1)
+        self.assertGreater(result.kpis['dashboard'].max_queries, result.kpis['questions_statistics'].max_queries)
+        self.assertEqual(result.rows['survey_submissions'], 10)
+
+    def test_compare_flags_regressions(self):
+        """Verifica que la comparación marca p95 más lento o más queries."""
+        def result(p95, queries):
+            return {'kpis': {'timeline': {'p95_ms': p95, 'max_queries': queries}}}
+
+        self.assertFalse(benchmark_service.compare_benchmarks(result(10, 1), result(11, 1))[0]['regression'])
+        self.assertTrue(benchmark_service.compare_benchmarks(result(10, 1), result(13, 1))[0]['regression'])
+        self.assertTrue(benchmark_service.compare_benchmarks(result(10, 1), result(9, 2))[0]['regression'])
+
+    def test_percentile(self):
+        self.assertEqual(benchmark_service.percentile([4, 1, 3, 2], 50), 2)
+        self.assertEqual(benchmark_service.percentile(list(range(1, 101)), 95), 95)
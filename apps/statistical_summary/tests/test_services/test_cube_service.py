@@ -0,0 +1,272 @@
+"""
+Tests para cube_service.
+
+Suite de equivalencia: el cubo en memoria debe devolver exactamente las
+mismas estadísticas que la implementación SQL para todos los períodos y
+filtros, incluso después de cargas incrementales y escrituras masivas.
+"""
+from dataclasses import asdict
+from datetime import timedelta
+from unittest import mock
+
+from django.test import override_settings
+from django.utils import timezone
+
+from apps.interview.backfill import backfill_denormalized_fields
+from apps.interview.models import Question, Answer, SurveySubmission
+from apps.interview.synthetic import generate_synthetic_data
+from apps.statistical_summary.services import cube_service, statistics_service
+from .. import StatisticalTestCase
+from ..factories import (
+    SurveySubmissionFactory, AnswerFactory, ComplaintFactory, QuestionFactory
+)
+
+PERIODS = ["today", "week", "month", "year", "all"]
+
+
+class CubeEquivalenceTestCase(StatisticalTestCase):
+    """Datos base + registros históricos y casos borde para comparar motores."""
+
+    def setUp(self):
+        super().setUp()
+
+        # Envíos históricos: caen en distintos períodos
+        for submission, days in zip(self.submissions[:3], [2, 40, 400]):
+            backdated = timezone.now() - timedelta(days=days)
+            SurveySubmission.objects.filter(id=submission.id).update(submitted_at=backdated)
+            Answer.objects.filter(submission=submission).update(created_at=backdated, submitted_at=backdated)
+
+        self.complaints[1].submitted_at = timezone.now() - timedelta(days=40)
+        self.complaints[1].save()
+
+        # Queja sin motivo ni unidad
+        ComplaintFactory(unit=None, reason=None, text="Sin datos de unidad")
+
+        # Preguntas que no aparecen en las estadísticas (TEXT e inactiva)
+        question_text = QuestionFactory(text="Comentarios", type=Question.QuestionType.TEXT, position=6)
+        AnswerFactory(submission=self.submissions[4], question=question_text, text_answer="Todo bien")
+        QuestionFactory(text="Pregunta retirada", type=Question.QuestionType.RATING, active=False, position=7)
+
+        # Calificación nula: no cuenta para el promedio
+        AnswerFactory(submission=self.submissions[5], question=self.question_rating, rating_answer=None)
+
+    def filter_combinations(self):
+        unit = self.submissions[4].unit
+        return [
+            {},
+            {'route_id': str(self.route1.id)},
+            {'route_id': str(self.route2.id)},
+            {'unit_id': str(unit.id)},
+        ]
+
+    def assert_equivalent(self, cube: cube_service.AnalyticsCube):
+        for period in PERIODS:
+            for filters in self.filter_combinations():
+                with self.subTest(period=period, **filters):
+                    expected = statistics_service.calculate_dashboard_statistics(period, **filters)
+                    actual = cube.statistics(period, **filters)
+                    self.assertEqual(asdict(actual), asdict(expected))
+
+
+class TestAnalyticsCubeEquivalence(CubeEquivalenceTestCase):
+    """Tests de AnalyticsCube.statistics() contra el motor SQL."""
+
+    def test_full_load_matches_sql(self):
+        """
+        Verifica que una carga completa coincide con SQL en todos los
+        períodos y filtros.
+        """
+        cube = cube_service.AnalyticsCube()
+        cube.refresh()
+
+        self.assert_equivalent(cube)
+
+    def test_incremental_refresh_matches_sql(self):
+        """
+        Verifica que las filas insertadas después de la primera carga se
+        agregan en la siguiente actualización sin duplicar las existentes.
+        """
+        # Arrange
+        cube = cube_service.AnalyticsCube()
+        cube.refresh()
+
+        unit = self.units_route2[3]
+        submission = SurveySubmissionFactory(unit=unit)
+        AnswerFactory(submission=submission, question=self.question_rating, rating_answer=1)
+        AnswerFactory(submission=submission, question=self.question_choice1, selected_option=self.choice1_opt2)
+        answer_multi = AnswerFactory(submission=submission, question=self.question_multi1)
+        answer_multi.selected_options.set([self.multi1_opt3])
+        ComplaintFactory(unit=unit, reason=self.reason2, text="Queja nueva")
+
+        # Act
+        cube.refresh()
+
+        # Assert
+        self.assertEqual(len(cube.submissions), SurveySubmission.objects.count())
+        self.assert_equivalent(cube)
+
+    def test_chunked_load_matches_sql(self):
+        """
+        Verifica que la carga por lotes (más pequeños que cada tabla) llena
+        los arrays sin perder ni duplicar filas.
+        """
+        with mock.patch.object(cube_service, 'CUBE_LOAD_CHUNK_SIZE', 3):
+            cube = cube_service.AnalyticsCube()
+            cube.refresh()
+
+        self.assertEqual(len(cube.submissions), SurveySubmission.objects.count())
+        self.assertEqual(len(cube.answers), Answer.objects.count())
+        self.assertEqual(len(cube.selections), Answer.selected_options.through.objects.count())
+        self.assert_equivalent(cube)
+
+    def test_selection_committed_out_of_order_is_loaded(self):
+        """
+        Verifica que una selección múltiple confirmada después de la carga con
+        un id menor a los ya cargados entra en la siguiente actualización.
+        """
+        through = Answer.selected_options.through
+        recent = timezone.now() - timedelta(hours=1)
+        late = through.objects.filter(answer__submitted_at__gte=recent).order_by('id').first()
+        late.delete()
+        cube = cube_service.AnalyticsCube()
+        cube.refresh()
+
+        through.objects.create(id=late.id, answer_id=late.answer_id, questionoption_id=late.questionoption_id)
+        cube.refresh()
+
+        self.assertEqual(len(cube.selections), through.objects.count())
+        self.assert_equivalent(cube)
+
+    def test_statistics_unknown_filters_return_empty(self):
+        """
+        Verifica que una ruta o unidad inexistente no cuenta registros.
+        """
+        cube = cube_service.AnalyticsCube()
+        cube.refresh()
+
+        stats = cube.statistics("all", unit_id="00000000-0000-0000-0000-000000000000")
+
+        self.assertEqual(stats.total_submissions, 0)
+        self.assertEqual(stats.complaints_by_reason, {})
+
+    def test_statistics_invalid_period_raises(self):
+        """
+        Verifica que un período inválido lanza ValueError, igual que SQL.
+        """
+        cube = cube_service.AnalyticsCube()
+
+        with self.assertRaises(ValueError):
+            cube.statistics("invalid")  # type: ignore
+
+
+class TestCubeEngineSetting(CubeEquivalenceTestCase):
+    """Tests de la selección de motor vía settings.STATISTICS_ENGINE."""
+
+    def setUp(self):
+        super().setUp()
+        cube_service._cubes.clear()
+
+    def tearDown(self):
+        cube_service._cubes.clear()
+        super().tearDown()
+
+    def test_engine_cube_delegates_to_cube(self):
+        """
+        Verifica que con STATISTICS_ENGINE="cube" el servicio principal usa
+        el cubo del tenant activo.
+        """
+        expected = asdict(statistics_service.calculate_dashboard_statistics("month"))
+
+        with override_settings(STATISTICS_ENGINE="cube"):
+            actual = asdict(statistics_service.calculate_dashboard_statistics("month"))
+
+        self.assertEqual(actual, expected)
+        self.assertIn(self.tenant.schema_name, cube_service._cubes)
+
+    def test_delete_invalidates_cube(self):
+        """
+        Verifica que eliminar un envío descarta el cubo para reconstruirlo.
+        """
+        # Arrange
+        cube_service.get_cube()
+
+        # Act
+        self.submissions[-1].delete()
+
+        # Assert
+        self.assertNotIn(self.tenant.schema_name, cube_service._cubes)
+        self.assert_equivalent(cube_service.get_cube())
+
+    def test_delete_invalidates_cube_in_other_processes(self):
+        """
+        Verifica que un cubo cargado en otro proceso se reconstruye en su
+        siguiente actualización cuando aquí se eliminan hechos.
+        """
+        # Arrange: caché compartido en memoria; el cubo de "otro proceso" es el cargado antes
+        with override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}):
+            other_process_cube = cube_service.get_cube()
+
+            # Act
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                for submission in self.submissions[-3:]:
+                    submission.delete()
+            cube_service._cubes[self.tenant.schema_name] = other_process_cube
+            other_process_cube.refreshed_at = None
+
+            cube = cube_service.get_cube()
+
+        # Assert: una sola publicación por transacción y un cubo nuevo sin los envíos eliminados
+        self.assertEqual(len(callbacks), 1)
+        self.assertIsNot(cube, other_process_cube)
+        self.assertEqual(len(cube.submissions), SurveySubmission.objects.count())
+        self.assert_equivalent(cube)
+
+    def use_other_process_cube(self, cube):
+        """Deja ``cube`` como el cubo de este proceso, pendiente de actualizar (como otro proceso)."""
+        cube_service._cubes[self.tenant.schema_name] = cube
+        cube.refreshed_at = None
+
+    def test_backdated_bulk_write_invalidates_cube(self):
+        """
+        Verifica que las filas con fechas anteriores a la marca de agua
+        (generador con COPY) llegan al cubo de otro proceso tras la escritura.
+        """
+        with override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}):
+            other_process_cube = cube_service.get_cube()
+
+            with self.captureOnCommitCallbacks(execute=True):
+                result = generate_synthetic_data(
+                    days=60, per_unit_daily=0.3, end=timezone.now() - timedelta(days=3), seed=5,
+                )
+            self.assertGreater(result.rows['survey_submissions'], 0)
+
+            # La carga incremental por fecha no ve las filas antiguas
+            other_process_cube.refresh()
+            self.assertLess(len(other_process_cube.submissions), SurveySubmission.objects.count())
+
+            self.use_other_process_cube(other_process_cube)
+            cube = cube_service.get_cube()
+
+        self.assertIsNot(cube, other_process_cube)
+        self.assertEqual(len(cube.submissions), SurveySubmission.objects.count())
+        self.assertEqual(len(cube.answers), Answer.objects.count())
+        self.assert_equivalent(cube)
+
+    def test_backfill_invalidates_cube_only_when_rows_change(self):
+        """
+        Verifica que el relleno de rutas descarta el cubo (las filas cargadas
+        tenían la ruta nula) y que un relleno sin cambios lo conserva.
+        """
+        # Envíos anteriores a la columna route, ya cargados en el cubo
+        SurveySubmission.objects.filter(id__in=[s.id for s in self.submissions[:4]]).update(route=None)
+        stale = cube_service.get_cube()
+
+        backfill_denormalized_fields()
+
+        self.assertNotIn(self.tenant.schema_name, cube_service._cubes)
+        cube = cube_service.get_cube()
+        self.assertIsNot(cube, stale)
+        self.assert_equivalent(cube)
+
+        backfill_denormalized_fields()
+        self.assertIs(cube_service.get_cube(), cube)
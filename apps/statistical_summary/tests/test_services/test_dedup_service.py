@@ -0,0 +1,115 @@
+"""
+Tests para dedup_service.
+
+Verifica que las quejas casi idénticas de la misma unidad dentro de la
+ventana se marcan como duplicadas y que el dashboard puede excluirlas.
+"""
+import os
+import subprocess
+import sys
+from datetime import timedelta
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+from apps.statistical_summary.models import ComplaintFingerprint
+from apps.statistical_summary.services import dedup_service, statistics_service
+from apps.statistical_summary.utils.minhash import compute_signature, estimate_similarity
+from .. import StatisticalTestCase
+from ..factories import ComplaintFactory
+
+TEXT = "El chofer iba hablando por celular y casi choca en la avenida principal"
+
+
+class TestComplaintDeduplication(StatisticalTestCase):
+    """Tests para la indexación al ingresar quejas."""
+
+    def setUp(self):
+        super().setUp()
+        self.unit = self.units_route1[0]
+        self.original = ComplaintFactory(unit=self.unit, reason=self.reason1, text=TEXT)
+
+    def test_signature_similarity_tracks_text_similarity(self):
+        """
+        Verifica que copias con cambios de formato tienen firma idéntica y
+        que textos distintos tienen similitud baja.
+        """
+        same = compute_signature(TEXT)
+        reformatted = compute_signature("¡¡EL CHOFER iba hablando por celular, y casi choca en la avenida principal!!")
+        different = compute_signature("La unidad estaba sucia y sin aire acondicionado")
+
+        self.assertEqual(estimate_similarity(same, reformatted), 1.0)
+        self.assertLess(estimate_similarity(same, different), 0.3)
+        self.assertIsNone(compute_signature("  ...  "))
+
+    def test_copy_pasted_complaints_point_to_original(self):
+        """
+        Verifica que cada copia (incluso con una palabra distinta) apunta a la
+        queja original y no a otra copia.
+        """
+        copy1 = ComplaintFactory(unit=self.unit, reason=self.reason1, text=TEXT)
+        copy2 = ComplaintFactory(unit=self.unit, reason=self.reason1, text=TEXT.replace("principal", "principal hoy"))
+
+        self.assertIsNone(self.original.fingerprint.duplicate_of_id)
+        self.assertEqual(ComplaintFingerprint.objects.get(complaint=copy1).duplicate_of_id, self.original.id)
+        self.assertEqual(ComplaintFingerprint.objects.get(complaint=copy2).duplicate_of_id, self.original.id)
+
+    def test_other_unit_or_outside_window_is_not_duplicate(self):
+        """
+        Verifica que la detección se limita a la misma unidad y a DEDUP_WINDOW.
+        """
+        other_unit = ComplaintFactory(unit=self.units_route1[1], reason=self.reason1, text=TEXT)
+        later = ComplaintFactory(
+            unit=self.unit, reason=self.reason1, text=TEXT,
+            submitted_at=self.original.submitted_at + timedelta(days=3),
+        )
+
+        self.assertIsNone(ComplaintFingerprint.objects.get(complaint=other_unit).duplicate_of_id)
+        self.assertIsNone(ComplaintFingerprint.objects.get(complaint=later).duplicate_of_id)
+
+    def test_dashboard_deduplicated_counts(self):
+        """
+        Verifica que deduplicate=True cuenta cada grupo de copias una sola vez.
+        """
+        ComplaintFactory(unit=self.unit, reason=self.reason1, text=TEXT)
+        ComplaintFactory(unit=self.unit, reason=self.reason1, text=TEXT)
+
+        stats = statistics_service.calculate_dashboard_statistics("all")
+        deduplicated = statistics_service.calculate_dashboard_statistics("all", deduplicate=True)
+
+        self.assertEqual(stats.total_complaints, 11)
+        self.assertEqual(deduplicated.total_complaints, 9)
+        self.assertEqual(
+            deduplicated.complaints_by_unit[self.unit.transit_number],
+            stats.complaints_by_unit[self.unit.transit_number] - 2,
+        )
+
+    def test_index_pending_complaints_backfills_in_order(self):
+        """
+        Verifica que el backfill indexa quejas sin firma en orden cronológico.
+        """
+        copy = ComplaintFactory(unit=self.unit, reason=self.reason1, text=TEXT)
+        ComplaintFingerprint.objects.all().delete()
+
+        indexed = dedup_service.index_pending_complaints()
+
+        self.assertEqual(indexed, 10)
+        self.assertEqual(ComplaintFingerprint.objects.get(complaint=copy).duplicate_of_id, self.original.id)
+
+
+class TestLazyMinhashImport(SimpleTestCase):
+    """NumPy solo se carga al indexar la primera queja, no al iniciar la app."""
+
+    def test_app_startup_does_not_import_numpy(self):
+        code = (
+            'import sys, django; django.setup(); '
+            'import apps.statistical_summary.signals; '
+            'print("numpy" in sys.modules)'
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code],
+            cwd=settings.BASE_DIR, capture_output=True, text=True, check=True,
+            env={**os.environ, 'DJANGO_SETTINGS_MODULE': 'buzon_quejas.settings'},
+        )
+
+        self.assertEqual(result.stdout.strip(), 'False')
@@ -0,0 +1,72 @@
+"""
+Tests para export_service.
+
+Verifica que la exportación genera una fila por envío con una columna
+por pregunta activa, tanto en CSV como en JSONL.
+"""
+import csv
+import io
+import json
+
+from apps.statistical_summary.services import export_service
+from .. import StatisticalTestCase
+
+
+class TestStreamExportCsv(StatisticalTestCase):
+    """Tests para export_service.stream_export() en formato CSV."""
+
+    def test_stream_export_csv_one_row_per_submission(self):
+        """
+        Verifica que el CSV tiene encabezado + una fila por envío y que
+        las columnas de preguntas contienen los valores esperados.
+        """
+        # Arrange
+        self.complaints[0].submission = self.submissions[0]
+        self.complaints[0].save()
+
+        # Act
+        content = ''.join(export_service.stream_export("csv", "all"))
+        rows = list(csv.DictReader(io.StringIO(content)))
+
+        # Assert
+        self.assertEqual(len(rows), 10)
+
+        first = rows[0]
+        self.assertEqual(first['unidad'], self.submissions[0].unit.transit_number)
+        self.assertEqual(first['ruta'], self.route1.name)
+        self.assertEqual(first[self.question_rating.text], '3')
+        self.assertEqual(first[self.question_choice1.text], 'Sí')
+        self.assertEqual(first[self.question_multi1.text], 'Wi-Fi; USB')
+        self.assertEqual(first['motivo_queja'], 'Mal servicio')
+        self.assertEqual(first['texto_queja'], 'Queja de prueba 1')
+
+        # Los envíos sin queja vinculada dejan las columnas vacías
+        self.assertEqual(rows[1]['motivo_queja'], '')
+
+    def test_stream_export_invalid_period_raises(self):
+        """
+        Verifica que un período inválido se reporta antes de iniciar el stream.
+        """
+        with self.assertRaises(ValueError):
+            export_service.stream_export("csv", "invalid")  # type: ignore
+
+
+class TestStreamExportJsonl(StatisticalTestCase):
+    """Tests para export_service.stream_export() en formato JSONL."""
+
+    def test_stream_export_jsonl_with_unit_filter(self):
+        """
+        Verifica que JSONL emite un objeto por línea y respeta el filtro de unidad.
+        """
+        # Arrange
+        unit = self.submissions[0].unit
+
+        # Act
+        lines = list(export_service.stream_export("jsonl", "all", unit_id=str(unit.id)))
+
+        # Assert
+        self.assertEqual(len(lines), 1)
+        record = json.loads(lines[0])
+        self.assertEqual(record['unidad'], unit.transit_number)
+        self.assertEqual(record[self.question_multi2.text], 'Puntualidad; Atención')
+        self.assertIsNone(record['motivo_queja'])
@@ -0,0 +1,84 @@
+"""
+Tests para search_service.
+
+Verifica la búsqueda de texto completo en español sobre quejas y
+respuestas TEXT: stemming, orden por relevancia y paginación.
+"""
+from apps.interview.models import Question
+from apps.statistical_summary.services import search_service
+from .. import StatisticalTestCase
+from ..factories import AnswerFactory, ComplaintFactory, QuestionFactory
+
+
+class TestSearchText(StatisticalTestCase):
+    """Tests para search_service.search_text()."""
+
+    def setUp(self):
+        super().setUp()
+        self.unit = self.units_route1[0]
+        self.complaint_brakes = ComplaintFactory(
+            unit=self.unit, reason=self.reason1,
+            text="El chofer no revisa los frenos y los frenos rechinan"
+        )
+        self.complaint_driver = ComplaintFactory(
+            unit=self.unit, reason=self.reason2, text="El chofer iba muy rápido"
+        )
+        question_text = QuestionFactory(
+            text="Comentarios", type=Question.QuestionType.TEXT, position=6
+        )
+        self.answer = AnswerFactory(
+            submission=self.submissions[0], question=question_text,
+            text_answer="Falla el freno de la unidad"
+        )
+
+    def test_search_text_uses_spanish_stemming(self):
+        """
+        Verifica que "freno" encuentra "frenos" en quejas y respuestas.
+        """
+        page = search_service.search_text("freno")
+
+        found = {(result.source, result.id) for result in page.results}
+        self.assertEqual(found, {
+            ('complaint', str(self.complaint_brakes.id)),
+            ('answer', str(self.answer.id)),
+        })
+
+    def test_search_text_orders_by_rank(self):
+        """
+        Verifica que la queja con más coincidencias aparece primero.
+        """
+        page = search_service.search_text("chofer frenos", source="complaints")
+
+        self.assertEqual(len(page.results), 1)
+        result = page.results[0]
+        self.assertEqual(result.id, str(self.complaint_brakes.id))
+        self.assertEqual(result.label, "Mal servicio")
+        self.assertEqual(result.transit_number, self.unit.transit_number)
+
+        page = search_service.search_text("chofer or frenos", source="complaints")
+        self.assertEqual(
+            [r.id for r in page.results],
+            [str(self.complaint_brakes.id), str(self.complaint_driver.id)],
+        )
+
+    def test_search_text_paginates_without_count(self):
+        """
+        Verifica que has_next se calcula con una fila extra.
+        """
+        first = search_service.search_text("chofer", page=1, page_size=1)
+        second = search_service.search_text("chofer", page=2, page_size=1)
+
+        self.assertTrue(first.has_next)
+        self.assertFalse(second.has_next)
+        self.assertNotEqual(first.results[0].id, second.results[0].id)
+
+    def test_search_text_invalid_params_raise(self):
+        """
+        Verifica que una consulta vacía o parámetros inválidos lanzan ValueError.
+        """
+        with self.assertRaises(ValueError):
+            search_service.search_text("   ")
+        with self.assertRaises(ValueError):
+            search_service.search_text("freno", source="quejas")  # type: ignore
+        with self.assertRaises(ValueError):
+            search_service.search_text("freno", page_size=1000)
@@ -0,0 +1,104 @@
+"""
+Tests para snapshot_service.
+
+Verifica que el snapshot columnar escribe particiones mensuales con
+respuestas en formato ancho y que el modo incremental solo reescribe
+los meses con cambios.
+"""
+import shutil
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+
+import pyarrow.parquet as pq
+from django.utils import timezone
+
+from apps.statistical_summary.services import snapshot_service
+from ..factories import SurveySubmissionFactory, AnswerFactory
+from .. import StatisticalTestCase
+
+
+class TestWriteTenantSnapshot(StatisticalTestCase):
+    """Tests para snapshot_service.write_tenant_snapshot()."""
+
+    def setUp(self):
+        super().setUp()
+        self.output_dir = Path(tempfile.mkdtemp())
+        self.month_key = timezone.localtime().strftime('%Y-%m')
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+        super().tearDown()
+
+    def test_write_tenant_snapshot_writes_wide_answers(self):
+        """
+        Verifica que se escriben envíos, quejas y una fila de respuestas
+        por envío con una columna por pregunta.
+        """
+        # Act
+        result = snapshot_service.write_tenant_snapshot('test', self.output_dir)
+
+        # Assert
+        self.assertEqual(result.months_written, [self.month_key])
+
+        tenant_dir = self.output_dir / 'test'
+        partition = f'month={self.month_key}'
+        submissions = pq.read_table(tenant_dir / 'submissions' / partition / 'part.parquet')
+        complaints = pq.read_table(tenant_dir / 'complaints' / partition / 'part.parquet')
+        answers = pq.read_table(tenant_dir / 'answers' / partition / 'part.parquet')
+
+        self.assertEqual(submissions.num_rows, 10)
+        self.assertEqual(complaints.num_rows, 8)
+        self.assertEqual(answers.num_rows, 10)
+        self.assertIn(str(self.question_rating.id), answers.column_names)
+
+        multi = answers.column(str(self.question_multi1.id)).to_pylist()
+        self.assertEqual(multi[0], ['Wi-Fi', 'USB'])
+
+        choice = answers.column(str(self.question_choice1.id)).to_pylist()
+        self.assertEqual(sorted(set(choice)), ['No', 'Sí'])
+
+    def test_write_tenant_snapshot_incremental_only_changed_months(self):
+        """
+        Verifica que el modo incremental no reescribe meses sin cambios
+        y sí escribe el mes de un envío nuevo.
+        """
+        # Arrange
+        snapshot_service.write_tenant_snapshot('test', self.output_dir)
+
+        # Act: sin cambios
+        unchanged = snapshot_service.write_tenant_snapshot(
+            'test', self.output_dir, incremental=True
+        )
+
+        # Assert
+        self.assertEqual(unchanged.months_written, [])
+
+        # Act: un envío nuevo
+        submission = SurveySubmissionFactory(unit=self.all_units[0])
+        AnswerFactory(submission=submission, question=self.question_rating, rating_answer=5)
+        changed = snapshot_service.write_tenant_snapshot(
+            'test', self.output_dir, incremental=True
+        )
+
+        # Assert
+        self.assertEqual(changed.months_written, [self.month_key])
+        submissions = pq.read_table(
+            self.output_dir / 'test' / 'submissions' / f'month={self.month_key}' / 'part.parquet'
+        )
+        self.assertEqual(submissions.num_rows, 11)
+
+    def test_write_tenant_snapshot_partitions_by_month(self):
+        """
+        Verifica que los envíos de otro mes se escriben en su propia partición.
+        """
+        # Arrange
+        old_date = timezone.now() - timedelta(days=70)
+        SurveySubmissionFactory(unit=self.all_units[0], submitted_at=old_date)
+
+        # Act
+        result = snapshot_service.write_tenant_snapshot('test', self.output_dir)
+
+        # Assert
+        self.assertEqual(len(result.months_written), 2)
+        self.assertIn(timezone.localtime(old_date).strftime('%Y-%m'), result.months_written)
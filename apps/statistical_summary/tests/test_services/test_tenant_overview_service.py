@@ -0,0 +1,97 @@
+"""
+Tests para tenant_overview_service.
+
+Verifica que los KPIs por organización calculados con UNION ALL desde el
+esquema público coinciden con el dashboard de cada tenant y que se
+reutilizan desde cache.
+"""
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Avg
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.interview.models import Answer, Question
+from apps.statistical_summary.services import statistics_service, tenant_overview_service
+from apps.statistical_summary.utils.date_utils import get_period_date_range
+from .. import StatisticalTestCase
+
+LOCAL_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+class TestTenantOverview(StatisticalTestCase):
+    """Tests para get_tenant_overview()."""
+
+    def setUp(self):
+        super().setUp()
+        # TenantTestCase no aplica override_settings a nivel de clase
+        local_cache = override_settings(CACHES=LOCAL_CACHE)
+        local_cache.enable()
+        self.addCleanup(local_cache.disable)
+        cache.clear()
+
+    def get_row(self, overview):
+        return next(row for row in overview.tenants if row.schema_name == self.tenant.schema_name)
+
+    def test_kpis_match_tenant_dashboard(self):
+        """
+        Verifica que envíos, quejas y promedio coinciden con el dashboard
+        del tenant para cada período.
+        """
+        rating_answers = Answer.objects.filter(
+            question__type=Question.QuestionType.RATING, question__active=True
+        )
+        # Respuestas capturadas hoy de envíos de hace 40 días: cuentan por submitted_at
+        backdated = list(rating_answers.order_by('id').values_list('id', flat=True)[:3])
+        rating_answers.filter(id__in=backdated).update(
+            submitted_at=timezone.now() - timedelta(days=40), rating_answer=1
+        )
+
+        for period in ["today", "month", "all"]:
+            with self.subTest(period=period):
+                expected = statistics_service.calculate_dashboard_statistics(period)
+                start_date, _ = get_period_date_range(period)
+                expected_rating = rating_answers.filter(
+                    **({'submitted_at__gte': start_date} if start_date else {})
+                ).aggregate(avg=Avg('rating_answer'))['avg']
+
+                connection.set_schema_to_public()
+                row = self.get_row(tenant_overview_service.get_tenant_overview(period))
+                connection.set_tenant(self.tenant)
+
+                self.assertEqual(row.total_submissions, expected.total_submissions)
+                self.assertEqual(row.total_complaints, expected.total_complaints)
+                self.assertAlmostEqual(row.average_rating, expected_rating)
+
+    def test_inactive_tenants_excluded(self):
+        """
+        Verifica que las organizaciones inactivas no aparecen.
+        """
+        self.tenant.is_active = False
+        self.tenant.save()
+
+        overview = tenant_overview_service.get_tenant_overview("all")
+
+        self.assertNotIn(self.tenant.schema_name, [row.schema_name for row in overview.tenants])
+
+    def test_cached_kpis_skip_aggregate_query(self):
+        """
+        Verifica que la segunda consulta solo lee la lista de organizaciones.
+        """
+        first = tenant_overview_service.get_tenant_overview("all")
+
+        with CaptureQueriesContext(connection) as queries:
+            second = tenant_overview_service.get_tenant_overview("all")
+
+        self.assertEqual(second, first)
+        self.assertFalse(any('UNION ALL' in query['sql'] for query in queries.captured_queries))
+
+    def test_invalid_period_raises(self):
+        """
+        Verifica que un período inválido lanza ValueError.
+        """
+        with self.assertRaises(ValueError):
+            tenant_overview_service.get_tenant_overview("invalid")  # type: ignore
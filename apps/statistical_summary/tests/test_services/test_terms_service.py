@@ -0,0 +1,164 @@
+"""
+Tests para terms_service.
+
+Verifica que los términos de quejas y respuestas TEXT se acumulan al
+guardarse y que el panel del dashboard agrega correctamente por período,
+ruta y pregunta.
+"""
+from datetime import timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.interview.models import Answer, Question
+from apps.statistical_summary.constants import DISPLAY_TIMEZONE
+from apps.statistical_summary.models import TermCount
+from apps.statistical_summary.services import terms_service
+from apps.statistical_summary.utils.text_utils import extract_terms
+from .. import StatisticalTestCase
+from ..factories import AnswerFactory, ComplaintFactory, QuestionFactory
+
+
+class TestExtractTerms(StatisticalTestCase):
+    """Tests para text_utils.extract_terms()."""
+
+    def test_extract_terms_removes_stopwords_and_short_words(self):
+        """
+        Verifica minúsculas, palabras vacías, longitud mínima y unicidad.
+        """
+        terms = extract_terms("El CHOFER no frenó, el chofer iba a 90 km/h")
+
+        self.assertEqual(terms, {'chofer', 'frenó', 'iba'})
+
+
+class TestTermFrequencies(StatisticalTestCase):
+    """Tests para el conteo incremental y get_term_frequencies()."""
+
+    def setUp(self):
+        super().setUp()
+        self.question_text = QuestionFactory(
+            text="Comentarios", type=Question.QuestionType.TEXT, position=6
+        )
+
+    def test_complaint_terms_counted_on_save(self):
+        """
+        Verifica que al crear quejas se acumulan sus términos por unidad.
+        """
+        # Arrange (las quejas base de StatisticalTestCase son "Queja de prueba N")
+        unit = self.units_route1[0]
+        ComplaintFactory(unit=unit, reason=self.reason1, text="Los frenos fallan")
+        ComplaintFactory(unit=unit, reason=self.reason1, text="Frenos y más frenos")
+
+        # Act
+        terms = terms_service.get_term_frequencies("all")
+
+        # Assert
+        self.assertEqual(terms.complaints['frenos'], 2)
+        self.assertEqual(terms.complaints['queja'], 8)
+        # Empates ordenados alfabéticamente
+        self.assertEqual(list(terms.complaints)[:2], ['prueba', 'queja'])
+
+    def test_answer_terms_grouped_by_question_and_filtered(self):
+        """
+        Verifica el panel por pregunta TEXT con filtros de ruta y período.
+        """
+        # Arrange
+        submission_route1 = self.submissions[0]  # unidad de la ruta 1
+        AnswerFactory(submission=submission_route1, question=self.question_text, text_answer="Unidad limpia")
+        # Capturada hoy, pero de un envío de hace 400 días: cuenta por submitted_at
+        old_submission = self.submissions[1]
+        old_answer = AnswerFactory(
+            submission=old_submission, question=self.question_text, text_answer="Unidad sucia",
+            unit_id=old_submission.unit_id, route_id=old_submission.route_id,
+            submitted_at=timezone.now() - timedelta(days=400),
+        )
+
+        # Act
+        month = terms_service.get_term_frequencies("month")
+        all_time = terms_service.get_term_frequencies("all")
+        route2 = terms_service.get_term_frequencies("all", route_id=str(self.route2.id))
+
+        # Assert
+        self.assertEqual(month.answers, {"Comentarios": {'limpia': 1, 'unidad': 1}})
+        self.assertEqual(all_time.answers["Comentarios"]['unidad'], 2)
+        self.assertEqual(route2.answers, {})
+        self.assertEqual(
+            TermCount.objects.get(term='sucia').day,
+            old_answer.submitted_at.astimezone(DISPLAY_TIMEZONE).date(),
+        )
+
+    def test_route_filter_uses_route_at_submission(self):
+        """
+        Verifica que el filtro de ruta usa la ruta registrada en el envío,
+        no la ruta actual de la unidad.
+        """
+        unit = self.units_route1[0]
+        submission = self.submissions[0]
+        self.assertEqual(submission.unit, unit)
+        AnswerFactory(submission=submission, question=self.question_text, text_answer="Asientos rotos")
+        ComplaintFactory(unit=unit, reason=None, text="Asientos rotos")
+
+        unit.route = self.route2
+        unit.save()
+
+        route1 = terms_service.get_term_frequencies("all", route_id=str(self.route1.id))
+        route2 = terms_service.get_term_frequencies("all", route_id=str(self.route2.id))
+        self.assertEqual(route1.answers["Comentarios"]['asientos'], 1)
+        self.assertEqual(route1.complaints['asientos'], 1)
+        self.assertNotIn("Comentarios", route2.answers)
+        self.assertNotIn('asientos', route2.complaints)
+
+    def test_delete_discounts_terms(self):
+        """
+        Verifica que eliminar una queja resta sus términos.
+        """
+        complaint = ComplaintFactory(unit=self.units_route1[0], reason=None, text="Frenos")
+
+        complaint.delete()
+
+        self.assertNotIn('frenos', terms_service.get_term_frequencies("all").complaints)
+
+    def test_cascade_delete_does_not_query_per_answer(self):
+        """
+        Verifica que eliminar un envío con muchas respuestas solo toca
+        TermCount por sus respuestas TEXT, sin cargar pregunta ni envío por fila.
+        """
+        submission = self.submissions[3]
+        AnswerFactory(submission=submission, question=self.question_text, text_answer="Frenos ruidosos")
+        non_text = Answer.objects.filter(submission=submission).exclude(question=self.question_text).count()
+        self.assertGreater(non_text, 0)
+        terms_service.get_text_question_ids()
+
+        with CaptureQueriesContext(connection) as queries:
+            submission.delete()
+
+        sql = [query['sql'] for query in queries]
+        self.assertEqual(sum('UPDATE "term_counts"' in statement for statement in sql), 1)
+        self.assertFalse([statement for statement in sql if 'FROM "questions"' in statement])
+        self.assertNotIn('frenos', terms_service.get_term_frequencies("all").answers.get("Comentarios", {}))
+
+    def test_text_question_ids_follow_question_changes(self):
+        """Verifica que cambiar el tipo de una pregunta descarta los ids cacheados."""
+        self.assertIn(self.question_text.id, terms_service.get_text_question_ids())
+
+        self.question_text.type = Question.QuestionType.RATING
+        self.question_text.save()
+
+        self.assertNotIn(self.question_text.id, terms_service.get_text_question_ids())
+
+    def test_rebuild_matches_incremental_counts(self):
+        """
+        Verifica que reconstruir desde cero produce los mismos conteos.
+        """
+        AnswerFactory(submission=self.submissions[2], question=self.question_text, text_answer="Buen chofer")
+        ComplaintFactory(unit=None, reason=None, text="Chofer grosero")
+        expected = set(TermCount.objects.values_list('day', 'unit_id', 'route_id', 'source', 'question_id', 'term', 'count'))
+
+        rows = terms_service.rebuild_term_counts()
+
+        self.assertEqual(rows, len(expected))
+        self.assertEqual(
+            set(TermCount.objects.values_list('day', 'unit_id', 'route_id', 'source', 'question_id', 'term', 'count')),
+            expected,
+        )
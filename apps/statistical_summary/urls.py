@@ -5,4 +5,6 @@ app_name = 'statistical_summary'
 
 urlpatterns = [
     path('dashboard/', views.DashboardView.as_view(), name='dashboard'),
+    path('export/', views.ExportView.as_view(), name='export'),
+    path('search/', views.SearchView.as_view(), name='search'),
 ]
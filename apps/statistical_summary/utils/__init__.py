@@ -1,9 +1,12 @@
 """Utilidades para statistical_summary."""
 from .date_utils import get_period_date_range
-from .filter_builder import build_submission_filters, build_complaint_filters
+from .filter_builder import build_submission_filters, build_complaint_filters, build_term_filters
+from .text_utils import extract_terms
 
 __all__ = [
     'get_period_date_range',
     'build_submission_filters',
     'build_complaint_filters',
+    'build_term_filters',
+    'extract_terms',
 ]
@@ -7,6 +7,8 @@ que se aplican a los querysets de Django ORM.
 from datetime import datetime
 from typing import Any
 
+from ..constants import DISPLAY_TIMEZONE
+
 
 def build_submission_filters(
     start_date: datetime | None,
@@ -36,16 +38,16 @@ def build_submission_filters(
         ...     unit_id=None
         ... )
         >>> print(filters)
-        {'submitted_at__gte': datetime(2024, 1, 1, 0, 0), 'unit__route_id': 'uuid-route'}
+        {'submitted_at__gte': datetime(2024, 1, 1, 0, 0), 'route_id': 'uuid-route'}
     """
     filters: dict[str, Any] = {}
     
     if start_date:
         filters['submitted_at__gte'] = start_date
     
-    # Filtros mutuamente excluyentes
+    # Filtros mutuamente excluyentes (route_id es la ruta al momento del envío)
     if route_id:
-        filters['unit__route_id'] = route_id
+        filters['route_id'] = route_id
     elif unit_id:
         filters['unit_id'] = unit_id
     
@@ -55,7 +57,8 @@ def build_submission_filters(
 def build_complaint_filters(
     start_date: datetime | None,
     route_id: str | None,
-    unit_id: str | None
+    unit_id: str | None,
+    deduplicate: bool = False
 ) -> dict[str, Any]:
     """
     Construye filtros para Complaint queryset.
@@ -67,6 +70,7 @@ def build_complaint_filters(
         start_date: Fecha mínima de submitted_at (None = sin filtro de fecha)
         route_id: ID de ruta para filtrar (None = sin filtro de ruta)
         unit_id: ID de unidad para filtrar (None = sin filtro de unidad)
+        deduplicate: True para excluir quejas marcadas como casi duplicadas
         
     Returns:
         Diccionario de filtros para Complaint.objects.filter(**filters)
@@ -81,10 +85,52 @@ def build_complaint_filters(
     if start_date:
         filters['submitted_at__gte'] = start_date
     
-    # Filtros mutuamente excluyentes
+    # Filtros mutuamente excluyentes (route_id es la ruta al momento de la queja)
     if route_id:
-        filters['unit__route_id'] = route_id
+        filters['route_id'] = route_id
     elif unit_id:
         filters['unit_id'] = unit_id
+
+    # Quejas sin firma (texto vacío o histórico sin indexar) cuentan como originales
+    if deduplicate:
+        filters['fingerprint__duplicate_of__isnull'] = True
     
     return filters
+
+
+def build_term_filters(
+    start_date: datetime | None,
+    route_id: str | None,
+    unit_id: str | None
+) -> dict[str, Any]:
+    """
+    Construye filtros para TermCount queryset.
+
+    TermCount está agregado por día local, por lo que el filtro de fecha
+    usa el día de start_date en DISPLAY_TIMEZONE.
+
+    Args:
+        start_date: Fecha mínima (None = sin filtro de fecha)
+        route_id: ID de ruta para filtrar (None = sin filtro de ruta)
+        unit_id: ID de unidad para filtrar (None = sin filtro de unidad)
+
+    Returns:
+        Diccionario de filtros para TermCount.objects.filter(**filters)
+
+    Example:
+        >>> filters = build_term_filters(None, None, "uuid-unit")
+        >>> print(filters)
+        {'unit_id': 'uuid-unit'}
+    """
+    filters: dict[str, Any] = {}
+
+    if start_date:
+        filters['day__gte'] = start_date.astimezone(DISPLAY_TIMEZONE).date()
+
+    # Filtros mutuamente excluyentes (route_id es la ruta al momento del envío)
+    if route_id:
+        filters['route_id'] = route_id
+    elif unit_id:
+        filters['unit_id'] = unit_id
+
+    return filters
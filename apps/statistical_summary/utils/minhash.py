@@ -0,0 +1,100 @@
+"""
+Utilidades MinHash/LSH para detectar textos casi duplicados.
+
+La firma de un texto son los mínimos de DEDUP_NUM_PERMUTATIONS funciones hash
+sobre sus shingles (subcadenas de DEDUP_SHINGLE_SIZE caracteres). La
+fracción de posiciones iguales entre dos firmas estima la similitud de
+Jaccard de los textos. Para buscar candidatos sin comparar todo contra todo,
+la firma se divide en DEDUP_BANDS bandas y cada banda se reduce a un bucket.
+"""
+import hashlib
+import re
+import unicodedata
+import zlib
+
+import numpy as np
+
+from ..constants import DEDUP_BANDS, DEDUP_NUM_PERMUTATIONS, DEDUP_SEED, DEDUP_SHINGLE_SIZE
+
+# Primo mayor que 2**32 para el hashing universal (a * x + b) mod p
+_PRIME = np.uint64(4294967311)
+
+# Coeficientes fijos (< 2**31 para que a * x + b no desborde uint64)
+_rng = np.random.default_rng(DEDUP_SEED)
+_A = _rng.integers(1, 2**31, size=DEDUP_NUM_PERMUTATIONS, dtype=np.uint64)
+_B = _rng.integers(0, 2**31, size=DEDUP_NUM_PERMUTATIONS, dtype=np.uint64)
+
+_NON_ALNUM_RE = re.compile(r'[\W_]+')
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normaliza un texto para comparar contenido y no formato.
+
+    Minúsculas, sin acentos y con cualquier puntuación o espacio repetido
+    reducido a un espacio.
+
+    Example:
+        >>> normalize_text("¡El CHOFER   no frenó!")
+        'el chofer no freno'
+    """
+    decomposed = unicodedata.normalize('NFKD', text.lower())
+    without_marks = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return _NON_ALNUM_RE.sub(' ', without_marks).strip()
+
+
+def compute_signature(text: str | None) -> np.ndarray | None:
+    """
+    Calcula la firma MinHash de un texto.
+
+    Args:
+        text: Texto de la queja
+
+    Returns:
+        Array uint32 de DEDUP_NUM_PERMUTATIONS elementos, o None si el texto
+        está vacío tras normalizar
+    """
+    normalized = normalize_text(text or '')
+    if not normalized:
+        return None
+
+    size = min(DEDUP_SHINGLE_SIZE, len(normalized))
+    shingles = {normalized[i:i + size] for i in range(len(normalized) - size + 1)}
+    hashes = np.fromiter(
+        (zlib.crc32(shingle.encode()) for shingle in shingles), dtype=np.uint64, count=len(shingles)
+    )
+
+    # Matriz (permutaciones x shingles) y mínimo por permutación
+    permuted = (np.outer(_A, hashes) + _B[:, None]) % _PRIME
+    return (permuted.min(axis=1) & np.uint64(0xFFFFFFFF)).astype(np.uint32)
+
+
+def band_buckets(signature: np.ndarray) -> list[int]:
+    """
+    Reduce cada banda de la firma a un entero de 64 bits con signo.
+
+    Args:
+        signature: Firma de compute_signature()
+
+    Returns:
+        Lista de DEDUP_BANDS buckets (el índice es el número de banda)
+    """
+    return [
+        int.from_bytes(hashlib.blake2b(band.tobytes(), digest_size=8).digest(), 'little', signed=True)
+        for band in np.split(signature, DEDUP_BANDS)
+    ]
+
+
+def estimate_similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Similitud de Jaccard estimada (fracción de mínimos iguales)."""
+    return float(np.mean(a == b))
+
+
+def signature_to_bytes(signature: np.ndarray) -> bytes:
+    """Serializa una firma para BinaryField."""
+    return signature.astype('<u4').tobytes()
+
+
+def signature_from_bytes(data: bytes | memoryview) -> np.ndarray:
+    """Deserializa una firma guardada con signature_to_bytes()."""
+    return np.frombuffer(bytes(data), dtype='<u4')
@@ -0,0 +1,42 @@
+"""
+Utilidades de texto para el análisis de frecuencia de términos.
+
+Este módulo tokeniza los textos libres (quejas y respuestas TEXT) en
+palabras normalizadas, descartando palabras vacías en español.
+"""
+import re
+import unicodedata
+
+from ..constants import SPANISH_STOPWORDS, TERM_MAX_LENGTH, TERM_MIN_LENGTH
+
+# Secuencias de letras (incluye acentos y ñ; excluye dígitos y guiones bajos)
+_WORD_RE = re.compile(r"[^\W\d_]+")
+
+
+def extract_terms(text: str | None) -> set[str]:
+    """
+    Obtiene los términos distintos de un texto.
+
+    Normaliza a minúsculas (NFC, para que "camión" escrito con acento
+    combinado cuente igual) y descarta palabras vacías y palabras más cortas
+    que TERM_MIN_LENGTH.
+
+    Args:
+        text: Texto libre (None o vacío devuelve un conjunto vacío)
+
+    Returns:
+        Conjunto de términos del texto
+
+    Example:
+        >>> sorted(extract_terms("El chofer no respetó el semáforo"))
+        ['chofer', 'respetó', 'semáforo']
+    """
+    if not text:
+        return set()
+
+    normalized = unicodedata.normalize('NFC', text).lower()
+    return {
+        word[:TERM_MAX_LENGTH]
+        for word in _WORD_RE.findall(normalized)
+        if len(word) >= TERM_MIN_LENGTH and word not in SPANISH_STOPWORDS
+    }
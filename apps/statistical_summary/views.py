@@ -4,13 +4,22 @@ Views para statistical_summary.
 Este módulo contiene las vistas CBV para el dashboard de estadísticas,
 delegando toda la lógica de negocio a los services.
 """
-from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
+from dataclasses import asdict
+
+from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin, UserPassesTestMixin
+from django.http import HttpResponseBadRequest, JsonResponse, StreamingHttpResponse
+from django.views import View
 from django.views.generic import TemplateView
 from typing import Any
 
 from .services.statistics_service import calculate_dashboard_statistics
+from .services.export_service import stream_export
+from .services.search_service import search_text
+from .services.terms_service import get_term_frequencies
+from .services.tenant_overview_service import get_tenant_overview
 from .repositories.transport_repository import get_filter_data
-from .schemas import PeriodType
+from .constants import EXPORT_CONTENT_TYPES, SEARCH_PAGE_SIZE
+from .schemas import ExportFormat, PeriodType, SearchSource
 
 
 class DashboardView(LoginRequiredMixin, PermissionRequiredMixin, TemplateView):
@@ -25,6 +34,7 @@ class DashboardView(LoginRequiredMixin, PermissionRequiredMixin, TemplateView):
         - period: "today" | "week" | "month" | "year" | "all" (default: "today")
         - route: UUID de ruta
         - unit: UUID de unidad (mutuamente excluyente con route)
+        - dedup: "1" para contar las quejas casi duplicadas una sola vez
     
     Template:
         statistical_summary/statistics_dashboard.html
@@ -53,6 +63,8 @@ class DashboardView(LoginRequiredMixin, PermissionRequiredMixin, TemplateView):
         period: PeriodType = self.request.GET.get('period', 'today')  # type: ignore
         route_id = self.request.GET.get('route')
         unit_id = self.request.GET.get('unit')
+        # Contar las quejas casi duplicadas una sola vez (opcional)
+        deduplicate = self.request.GET.get('dedup') == '1'
         
         # Si ambos filtros están presentes, priorizar ruta y limpiar unidad
         if route_id and unit_id:
@@ -60,8 +72,11 @@ class DashboardView(LoginRequiredMixin, PermissionRequiredMixin, TemplateView):
         
         try:
             # Calcular estadísticas usando el service principal
-            statistics = calculate_dashboard_statistics(period, route_id, unit_id)
+            statistics = calculate_dashboard_statistics(period, route_id, unit_id, deduplicate)
             
+            # Palabras frecuentes en textos libres (quejas y preguntas TEXT)
+            term_frequencies = get_term_frequencies(period, route_id, unit_id)
+
             # Obtener datos para los filtros (rutas y unidades)
             filters_data = get_filter_data()
             
@@ -74,8 +89,10 @@ class DashboardView(LoginRequiredMixin, PermissionRequiredMixin, TemplateView):
                 'organization_name': self.request.tenant.name,
                 'selected_route': route_id,
                 'selected_unit': unit_id,
+                'deduplicate': deduplicate,
                 # Objeto completo con todas las estadísticas
                 'statistics': statistics,
+                'term_frequencies': term_frequencies,
                 # Datos para filtros (rutas y unidades)
                 'filters_data': filters_data,
             })
@@ -95,3 +112,136 @@ class DashboardView(LoginRequiredMixin, PermissionRequiredMixin, TemplateView):
             })
         
         return context
+
+
+class ExportView(LoginRequiredMixin, PermissionRequiredMixin, View):
+    """
+    Exportación en streaming de las respuestas de encuestas.
+
+    Emite una fila por envío (unidad, ruta, fecha, una columna por pregunta
+    activa y motivo/texto de la queja) usando StreamingHttpResponse, por lo
+    que la memoria usada es constante sin importar el tamaño del tenant.
+
+    Requiere:
+        - Usuario autenticado (LoginRequiredMixin)
+        - Permiso 'can_export_survey_data'
+
+    Parámetros GET:
+        - format: "csv" | "jsonl" (default: "csv")
+        - period, route, unit: mismos filtros que DashboardView
+    """
+    permission_required = 'statistical_summary.can_export_survey_data'
+
+    def get(self, request, *args: Any, **kwargs: Any):
+        """
+        Devuelve el archivo de exportación como descarga.
+
+        Returns:
+            StreamingHttpResponse con el archivo, o HttpResponseBadRequest
+            si los parámetros no son válidos
+        """
+        export_format: ExportFormat = request.GET.get('format', 'csv')  # type: ignore
+        period: PeriodType = request.GET.get('period', 'today')  # type: ignore
+        route_id = request.GET.get('route')
+        unit_id = request.GET.get('unit')
+
+        # Misma prioridad que el dashboard: la ruta gana sobre la unidad
+        if route_id and unit_id:
+            unit_id = None
+
+        if export_format not in EXPORT_CONTENT_TYPES:
+            return HttpResponseBadRequest(f'Formato de exportación no soportado: {export_format}')
+
+        try:
+            lines = stream_export(export_format, period, route_id, unit_id)
+        except ValueError as e:
+            return HttpResponseBadRequest(f'Error en los parámetros: {str(e)}')
+
+        response = StreamingHttpResponse(lines, content_type=EXPORT_CONTENT_TYPES[export_format])
+        filename = f'encuestas_{request.tenant.schema_name}_{period}.{export_format}'
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+
+class SearchView(LoginRequiredMixin, PermissionRequiredMixin, View):
+    """
+    Búsqueda de texto completo (JSON) en quejas y respuestas de texto.
+
+    Usa el tsvector en español con índice GIN de cada tenant, por lo que
+    "frenos" también encuentra "freno" sin recorrer la tabla completa.
+
+    Requiere:
+        - Usuario autenticado (LoginRequiredMixin)
+        - Permisos de lectura de quejas y respuestas
+
+    Parámetros GET:
+        - q: Consulta ("chofer frenos", "frase exacta", -palabra)
+        - source: "all" | "complaints" | "answers" (default: "all")
+        - page: Número de página (default: 1)
+        - page_size: Resultados por página (default: SEARCH_PAGE_SIZE)
+    """
+    permission_required = ('interview.view_complaint', 'interview.view_answer')
+
+    def get(self, request, *args: Any, **kwargs: Any):
+        """
+        Devuelve una página de resultados ordenados por relevancia.
+
+        Returns:
+            JsonResponse con query, page, page_size, has_next y results,
+            o HttpResponseBadRequest si los parámetros no son válidos
+        """
+        source: SearchSource = request.GET.get('source', 'all')  # type: ignore
+
+        try:
+            page = int(request.GET.get('page', 1))
+            page_size = int(request.GET.get('page_size', SEARCH_PAGE_SIZE))
+            results = search_text(request.GET.get('q', ''), source, page, page_size)
+        except ValueError as e:
+            return HttpResponseBadRequest(f'Error en los parámetros: {str(e)}')
+
+        return JsonResponse(asdict(results))
+
+
+class ExecutiveDashboardView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
+    """
+    Dashboard ejecutivo con los KPIs de todas las organizaciones activas.
+
+    Se sirve desde el esquema público (urls_public) y solo para
+    superusuarios del super-admin.
+
+    Filtros soportados (GET params):
+        - period: "today" | "week" | "month" | "year" | "all" (default: "month")
+
+    Template:
+        statistical_summary/executive_dashboard.html
+    """
+    template_name = "statistical_summary/executive_dashboard.html"
+    login_url = '/super-admin/login/'
+
+    def test_func(self) -> bool:
+        return self.request.user.is_superuser
+
+    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        """
+        Prepara el contexto con los KPIs por organización.
+
+        Returns:
+            Diccionario con datos para el template
+        """
+        context = super().get_context_data(**kwargs)
+        period: PeriodType = self.request.GET.get('period', 'month')  # type: ignore
+
+        try:
+            context.update({
+                'has_data': True,
+                'period': period,
+                'title': 'Dashboard Ejecutivo',
+                'overview': get_tenant_overview(period),
+            })
+        except ValueError as e:
+            context.update({
+                'error_message': f'Error en los parámetros: {str(e)}',
+                'has_data': False,
+            })
+
+        return context
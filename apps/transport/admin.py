@@ -1,12 +1,18 @@
-from django.contrib import admin
+from django.contrib import admin, messages
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.contrib.auth.admin import GroupAdmin, UserAdmin
+from django.core.exceptions import PermissionDenied
+from django.shortcuts import redirect
+from django.template.response import TemplateResponse
+from django.urls import path, reverse
 
 
 from django.utils.translation import gettext_lazy as _
 
 
+from .forms import FleetImportForm
+from .importers import FleetImportError, import_fleet, iter_file_rows
 from .models import Route, Unit
 
 User = get_user_model()
@@ -137,6 +143,8 @@ class RouteAdmin(admin.ModelAdmin):
     search_fields = ('name',)
     readonly_fields = ('created_at', 'updated_at')
     exclude = ('metadata',)
+    # botón "Importar flota" (la importación vive en UnitAdmin)
+    change_list_template = 'admin/transport/fleet_import_change_list.html'
 
 class UnitAdmin(admin.ModelAdmin):
     list_display = ('transit_number', 'internal_number', 'owner', 'route', 'created_at', 'updated_at')
@@ -145,6 +153,54 @@ class UnitAdmin(admin.ModelAdmin):
     readonly_fields = ('created_at', 'updated_at')
     # hide metadata from admin and prevent editing through admin UI
     exclude = ('metadata',)
+    change_list_template = 'admin/transport/fleet_import_change_list.html'
+
+    def get_urls(self):
+        urls = [
+            path(
+                'import/',
+                self.admin_site.admin_view(self.import_view),
+                name='transport_unit_import',
+            ),
+        ]
+        return urls + super().get_urls()
+
+    def import_view(self, request):
+        """
+        Importa rutas y unidades desde un CSV/XLSX.
+
+        Si alguna fila tiene errores no se guarda nada y se muestran los
+        errores por fila; si no, redirige al listado de unidades.
+        """
+        if not (self.has_add_permission(request) and self.has_change_permission(request)):
+            raise PermissionDenied
+
+        request.current_app = self.admin_site.name
+        result = None
+        form = FleetImportForm(request.POST or None, request.FILES or None)
+
+        if request.method == 'POST' and form.is_valid():
+            try:
+                result = import_fleet(iter_file_rows(form.cleaned_data['file']))
+            except FleetImportError as exc:
+                form.add_error('file', str(exc))
+            else:
+                if result.ok:
+                    messages.success(
+                        request,
+                        f'Importación completada: {result.created_units} unidades nuevas, '
+                        f'{result.updated_units} actualizadas y {result.created_routes} rutas nuevas.',
+                    )
+                    return redirect(reverse(f'{self.admin_site.name}:transport_unit_changelist'))
+
+        context = {
+            **self.admin_site.each_context(request),
+            'title': 'Importar flota',
+            'opts': self.opts,
+            'form': form,
+            'result': result,
+        }
+        return TemplateResponse(request, 'admin/transport/unit/import.html', context)
 
 
 tenant_admin_site = TenantAdminSite(name='transport_admin')
@@ -0,0 +1,15 @@
+from django import forms
+from django.core.validators import FileExtensionValidator
+
+
+class FleetImportForm(forms.Form):
+    """
+    Formulario para importar rutas y unidades desde un archivo CSV o XLSX.
+    """
+
+    file = forms.FileField(
+        label='Archivo',
+        help_text='CSV (UTF-8) o XLSX con las columnas transit_number, internal_number, owner y route.',
+        validators=[FileExtensionValidator(allowed_extensions=['csv', 'xlsx'])],
+        widget=forms.ClearableFileInput(attrs={'class': 'form-control', 'accept': '.csv,.xlsx'}),
+    )
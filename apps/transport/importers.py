@@ -0,0 +1,349 @@
+"""
+Importación masiva de la flota (rutas y unidades) desde CSV o XLSX.
+
+El archivo se lee fila por fila (CSV con ``csv``; XLSX descomprimiendo la
+hoja y recorriendo su XML con ``iterparse``, sin dependencias extra) y se
+escribe por lotes:
+
+- Rutas: se buscan por nombre y las que faltan se crean con ``bulk_create``.
+- Unidades: ``bulk_create(update_conflicts=True)`` sobre ``transit_number``
+  (crea las nuevas y actualiza las existentes en un solo INSERT por lote).
+
+Todo corre en una transacción: si alguna fila tiene errores no se guarda
+nada y se reportan los errores con su número de fila.
+
+Columnas (encabezado en la primera fila; también en español):
+    transit_number (número de tránsito, obligatorio), internal_number,
+    owner, route (nombre de la ruta; vacío = sin ruta)
+"""
+import csv
+import io
+import unicodedata
+import zipfile
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from xml.etree.ElementTree import iterparse
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Route, Unit
+
+# Filas por INSERT
+IMPORT_BATCH_SIZE = 500
+
+# Errores que se reportan como máximo (el resto solo se cuenta)
+MAX_REPORTED_ERRORS = 100
+
+# Encabezado normalizado → campo
+HEADER_FIELDS = {
+    'transit_number': 'transit_number',
+    'numero_de_transito': 'transit_number',
+    'numero_transito': 'transit_number',
+    'internal_number': 'internal_number',
+    'numero_interno': 'internal_number',
+    'numero_de_interno': 'internal_number',
+    'owner': 'owner',
+    'propietario': 'owner',
+    'route': 'route',
+    'ruta': 'route',
+}
+
+XLSX_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+XLSX_REL_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+XLSX_PKG_REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+
+class FleetImportError(Exception):
+    """El archivo no se puede leer (formato o encabezado inválido)."""
+
+
+@dataclass
+class ImportRowError:
+    row: int
+    message: str
+
+
+@dataclass
+class FleetImportResult:
+    """Resumen de una importación."""
+    rows: int = 0
+    created_units: int = 0
+    updated_units: int = 0
+    created_routes: int = 0
+    error_count: int = 0
+    errors: list[ImportRowError] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.error_count == 0
+
+    def add_error(self, row: int, message: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(ImportRowError(row, message))
+
+
+def iter_file_rows(uploaded_file) -> Iterator[tuple[int, dict[str, str]]]:
+    """
+    Lee las filas de un archivo CSV o XLSX.
+
+    Args:
+        uploaded_file: Archivo subido (o cualquier archivo binario con ``name``)
+
+    Returns:
+        Iterador de tuplas (número_de_fila, {campo: valor}); el número de
+        fila es el del archivo (el encabezado es la fila 1)
+
+    Raises:
+        FleetImportError: Si la extensión no es .csv/.xlsx, el archivo está
+            dañado o falta la columna transit_number
+    """
+    name = (getattr(uploaded_file, 'name', '') or '').lower()
+
+    if name.endswith('.csv'):
+        values = _iter_csv_values(uploaded_file)
+    elif name.endswith('.xlsx'):
+        values = _iter_xlsx_values(uploaded_file)
+    else:
+        raise FleetImportError('Formato no soportado: usa un archivo .csv o .xlsx')
+
+    return _map_header(values)
+
+
+def import_fleet(rows: Iterable[tuple[int, dict[str, str]]]) -> FleetImportResult:
+    """
+    Valida e importa rutas y unidades en el tenant actual.
+
+    Args:
+        rows: Filas como las entrega iter_file_rows()
+
+    Returns:
+        Resumen; si ``result.ok`` es False no se guardó ningún cambio
+
+    Example:
+        >>> result = import_fleet(iter_file_rows(request.FILES['file']))
+        >>> result.created_units, result.updated_units, result.error_count
+        (1980, 20, 0)
+    """
+    result = FleetImportResult()
+    seen: dict[str, int] = {}
+    route_ids: dict[str, object] = {}
+    batch: list[dict[str, str]] = []
+
+    with transaction.atomic():
+        for row_number, values in rows:
+            result.rows += 1
+            data, message = _clean_row(values)
+
+            if message is None and data['transit_number'] in seen:
+                message = f"transit_number {data['transit_number']} repetido (fila {seen[data['transit_number']]})"
+
+            if message:
+                result.add_error(row_number, message)
+                continue
+
+            seen[data['transit_number']] = row_number
+            batch.append(data)
+
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                _write_batch(batch, route_ids, result)
+                batch = []
+
+        if batch:
+            _write_batch(batch, route_ids, result)
+
+        if not result.ok:
+            transaction.set_rollback(True)
+
+    return result
+
+
+def _clean_row(values: dict[str, str]) -> tuple[dict[str, str], str | None]:
+    """Normaliza una fila y valida longitudes (según los campos del modelo)."""
+    data = {name: (values.get(name) or '').strip() for name in ('transit_number', 'internal_number', 'owner', 'route')}
+
+    if not data['transit_number']:
+        return data, 'transit_number es obligatorio'
+
+    limits = {
+        'transit_number': Unit._meta.get_field('transit_number').max_length,
+        'internal_number': Unit._meta.get_field('internal_number').max_length,
+        'owner': Unit._meta.get_field('owner').max_length,
+        'route': Route._meta.get_field('name').max_length,
+    }
+    for name, limit in limits.items():
+        if len(data[name]) > limit:
+            return data, f'{name} excede {limit} caracteres'
+
+    return data, None
+
+
+def _write_batch(batch: list[dict[str, str]], route_ids: dict[str, object], result: FleetImportResult) -> None:
+    """Crea las rutas faltantes y hace upsert de las unidades del lote."""
+    missing_routes = {data['route'] for data in batch if data['route']} - route_ids.keys()
+    if missing_routes:
+        # Si hay rutas con el mismo nombre se usa la más antigua
+        for name, route_id in (
+            Route.objects.filter(name__in=missing_routes).order_by('-created_at').values_list('name', 'id')
+        ):
+            route_ids[name] = route_id
+
+        new_routes = [Route(name=name) for name in sorted(missing_routes - route_ids.keys())]
+        Route.objects.bulk_create(new_routes)
+        route_ids.update((route.name, route.id) for route in new_routes)
+        result.created_routes += len(new_routes)
+
+    transit_numbers = [data['transit_number'] for data in batch]
+    existing = set(Unit.objects.filter(transit_number__in=transit_numbers).values_list('transit_number', flat=True))
+
+    now = timezone.now()
+    Unit.objects.bulk_create(
+        [
+            Unit(
+                transit_number=data['transit_number'],
+                internal_number=data['internal_number'],
+                owner=data['owner'] or None,
+                route_id=route_ids.get(data['route']),
+                updated_at=now,
+            )
+            for data in batch
+        ],
+        update_conflicts=True,
+        unique_fields=['transit_number'],
+        update_fields=['internal_number', 'owner', 'route', 'updated_at'],
+    )
+
+    result.updated_units += len(existing)
+    result.created_units += len(batch) - len(existing)
+
+
+def _map_header(values: Iterator[list[str]]) -> Iterator[tuple[int, dict[str, str]]]:
+    """Convierte listas de valores en diccionarios según el encabezado."""
+    header = next(values, None)
+    if header is None:
+        raise FleetImportError('El archivo está vacío')
+
+    fields = [HEADER_FIELDS.get(_normalize_header(name)) for name in header]
+    if 'transit_number' not in fields:
+        raise FleetImportError('Falta la columna transit_number (o "número de tránsito") en el encabezado')
+
+    for row_number, row in enumerate(values, start=2):
+        if not any((value or '').strip() for value in row):
+            continue
+        yield row_number, {name: value for name, value in zip(fields, row) if name}
+
+
+def _normalize_header(name: str) -> str:
+    """'Número de tránsito' → 'numero_de_transito'."""
+    text = unicodedata.normalize('NFKD', str(name or '')).encode('ascii', 'ignore').decode()
+    return '_'.join(text.lower().split())
+
+
+def _iter_csv_values(uploaded_file) -> Iterator[list[str]]:
+    """Filas del CSV (UTF-8, con o sin BOM; separador , o ; detectado)."""
+    text = io.TextIOWrapper(uploaded_file, encoding='utf-8-sig', newline='')
+    try:
+        sample = text.read(4096)
+        dialect = csv.Sniffer().sniff(sample, delimiters=',;\t') if sample else csv.excel
+    except csv.Error:
+        dialect = csv.excel
+    except UnicodeDecodeError:
+        raise FleetImportError('El CSV debe estar codificado en UTF-8')
+
+    text.seek(0)
+    try:
+        yield from csv.reader(text, dialect)
+    except (csv.Error, UnicodeDecodeError) as exc:
+        raise FleetImportError(f'CSV inválido: {exc}')
+    finally:
+        # No cerrar el archivo subido junto con el wrapper
+        text.detach()
+
+
+def _iter_xlsx_values(uploaded_file) -> Iterator[list[str]]:
+    """Filas de la primera hoja del XLSX, leídas en streaming desde el XML."""
+    try:
+        archive = zipfile.ZipFile(uploaded_file)
+        shared_strings = _read_shared_strings(archive)
+        sheet_path = _first_sheet_path(archive)
+        sheet = archive.open(sheet_path)
+    except (zipfile.BadZipFile, KeyError) as exc:
+        raise FleetImportError(f'XLSX inválido: {exc}')
+
+    with archive, sheet:
+        for _, element in iterparse(sheet):
+            if element.tag != f'{XLSX_NS}row':
+                continue
+
+            row: list[str] = []
+            for cell in element.iter(f'{XLSX_NS}c'):
+                index = _column_index(cell.get('r', ''), default=len(row))
+                row.extend([''] * (index - len(row)))
+                row.append(_cell_value(cell, shared_strings))
+
+            element.clear()
+            yield row
+
+
+def _read_shared_strings(archive: zipfile.ZipFile) -> list[str]:
+    try:
+        source = archive.open('xl/sharedStrings.xml')
+    except KeyError:
+        return []
+
+    strings = []
+    with source:
+        for _, element in iterparse(source):
+            if element.tag == f'{XLSX_NS}si':
+                strings.append(''.join(text.text or '' for text in element.iter(f'{XLSX_NS}t')))
+                element.clear()
+    return strings
+
+
+def _first_sheet_path(archive: zipfile.ZipFile) -> str:
+    """Ruta dentro del ZIP de la primera hoja del libro."""
+    with archive.open('xl/workbook.xml') as workbook:
+        sheet = next(
+            element for _, element in iterparse(workbook) if element.tag == f'{XLSX_NS}sheet'
+        )
+    relationship_id = sheet.get(f'{XLSX_REL_NS}id')
+
+    with archive.open('xl/_rels/workbook.xml.rels') as rels:
+        for _, element in iterparse(rels):
+            if element.tag == f'{XLSX_PKG_REL_NS}Relationship' and element.get('Id') == relationship_id:
+                target = element.get('Target')
+                return target.lstrip('/') if target.startswith('/') else f'xl/{target}'
+
+    raise KeyError('hoja no encontrada')
+
+
+def _column_index(reference: str, default: int) -> int:
+    """'C7' → 2 (columna base 0)."""
+    letters = ''.join(char for char in reference if char.isalpha())
+    if not letters:
+        return default
+
+    index = 0
+    for char in letters.upper():
+        index = index * 26 + ord(char) - ord('A') + 1
+    return index - 1
+
+
+def _cell_value(cell, shared_strings: list[str]) -> str:
+    cell_type = cell.get('t')
+
+    if cell_type == 'inlineStr':
+        return ''.join(text.text or '' for text in cell.iter(f'{XLSX_NS}t'))
+
+    value = cell.find(f'{XLSX_NS}v')
+    if value is None or value.text is None:
+        return ''
+    if cell_type == 's':
+        return shared_strings[int(value.text)]
+
+    text = value.text
+    # Números enteros guardados como float por Excel ("1234.0")
+    if cell_type in (None, 'n') and text.endswith('.0'):
+        text = text[:-2]
+    return text
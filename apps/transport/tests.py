@@ -1,3 +1,167 @@
-from django.test import TestCase
+"""
+Tests de la importación masiva de flota (CSV/XLSX) del admin de transporte.
+"""
+import io
+import zipfile
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django_tenants.test.client import TenantClient
+
+from apps.interview.tests import TEST_SETTINGS
+from apps.statistical_summary.tests import StatisticalTestCase
+from apps.transport import importers
+from apps.transport.importers import FleetImportError, import_fleet, iter_file_rows
+from apps.transport.models import Route, Unit
+
+
+def csv_file(lines, name='flota.csv'):
+    return SimpleUploadedFile(name, '\n'.join(lines).encode('utf-8-sig'), content_type='text/csv')
+
+
+def xlsx_file(rows, name='flota.xlsx'):
+    """XLSX mínimo (una hoja, celdas de texto en línea) sin dependencias."""
+    ns = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+    rel_ns = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+
+    sheet_rows = ''.join(
+        f'<row r="{r}">' + ''.join(
+            f'<c r="{chr(65 + c)}{r}" t="inlineStr"><is><t>{value}</t></is></c>'
+            for c, value in enumerate(row) if value != ''
+        ) + '</row>'
+        for r, row in enumerate(rows, start=1)
+    )
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr(
+            'xl/workbook.xml',
+            f'<workbook xmlns="{ns}" xmlns:r="{rel_ns}"><sheets>'
+            f'<sheet name="Flota" sheetId="1" r:id="rId1"/></sheets></workbook>',
+        )
+        archive.writestr(
+            'xl/_rels/workbook.xml.rels',
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Type="worksheet" Target="worksheets/sheet1.xml"/></Relationships>',
+        )
+        archive.writestr('xl/worksheets/sheet1.xml', f'<worksheet xmlns="{ns}"><sheetData>{sheet_rows}</sheetData></worksheet>')
+
+    return SimpleUploadedFile(name, buffer.getvalue())
+
+
+class TestFleetImport(StatisticalTestCase):
+    """Tests de importers.import_fleet."""
+
+    def test_creates_and_updates_units_in_batches(self):
+        """
+        Verifica que se crean unidades nuevas, se actualizan las existentes
+        (por transit_number) y las rutas se reutilizan o crean por nombre.
+        """
+        lines = ['transit_number,internal_number,owner,route']
+        lines += [f'NEW{i:04d},{i},Dueño {i},Ruta Centro-Norte' for i in range(25)]
+        lines += ['ABC001,INT-NUEVO,,Ruta Sur']
+
+        with mock.patch.object(importers, 'IMPORT_BATCH_SIZE', 10):
+            result = import_fleet(iter_file_rows(csv_file(lines)))
+
+        self.assertTrue(result.ok)
+        self.assertEqual((result.created_units, result.updated_units, result.created_routes), (25, 1, 1))
+        self.assertEqual(Unit.objects.filter(route=self.route1, transit_number__startswith='NEW').count(), 25)
+
+        updated = Unit.objects.get(transit_number='ABC001')
+        self.assertEqual(updated.internal_number, 'INT-NUEVO')
+        self.assertIsNone(updated.owner)
+        self.assertEqual(updated.route.name, 'Ruta Sur')
+        self.assertEqual(Unit.objects.count(), 20 + 25)
+
+    def test_query_count_depends_on_batches_not_rows(self):
+        """Verifica que importar 10 o 40 filas (un lote) cuesta los mismos queries."""
+        def count_queries(rows):
+            lines = ['transit_number,route'] + [f'Q{rows}-{i},{self.route1.name}' for i in range(rows)]
+            with CaptureQueriesContext(connection) as queries:
+                self.assertTrue(import_fleet(iter_file_rows(csv_file(lines))).ok)
+            return len(queries)
+
+        self.assertEqual(count_queries(10), count_queries(40))
+
+    def test_row_errors_roll_back_everything(self):
+        """Verifica que con errores de fila no se guarda nada y se reporta cada fila."""
+        lines = [
+            'Número de tránsito;Propietario;Ruta',
+            'OK001;Ana;Ruta Nueva',
+            ';Sin número;',
+            'OK001;Repetido;',
+            f"{'X' * 30};Largo;",
+        ]
+
+        result = import_fleet(iter_file_rows(csv_file(lines)))
+
+        self.assertFalse(result.ok)
+        self.assertEqual([error.row for error in result.errors], [3, 4, 5])
+        self.assertIn('repetido (fila 2)', result.errors[1].message)
+        self.assertFalse(Unit.objects.filter(transit_number='OK001').exists())
+        self.assertFalse(Route.objects.filter(name='Ruta Nueva').exists())
+
+    def test_reads_xlsx(self):
+        """Verifica la lectura en streaming de la primera hoja de un XLSX."""
+        rows = [
+            ['transit_number', 'internal_number', 'owner', 'route'],
+            ['XL001', '7', '', 'Ruta Este-Oeste'],
+            ['', '', '', ''],
+            ['XL002', '', 'Luis', ''],
+        ]
+
+        parsed = list(iter_file_rows(xlsx_file(rows)))
+
+        self.assertEqual([row for row, _ in parsed], [2, 4])
+        self.assertEqual(parsed[0][1]['route'], 'Ruta Este-Oeste')
+        self.assertEqual(parsed[1][1]['owner'], 'Luis')
+
+    def test_rejects_unknown_format_and_missing_header(self):
+        """Verifica los errores de archivo (formato y encabezado)."""
+        with self.assertRaises(FleetImportError):
+            iter_file_rows(SimpleUploadedFile('flota.txt', b'transit_number'))
+
+        with self.assertRaises(FleetImportError):
+            list(iter_file_rows(csv_file(['placa,ruta', 'A1,R1'])))
+
+
+class TestFleetImportAdmin(StatisticalTestCase):
+    """Tests de la vista de importación del admin de tenant."""
+
+    def setUp(self):
+        super().setUp()
+        test_settings = override_settings(**TEST_SETTINGS)
+        test_settings.enable()
+        self.addCleanup(test_settings.disable)
+
+        user = get_user_model().objects.create_superuser(
+            username='admin', email='admin@example.com', password='admin'
+        )
+        self.client = TenantClient(self.tenant)
+        self.client.force_login(user)
+        self.url = reverse('transport_admin:transport_unit_import')
+
+    def test_changelist_links_to_import(self):
+        response = self.client.get(reverse('transport_admin:transport_unit_changelist'))
+
+        self.assertContains(response, self.url)
+
+    def test_successful_import_redirects_to_changelist(self):
+        response = self.client.post(self.url, {'file': csv_file(['transit_number', 'ADM001'])})
+
+        self.assertRedirects(
+            response, reverse('transport_admin:transport_unit_changelist'), fetch_redirect_response=False
+        )
+        self.assertTrue(Unit.objects.filter(transit_number='ADM001').exists())
+
+    def test_row_errors_are_listed(self):
+        response = self.client.post(self.url, {'file': csv_file(['transit_number,owner', ',Ana'])})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'transit_number es obligatorio')
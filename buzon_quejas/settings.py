@@ -123,9 +123,18 @@ TENANT_MODEL = "organization.Organization"  # Cambiar de tenant_manager a organi
 TENANT_DOMAIN_MODEL = "organization.Domain"
 SHOW_PUBLIC_IF_NO_TENANT_FOUND = True
 
+# Schema plantilla para crear tenants por clonación (ver apps/organization/provisioning.py).
+# Vacío = cada tenant nuevo ejecuta todas las migraciones. Se prepara con:
+#   python manage.py prepare_tenant_template
+TENANT_TEMPLATE_SCHEMA = os.getenv('TENANT_TEMPLATE_SCHEMA', '')
+
+# Procesos para migrar schemas de tenants en paralelo (0 = uno por CPU).
+# Cada proceso abre una conexión: no exceder el límite de conexiones del plan.
+TENANT_MIGRATION_WORKERS = int(os.getenv('TENANT_MIGRATION_WORKERS', '0'))
+
 
 MIDDLEWARE = [
-    "django_tenants.middleware.main.TenantMainMiddleware",  # DEBE IR PRIMERO
+    "apps.organization.middleware.CachedTenantMainMiddleware",  # DEBE IR PRIMERO (TenantMainMiddleware con caché)
     "apps.organization.middleware.TenantActiveMiddleware",  # Verificar si el tenant está activo
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
@@ -222,6 +231,19 @@ CACHES = {
 RATELIMIT_ENABLE = True  # Habilitar rate limiting
 RATELIMIT_USE_CACHE = 'default'  # Usar cache de Redis para almacenar contadores
 
+# Motor de estadísticas del dashboard
+# "sql": queries agregadas por request (default)
+# "cube": cubo en memoria con NumPy, actualizado de forma incremental (tenants grandes)
+STATISTICS_ENGINE = os.getenv('STATISTICS_ENGINE', 'sql')
+
+# Procesos para renderizar códigos QR en lote (0 = uno por CPU)
+QR_RENDER_WORKERS = int(os.getenv('QR_RENDER_WORKERS', '0'))
+
+# Caché de PNG de códigos QR (por hash de contenido)
+# "disk": archivos en QR_CACHE_DIR | "cache": Redis (CACHES['default']) | "off"
+QR_CACHE_BACKEND = os.getenv('QR_CACHE_BACKEND', 'disk')
+QR_CACHE_DIR = os.getenv('QR_CACHE_DIR', str(BASE_DIR / 'qr_cache'))
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -431,10 +453,30 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 
+# Archivos generados por la aplicación
+MEDIA_ROOT = os.getenv('MEDIA_ROOT', os.path.join(BASE_DIR, "media"))
+
+# Archivos de los trabajos de QR en segundo plano (STORAGES["qr_jobs"]): los
+# escribe el worker (run_qr_generation_jobs) y los descarga el proceso web, así
+# que ambos deben ver el mismo almacenamiento. Con contenedores o dynos
+# separados, montar un volumen compartido en QR_JOB_STORAGE_LOCATION o usar un
+# backend remoto en QR_JOB_STORAGE_BACKEND (ej. "storages.backends.s3.S3Storage",
+# configurado con sus propios settings AWS_*).
+QR_JOB_STORAGE_BACKEND = os.getenv('QR_JOB_STORAGE_BACKEND', 'django.core.files.storage.FileSystemStorage')
+QR_JOB_STORAGE_LOCATION = os.getenv('QR_JOB_STORAGE_LOCATION', '')
+
 STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
     "staticfiles": {
         "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
     },
+    "qr_jobs": {
+        "BACKEND": QR_JOB_STORAGE_BACKEND,
+        # Sin ubicación: MEDIA_ROOT en disco, la raíz del bucket en backends remotos
+        "OPTIONS": {"location": QR_JOB_STORAGE_LOCATION} if QR_JOB_STORAGE_LOCATION else {},
+    },
 }
 
 PUBLIC_SCHEMA_URLCONF = 'buzon_quejas.urls_public'  # URLs para el esquema público
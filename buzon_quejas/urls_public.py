@@ -2,11 +2,16 @@
 from django.contrib import admin
 from django.urls import path, include
 
+from apps.statistical_summary.views import ExecutiveDashboardView
+
 
 urlpatterns = [
     # El admin del esquema PÚBLICO
     path('super-admin/', admin.site.urls),
 
+    # KPIs de todas las organizaciones (solo superusuarios)
+    path('executive-dashboard/', ExecutiveDashboardView.as_view(), name='executive_dashboard'),
+
     # La vista de selección de organización
     path('', include('apps.organization.urls', namespace='organization')),
 
@@ -16,6 +16,7 @@ Requisitos:
     - Organizaciones (tenants) creadas
 """
 
+import copy
 import os
 import sys
 import django
@@ -33,6 +34,7 @@ from django_tenants.utils import schema_context
 from apps.organization.models import Organization
 from apps.transport.models import Route, Unit
 from apps.interview.models import Question, QuestionOption, ComplaintReason
+from apps.interview.seed import DEFAULT_COMPLAINT_REASONS, DEFAULT_QUESTIONS
 
 
 def print_header(message):
@@ -142,97 +144,7 @@ def create_units(schema_name, org_name, routes):
 
 def create_questions(schema_name, org_name):
     """Crea preguntas de encuesta para una organización."""
-    questions_data = [
-        # Preguntas tipo RATING
-        {
-            'text': '¿Qué tan satisfecho estás con el servicio de transporte?',
-            'type': Question.QuestionType.RATING,
-            'position': 1,
-            'options': []
-        },
-        {
-            'text': '¿Cómo calificarías la limpieza de la unidad?',
-            'type': Question.QuestionType.RATING,
-            'position': 2,
-            'options': []
-        },
-        {
-            'text': '¿Qué tan puntual fue el servicio?',
-            'type': Question.QuestionType.RATING,
-            'position': 3,
-            'options': []
-        },
-        {
-            'text': '¿Cómo calificarías la conducción del operador?',
-            'type': Question.QuestionType.RATING,
-            'position': 4,
-            'options': []
-        },
-        
-        # Preguntas tipo CHOICE
-        {
-            'text': '¿Con qué frecuencia utilizas este servicio?',
-            'type': Question.QuestionType.CHOICE,
-            'position': 5,
-            'options': [
-                {'text': 'Diariamente', 'position': 1},
-                {'text': '3-4 veces por semana', 'position': 2},
-                {'text': '1-2 veces por semana', 'position': 3},
-                {'text': 'Ocasionalmente', 'position': 4},
-                {'text': 'Primera vez', 'position': 5},
-            ]
-        },
-        {
-            'text': '¿Cuál es el principal motivo de tu viaje?',
-            'type': Question.QuestionType.CHOICE,
-            'position': 6,
-            'options': [
-                {'text': 'Trabajo', 'position': 1},
-                {'text': 'Escuela', 'position': 2},
-                {'text': 'Compras', 'position': 3},
-                {'text': 'Entretenimiento', 'position': 4},
-                {'text': 'Salud', 'position': 5},
-                {'text': 'Otro', 'position': 6},
-            ]
-        },
-        
-        # Preguntas tipo MULTI_CHOICE
-        {
-            'text': '¿Qué aspectos del servicio consideras más importantes? (Selecciona todos los que apliquen)',
-            'type': Question.QuestionType.MULTI_CHOICE,
-            'position': 7,
-            'options': [
-                {'text': 'Puntualidad', 'position': 1},
-                {'text': 'Limpieza', 'position': 2},
-                {'text': 'Seguridad', 'position': 3},
-                {'text': 'Amabilidad del conductor', 'position': 4},
-                {'text': 'Precio', 'position': 5},
-                {'text': 'Comodidad', 'position': 6},
-            ]
-        },
-        {
-            'text': '¿Qué mejoras te gustaría ver en el servicio? (Selecciona todas las que apliquen)',
-            'type': Question.QuestionType.MULTI_CHOICE,
-            'position': 8,
-            'options': [
-                {'text': 'Más frecuencia de unidades', 'position': 1},
-                {'text': 'Aire acondicionado', 'position': 2},
-                {'text': 'WiFi gratuito', 'position': 3},
-                {'text': 'Puertos USB para cargar dispositivos', 'position': 4},
-                {'text': 'Mejor iluminación', 'position': 5},
-                {'text': 'Mejor ventilación', 'position': 6},
-                {'text': 'Más limpieza', 'position': 7},
-            ]
-        },
-        
-        # Pregunta tipo TEXT
-        {
-            'text': '¿Tienes algún comentario o sugerencia adicional?',
-            'type': Question.QuestionType.TEXT,
-            'position': 9,
-            'options': []
-        },
-    ]
+    questions_data = copy.deepcopy(DEFAULT_QUESTIONS)
     
     questions_count = 0
     
@@ -267,23 +179,7 @@ def create_questions(schema_name, org_name):
 
 def create_complaint_reasons(schema_name, org_name):
     """Crea motivos de queja para una organización."""
-    reasons_data = [
-        'Mal trato del operador',
-        'Conducción peligrosa o imprudente',
-        'Unidad en malas condiciones',
-        'Unidad sucia',
-        'Retraso excesivo',
-        'No respetó paradas',
-        'Operador hablando por teléfono',
-        'Música a volumen muy alto',
-        'Exceso de velocidad',
-        'Cobro incorrecto',
-        'No dio cambio',
-        'Asientos rotos o dañados',
-        'Mal olor en la unidad',
-        'Acoso o comportamiento inapropiado',
-        'Otro',
-    ]
+    reasons_data = DEFAULT_COMPLAINT_REASONS
     
     reasons_count = 0
     
@@ -5,9 +5,17 @@ Script de inicialización de base de datos para django-tenants.
 Este script:
 1. Ejecuta las migraciones del esquema compartido (público)
 2. Crea la organización pública con sus dominios
+3. Migra los tenants existentes
+4. Crea las particiones mensuales de los meses siguientes en cada tenant
+5. Registra la huella de migraciones (SchemaFingerprint)
 
 Uso:
-    python start_db.py
+    python start_db.py            # fase release: inicialización completa
+    python start_db.py --check    # arranque web: solo compara la huella
+
+Con --check, si la huella del código ya fue registrada por la fase release
+termina de inmediato; si no (ej. despliegue sin fase release, desarrollo
+local), ejecuta la inicialización completa.
 
 Requisitos:
     - Tener configuradas las variables de entorno en .env
@@ -29,6 +37,7 @@ django.setup()
 
 from django.core.management import call_command
 from apps.organization.models import Organization, Domain
+from apps.organization.schema_migrations import record_schema_fingerprint, schema_fingerprint_is_current
 from django.db import connection
 
 
@@ -80,7 +89,8 @@ def run_tenant_migrations():
             return True
 
         print_info(f"Se encontraron {tenant_count} tenant(s) adicional(es) para migrar")
-        call_command('migrate_schemas', verbosity=2)
+        # En paralelo y omitiendo los schemas al día (TENANT_MIGRATION_WORKERS)
+        call_command('migrate_tenants')
         print_success("Migraciones de tenants completadas")
         return True
     except Exception as e:
@@ -143,6 +153,53 @@ def create_public_tenant():
 
 
 
+def prepare_tenant_template():
+    """Actualiza el schema plantilla de tenants (si TENANT_TEMPLATE_SCHEMA está configurado)."""
+    from django.conf import settings
+
+    if not settings.TENANT_TEMPLATE_SCHEMA:
+        return True
+
+    print_header("Paso 3b: Preparando schema plantilla de tenants")
+
+    try:
+        call_command('prepare_tenant_template', verbosity=1)
+        return True
+    except Exception as e:
+        print_error(f"Error al preparar la plantilla de tenants: {e}")
+        return False
+
+
+def ensure_monthly_partitions():
+    """Crea por adelantado las particiones mensuales de envíos y respuestas de cada tenant."""
+    print_header("Paso 3c: Creando particiones mensuales")
+
+    try:
+        # Sin ellas, las filas de meses nuevos caen en la partición DEFAULT
+        call_command('ensure_partitions')
+        return True
+    except Exception as e:
+        print_error(f"Error al crear las particiones mensuales: {e}")
+        return False
+
+
+def record_fingerprint():
+    """Registra la huella de migraciones para que el arranque web no migre."""
+    print_header("Paso 5: Registrando huella de migraciones")
+
+    try:
+        outdated = record_schema_fingerprint()
+        if outdated:
+            print_error(f"Schemas con migraciones pendientes: {', '.join(outdated)}")
+            return False
+
+        print_success("Huella registrada: el arranque web omitirá la inicialización")
+        return True
+    except Exception as e:
+        print_error(f"Error al registrar la huella de migraciones: {e}")
+        return False
+
+
 def verify_installation():
     """Verifica que la instalación sea correcta."""
     print_header("Paso 4: Verificando instalación")
@@ -182,12 +239,19 @@ def verify_installation():
 
 def main():
     """Función principal del script."""
+    if '--check' in sys.argv[1:]:
+        if schema_fingerprint_is_current():
+            print_success("Esquemas al día (huella registrada en la fase release)")
+            return
+        print_info("Huella de migraciones no registrada: ejecutando inicialización completa")
+
     print_header("🚀 Inicialización de Base de Datos - Django Tenants")
 
     print_info("Este script inicializará la base de datos con:")
     print_info("  1. Esquema compartido (público)")
     print_info("  2. Organización pública con dominios")
     print_info("  3. Migraciones de tenants existentes")
+    print_info("  4. Particiones mensuales de tenants")
     print()
 
     # Ejecutar pasos
@@ -195,7 +259,10 @@ def main():
         ("Migraciones compartidas", run_shared_migrations),
         ("Creación de tenant público", create_public_tenant),
         ("Migraciones de tenants", run_tenant_migrations),
+        ("Plantilla de tenants", prepare_tenant_template),
+        ("Particiones mensuales", ensure_monthly_partitions),
         ("Verificación", verify_installation),
+        ("Registro de huella", record_fingerprint),
     ]
     
     for step_name, step_func in steps: